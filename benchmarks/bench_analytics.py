@@ -0,0 +1,133 @@
+"""
+Engagement snapshot ingestion benchmark.
+
+Loads the same snapshot stream into the SQLite stand-in twice: one
+transaction per snapshot (the row-at-a-time path the pipeline replaces)
+and whole batches. Both modes maintain rollups and video counters.
+It then times an hourly time series read from the rollup table against
+the same aggregate computed from raw snapshots.
+
+Usage:
+    uv run python benchmarks/bench_analytics.py
+    uv run python benchmarks/bench_analytics.py --snapshots 200000 --batch 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from chimera.analytics import EngagementSnapshot, SQLiteSnapshotStore
+
+START = 1_700_006_400.0
+VIDEOS = 20
+CROSS_POSTS = 3
+
+
+def stream(count: int, seed: int = 7) -> list[EngagementSnapshot]:
+    """Snapshots of every publication, polled in rounds every five minutes."""
+    rng = random.Random(seed)
+    publications = VIDEOS * CROSS_POSTS
+    views = [0] * publications
+    out = []
+    for n in range(count):
+        pub = n % publications
+        views[pub] += rng.randrange(50)
+        out.append(
+            EngagementSnapshot(
+                f"p{pub}",
+                view_count=views[pub],
+                like_count=views[pub] // 20,
+                comment_count=views[pub] // 100,
+                captured_at=START + 300 * (n // publications),
+            )
+        )
+    return out
+
+
+def open_store(path: Path) -> SQLiteSnapshotStore:
+    store = SQLiteSnapshotStore(path)
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executemany(
+        "INSERT INTO video_metadata (video_id) VALUES (?)",
+        [(f"v{v}",) for v in range(VIDEOS)],
+    )
+    conn.executemany(
+        "INSERT INTO publications (publication_id, video_id) VALUES (?, ?)",
+        [(f"p{p}", f"v{p % VIDEOS}") for p in range(VIDEOS * CROSS_POSTS)],
+    )
+    conn.close()
+    return store
+
+
+async def load(store: SQLiteSnapshotStore, snapshots, batch: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(snapshots), batch):
+        await store.write_batch(snapshots[i : i + batch])
+    return time.perf_counter() - start
+
+
+def query_raw(path: Path, publication_id: str) -> float:
+    conn = sqlite3.connect(path)
+    start = time.perf_counter()
+    for _ in range(100):
+        conn.execute(
+            "SELECT CAST(captured_at / 3600 AS INTEGER) * 3600 AS bucket,"
+            " COUNT(*), MAX(view_count), AVG(engagement_rate)"
+            " FROM engagement_snapshots WHERE publication_id = ?"
+            " GROUP BY bucket ORDER BY bucket",
+            (publication_id,),
+        ).fetchall()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed / 100
+
+
+async def query_rollup(store: SQLiteSnapshotStore, publication_id: str) -> float:
+    start = time.perf_counter()
+    for _ in range(100):
+        await store.series(publication_id, start=START, end=START + 10**7)
+    return (time.perf_counter() - start) / 100
+
+
+async def main(snapshots: int, batch: int, single: int) -> None:
+    data = stream(snapshots)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = open_store(Path(tmp) / "single.db")
+        single_s = await load(store, data[:single], 1)
+        await store.close()
+
+        path = Path(tmp) / "batched.db"
+        store = open_store(path)
+        batched_s = await load(store, data, batch)
+        raw_s = query_raw(path, "p0")
+        rollup_s = await query_rollup(store, "p0")
+        await store.close()
+
+    single_rate = single / single_s
+    batched_rate = snapshots / batched_s
+    print(f"row-at-a-time:  {single_rate:>10,.0f} snapshots/s ({single:,} snapshots)")
+    print(
+        f"batched x{batch:<6,} {batched_rate:>10,.0f} snapshots/s"
+        f" ({snapshots:,} snapshots, {batched_rate / single_rate:.0f}x)"
+    )
+    print(
+        f"hourly series:  raw snapshots {raw_s * 1e3:.2f} ms,"
+        f" rollup {rollup_s * 1e3:.2f} ms ({raw_s / rollup_s:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshots", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument(
+        "--single", type=int, default=5_000, help="snapshots loaded one at a time"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.snapshots, args.batch, args.single))
@@ -0,0 +1,109 @@
+"""
+Audit trace benchmark.
+
+Writes synthetic workflows (campaign → task → result → publication) to audit
+segments, indexes them, then times rebuilding one workflow's tree through
+the correlation index against a full scan of every segment.
+
+Usage:
+    uv run python benchmarks/bench_audit_trace.py
+    uv run python benchmarks/bench_audit_trace.py --events 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from chimera.audit import (
+    AuditEvent,
+    AuditIndex,
+    SegmentWriter,
+    list_segments,
+    read_segment,
+)
+
+BATCH = 4_096
+
+
+def write_history(directory: Path, events: int, seed: int = 0) -> list[str]:
+    """Interleave four-event workflows; returns their correlation IDs."""
+    rng = random.Random(seed)
+    writer = SegmentWriter(directory, fsync="never")
+    open_chains: dict[str, AuditEvent] = {}
+    kinds = ("campaign.created", "task.created", "task.completed", "publication")
+    correlation_ids = []
+    batch = []
+    for n in range(events):
+        if not open_chains or (len(open_chains) < 1_000 and rng.random() < 0.3):
+            cid = f"camp-{n}"
+            correlation_ids.append(cid)
+            event = AuditEvent(kinds[0], cid, "planner")
+        else:
+            cid = rng.choice(list(open_chains))
+            parent = open_chains[cid]
+            kind = kinds[kinds.index(parent.event_type) + 1]
+            event = AuditEvent(kind, cid, "worker", parent_id=parent.event_id)
+        if event.event_type == kinds[-1]:
+            open_chains.pop(cid)
+        else:
+            open_chains[cid] = event
+        batch.append(event.to_json())
+        if len(batch) == BATCH:
+            writer.write(batch)
+            batch = []
+    writer.write(batch)
+    writer.close()
+    return correlation_ids
+
+
+def trace_by_scan(directory: Path, correlation_id: str) -> int:
+    return sum(
+        1
+        for _, path in list_segments(directory)
+        for _, event in read_segment(path)
+        if event["correlation_id"] == correlation_id
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--traces", type=int, default=100)
+    args = parser.parse_args()
+
+    for count in args.events:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            correlation_ids = write_history(directory, count)
+            index = AuditIndex(directory)
+
+            start = time.perf_counter()
+            index.catch_up()
+            build = time.perf_counter() - start
+
+            sample = random.Random(1).sample(
+                correlation_ids, min(args.traces, len(correlation_ids))
+            )
+            start = time.perf_counter()
+            for cid in sample:
+                index.trace(cid)
+            indexed = (time.perf_counter() - start) / len(sample)
+
+            start = time.perf_counter()
+            trace_by_scan(directory, sample[0])
+            scan = time.perf_counter() - start
+            index.close()
+
+        print(
+            f"  events={count:>9,}  index build {build:>6.1f}s"
+            f"  trace {indexed * 1000:>7.2f} ms  scan {scan * 1000:>9.1f} ms"
+            f"  ({scan / indexed:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Budget reservation contention benchmark.
+
+Runs concurrent reservers (threads), each making many small
+reserve-then-commit calls against nested global/campaign/agent limits,
+three ways: a transactional SQLite round trip per call, the in-memory
+ledger, and Worker-local leases refilled from the ledger in bulk. Every mode
+checks that no scope ended above its limit.
+
+Usage:
+    uv run python benchmarks/bench_budget.py
+    uv run python benchmarks/bench_budget.py --reservers 64 --calls 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from chimera.budget import (
+    BudgetExceededError,
+    BudgetLedger,
+    BudgetPolicy,
+    scopes_for,
+)
+
+COST_USD = 0.001
+CAMPAIGNS = 8
+
+
+def policies(limit_usd: float) -> list[BudgetPolicy]:
+    return [BudgetPolicy(daily_limit_usd=limit_usd)] + [
+        BudgetPolicy("campaign", f"c{n}", daily_limit_usd=limit_usd / 4)
+        for n in range(CAMPAIGNS)
+    ]
+
+
+def run(reservers: int, body: Callable[[int], int]) -> tuple[float, int]:
+    admitted = [0] * reservers
+
+    def target(n: int) -> None:
+        admitted[n] = body(n)
+
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(reservers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, sum(admitted)
+
+
+def bench_sqlite(path: Path, reservers: int, calls: int, limit_usd: float):
+    """One ``BEGIN IMMEDIATE`` transaction per reservation and per commit."""
+    setup = sqlite3.connect(path, isolation_level=None)
+    setup.execute("PRAGMA journal_mode=WAL")
+    setup.execute(
+        "CREATE TABLE budget (scope TEXT PRIMARY KEY, lim INTEGER,"
+        " spent INTEGER, committed INTEGER)"
+    )
+    setup.executemany(
+        "INSERT INTO budget VALUES (?, ?, 0, 0)",
+        [(p.key, round(p.daily_limit_usd * 1e6)) for p in policies(limit_usd)],
+    )
+    setup.close()
+    micros = round(COST_USD * 1e6)
+
+    def body(n: int) -> int:
+        conn = sqlite3.connect(path, isolation_level=None, timeout=60)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        scopes = scopes_for(campaign_id=f"c{n % CAMPAIGNS}", agent_id=f"a{n}")
+        marks = ",".join("?" * len(scopes))
+        admitted = 0
+        for _ in range(calls):
+            conn.execute("BEGIN IMMEDIATE")
+            full = conn.execute(
+                f"SELECT 1 FROM budget WHERE scope IN ({marks})"
+                " AND spent + committed + ? > lim",
+                (*scopes, micros),
+            ).fetchone()
+            if full:
+                conn.execute("ROLLBACK")
+                continue
+            conn.execute(
+                f"UPDATE budget SET committed = committed + ? WHERE scope IN ({marks})",
+                (micros, *scopes),
+            )
+            conn.execute("COMMIT")
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE budget SET committed = committed - ?, spent = spent + ?"
+                f" WHERE scope IN ({marks})",
+                (micros, micros, *scopes),
+            )
+            conn.execute("COMMIT")
+            admitted += 1
+        conn.close()
+        return admitted
+
+    elapsed, admitted = run(reservers, body)
+    check = sqlite3.connect(path)
+    over = check.execute("SELECT COUNT(*) FROM budget WHERE spent > lim").fetchone()[0]
+    check.close()
+    return elapsed, admitted, over == 0
+
+
+def bench_ledger(reservers: int, calls: int, limit_usd: float, slice_usd: float):
+    """``slice_usd == 0`` reserves at the ledger directly on every call."""
+    ledger = BudgetLedger(policies(limit_usd))
+
+    def body(n: int) -> int:
+        scopes = scopes_for(campaign_id=f"c{n % CAMPAIGNS}", agent_id=f"a{n}")
+        admitted = 0
+        if not slice_usd:
+            for _ in range(calls):
+                try:
+                    ledger.reserve(scopes, COST_USD).commit()
+                except BudgetExceededError:
+                    continue
+                admitted += 1
+            return admitted
+        with ledger.lease(scopes, slice_usd=slice_usd) as lease:
+            for _ in range(calls):
+                try:
+                    lease.reserve(COST_USD).commit()
+                except BudgetExceededError:
+                    continue
+                admitted += 1
+        return admitted
+
+    elapsed, admitted = run(reservers, body)
+    within = all(
+        ledger.usage(p.key).spent_usd <= p.daily_limit_usd + 1e-9
+        for p in policies(limit_usd)
+    )
+    return elapsed, admitted, within, ledger.stats.refills
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reservers", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--sqlite-calls", type=int, default=100)
+    parser.add_argument("--slice-usd", type=float, default=0.25)
+    args = parser.parse_args()
+
+    # Enough budget for about 80% of the calls, so the limits are exercised.
+    total = args.reservers * args.calls
+    limit = total * COST_USD * 0.8
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_total = args.reservers * args.sqlite_calls
+        elapsed, admitted, ok = bench_sqlite(
+            Path(tmp) / "budget.db",
+            args.reservers,
+            args.sqlite_calls,
+            sqlite_total * COST_USD * 0.8,
+        )
+    print(
+        f"  {args.reservers} reservers  sqlite txn per call"
+        f" {sqlite_total / elapsed:>11,.0f} calls/s"
+        f"  admitted={admitted:,}  within_limits={ok}"
+    )
+    for label, slice_usd in (("ledger", 0.0), ("leases", args.slice_usd)):
+        elapsed, admitted, ok, refills = bench_ledger(
+            args.reservers, args.calls, limit, slice_usd
+        )
+        print(
+            f"  {args.reservers} reservers  {label:<19} {total / elapsed:>11,.0f}"
+            f" calls/s  admitted={admitted:,}  within_limits={ok}"
+            f"  refills={refills:,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Data-contract encode/decode/validate microbenchmark.
+
+For each contract, times a stdlib ``json`` dumps+loads round trip of the
+plain dict (how the tests' dict contracts would travel), then the codec's
+encode, a validating decode, a trusted decode, and validation alone
+(``from_dict`` on an already parsed dict). Times are microseconds per
+record.
+
+Usage:
+    uv run python benchmarks/bench_contracts.py
+    uv run python benchmarks/bench_contracts.py --records 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from chimera.contracts import (
+    AuditEvent,
+    Campaign,
+    ResultArtifact,
+    ReviewItem,
+    Task,
+    decode,
+    encode,
+    from_dict,
+    to_dict,
+)
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def samples() -> list[Any]:
+    text = "The EU AI Act sets out a risk-based framework for AI systems. " * 6
+    return [
+        Task(
+            task_id=new_id(),
+            campaign_id=new_id(),
+            task_type="generate_content",
+            priority="high",
+            context={
+                "goal_description": "Explain the EU AI Act to startup founders",
+                "persona_constraints": ["cite sources", "avoid hype"],
+                "required_resources": ["news://ai/regulation", "twitter://trends"],
+                "memory_refs": [new_id() for _ in range(3)],
+            },
+            acceptance_criteria=("max_length:280", "Cites at least one source"),
+            deadline="2026-06-01T12:00:00+00:00",
+            correlation_id=new_id(),
+        ),
+        ResultArtifact(
+            result_id=new_id(),
+            task_id=new_id(),
+            worker_id="worker-001",
+            artifact_type="content",
+            content={"text": text, "media_urls": ["https://cdn.example/1.png"]},
+            confidence_score=0.87,
+            tool_usage=tuple(
+                {
+                    "tool_name": "text_completion",
+                    "inputs": {"prompt": text[:120]},
+                    "outputs": {"tokens": 212},
+                    "duration_ms": 840,
+                }
+                for _ in range(3)
+            ),
+            provenance={
+                "memory_refs": [new_id() for _ in range(3)],
+                "signal_refs": [new_id()],
+                "inputs_hash": "9f" * 32,
+            },
+            execution_duration_ms=2_340,
+            correlation_id=new_id(),
+        ),
+        AuditEvent(
+            "task.completed",
+            new_id(),
+            "worker-001",
+            {"task_id": new_id(), "duration_ms": 2_340, "outcome": "review"},
+        ),
+        ReviewItem(
+            review_id=new_id(),
+            result_id=new_id(),
+            escalation_reason="low_confidence",
+            confidence_score=0.78,
+            reasoning_trace="Confidence below the auto-approve threshold.",
+            context_snapshot={
+                "campaign_goal": "Explain the EU AI Act",
+                "persona_name": "Tech Analyst",
+                "persona_voice_traits": ["analytical", "concise"],
+                "recent_history": [],
+            },
+            content_preview={"text": text[:280], "media_urls": []},
+            correlation_id=new_id(),
+        ),
+        Campaign(
+            campaign_id=new_id(),
+            goal_description="Analyze new AI regulations for founders",
+            agent_ids=tuple(new_id() for _ in range(3)),
+            priority="high",
+            budget_allocation={"daily_limit_usd": 50.0},
+            created_by="operator",
+            constraints={"platforms": ["twitter", "linkedin"]},
+        ),
+    ]
+
+
+def per_record(fn: Callable[[], object], records: int) -> float:
+    start = time.perf_counter()
+    for _ in range(records):
+        fn()
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def row(record: Any, n: int) -> str:
+    cls = type(record)
+    wire = to_dict(record)
+    encoded = encode(record)
+    text = json.dumps(wire)
+    baseline = per_record(lambda: json.dumps(wire).encode(), n) + per_record(
+        lambda: json.loads(text), n
+    )
+    return (
+        f"{cls.__name__:<16}{baseline:>18.2f}"
+        f"{per_record(lambda: encode(record), n):>9.2f}"
+        f"{per_record(lambda: decode(cls, encoded), n):>9.2f}"
+        f"{per_record(lambda: decode(cls, encoded, trusted=True), n):>9.2f}"
+        f"{per_record(lambda: from_dict(cls, wire), n):>10.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"microseconds per record, {args.records:,} records each")
+    print(
+        f"{'contract':<16}{'json dumps+loads':>18}{'encode':>9}{'decode':>9}"
+        f"{'trusted':>9}{'validate':>10}"
+    )
+    for record in samples():
+        print(row(record, args.records))
+
+
+if __name__ == "__main__":
+    main()
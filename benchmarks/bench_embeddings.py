@@ -0,0 +1,115 @@
+"""
+Embedding throughput benchmark: per-text calls against the batched service.
+
+Simulates a fleet of agents that each embed the same hour's trending
+headlines plus a few texts of their own. The naive path makes one backend
+call per text. The EmbeddingService path caches, coalesces and
+micro-batches. The simulated backend costs a fixed round trip per call plus
+a small per-text cost.
+
+Usage:
+    uv run python benchmarks/bench_embeddings.py
+    uv run python benchmarks/bench_embeddings.py --agents 200 --headlines 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import numpy as np
+
+from chimera.embeddings import EmbeddingService, VectorCache
+
+
+class SimulatedModel:
+    """Embedding endpoint: ``rtt`` per call plus ``per_text`` per input."""
+
+    def __init__(self, dim: int, rtt: float, per_text: float) -> None:
+        self.dim = dim
+        self.rtt = rtt
+        self.per_text = per_text
+        self.calls = 0
+        self.texts = 0
+
+    async def __call__(self, texts: list[str]) -> np.ndarray:
+        self.calls += 1
+        self.texts += len(texts)
+        await asyncio.sleep(self.rtt + self.per_text * len(texts))
+        rng = np.random.default_rng(len(texts))
+        return rng.normal(size=(len(texts), self.dim)).astype(np.float32)
+
+
+def workload(agents: int, headlines: int, own: int) -> list[list[str]]:
+    trending = [f"trending headline {n}" for n in range(headlines)]
+    return [
+        trending + [f"agent {a} note {n}" for n in range(own)] for a in range(agents)
+    ]
+
+
+async def naive(model: SimulatedModel, texts: list[list[str]], limit: int) -> None:
+    slots = asyncio.Semaphore(limit)
+
+    async def one(text: str) -> None:
+        async with slots:
+            await model([text])
+
+    await asyncio.gather(*(one(text) for agent in texts for text in agent))
+
+
+async def batched(service: EmbeddingService, texts: list[list[str]]) -> None:
+    await asyncio.gather(*(service.embed_many(agent) for agent in texts))
+
+
+def report(label: str, model: SimulatedModel, requests: int, seconds: float) -> None:
+    print(
+        f"  {label:<18} {seconds:7.2f}s  {requests / seconds:10,.0f} texts/s"
+        f"  backend calls={model.calls:,}  texts sent={model.texts:,}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    texts = workload(args.agents, args.headlines, args.own)
+    requests = sum(len(agent) for agent in texts)
+    print(f"  {args.agents} agents, {requests:,} embedding requests")
+
+    model = SimulatedModel(args.dim, args.rtt_ms / 1000, args.per_text_ms / 1000)
+    start = time.perf_counter()
+    await naive(model, texts, args.concurrency)
+    report("one call per text", model, requests, time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as directory:
+        model = SimulatedModel(args.dim, args.rtt_ms / 1000, args.per_text_ms / 1000)
+        cache = VectorCache(directory, dim=args.dim, dtype="float16")
+        async with EmbeddingService(
+            model, dim=args.dim, cache=cache, max_concurrent_batches=args.concurrency
+        ) as service:
+            start = time.perf_counter()
+            await batched(service, texts)
+            report("service (cold)", model, requests, time.perf_counter() - start)
+            start = time.perf_counter()
+            await batched(service, texts)
+            report("service (warm)", model, requests, time.perf_counter() - start)
+        print(
+            f"  hit_rate={service.stats.hit_rate:.2%}  batches={service.stats.batches:,}"
+            f"  cache={cache.nbytes / 2**20:.1f} MiB"
+        )
+        cache.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--headlines", type=int, default=200)
+    parser.add_argument("--own", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.05)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+HITL edit-log size benchmark.
+
+Simulates reviewer edits to platform variants of generated posts and
+compares the bytes the hitl.reviewed audit payload needs for full
+before/after snapshots with content-addressed originals plus token deltas.
+It also times how long it takes to reconstruct every edited version.
+
+Usage:
+    uv run python benchmarks/bench_hitl_edits.py
+    uv run python benchmarks/bench_hitl_edits.py --posts 5000 --edits-per-post 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from chimera.hitl import EditLog
+
+VOCABULARY = (
+    "ai regulation startup founders model safety chips funding policy launch "
+    "market privacy open source robotics climate compliance audit data teams"
+).split()
+
+
+def make_post(rng: random.Random, words: int) -> str:
+    sentences = []
+    while words > 0:
+        n = min(words, rng.randint(8, 18))
+        sentences.append(" ".join(rng.choices(VOCABULARY, k=n)).capitalize() + ".")
+        words -= n
+    return " ".join(sentences)
+
+
+def edit(rng: random.Random, text: str) -> str:
+    tokens = text.split(" ")
+    for _ in range(rng.randint(1, 4)):
+        tokens[rng.randrange(len(tokens))] = rng.choice(VOCABULARY)
+    return " ".join(tokens)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=2_000)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--edits-per-post", type=int, default=2)
+    parser.add_argument("--words", type=int, default=250)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    log = EditLog()
+    snapshot_bytes = delta_bytes = 0
+    records = []
+    for _ in range(args.posts):
+        original = make_post(rng, args.words)
+        # Platform variants escalated with the same body share one original.
+        for _ in range(args.variants):
+            current = original
+            for _ in range(args.edits_per_post):
+                current = edit(rng, current)
+                snapshot_bytes += len(
+                    json.dumps({"original": original, "edited": current})
+                )
+                ref, new = log.original(original)
+                record = log.record(original, current)
+                payload = {"original_ref": ref, "edit": record.to_dict()}
+                if new:
+                    payload["original"] = original
+                delta_bytes += len(json.dumps(payload))
+                records.append((record, current))
+
+    start = time.perf_counter()
+    for record, expected in records:
+        assert log.reconstruct(record) == expected
+    elapsed = time.perf_counter() - start
+
+    print(f"edits={len(records):,}  originals stored={len(log.store):,}")
+    print(f"  full snapshots   {snapshot_bytes / 2**20:8.2f} MiB")
+    print(
+        f"  ref + delta      {delta_bytes / 2**20:8.2f} MiB"
+        f"  ({snapshot_bytes / delta_bytes:.1f}x smaller)"
+    )
+    print(f"  reconstruct      {elapsed / len(records) * 1e6:8.1f} us/version")
+
+
+if __name__ == "__main__":
+    main()
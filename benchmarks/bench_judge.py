@@ -0,0 +1,90 @@
+"""
+Judge throughput benchmark.
+
+Reviews synthetic Result Artifacts through the Judge (one Aho-Corasick
+pass per text) and compares sensitive-topic detection against a
+per-keyword regex reference that scans every text once per keyword.
+
+Usage:
+    uv run python benchmarks/bench_judge.py
+    uv run python benchmarks/bench_judge.py --artifacts 100000 --extra-keywords 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from chimera.judge import (
+    SENSITIVE_TOPICS,
+    CampaignPolicy,
+    Judge,
+    PersonaRules,
+    ReviewContext,
+)
+
+VOCABULARY = (
+    "ai regulation startup founders model safety chips funding policy launch "
+    "market privacy open source robotics climate music film travel security "
+    "cloud benchmark research vote cure invest lawsuit kids hurricane"
+).split()
+
+
+def make_artifacts(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "result_id": f"r{n}",
+            "artifact_type": "content",
+            "content": {"text": " ".join(rng.choices(VOCABULARY, k=40))},
+            "confidence_score": rng.random(),
+            "correlation_id": f"corr-{n}",
+        }
+        for n in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--artifacts", type=int, default=20_000)
+    parser.add_argument("--extra-keywords", type=int, nargs="+", default=[0, 1_000])
+    args = parser.parse_args()
+
+    artifacts = make_artifacts(args.artifacts)
+    persona = PersonaRules("bench", forbidden_patterns=(r"\bto the moon\b", r"!!+"))
+    context = ReviewContext("bench", persona, ("max_length:2000",))
+    for extra in args.extra_keywords:
+        keywords = {"custom": tuple(f"term{n}" for n in range(extra))}
+        judge = Judge(
+            policies=[
+                CampaignPolicy(
+                    "bench", sensitive_keywords=keywords, first_posts_hitl_count=0
+                )
+            ]
+        )
+        start = time.perf_counter()
+        judge.review_batch((artifact, context) for artifact in artifacts)
+        automaton = time.perf_counter() - start
+
+        patterns = [
+            re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
+            for words in (*SENSITIVE_TOPICS.values(), *keywords.values())
+            for word in words
+        ]
+        start = time.perf_counter()
+        for artifact in artifacts:
+            text = artifact["content"]["text"]
+            [pattern for pattern in patterns if pattern.search(text)]
+        per_keyword = time.perf_counter() - start
+
+        count = len(artifacts)
+        print(
+            f"  keywords={len(patterns):>6,}  judge {count / automaton:>9,.0f}/s"
+            f"  per-keyword regex scan {count / per_keyword:>9,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
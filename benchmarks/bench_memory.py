@@ -0,0 +1,121 @@
+"""
+Agent memory retrieval benchmark: recall@k against latency.
+
+Fills an IVFIndex with clustered synthetic embeddings and, for each nprobe
+setting, reports recall@k against exact search along with per-query latency.
+It then times TieredMemory retrievals for one persona, where the hot tier is
+compared with a simulated MCP round trip to the vector store.
+
+Usage:
+    uv run python benchmarks/bench_memory.py
+    uv run python benchmarks/bench_memory.py --vectors 200000 --dim 768 --k 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+
+from chimera.memory import IVFIndex, LongTermMemory, TieredMemory
+
+
+def clustered(count: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(1, count // 50), dim))
+    labels = rng.integers(len(centres), size=count)
+    points = centres[labels] + rng.normal(scale=1.2, size=(count, dim))
+    return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float32)
+
+
+class SimulatedVectorStore:
+    """``memory://search`` with a fixed round-trip delay and exact search."""
+
+    def __init__(self, memories: list[LongTermMemory], rtt: float) -> None:
+        self.memories = memories
+        self.matrix = np.stack([m.embedding for m in memories])
+        self.rtt = rtt
+        self.query: np.ndarray | None = None
+
+    async def read_resource(self, resource_uri: str) -> dict[str, Any]:
+        await asyncio.sleep(self.rtt)
+        assert self.query is not None
+        top = np.argsort(-(self.matrix @ self.query))[:16]
+        return {"memories": [self.memories[i].to_dict() for i in top]}
+
+    async def call_tool(self, tool_name: str, params: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+
+async def bench_tiers(dim: int, queries: int, rtt_ms: float) -> None:
+    points = clustered(5_000, dim, seed=1)
+    memories = [
+        LongTermMemory("persona", f"m{n}", p, memory_id=f"m{n}")
+        for n, p in enumerate(points)
+    ]
+    store = SimulatedVectorStore(memories, rtt_ms / 1000)
+    tiers = TieredMemory(store, dim=dim)
+    rng = np.random.default_rng(2)
+    # A persona's retrievals revolve around a few recurring themes.
+    themes = points[rng.choice(len(points), 8, replace=False)]
+    start = time.perf_counter()
+    for _ in range(queries):
+        query = themes[rng.integers(len(themes))] + rng.normal(scale=0.01, size=dim)
+        store.query = query / np.linalg.norm(query)
+        await tiers.retrieve("persona", "theme", query, k=8)
+    per_query = (time.perf_counter() - start) / queries * 1e3
+    print(
+        f"  tiered retrieval  rtt={rtt_ms:.0f}ms  {per_query:8.3f} ms/query"
+        f"  hit_rate={tiers.stats.hit_rate:.2%}  vs {rtt_ms:.0f}+ ms uncached"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    points = clustered(args.vectors, args.dim)
+    index = IVFIndex(args.dim)
+    start = time.perf_counter()
+    for n, point in enumerate(points):
+        index.add(str(n), point)
+    build = time.perf_counter() - start
+    print(f"  built {len(index):,} x {args.dim} (nlist={index.nlist}) in {build:.1f}s")
+
+    rng = np.random.default_rng(1)
+    queries = points[rng.choice(len(points), args.queries, replace=False)]
+    start = time.perf_counter()
+    truth = []
+    for query in queries:
+        scores = points @ query
+        truth.append(set(np.argpartition(-scores, args.k)[: args.k].tolist()))
+    exact_ms = (time.perf_counter() - start) / args.queries * 1e3
+    print(f"  exact scan            {exact_ms:8.3f} ms/query  recall@{args.k}=1.000")
+
+    for nprobe in (1, 2, 4, 8, 16, 32):
+        start = time.perf_counter()
+        found = [index.search(query, args.k, nprobe=nprobe) for query in queries]
+        ms = (time.perf_counter() - start) / args.queries * 1e3
+        recall = np.mean(
+            [
+                len(expected & {int(key) for key, _ in hits}) / args.k
+                for expected, hits in zip(truth, found, strict=True)
+            ]
+        )
+        print(
+            f"  ivf nprobe={nprobe:<3}        {ms:8.3f} ms/query  recall@{args.k}={recall:.3f}"
+        )
+
+    asyncio.run(bench_tiers(args.dim, args.queries, args.rtt_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Planner re-planning trigger cost versus backlog size.
+
+Plans ``--campaigns`` campaigns of chained tasks on an in-memory queue,
+then times a platform outage that affects one platform's tasks (1/50 of
+the backlog), and a campaign pause plus resume. Each is timed through
+the incremental triggers and against a full rebuild, which plans the
+whole backlog again into an empty queue. Times are milliseconds.
+
+Usage:
+    uv run python benchmarks/bench_planner.py
+    uv run python benchmarks/bench_planner.py --campaigns 50 --tasks 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable
+
+from chimera.contracts import Campaign
+from chimera.planner import PlannedTask, Planner
+from chimera.queue import InMemoryTaskQueue
+
+PLATFORMS = tuple(f"platform-{i}" for i in range(50))
+
+
+def build_campaign(tasks: int, offset: int) -> tuple[Campaign, list[PlannedTask]]:
+    campaign = Campaign(
+        campaign_id=str(uuid.uuid4()),
+        goal_description="Explain new AI regulations",
+        agent_ids=(str(uuid.uuid4()),),
+        created_by="bench",
+    )
+    planned: list[PlannedTask] = []
+    for i in range(tasks):
+        # Every fourth task depends on the previous one.
+        depends = (planned[-1].task_id,) if planned and i % 4 else ()
+        planned.append(
+            PlannedTask(
+                campaign.campaign_id,
+                "generate_content",
+                depends_on=depends,
+                platforms=(PLATFORMS[(offset + i) % len(PLATFORMS)],),
+                estimated_cost_usd=0.01,
+            )
+        )
+    return campaign, planned
+
+
+async def plan_all(plans: list[tuple[Campaign, list[PlannedTask]]]) -> Planner:
+    planner = Planner(InMemoryTaskQueue())
+    for campaign, planned in plans:
+        planner.add_campaign(campaign)
+        await planner.plan(campaign.campaign_id, planned)
+    return planner
+
+
+async def timed(awaitable: Awaitable[object]) -> float:
+    start = time.perf_counter()
+    await awaitable
+    return (time.perf_counter() - start) * 1e3
+
+
+async def run(campaigns: int, tasks: int) -> None:
+    plans = [build_campaign(tasks, c) for c in range(campaigns)]
+    planner = await plan_all(plans)
+    target = plans[len(plans) // 2][0].campaign_id
+    print(f"{len(planner.graph):,} planned tasks, {planner.stats.enqueued:,} queued")
+    rebuild = await timed(plan_all(plans))
+
+    print(f"{'trigger':<24}{'incremental ms':>16}{'rebuild ms':>12}")
+    down = await timed(planner.platform_down(PLATFORMS[0]))
+    up = await timed(planner.platform_up(PLATFORMS[0]))
+    print(f"{'platform down + up':<24}{down + up:>16.2f}{rebuild * 2:>12.2f}")
+    pause = await timed(planner.set_campaign_status(target, "paused"))
+    resume = await timed(planner.set_campaign_status(target, "active"))
+    print(f"{'campaign pause + resume':<24}{pause + resume:>16.2f}{rebuild * 2:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--campaigns", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.campaigns, args.tasks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Task Queue throughput benchmark.
+
+Measures end-to-end tasks/sec (enqueue → claim_batch → ack) with 1, 8 and
+64 concurrent Workers. The Planner pushes tasks in batches while Workers
+drain, so head-of-line blocking shows up as a throughput drop at high
+concurrency.
+
+Usage:
+    uv run python benchmarks/bench_queue.py --backend memory
+    uv run python benchmarks/bench_queue.py --backend redis --redis-url redis://localhost:6379/0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from chimera.queue import InMemoryTaskQueue, QueuedTask, RedisTaskQueue, TaskQueue
+
+PRIORITIES = ("high", "medium", "low")
+
+
+async def make_queue(backend: str, redis_url: str) -> TaskQueue:
+    if backend == "memory":
+        return InMemoryTaskQueue()
+    import redis.asyncio as redis
+
+    return RedisTaskQueue(redis.from_url(redis_url), prefix=f"bench:{uuid.uuid4().hex}")
+
+
+async def run(
+    queue: TaskQueue, workers: int, tasks: int, batch: int
+) -> tuple[float, int]:
+    done = 0
+    produced = asyncio.Event()
+
+    async def planner() -> None:
+        for start in range(0, tasks, 500):
+            await queue.enqueue_many(
+                QueuedTask(
+                    task_id=uuid.uuid4().hex,
+                    task_type="generate_content",
+                    priority=random.choice(PRIORITIES),
+                )
+                for _ in range(min(500, tasks - start))
+            )
+            await asyncio.sleep(0)
+        produced.set()
+
+    async def worker(worker_id: str) -> None:
+        nonlocal done
+        while True:
+            leases = await queue.claim_batch(worker_id, batch)
+            if not leases:
+                if produced.is_set() and await queue.depth() == 0:
+                    return
+                await asyncio.sleep(0.001)
+                continue
+            done += await queue.ack_many(leases)
+
+    start = time.perf_counter()
+    await asyncio.gather(planner(), *(worker(f"w{i}") for i in range(workers)))
+    return time.perf_counter() - start, done
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=["memory", "redis"], default="memory")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 64])
+    args = parser.parse_args()
+
+    print(f"backend={args.backend} tasks={args.tasks} batch={args.batch}")
+    for workers in args.workers:
+        queue = await make_queue(args.backend, args.redis_url)
+        elapsed, done = await run(queue, workers, args.tasks, args.batch)
+        print(f"  workers={workers:>3}  {done / elapsed:>12,.0f} tasks/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
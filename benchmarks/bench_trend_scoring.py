@@ -0,0 +1,108 @@
+"""
+Trend relevance scoring benchmark.
+
+Ranks synthetic signal batches (10k / 100k / 1M by default) down to
+``max_trends`` TrendObjects, comparing the vectorized NumPy scorer against
+a per-signal Python reference (tokenize, set intersection, full sort).
+
+Usage:
+    uv run python benchmarks/bench_trend_scoring.py
+    uv run python benchmarks/bench_trend_scoring.py --signals 100000 --chunk-size 16384
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+# Skills live at the repository root, outside the installed package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from skills.skill_fetch_trends import Signal, persona_terms, rank_trends, tokenize
+from skills.skill_fetch_trends.scoring import DEFAULT_CHUNK_SIZE
+
+VOCABULARY = (
+    "ai regulation startup founders model safety chips funding policy launch "
+    "market privacy open source robotics climate election football music film "
+    "celebrity recipe travel crypto security cloud benchmark research"
+).split()
+
+PERSONA = {
+    "voice_traits": ["analytical", "data-driven"],
+    "directives": ["focus on AI/ML topics", "cite research and policy sources"],
+}
+
+
+def make_signals(count: int, topics: int, seed: int = 0) -> list[Signal]:
+    rng = random.Random(seed)
+    names = [" ".join(rng.sample(VOCABULARY, 3)) for _ in range(topics)]
+    return [
+        Signal(
+            topic=rng.choice(names),
+            text=" ".join(rng.choices(VOCABULARY, k=12)),
+            source=rng.choice(("news", "twitter", "reddit")),
+            volume=rng.randint(1, 5000),
+        )
+        for _ in range(count)
+    ]
+
+
+def rank_scalar(
+    signals: list[Signal], terms: set[str], max_trends: int
+) -> list[tuple[float, str]]:
+    """Per-signal reference: Python set intersection, dict aggregates, full sort."""
+    groups: dict[str, dict] = {}
+    for signal in signals:
+        words = tokenize(f"{signal.topic} {signal.text}")
+        score = len(words & terms) / math.sqrt(len(words) * len(terms)) if words else 0
+        key = " ".join(signal.topic.casefold().split())
+        group = groups.setdefault(
+            key, {"score": 0.0, "volume": 0, "sources": set(), "samples": []}
+        )
+        group["score"] = max(group["score"], score)
+        group["volume"] += signal.volume
+        group["sources"].add(signal.source)
+        if len(group["samples"]) < 3:
+            group["samples"].append(signal.text)
+    ranked = sorted(groups.items(), key=lambda kv: (-kv[1]["score"], -kv[1]["volume"]))
+    return [(group["score"], key) for key, group in ranked[:max_trends]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--signals", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--topics", type=int, default=5_000)
+    parser.add_argument("--max-trends", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    terms = persona_terms(PERSONA, "Explain new AI regulation to startup founders")
+    print(f"topics={args.topics} max_trends={args.max_trends} chunk={args.chunk_size}")
+    for count in args.signals:
+        signals = make_signals(count, args.topics)
+
+        start = time.perf_counter()
+        rank_scalar(signals, terms, args.max_trends)
+        scalar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rank_trends(
+            signals, terms, max_trends=args.max_trends, chunk_size=args.chunk_size
+        )
+        vectorized = time.perf_counter() - start
+
+        print(
+            f"  signals={count:>9,}  scalar {count / scalar:>11,.0f}/s"
+            f"  vectorized {count / vectorized:>11,.0f}/s"
+            f"  ({scalar / vectorized:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+skill_fetch_trends: perception layer for content planning.
+
+Contract: skills/skill_fetch_trends/README.md. Reads trend signals from MCP
+Resources (through a shared TTL cache with request coalescing) and ranks
+them against the calling agent's persona and campaign goal with a
+vectorized NumPy scorer. Near-duplicate topics across sources are merged
+by a rolling MinHash/LSH index.
+"""
+
+from .cache import CacheKey, CacheStats, TrendCache
+from .dedup import MinHasher, TrendCluster, TrendIndex
+from .ranking import TopicGroups, rank_trends, trend_id
+from .scoring import RelevanceScorer, top_k
+from .signals import Signal, parse_signals, persona_terms, tokenize
+from .skill import execute, resource_uri, shared_cache, shared_index
+
+__all__ = [
+    "CacheKey",
+    "CacheStats",
+    "MinHasher",
+    "RelevanceScorer",
+    "Signal",
+    "TopicGroups",
+    "TrendCache",
+    "TrendCluster",
+    "TrendIndex",
+    "execute",
+    "parse_signals",
+    "persona_terms",
+    "rank_trends",
+    "resource_uri",
+    "shared_cache",
+    "shared_index",
+    "tokenize",
+    "top_k",
+    "trend_id",
+]
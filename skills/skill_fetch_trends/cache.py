@@ -0,0 +1,153 @@
+"""
+TTL + LRU cache for raw trend signals, with single-flight fetches.
+
+Entries hold the *unranked* signals one MCP Resource returned for a
+``(source, time_window_hours, query)`` key. They are shared by every agent
+and campaign that asks for the same key; persona ranking always runs
+afterwards, per invocation, so no agent's relevance scores leak into another
+agent's results (specs/_meta.md memory isolation).
+
+Concurrent misses for one key are coalesced by a
+:class:`~chimera.asyncutil.SingleFlight`: the first caller starts the fetch
+and later callers await the same result, so N simultaneous invocations
+cost one Resource read.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from chimera.asyncutil import SingleFlight
+from chimera.metrics import counter
+
+T = TypeVar("T")
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+CACHE_HITS = counter(
+    "skill_fetch_trends_cache_hits",
+    "Trend fetches served from cache",
+    labelnames=("source",),
+)
+CACHE_MISSES = counter(
+    "skill_fetch_trends_cache_misses",
+    "Trend fetches that read the MCP Resource",
+    labelnames=("source",),
+)
+CACHE_COALESCED = counter(
+    "skill_fetch_trends_cache_coalesced",
+    "Trend fetches that joined an in-flight read of the same key",
+    labelnames=("source",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheKey:
+    source: str
+    time_window_hours: int
+    query: str
+    language: str = "en"
+    geo_region: str | None = None
+
+    @classmethod
+    def build(
+        cls,
+        source: str,
+        time_window_hours: int,
+        query: str = "",
+        *,
+        language: str = "en",
+        geo_region: str | None = None,
+    ) -> CacheKey:
+        """Normalize case and whitespace so equivalent queries share an entry."""
+        return cls(
+            source=source.strip().lower(),
+            time_window_hours=time_window_hours,
+            query=" ".join(query.casefold().split()),
+            language=language.strip().lower(),
+            geo_region=geo_region.strip().upper() if geo_region else None,
+        )
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class TrendCache(Generic[T]):
+    """Async TTL/LRU cache keyed by :class:`CacheKey`.
+
+    Cached values are shared between callers and must be treated as
+    read-only; store immutable values (tuples of frozen records).
+    Failed fetches are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, tuple[float, T]] = OrderedDict()
+        self._inflight: SingleFlight[CacheKey, T] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> T | None:
+        """Return a fresh entry (refreshing its LRU position) or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: CacheKey, value: T) -> None:
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: CacheKey | None = None) -> None:
+        """Drop one key, or every entry when ``key`` is ``None``."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: CacheKey, fetch: Callable[[], Awaitable[T]]) -> T:
+        value = self.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            CACHE_HITS.inc(source=key.source)
+            return value
+        if key in self._inflight:
+            self.stats.coalesced += 1
+            CACHE_COALESCED.inc(source=key.source)
+        else:
+            self.stats.misses += 1
+            CACHE_MISSES.inc(source=key.source)
+        return await self._inflight.run(key, lambda: self._fetch(key, fetch))
+
+    async def _fetch(self, key: CacheKey, fetch: Callable[[], Awaitable[T]]) -> T:
+        value = await fetch()
+        self.put(key, value)
+        return value
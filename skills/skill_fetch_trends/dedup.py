@@ -0,0 +1,209 @@
+"""
+Near-duplicate trend clustering with MinHash and locality-sensitive hashing.
+
+Sources phrase the same trend differently ("AI regulation debate",
+"#AIRegulation"). Each distinct topic string is reduced to a MinHash
+signature over character 3-grams of its alphanumeric form, and the
+signature's bands are looked up in an LSH table to find existing clusters
+with an estimated Jaccard similarity of at least ``threshold``. Matching
+topics join that cluster; others start a new one.
+
+:class:`TrendIndex` persists across invocations. Topics it has seen map
+straight to their cluster without rehashing, so a steady stream of polls
+only pays for genuinely new topic strings, and a cluster keeps the same
+``trend_id`` for as long as it stays in the index. Clusters not seen for
+``ttl`` seconds are dropped.
+
+New topics compare against each cluster's first (representative) signature
+only, which keeps clusters from chaining into one another.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import zlib
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_INDEX_TTL = 48 * 3600.0
+SHINGLE_SIZE = 3
+SIGNATURE_BATCH = 1024
+
+_PRIME = (1 << 31) - 1
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def shingles(topic: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Character n-grams of the topic with case, spaces and punctuation removed."""
+    text = _NON_ALNUM.sub("", topic.casefold())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """Universal-hash MinHash: ``min((a * x + b) mod p)`` per permutation."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, *, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)[:, None]
+
+    def signatures(self, topics: Sequence[str]) -> npt.NDArray[np.uint32]:
+        """Signatures for many topics at once, shape ``(len(topics), num_perm)``.
+
+        Topics with no alphanumeric characters get an all-``p`` signature,
+        which never matches a real topic.
+        """
+        sets = [sorted(shingles(topic)) for topic in topics]
+        counts = np.fromiter(map(len, sets), dtype=np.intp, count=len(sets))
+        result = np.full((len(sets), self.num_perm), _PRIME, dtype=np.uint32)
+        present = np.flatnonzero(counts)
+        if present.size == 0:
+            return result
+        values = np.fromiter(
+            (zlib.crc32(s.encode()) for grams in sets for s in grams),
+            dtype=np.uint64,
+        )
+        hashed = (self._a * values + self._b) % _PRIME
+        starts = np.concatenate(([0], np.cumsum(counts[present])[:-1]))
+        result[present] = np.minimum.reduceat(hashed, starts, axis=1).T
+        return result
+
+
+@dataclass(slots=True)
+class TrendCluster:
+    """One group of near-duplicate topics tracked by :class:`TrendIndex`."""
+
+    cluster_id: int
+    topic: str
+    signature: npt.NDArray[np.uint32]
+    first_seen: float
+    last_seen: float
+    topics: set[str] = field(default_factory=set)
+
+    @property
+    def detected_at(self) -> str:
+        return (
+            datetime.fromtimestamp(self.first_seen, UTC)
+            .replace(microsecond=0)
+            .isoformat()
+        )
+
+
+@dataclass(slots=True)
+class IndexStats:
+    topics_hashed: int = 0
+    clusters_created: int = 0
+    merged: int = 0
+    expired: int = 0
+
+
+class TrendIndex:
+    """Rolling MinHash/LSH index of trend clusters, shared across invocations."""
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float = DEFAULT_INDEX_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = IndexStats()
+        self.clusters: dict[int, TrendCluster] = {}
+        self._by_topic: dict[str, int] = {}
+        self._buckets: dict[tuple[int, bytes], list[int]] = {}
+        self._next_id = 0
+        self._next_sweep = clock() + ttl / 4
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def assign(self, topics: Iterable[str]) -> list[int]:
+        """Cluster id for each topic, creating clusters for new trends."""
+        topics = list(topics)
+        now = self.clock()
+        if now >= self._next_sweep:
+            self.expire(now)
+        unseen = list(dict.fromkeys(t for t in topics if t not in self._by_topic))
+        self.stats.topics_hashed += len(unseen)
+        for start in range(0, len(unseen), SIGNATURE_BATCH):
+            batch = unseen[start : start + SIGNATURE_BATCH]
+            signatures = self.hasher.signatures(batch)
+            for topic, signature in zip(batch, signatures, strict=True):
+                self._by_topic[topic] = self._place(topic, signature, now)
+        ids = [self._by_topic[topic] for topic in topics]
+        for cluster_id in set(ids):
+            self.clusters[cluster_id].last_seen = now
+        return ids
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop clusters not seen within ``ttl``; returns how many were dropped."""
+        now = self.clock() if now is None else now
+        stale = [c for c in self.clusters.values() if now - c.last_seen >= self.ttl]
+        for cluster in stale:
+            del self.clusters[cluster.cluster_id]
+            for topic in cluster.topics:
+                self._by_topic.pop(topic, None)
+            for key in self._band_keys(cluster.signature):
+                members = self._buckets.get(key)
+                if members is not None and cluster.cluster_id in members:
+                    members.remove(cluster.cluster_id)
+                    if not members:
+                        del self._buckets[key]
+        self.stats.expired += len(stale)
+        self._next_sweep = now + self.ttl / 4
+        return len(stale)
+
+    def similarity(self, a: npt.NDArray[np.uint32], b: npt.NDArray[np.uint32]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    def _place(self, topic: str, signature: npt.NDArray[np.uint32], now: float) -> int:
+        # Topics without alphanumerics have no shingles and never merge.
+        keys = self._band_keys(signature) if signature[0] != _PRIME else []
+        candidates = {cid for key in keys for cid in self._buckets.get(key, ())}
+        best, best_score = None, self.threshold
+        for cluster_id in sorted(candidates):
+            score = self.similarity(signature, self.clusters[cluster_id].signature)
+            if score >= best_score:
+                best, best_score = cluster_id, score
+        if best is not None:
+            self.clusters[best].topics.add(topic)
+            self.stats.merged += 1
+            return best
+        cluster_id = self._next_id
+        self._next_id += 1
+        self.clusters[cluster_id] = TrendCluster(
+            cluster_id, topic, signature, now, now, {topic}
+        )
+        for key in keys:
+            self._buckets.setdefault(key, []).append(cluster_id)
+        self.stats.clusters_created += 1
+        return cluster_id
+
+    def _band_keys(self, signature: npt.NDArray[np.uint32]) -> list[tuple[int, bytes]]:
+        rows = self.rows
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self.bands)
+        ]
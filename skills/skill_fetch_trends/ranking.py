@@ -0,0 +1,215 @@
+"""
+Topic grouping and top-k trend ranking over streams of signals.
+
+Signals are consumed in fixed-size chunks. Topics are grouped by their
+normalized text or, given a :class:`~.dedup.TrendIndex`, by near-duplicate
+cluster, so "AI regulation debate" and "#AIRegulation" pool their volume,
+sources and samples into one trend. Per-topic aggregates (volume,
+source set, sentiment counts, best relevance) live in NumPy columns indexed
+by group id and are updated with ``bincount``/``ufunc.at`` once per chunk,
+so memory grows with distinct topics rather than with signals. Only the
+``max_trends`` winners are materialized as TrendObject dicts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import re
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .dedup import TrendCluster, TrendIndex
+from .scoring import DEFAULT_CHUNK_SIZE, RelevanceScorer, top_k
+from .signals import SENTIMENTS, Signal
+
+MAX_SAMPLE_POSTS = 3
+
+_SENTIMENT_CODES = {name: code for code, name in enumerate(SENTIMENTS)}
+_NEUTRAL = _SENTIMENT_CODES["neutral"]
+_SLUG_TOKEN = re.compile(r"[a-z0-9]+")
+_topic = attrgetter("topic")
+_source = attrgetter("source")
+_volume = attrgetter("volume")
+_sentiment = attrgetter("sentiment")
+_scored_text = "{0.topic} {0.text}".format
+
+
+class TopicGroups:
+    """Columnar per-topic aggregates, fed one chunk of signals at a time."""
+
+    def __init__(self, index: TrendIndex | None = None) -> None:
+        self.index = index
+        self._by_topic: dict[str, int] = {}
+        self._by_key: dict[str | int, int] = {}
+        self.clusters: list[TrendCluster | None] = []
+        self._source_ids: dict[str, int] = {}
+        self.sources: list[str] = []
+        self.topics: list[str] = []
+        self.samples: list[list[str]] = []
+        self.volume = np.zeros(0, dtype=np.int64)
+        self.topic_volume = np.zeros(0, dtype=np.int64)
+        self.source_mask = np.zeros(0, dtype=np.uint64)
+        self.sentiments = np.zeros((0, len(SENTIMENTS)), dtype=np.int64)
+        self.relevance = np.zeros(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def add(self, chunk: Sequence[Signal], relevance: npt.NDArray[np.float32]) -> None:
+        """Fold one chunk of signals and their relevance scores into the groups."""
+        gids = self._group_ids(list(map(_topic, chunk)))
+        self._grow()
+        volumes = np.fromiter(map(_volume, chunk), dtype=np.int64, count=len(chunk))
+        size = len(self)
+        self.volume += np.bincount(gids, weights=volumes, minlength=size).astype(
+            np.int64
+        )
+        codes = np.frombuffer(
+            bytes(
+                map(
+                    _SENTIMENT_CODES.get,
+                    map(_sentiment, chunk),
+                    itertools.repeat(_NEUTRAL),
+                )
+            ),
+            dtype=np.uint8,
+        ).astype(np.intp)
+        self.sentiments += np.bincount(
+            gids * len(SENTIMENTS) + codes, minlength=size * len(SENTIMENTS)
+        ).reshape(size, len(SENTIMENTS))
+        sids = self._ids(list(map(_source, chunk)), self._source_ids, self._new_source)
+        np.bitwise_or.at(
+            self.source_mask, gids, np.left_shift(np.uint64(1), sids.astype(np.uint64))
+        )
+        np.maximum.at(self.relevance, gids, relevance)
+
+        # Per-signal Python work only for groups that still need samples or
+        # whose display topic may change; both sets shrink as groups fill.
+        needy = np.flatnonzero(
+            (self._sample_counts()[gids] < MAX_SAMPLE_POSTS)
+            | (volumes > self.topic_volume[gids])
+        )
+        for i in needy.tolist():
+            gid, signal = int(gids[i]), chunk[i]
+            if len(self.samples[gid]) < MAX_SAMPLE_POSTS:
+                self.samples[gid].append(signal.text)
+            if signal.volume > self.topic_volume[gid]:
+                self.topics[gid] = signal.topic
+                self.topic_volume[gid] = signal.volume
+
+    def top(self, k: int) -> npt.NDArray[np.intp]:
+        return top_k(self.relevance, k, tiebreak=self.volume)
+
+    def trend(self, gid: int, detected_at: str) -> dict[str, Any]:
+        mask = int(self.source_mask[gid])
+        cluster = self.clusters[gid]
+        if cluster is not None:
+            # Stable across polls for as long as the cluster stays indexed.
+            detected_at = cluster.detected_at
+        topic_id = cluster.topic if cluster is not None else self.topics[gid]
+        return {
+            "trend_id": trend_id(topic_id, detected_at),
+            "topic": self.topics[gid],
+            "relevance_score": round(float(self.relevance[gid]), 4),
+            "volume": int(self.volume[gid]),
+            "sentiment": SENTIMENTS[int(np.argmax(self.sentiments[gid]))],
+            "sources": sorted(
+                name for sid, name in enumerate(self.sources) if mask >> sid & 1
+            ),
+            "sample_posts": list(self.samples[gid]),
+            "detected_at": detected_at,
+        }
+
+    def _ids(
+        self,
+        names: list[str],
+        index: dict[str, int],
+        create: Callable[[str], int],
+    ) -> npt.NDArray[np.intp]:
+        ids = list(map(index.get, names, itertools.repeat(-1)))
+        for i, found in enumerate(ids):
+            if found < 0:
+                # Re-check: an earlier name in this chunk may have created it.
+                ids[i] = index[names[i]] if names[i] in index else create(names[i])
+        return np.array(ids, dtype=np.intp)
+
+    def _group_ids(self, topics: list[str]) -> npt.NDArray[np.intp]:
+        ids = list(map(self._by_topic.get, topics, itertools.repeat(-1)))
+        new = list(
+            dict.fromkeys(t for t, gid in zip(topics, ids, strict=True) if gid < 0)
+        )
+        if new:
+            keys: Sequence[str | int]
+            if self.index is None:
+                keys = [" ".join(topic.casefold().split()) for topic in new]
+            else:
+                keys = self.index.assign(new)
+            for topic, key in zip(new, keys, strict=True):
+                gid = self._by_key.get(key)
+                if gid is None:
+                    gid = self._by_key[key] = len(self.topics)
+                    self.topics.append(topic)
+                    self.samples.append([])
+                    self.clusters.append(
+                        None if self.index is None else self.index.clusters[int(key)]
+                    )
+                self._by_topic[topic] = gid
+            ids = [self._by_topic[topic] for topic in topics]
+        return np.array(ids, dtype=np.intp)
+
+    def _new_source(self, source: str) -> int:
+        if len(self.sources) == 64:
+            raise ValueError("TopicGroups supports at most 64 distinct sources")
+        sid = self._source_ids[source] = len(self.sources)
+        self.sources.append(source)
+        return sid
+
+    def _grow(self) -> None:
+        extra = len(self) - len(self.volume)
+        if extra <= 0:
+            return
+        self.volume = np.pad(self.volume, (0, extra))
+        self.topic_volume = np.pad(self.topic_volume, (0, extra))
+        self.source_mask = np.pad(self.source_mask, (0, extra))
+        self.sentiments = np.pad(self.sentiments, ((0, extra), (0, 0)))
+        self.relevance = np.pad(self.relevance, (0, extra))
+
+    def _sample_counts(self) -> npt.NDArray[np.intp]:
+        return np.fromiter(map(len, self.samples), dtype=np.intp, count=len(self))
+
+
+def rank_trends(
+    signals: Iterable[Signal],
+    terms: set[str],
+    *,
+    max_trends: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    index: TrendIndex | None = None,
+) -> list[dict[str, Any]]:
+    """Group signals by topic and return the top ``max_trends`` TrendObjects.
+
+    A group's relevance is that of its most relevant signal; ties go to the
+    higher total volume. With ``index``, near-duplicate topics share a group
+    and a stable ``trend_id``.
+    """
+    scorer = RelevanceScorer(terms)
+    groups = TopicGroups(index)
+    iterator = iter(signals)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        groups.add(chunk, scorer.score(list(map(_scored_text, chunk))))
+    detected_at = datetime.now(UTC).replace(microsecond=0).isoformat()
+    return [groups.trend(int(gid), detected_at) for gid in groups.top(max_trends)]
+
+
+def trend_id(topic: str, detected_at: str) -> str:
+    """``<topic-slug>-<timestamp>``, per README §4 (hash of topic + timestamp)."""
+    slug = "-".join(_SLUG_TOKEN.findall(topic.casefold()))[:64]
+    if not slug:
+        slug = hashlib.sha1(topic.encode()).hexdigest()[:12]
+    return f"{slug}-{detected_at}"
@@ -0,0 +1,120 @@
+"""
+Vectorized relevance scoring and top-k selection for trend signals.
+
+A fetch can return hundreds of thousands of signals that reduce to
+``max_trends`` TrendObjects, so scoring is the skill's CPU hot path. Instead
+of tokenizing and intersecting a set per signal, each chunk is scored in a
+few bulk operations:
+
+1. Join the chunk's texts around a NUL separator (``parse_signals`` strips
+   NUL from untrusted input), map every byte outside ``[a-z0-9]`` to a space
+   with ``bytes.translate`` and ``split()`` once.
+2. Classify every token with one C-level ``map`` over a small dict (persona
+   term / stopword / separator / other word) into a ``uint8`` array.
+3. Count words and matches per signal with ``np.bincount`` over the
+   separator-derived signal index.
+
+Relevance is ``hits / sqrt(words * terms)``: a signal's persona-term
+occurrences over the geometric mean of its non-stopword count and the
+persona's term count, clipped to ``[0, 1]``. It is the cosine between the
+signal's word counts and the persona's binary term vector when no word
+repeats. A repeated word raises the score above that cosine, since only
+``words`` and not the sum of squared counts enters the norm. The upper
+bound needs only the two ``bincount`` results. Selection uses
+``np.partition`` (O(n)) and sorts only the k winners.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_CHUNK_SIZE = 16_384
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to with"
+    " when what about new".split()
+)
+
+_SEPARATOR = " \x00 "
+_WORD_BYTES = b"abcdefghijklmnopqrstuvwxyz0123456789\x00"
+_TO_SPACE = bytes(c if c in _WORD_BYTES else 0x20 for c in range(256))
+
+# Token classes; ordinary words and persona terms sort below the others.
+_WORD, _TERM, _STOPWORD, _BOUNDARY = range(4)
+
+
+class RelevanceScorer:
+    """Scores batches of texts against one agent's persona terms.
+
+    Build one per invocation; it holds only that agent's terms.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms = frozenset(terms) - STOPWORDS
+        self._classes = {word.encode(): _STOPWORD for word in STOPWORDS}
+        self._classes.update((term.casefold().encode(), _TERM) for term in self.terms)
+        self._classes[b"\x00"] = _BOUNDARY
+        self._norm = np.sqrt(max(len(self.terms), 1))
+
+    def score(self, texts: Sequence[str]) -> npt.NDArray[np.float32]:
+        """Relevance in ``[0, 1]`` for each text, as one vectorized pass.
+
+        Texts must not contain NUL characters.
+        """
+        count = len(texts)
+        if count == 0 or not self.terms:
+            return np.zeros(count, dtype=np.float32)
+        raw = _SEPARATOR.join(texts).casefold().encode()
+        tokens = raw.translate(_TO_SPACE).split()
+        classes = np.frombuffer(
+            bytes(map(self._classes.get, tokens, itertools.repeat(_WORD))),
+            dtype=np.uint8,
+        )
+        doc = np.cumsum(classes == _BOUNDARY)
+        words = classes <= _TERM
+        matches = classes == _TERM
+        lengths = np.bincount(doc[words], minlength=count)
+        hits = np.bincount(doc[matches], minlength=count)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = hits / (np.sqrt(lengths) * self._norm)
+        clipped: npt.NDArray[np.float32] = np.clip(
+            np.nan_to_num(scores), 0.0, 1.0
+        ).astype(np.float32)
+        return clipped
+
+
+def top_k(
+    scores: npt.NDArray[np.floating],
+    k: int,
+    *,
+    tiebreak: npt.NDArray[np.number] | None = None,
+) -> npt.NDArray[np.intp]:
+    """Indices of the ``k`` highest scores, best first.
+
+    Partial selection is O(n); only the winners are sorted, O(k log k).
+    Equal scores are ordered by ``tiebreak`` (higher first), e.g. volume.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)
+        need = k - len(above)
+        if tiebreak is not None and len(ties) > need:
+            ties = ties[np.argpartition(-tiebreak[ties], need - 1)[:need]]
+        else:
+            ties = ties[:need]
+        index = np.concatenate([above, ties])
+    else:
+        index = np.arange(n)
+    if tiebreak is None:
+        order = np.argsort(-scores[index], kind="stable")
+    else:
+        order = np.lexsort((-tiebreak[index], -scores[index]))
+    return index[order]
@@ -0,0 +1,104 @@
+"""
+Trend signal records and the untrusted-input boundary (README §10).
+
+MCP Resource payloads are external data. :func:`parse_signals` is the only
+place they enter the skill: it keeps known fields, strips control
+characters (including the NUL byte the scorer uses as a separator), caps
+lengths, and coerces ``volume``/``sentiment`` to valid values.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .scoring import STOPWORDS
+
+SENTIMENTS = ("positive", "neutral", "negative")
+MAX_TOPIC_CHARS = 200
+MAX_TEXT_CHARS = 1000
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True, slots=True)
+class Signal:
+    """One sanitized trend signal from a single MCP Resource."""
+
+    topic: str
+    text: str
+    source: str
+    volume: int = 1
+    sentiment: str = "neutral"
+
+
+def parse_signals(payload: Any, source: str) -> list[Signal]:
+    """Turn an untrusted Resource payload into sanitized :class:`Signal` records.
+
+    Accepts ``{"signals": [...]}`` directly or an MCP ``ReadResourceResult``
+    whose text contents hold that JSON. Malformed items are dropped.
+    """
+    items: list[Any] = []
+    if isinstance(payload, Mapping):
+        if isinstance(payload.get("signals"), list):
+            items.extend(payload["signals"])
+        for content in payload.get("contents") or []:
+            text = content.get("text") if isinstance(content, Mapping) else None
+            if not isinstance(text, str):
+                continue
+            try:
+                decoded = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(decoded, Mapping):
+                decoded = decoded.get("signals")
+            if isinstance(decoded, list):
+                items.extend(decoded)
+
+    signals = []
+    for item in items:
+        if not isinstance(item, Mapping):
+            continue
+        topic = _clean(item.get("topic"), MAX_TOPIC_CHARS)
+        if not topic:
+            continue
+        text = _clean(item.get("text") or item.get("headline"), MAX_TEXT_CHARS)
+        volume = item.get("volume", 1)
+        sentiment = item.get("sentiment")
+        signals.append(
+            Signal(
+                topic=topic,
+                text=text or topic,
+                source=source,
+                volume=volume if isinstance(volume, int) and volume > 0 else 1,
+                sentiment=sentiment if sentiment in SENTIMENTS else "neutral",
+            )
+        )
+    return signals
+
+
+def tokenize(text: str) -> set[str]:
+    return {t for t in _TOKEN.findall(text.casefold()) if t not in STOPWORDS}
+
+
+def persona_terms(
+    persona_constraints: Mapping[str, Any], campaign_goal: str | None = None
+) -> set[str]:
+    """Terms an agent cares about: voice traits, directives and campaign goal."""
+    parts: list[str] = []
+    for field in ("voice_traits", "directives"):
+        value = persona_constraints.get(field) or []
+        parts.extend(str(v) for v in value)
+    if campaign_goal:
+        parts.append(campaign_goal)
+    return tokenize(" ".join(parts))
+
+
+def _clean(value: Any, limit: int) -> str:
+    if not isinstance(value, str):
+        return ""
+    return _CONTROL_CHARS.sub("", value).strip()[:limit]
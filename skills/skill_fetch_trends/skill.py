@@ -0,0 +1,233 @@
+"""
+skill_fetch_trends execution pipeline (skills/skill_fetch_trends/README.md).
+
+1. Read one MCP Resource per platform, concurrently, through the shared
+   :class:`~skills.skill_fetch_trends.cache.TrendCache`.
+2. Sanitize the untrusted payloads into :class:`Signal` records.
+3. Cluster near-duplicate topics with the shared rolling
+   :class:`~skills.skill_fetch_trends.dedup.TrendIndex`.
+4. Rank the clusters against *this* agent's persona and campaign goal
+   (:mod:`.ranking`, :mod:`.scoring`).
+
+Steps 1 and 3 share state between invocations (raw signals and topic
+clusters, neither agent-specific); relevance scoring is always per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from chimera.audit import AuditSink, SkillAuditor
+from chimera.metrics import counter
+
+from .cache import CacheKey, TrendCache
+from .dedup import TrendIndex
+from .ranking import rank_trends
+from .signals import Signal, parse_signals, persona_terms
+
+SKILL_TIMEOUT_SECONDS = 10.0
+DEFAULT_PLATFORMS = ("twitter", "news")
+INACTIVE_CAMPAIGN_STATUSES = frozenset({"cancelled", "completed"})
+
+SUCCESS_RATE = counter(
+    "skill_fetch_trends_success_rate",
+    "Invocations by outcome",
+    labelnames=("status",),
+)
+MCP_FAILURES = counter(
+    "skill_fetch_trends_mcp_failures",
+    "MCP Resource reads that failed",
+    labelnames=("resource",),
+)
+
+_SHARED_CACHE: TrendCache[tuple[Signal, ...]] = TrendCache()
+_SHARED_INDEX = TrendIndex()
+
+
+def shared_cache() -> TrendCache[tuple[Signal, ...]]:
+    """Process-wide cache shared by every invocation that does not pass one."""
+    return _SHARED_CACHE
+
+
+def shared_index() -> TrendIndex:
+    """Process-wide trend cluster index shared by every invocation."""
+    return _SHARED_INDEX
+
+
+def resource_uri(
+    platform: str,
+    query: str,
+    *,
+    time_window_hours: int,
+    language: str,
+    geo_region: str | None,
+) -> str:
+    """Build the §8.2 Resource URI for one platform."""
+    topic = "-".join(query.casefold().split()) or "all"
+    if platform == "news":
+        path = f"{geo_region.upper()}/{topic}" if geo_region else f"{topic}/latest"
+    else:
+        path = f"trends/{topic}"
+    return f"{platform}://{path}?window_hours={time_window_hours}&lang={language}"
+
+
+async def execute(
+    mcp: Any,
+    *,
+    correlation_id: str,
+    agent_id: str,
+    campaign_id: str,
+    persona_constraints: Mapping[str, Any],
+    time_window_hours: int = 24,
+    max_trends: int = 10,
+    platforms: Sequence[str] = DEFAULT_PLATFORMS,
+    language: str = "en",
+    geo_region: str | None = None,
+    query: str = "",
+    campaign_goal: str | None = None,
+    campaign_status: str | None = None,
+    cache: TrendCache[tuple[Signal, ...]] | None = None,
+    index: TrendIndex | None = None,
+    audit: AuditSink | None = None,
+) -> dict[str, Any]:
+    """Fetch, rank and return trends per the README §3/§4 contract.
+
+    ``mcp`` is any client exposing ``read_resource(uri)`` (sync or async),
+    normally a :class:`chimera.mcp.ClientPool`. ``cache`` defaults to
+    :func:`shared_cache` and ``index`` to :func:`shared_index`; pass
+    private instances to isolate callers.
+    """
+    start = time.perf_counter()
+    cache = cache if cache is not None else shared_cache()
+    index = index if index is not None else shared_index()
+    emit = SkillAuditor(audit, correlation_id, actor="skill_fetch_trends")
+    emit(
+        "skill.fetch_trends.start",
+        {"agent_id": agent_id, "campaign_id": campaign_id},
+    )
+
+    def finish(output: dict[str, Any]) -> dict[str, Any]:
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        output["metadata"]["execution_duration_ms"] = duration_ms
+        output["metadata"]["correlation_id"] = correlation_id
+        SUCCESS_RATE.inc(status=output["status"])
+        emit(
+            "skill.fetch_trends.complete",
+            {
+                "status": output["status"],
+                "trends_count": len(output.get("trends", [])),
+                "duration_ms": duration_ms,
+            },
+        )
+        return output
+
+    if not isinstance(persona_constraints, Mapping):
+        return finish(
+            _failure("INVALID_PERSONA", "persona_constraints must be a mapping")
+        )
+    if campaign_status in INACTIVE_CAMPAIGN_STATUSES:
+        return finish(_failure("CAMPAIGN_INACTIVE", f"Campaign is {campaign_status}"))
+    if not platforms:
+        return finish(_failure("NO_MCP_RESOURCES", "No MCP Resources configured"))
+
+    async def fetch(platform: str) -> tuple[Signal, ...]:
+        uri = resource_uri(
+            platform,
+            query,
+            time_window_hours=time_window_hours,
+            language=language,
+            geo_region=geo_region,
+        )
+        key = CacheKey.build(
+            platform,
+            time_window_hours,
+            query,
+            language=language,
+            geo_region=geo_region,
+        )
+
+        async def read() -> tuple[Signal, ...]:
+            emit(
+                "skill.fetch_trends.mcp_query",
+                {"resource_name": platform, "query_params": {"uri": uri}},
+            )
+            payload = mcp.read_resource(uri)
+            if inspect.isawaitable(payload):
+                payload = await payload
+            return tuple(parse_signals(payload, platform))
+
+        return await cache.get_or_fetch(key, read)
+
+    try:
+        async with asyncio.timeout(SKILL_TIMEOUT_SECONDS):
+            results = await asyncio.gather(
+                *(fetch(platform) for platform in platforms), return_exceptions=True
+            )
+    except TimeoutError:
+        return finish(
+            _failure(
+                "TIMEOUT",
+                f"Execution exceeded {SKILL_TIMEOUT_SECONDS:g} seconds",
+                sources_queried=list(platforms),
+            )
+        )
+
+    signals: list[Signal] = []
+    failed: list[str] = []
+    for platform, result in zip(platforms, results, strict=True):
+        if isinstance(result, BaseException):
+            failed.append(platform)
+            MCP_FAILURES.inc(resource=platform)
+        else:
+            signals.extend(result)
+    if len(failed) == len(platforms):
+        return finish(
+            _failure(
+                "MCP_RESOURCE_UNAVAILABLE",
+                "All configured MCP Resources failed to respond",
+                sources_queried=list(platforms),
+                sources_failed=failed,
+            )
+        )
+
+    trends = rank_trends(
+        signals,
+        persona_terms(persona_constraints, campaign_goal),
+        max_trends=max_trends,
+        index=index,
+    )
+    return finish(
+        {
+            "status": "success",
+            "trends": trends,
+            "metadata": {
+                "sources_queried": [p for p in platforms if p not in failed],
+                "sources_failed": failed,
+                "total_signals_processed": len(signals),
+            },
+        }
+    )
+
+
+def _failure(
+    error_code: str,
+    message: str,
+    *,
+    sources_queried: list[str] | None = None,
+    sources_failed: list[str] | None = None,
+) -> dict[str, Any]:
+    retryable = error_code in {"MCP_RESOURCE_UNAVAILABLE", "MCP_RATE_LIMIT", "TIMEOUT"}
+    return {
+        "status": "failure",
+        "error_code": error_code,
+        "error_message": message,
+        "retry_eligible": retryable,
+        "metadata": {
+            "sources_queried": sources_queried or [],
+            "sources_failed": sources_failed or [],
+        },
+    }
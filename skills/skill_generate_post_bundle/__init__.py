@@ -0,0 +1,39 @@
+"""
+skill_generate_post_bundle: content generation layer.
+
+Contract: skills/skill_generate_post_bundle/README.md. Builds one persona-
+and trend-aware base prompt, then runs the bundle as a dependency graph:
+per-platform text variants run concurrently through ``text_completion``
+while media generation starts speculatively from the base prompt, with one
+asset shared by every platform of the same aspect ratio.
+"""
+
+from .dag import GraphRun, Node, TaskGraph
+from .skill import (
+    PLATFORM_SPECS,
+    PROMPT_TEMPLATE,
+    BundleError,
+    PlatformSpec,
+    build_prompt,
+    execute,
+    fit_to_limit,
+    media_prompt,
+    persona_identity,
+    platform_spec,
+)
+
+__all__ = [
+    "PLATFORM_SPECS",
+    "PROMPT_TEMPLATE",
+    "BundleError",
+    "GraphRun",
+    "Node",
+    "PlatformSpec",
+    "TaskGraph",
+    "build_prompt",
+    "execute",
+    "fit_to_limit",
+    "media_prompt",
+    "persona_identity",
+    "platform_spec",
+]
@@ -0,0 +1,130 @@
+"""
+Dependency-graph executor for one bundle's generation steps.
+
+Each node is an async function of its dependencies' results. A node starts
+as soon as every dependency has finished, so independent branches (the
+per-platform text variants, the media generations) run concurrently and
+the bundle takes as long as its critical path rather than the sum of its
+calls.
+
+Nodes are *required* or *optional*. A failed optional node hands ``None``
+to its dependents, which fall back (a variant without media). A failed
+required node cancels every node still pending or running and its error is
+raised from :meth:`TaskGraph.run`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+NodeFn = Callable[[Mapping[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    name: str
+    fn: NodeFn
+    after: tuple[str, ...] = ()
+    optional: bool = False
+
+
+@dataclass(slots=True)
+class GraphRun:
+    """Outcome of :meth:`TaskGraph.run`, filled in as nodes settle."""
+
+    results: dict[str, Any] = field(default_factory=dict)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    cancelled: list[str] = field(default_factory=list)
+
+
+class TaskGraph:
+    """A DAG of async steps; nodes must be added after their dependencies."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, Node] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._nodes
+
+    def add(
+        self,
+        name: str,
+        fn: NodeFn,
+        *,
+        after: Sequence[str] = (),
+        optional: bool = False,
+    ) -> None:
+        if name in self._nodes:
+            raise ValueError(f"Duplicate node {name!r}")
+        missing = [dep for dep in after if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"Node {name!r} depends on unknown nodes {missing}")
+        self._nodes[name] = Node(name, fn, tuple(after), optional)
+
+    async def run(self, outcome: GraphRun | None = None) -> GraphRun:
+        """Run every node; raises the first required node's error.
+
+        Pass ``outcome`` to keep what had settled when the run failed or
+        was cancelled (partial output).
+        """
+        outcome = outcome if outcome is not None else GraphRun()
+        tasks: dict[str, asyncio.Task[Any]] = {}
+        try:
+            async with asyncio.TaskGroup() as group:
+                for node in self._nodes.values():
+                    deps = {dep: tasks[dep] for dep in node.after}
+                    tasks[node.name] = group.create_task(
+                        self._run_node(node, deps, outcome), name=node.name
+                    )
+        except BaseExceptionGroup as errors:
+            raise _first_cause(errors) from None
+        finally:
+            outcome.cancelled.extend(
+                name for name, task in tasks.items() if task.cancelled()
+            )
+        return outcome
+
+    async def _run_node(
+        self,
+        node: Node,
+        deps: Mapping[str, asyncio.Task[Any]],
+        outcome: GraphRun,
+    ) -> Any:
+        try:
+            inputs = {name: await task for name, task in deps.items()}
+        except _NodeFailed:
+            # A required dependency failed: this node will never run.
+            raise asyncio.CancelledError from None
+        try:
+            result = await node.fn(inputs)
+        except Exception as exc:
+            outcome.failed[node.name] = exc
+            if not node.optional:
+                raise _NodeFailed(exc) from exc
+            result = None
+        else:
+            outcome.results[node.name] = result
+        return result
+
+
+class _NodeFailed(Exception):
+    """Wraps a required node's error; dependents see it and stand down."""
+
+    def __init__(self, cause: Exception) -> None:
+        super().__init__(str(cause))
+        self.cause = cause
+
+
+def _first_cause(errors: BaseExceptionGroup[BaseException]) -> BaseException:
+    for error in errors.exceptions:
+        if isinstance(error, BaseExceptionGroup):
+            return _first_cause(error)
+        if isinstance(error, _NodeFailed):
+            return error.cause
+    return errors.exceptions[0]
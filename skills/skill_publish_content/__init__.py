@@ -0,0 +1,28 @@
+"""
+skill_publish_content: execution layer for approved content bundles.
+
+Contract: skills/skill_publish_content/README.md. Publishes each target
+platform's variant through its MCP Tool, sequentially or in parallel, with
+a per-platform token bucket that absorbs ``rate_limited``/``retry_after``
+responses so one throttled platform never holds up the others.
+"""
+
+from .ratelimit import PlatformLimiters, TokenBucket, backoff_delay
+from .skill import (
+    PublishError,
+    execute,
+    shared_idempotency,
+    shared_limiters,
+    tool_name,
+)
+
+__all__ = [
+    "PlatformLimiters",
+    "PublishError",
+    "TokenBucket",
+    "backoff_delay",
+    "execute",
+    "shared_idempotency",
+    "shared_limiters",
+    "tool_name",
+]
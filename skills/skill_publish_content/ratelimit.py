@@ -0,0 +1,127 @@
+"""
+Per-platform rate limiting for MCP publish tools (specs/technical.md §8.3.4).
+
+Each platform gets its own :class:`TokenBucket`, so a platform that answers
+``rate_limited`` only slows down calls to itself. Throttling responses feed
+the bucket through :meth:`TokenBucket.block`: the server's ``retry_after``
+when it gives one, otherwise an exponential backoff (5s, 10s, 20s per
+README §8). Every caller waiting on that platform then resumes together
+once the window has passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 5
+BACKOFF_BASE_SECONDS = 5.0
+BACKOFF_MAX_SECONDS = 300.0
+
+Sleep = Callable[[float], Awaitable[object]]
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Seconds to wait before retry number ``attempt`` (0-based).
+
+    A server-provided ``retry_after`` wins; otherwise the delay doubles from
+    :data:`BACKOFF_BASE_SECONDS`, capped at :data:`BACKOFF_MAX_SECONDS`.
+    """
+    if retry_after is not None and retry_after >= 0:
+        return float(retry_after)
+    return float(min(BACKOFF_BASE_SECONDS * 2**attempt, BACKOFF_MAX_SECONDS))
+
+
+class TokenBucket:
+    """Async token bucket that can be paused by a ``retry_after`` window.
+
+    ``rate`` tokens per second accrue up to ``burst``. Waiters are served in
+    arrival order.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Wait for one token; returns the seconds spent waiting."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self.clock()
+                self._refill(now)
+                delay = self.blocked_until - now
+                if delay <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+                await self.sleep(delay)
+                waited += delay
+
+    def block(self, seconds: float) -> None:
+        """Hold every caller for ``seconds``, then allow a single request."""
+        now = self.clock()
+        until = max(self.blocked_until, now + seconds)
+        self.blocked_until = until
+        # Refill resumes only once the window ends; one probe may go first.
+        self.tokens = 1.0
+        self._updated = until
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            elapsed = now - self._updated
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+            self._updated = now
+
+
+class PlatformLimiters:
+    """Lazily created :class:`TokenBucket` per platform.
+
+    ``limits`` overrides ``(rate, burst)`` for specific platforms.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        limits: Mapping[str, tuple[float, int]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def __getitem__(self, platform: str) -> TokenBucket:
+        bucket = self._buckets.get(platform)
+        if bucket is None:
+            rate, burst = self.limits.get(platform, (self.rate, self.burst))
+            bucket = self._buckets[platform] = TokenBucket(
+                rate=rate, burst=burst, clock=self.clock, sleep=self.sleep
+            )
+        return bucket
+
+    def __contains__(self, platform: object) -> bool:
+        return platform in self._buckets
@@ -0,0 +1,469 @@
+"""
+skill_publish_content execution pipeline (skills/skill_publish_content/README.md).
+
+1. Verify the bundle carries a Judge or HITL approval record (§6).
+2. Publish each target platform's variant through its MCP Tool, uploading
+   media first. ``publish_strategy="parallel"`` fans out to every platform
+   at once; ``"sequential"`` publishes in order and stops at the first
+   failure when partial success is not allowed.
+3. Each call first takes a token from that platform's
+   :class:`~skills.skill_publish_content.ratelimit.TokenBucket`.
+   ``rate_limited`` and transient failures block only that bucket, for
+   ``retry_after`` or an exponential backoff, before the call is retried.
+4. Record each published outcome in the idempotency store under
+   ``<tool>:<idempotency_key>``; a retry replays it without a platform call.
+5. Emit per-platform audit events and a Publication Record for every post
+   that went live.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from chimera.audit import AuditSink, SkillAuditor
+from chimera.errors import ChimeraError
+from chimera.idempotency import BloomFilter, IdempotencyStore, InMemoryIdempotencyStore
+from chimera.metrics import counter
+
+from .ratelimit import PlatformLimiters, backoff_delay
+
+PLATFORM_TIMEOUT_SECONDS = 10.0
+MAX_RETRIES = 3
+PUBLISH_STRATEGIES = ("sequential", "parallel")
+APPROVERS = frozenset({"judge", "hitl_reviewer"})
+PLATFORM_TOOLS = {
+    "twitter": "post_tweet",
+    "instagram": "post_instagram",
+    "linkedin": "post_linkedin",
+}
+RETRYABLE_ERRORS = frozenset(
+    {
+        "PLATFORM_RATE_LIMIT",
+        "PLATFORM_TRANSIENT_ERROR",
+        "MEDIA_UPLOAD_FAILED",
+        "TIMEOUT",
+    }
+)
+
+SUCCESS_RATE = counter(
+    "skill_publish_content_success_rate",
+    "Invocations by outcome",
+    labelnames=("status",),
+)
+PUBLICATIONS = counter(
+    "skill_publish_content_publications",
+    "Per-platform publication outcomes",
+    labelnames=("platform", "status"),
+)
+RATE_LIMITED = counter(
+    "skill_publish_content_rate_limited",
+    "MCP Tool calls answered with rate_limited",
+    labelnames=("platform",),
+)
+
+RecordSink = Callable[[dict[str, Any]], None]
+
+_SHARED_LIMITERS = PlatformLimiters()
+_SHARED_IDEMPOTENCY = InMemoryIdempotencyStore(bloom=BloomFilter())
+
+
+def shared_limiters() -> PlatformLimiters:
+    """Process-wide per-platform limiters shared by every invocation."""
+    return _SHARED_LIMITERS
+
+
+def shared_idempotency() -> IdempotencyStore:
+    """Process-wide idempotency store used when none is passed."""
+    return _SHARED_IDEMPOTENCY
+
+
+def tool_name(platform: str) -> str:
+    """MCP Tool that publishes to ``platform`` (README §5)."""
+    return PLATFORM_TOOLS.get(platform, f"post_{platform}")
+
+
+class PublishError(ChimeraError):
+    """One platform's publish failed with a README §8 error code."""
+
+    def __init__(self, error_code: str, message: str) -> None:
+        super().__init__(message, retryable=error_code in RETRYABLE_ERRORS)
+        self.error_code = error_code
+
+
+class _Throttled(PublishError):
+    def __init__(self, error_code: str, message: str, retry_after: float | None):
+        super().__init__(error_code, message)
+        self.retry_after = retry_after
+
+
+async def execute(
+    mcp: Any,
+    *,
+    correlation_id: str,
+    task_id: str,
+    agent_id: str,
+    campaign_id: str,
+    content_bundle: Mapping[str, Any],
+    target_platforms: Sequence[str],
+    idempotency_key: str,
+    publish_strategy: str = "sequential",
+    partial_success_allowed: bool = True,
+    dry_run: bool = False,
+    limiters: PlatformLimiters | None = None,
+    idempotency: IdempotencyStore | None = None,
+    max_retries: int = MAX_RETRIES,
+    audit: AuditSink | None = None,
+    records: RecordSink | None = None,
+) -> dict[str, Any]:
+    """Publish an approved bundle per the README §3/§4 contract.
+
+    ``mcp`` is any client exposing ``call_tool(name, params)`` (sync or
+    async), normally a :class:`chimera.mcp.ClientPool`. ``limiters``
+    defaults to :func:`shared_limiters` so concurrent invocations respect
+    the same platform limits. ``idempotency`` (default
+    :func:`shared_idempotency`) records each platform's outcome per
+    ``idempotency_key``; a repeat call replays it without calling the tool.
+    Publication Records go to ``records``.
+    """
+    start = time.perf_counter()
+    limiters = limiters if limiters is not None else shared_limiters()
+    idempotency = idempotency if idempotency is not None else shared_idempotency()
+    emit = SkillAuditor(audit, correlation_id, actor="skill_publish_content")
+    platforms = list(dict.fromkeys(target_platforms))
+    emit(
+        "skill.publish_content.start",
+        {
+            "task_id": task_id,
+            "agent_id": agent_id,
+            "campaign_id": campaign_id,
+            "platforms": platforms,
+        },
+    )
+
+    def finish(output: dict[str, Any]) -> dict[str, Any]:
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        metadata = output.setdefault("metadata", {})
+        metadata["idempotency_key"] = idempotency_key
+        metadata["correlation_id"] = correlation_id
+        metadata["execution_duration_ms"] = duration_ms
+        SUCCESS_RATE.inc(status=output["status"])
+        emit(
+            "skill.publish_content.complete",
+            {
+                "status": output["status"],
+                "successful_platforms": metadata.get("successful_platforms", 0),
+                "failed_platforms": metadata.get("failed_platforms", 0),
+                "duration_ms": duration_ms,
+            },
+        )
+        return output
+
+    approval = content_bundle.get("approval_record")
+    if (
+        not isinstance(approval, Mapping)
+        or approval.get("approved_by") not in APPROVERS
+    ):
+        return finish(
+            _failure(
+                "NO_APPROVAL_RECORD",
+                "Content bundle has no Judge or HITL approval record",
+            )
+        )
+    if publish_strategy not in PUBLISH_STRATEGIES:
+        return finish(
+            _failure("INVALID_INPUT", f"Unknown publish_strategy {publish_strategy!r}")
+        )
+    if not platforms:
+        return finish(_failure("INVALID_INPUT", "target_platforms is empty"))
+
+    variants = {
+        v.get("platform"): v
+        for v in content_bundle.get("variants") or []
+        if isinstance(v, Mapping)
+    }
+
+    async def call(platform: str, name: str, params: dict[str, Any]) -> dict[str, Any]:
+        await limiters[platform].acquire()
+        try:
+            async with asyncio.timeout(PLATFORM_TIMEOUT_SECONDS):
+                response = mcp.call_tool(name, params)
+                if inspect.isawaitable(response):
+                    response = await response
+        except TimeoutError:
+            raise PublishError(
+                "TIMEOUT", f"{name} exceeded {PLATFORM_TIMEOUT_SECONDS:g} seconds"
+            ) from None
+        except ChimeraError as exc:
+            if not exc.retryable:
+                raise PublishError("PLATFORM_UNAVAILABLE", str(exc)) from exc
+            raise _Throttled("PLATFORM_TRANSIENT_ERROR", str(exc), None) from exc
+        except (ConnectionError, OSError) as exc:
+            raise _Throttled("PLATFORM_TRANSIENT_ERROR", str(exc), None) from exc
+        return _check(platform, name, response)
+
+    async def attempt(
+        platform: str, variant: Mapping[str, Any], media: list[Any]
+    ) -> dict[str, Any]:
+        base = {
+            "idempotency_key": idempotency_key,
+            "caller_id": agent_id,
+            "correlation_id": correlation_id,
+        }
+        # Uploads that succeeded on an earlier attempt are kept.
+        for n, url in enumerate(variant.get("media_refs") or []):
+            if n < len(media):
+                continue
+            uploaded = await call(
+                platform,
+                "upload_media",
+                {
+                    **base,
+                    "idempotency_key": f"{idempotency_key}:{platform}:media:{n}",
+                    "platform": platform,
+                    "media_url": url,
+                },
+            )
+            media.append(uploaded.get("media_id") or uploaded.get("external_id"))
+        params = {
+            **base,
+            "text_content": variant.get("text_content", ""),
+            "hashtags": list(variant.get("hashtags") or []),
+            "disclosure_label": variant["disclosure_label"],
+        }
+        if media:
+            params["media_ids"] = list(media)
+        return await call(platform, tool_name(platform), params)
+
+    async def publish(platform: str) -> dict[str, Any]:
+        variant = variants.get(platform)
+        if variant is None:
+            error = PublishError(
+                "NO_VARIANT", f"Bundle has no content variant for {platform}"
+            )
+            return _publication_failed(platform, error, emit)
+        if not variant.get("disclosure_label"):
+            error = PublishError(
+                "CONTENT_POLICY_VIOLATION", "Variant is missing its disclosure_label"
+            )
+            return _publication_failed(platform, error, emit)
+        if dry_run:
+            return _publication(platform, "skipped")
+
+        store_key = f"{tool_name(platform)}:{idempotency_key}"
+        seen = await idempotency.get(store_key)
+        if seen is not None:
+            # Already published under this key: replay, no platform call.
+            published = _publication(
+                platform,
+                "published",
+                external_id=seen.outcome.get("external_id"),
+                external_url=seen.outcome.get("external_url"),
+                published_at=seen.outcome.get("published_at"),
+            )
+            PUBLICATIONS.inc(platform=platform, status="replayed")
+            emit(
+                "skill.publish_content.success",
+                {
+                    "platform": platform,
+                    "external_id": published["external_id"],
+                    "external_url": published["external_url"],
+                    "replayed": True,
+                },
+            )
+            return published
+
+        media: list[Any] = []
+        for retry in range(max_retries + 1):
+            emit(
+                "skill.publish_content.attempt",
+                {
+                    "platform": platform,
+                    "idempotency_key": idempotency_key,
+                    "attempt": retry + 1,
+                },
+            )
+            try:
+                response = await attempt(platform, variant, media)
+            except _Throttled as exc:
+                if exc.error_code == "PLATFORM_RATE_LIMIT":
+                    RATE_LIMITED.inc(platform=platform)
+                if retry == max_retries:
+                    return _publication_failed(platform, exc, emit)
+                limiters[platform].block(backoff_delay(retry, exc.retry_after))
+            except PublishError as exc:
+                return _publication_failed(platform, exc, emit)
+            else:
+                break
+
+        published = _publication(
+            platform,
+            "published",
+            external_id=response.get("external_id"),
+            external_url=response.get("external_url"),
+            published_at=response.get("published_at")
+            or datetime.now(UTC).replace(microsecond=0).isoformat(),
+        )
+        await idempotency.put(
+            store_key,
+            {
+                "external_id": published["external_id"],
+                "external_url": published["external_url"],
+                "published_at": published["published_at"],
+            },
+        )
+        PUBLICATIONS.inc(platform=platform, status="published")
+        emit(
+            "skill.publish_content.success",
+            {
+                "platform": platform,
+                "external_id": published["external_id"],
+                "external_url": published["external_url"],
+            },
+        )
+        if records is not None:
+            records(
+                {
+                    "publication_id": str(uuid.uuid4()),
+                    "task_id": task_id,
+                    "campaign_id": campaign_id,
+                    "platform": platform,
+                    "external_id": published["external_id"],
+                    "content_snapshot": dict(variant),
+                    "published_at": published["published_at"],
+                    "correlation_id": correlation_id,
+                }
+            )
+        return published
+
+    if publish_strategy == "parallel":
+        publications = list(await asyncio.gather(*map(publish, platforms)))
+    else:
+        publications = []
+        stopped = False
+        for platform in platforms:
+            if stopped:
+                publications.append(_publication(platform, "skipped"))
+                continue
+            publications.append(await publish(platform))
+            stopped = (
+                not partial_success_allowed and publications[-1]["status"] == "failed"
+            )
+
+    failed = [p for p in publications if p["status"] == "failed"]
+    published_count = sum(p["status"] == "published" for p in publications)
+    metadata = {
+        "publish_strategy": publish_strategy,
+        "total_platforms": len(platforms),
+        "successful_platforms": published_count,
+        "failed_platforms": len(failed),
+    }
+    if not failed:
+        return finish(
+            {"status": "success", "publications": publications, "metadata": metadata}
+        )
+    if partial_success_allowed and published_count:
+        return finish(
+            {
+                "status": "partial_success",
+                "publications": publications,
+                "metadata": metadata,
+            }
+        )
+    output = _failure(
+        failed[0]["error_code"],
+        failed[0]["error_message"],
+        retryable=all(p["retry_eligible"] for p in failed),
+    )
+    output["publications"] = publications
+    output["metadata"] = metadata
+    return finish(output)
+
+
+def _check(platform: str, name: str, response: Any) -> dict[str, Any]:
+    """Map a §8.3.2 tool response onto success or a typed error."""
+    if not isinstance(response, Mapping):
+        raise PublishError("PLATFORM_TRANSIENT_ERROR", f"{name} returned no result")
+    status = response.get("status")
+    details = response.get("error_details") or {}
+    message = str(details.get("message") or f"{name} returned {status}")
+    if status == "success":
+        return dict(response)
+    if status == "rate_limited":
+        retry_after = response.get("retry_after")
+        raise _Throttled(
+            "PLATFORM_RATE_LIMIT",
+            f"{platform} API rate limit exceeded",
+            float(retry_after) if isinstance(retry_after, int | float) else None,
+        )
+    if status == "auth_error":
+        raise PublishError("PLATFORM_AUTH_INVALID", message)
+    code = details.get("code")
+    if name == "upload_media" and code != "MEDIA_NOT_ACCESSIBLE":
+        code = "MEDIA_UPLOAD_FAILED"
+    if code is None or code in RETRYABLE_ERRORS:
+        raise _Throttled(code or "PLATFORM_TRANSIENT_ERROR", message, None)
+    raise PublishError(str(code), message)
+
+
+def _publication(
+    platform: str,
+    status: str,
+    *,
+    external_id: str | None = None,
+    external_url: str | None = None,
+    published_at: str | None = None,
+    error_code: str | None = None,
+    error_message: str | None = None,
+    retry_eligible: bool = False,
+) -> dict[str, Any]:
+    return {
+        "platform": platform,
+        "status": status,
+        "external_id": external_id,
+        "external_url": external_url,
+        "published_at": published_at,
+        "error_code": error_code,
+        "error_message": error_message,
+        "retry_eligible": retry_eligible,
+    }
+
+
+def _publication_failed(
+    platform: str, error: PublishError, emit: SkillAuditor
+) -> dict[str, Any]:
+    PUBLICATIONS.inc(platform=platform, status="failed")
+    emit(
+        "skill.publish_content.failure",
+        {
+            "platform": platform,
+            "error_code": error.error_code,
+            "error_message": str(error),
+        },
+        severity="error",
+    )
+    return _publication(
+        platform,
+        "failed",
+        error_code=error.error_code,
+        error_message=str(error),
+        retry_eligible=error.retryable,
+    )
+
+
+def _failure(
+    error_code: str, message: str, *, retryable: bool = False
+) -> dict[str, Any]:
+    return {
+        "status": "failure",
+        "error_code": error_code,
+        "error_message": message,
+        "retry_eligible": retryable,
+        "publications": [],
+        "metadata": {},
+    }
@@ -0,0 +1,45 @@
+"""
+Engagement analytics ingestion (specs/technical.md §12.5).
+
+:class:`IngestionPipeline` buffers :class:`EngagementSnapshot` records and
+bulk-loads them in batches into a :class:`SnapshotStore`. Each batch also
+updates the denormalized ``video_metadata`` counters and the hourly/daily
+rollup tables that :meth:`SnapshotStore.series` reads.
+
+- :class:`PostgresSnapshotStore` — asyncpg ``COPY`` into a staging table
+- :class:`SQLiteSnapshotStore` — single-node file and test stand-in
+"""
+
+from chimera.analytics.base import SnapshotStore
+from chimera.analytics.pipeline import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CAPACITY,
+    DEFAULT_FLUSH_INTERVAL,
+    IngestionPipeline,
+    IngestionStats,
+)
+from chimera.analytics.postgres import PostgresSnapshotStore
+from chimera.analytics.snapshots import (
+    GRANULARITIES,
+    AnalyticsError,
+    EngagementSnapshot,
+    RollupPoint,
+    engagement_rate,
+)
+from chimera.analytics.sqlite import SQLiteSnapshotStore
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_CAPACITY",
+    "DEFAULT_FLUSH_INTERVAL",
+    "GRANULARITIES",
+    "AnalyticsError",
+    "EngagementSnapshot",
+    "IngestionPipeline",
+    "IngestionStats",
+    "PostgresSnapshotStore",
+    "RollupPoint",
+    "SQLiteSnapshotStore",
+    "SnapshotStore",
+    "engagement_rate",
+]
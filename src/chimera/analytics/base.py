@@ -0,0 +1,69 @@
+"""
+Engagement snapshot store interface (specs/technical.md §12.5).
+
+A store writes whole batches. Each :meth:`SnapshotStore.write_batch` call
+lands in one transaction and is set-based throughout:
+
+1. the batch is bulk-loaded into a staging table, and snapshots already
+   stored are discarded, so a retried batch is not counted twice;
+2. the rest are appended to ``engagement_snapshots``;
+3. ``engagement_hourly`` and ``engagement_daily`` are upserted with one
+   grouped row per (publication, bucket) touched by the batch;
+4. ``engagement_latest`` keeps each publication's newest counters;
+5. ``video_metadata`` counters of the videos touched by the batch are
+   recomputed in one ``UPDATE ... FROM``, summing the latest counters of
+   every publication of the video (cross-posts, §12.5.2).
+
+Time-series reads (:meth:`SnapshotStore.series`) come from the rollup
+tables, so dashboards never scan raw snapshots.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+from collections.abc import Iterable
+
+from chimera.analytics.snapshots import (
+    GRANULARITIES,
+    AnalyticsError,
+    EngagementSnapshot,
+    RollupPoint,
+)
+
+
+class SnapshotStore(abc.ABC):
+    """Batch writer and rollup reader for engagement snapshots."""
+
+    async def write_batch(self, snapshots: Iterable[EngagementSnapshot]) -> int:
+        """Store a batch atomically; returns how many snapshots were new."""
+        unique = list({s.snapshot_id: s for s in snapshots}.values())
+        if not unique:
+            return 0
+        return await self._write(unique)
+
+    async def series(
+        self,
+        publication_id: str,
+        *,
+        start: float,
+        end: float,
+        granularity: str = "hour",
+    ) -> list[RollupPoint]:
+        """Rollup buckets of one publication overlapping ``[start, end)``."""
+        width = GRANULARITIES.get(granularity)
+        if width is None:
+            raise AnalyticsError(f"Unknown granularity {granularity!r}")
+        first = math.floor(start / width) * width
+        return await self._series(publication_id, granularity, first, end)
+
+    async def close(self) -> None:
+        return None
+
+    @abc.abstractmethod
+    async def _write(self, snapshots: list[EngagementSnapshot]) -> int: ...
+
+    @abc.abstractmethod
+    async def _series(
+        self, publication_id: str, granularity: str, start: float, end: float
+    ) -> list[RollupPoint]: ...
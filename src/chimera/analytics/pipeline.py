@@ -0,0 +1,192 @@
+"""
+Engagement snapshot ingestion pipeline (specs/technical.md §12.5).
+
+Pollers call :meth:`IngestionPipeline.submit` for every snapshot they
+fetch. Snapshots are buffered in memory, and a background flusher hands
+whole batches to a :class:`~chimera.analytics.base.SnapshotStore`. It wakes
+every ``flush_interval`` seconds, or as soon as ``batch_size`` snapshots
+are waiting. The store loads each batch in one transaction, so the cost of
+indexes, rollups and ``video_metadata`` counters is paid per batch rather
+than per snapshot.
+
+A batch the store rejects goes back to the front of the buffer and is
+retried on the next flush. After ``max_attempts`` consecutive failures it
+is dropped, counted and logged, so a poison batch cannot wedge
+ingestion. When the buffer is full, :meth:`~IngestionPipeline.submit`
+rejects the snapshot and :meth:`~IngestionPipeline.put` waits for room.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from chimera.analytics.base import SnapshotStore
+from chimera.analytics.snapshots import AnalyticsError, EngagementSnapshot
+from chimera.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 100_000
+DEFAULT_BATCH_SIZE = 5_000
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+SNAPSHOTS_WRITTEN = counter(
+    "chimera_analytics_snapshots_written",
+    "Engagement snapshots stored by the ingestion pipeline",
+)
+SNAPSHOTS_DROPPED = counter(
+    "chimera_analytics_snapshots_dropped",
+    "Engagement snapshots lost before reaching the store",
+    labelnames=("reason",),
+)
+
+
+@dataclass(slots=True)
+class IngestionStats:
+    submitted: int = 0
+    written: int = 0
+    duplicates: int = 0
+    dropped: int = 0
+    batches: int = 0
+    failures: int = 0
+
+
+class IngestionPipeline:
+    """Buffers engagement snapshots and bulk-loads them in the background.
+
+    Usage::
+
+        async with IngestionPipeline(SQLiteSnapshotStore(path)) as pipeline:
+            pipeline.submit(EngagementSnapshot(publication_id, view_count=120))
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        if batch_size < 1 or capacity < batch_size:
+            raise AnalyticsError("Need 1 <= batch_size <= capacity")
+        self.store = store
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.stats = IngestionStats()
+        self._pending: deque[EngagementSnapshot] = deque()
+        self._failed_attempts = 0
+        self._wake = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> IngestionPipeline:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_forever())
+
+    async def close(self) -> None:
+        """Stop the flusher and write everything still buffered."""
+        if self._flusher is not None:
+            async with self._flush_lock:
+                self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        # Ends: each batch is either written or dropped after max_attempts.
+        while self._pending:
+            await self.flush()
+
+    def submit(self, snapshot: EngagementSnapshot) -> bool:
+        """Buffer ``snapshot`` without waiting. False if the buffer is full."""
+        self.stats.submitted += 1
+        if len(self._pending) >= self.capacity:
+            self._drop("buffer_full")
+            return False
+        self._pending.append(snapshot)
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def submit_many(self, snapshots: Iterable[EngagementSnapshot]) -> int:
+        """Buffer each snapshot; returns how many were accepted."""
+        return sum(self.submit(snapshot) for snapshot in snapshots)
+
+    async def put(self, snapshot: EngagementSnapshot) -> bool:
+        """Like :meth:`submit`, but waits for the flusher to make room."""
+        while len(self._pending) >= self.capacity:
+            self._space.clear()
+            self._wake.set()
+            await self._space.wait()
+        return self.submit(snapshot)
+
+    async def flush(self) -> int:
+        """Write every buffered snapshot now; returns how many were new.
+
+        Stops early when the store rejects a batch; the batch stays
+        buffered for the next flush.
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                count = min(self.batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                self._space.set()
+                try:
+                    inserted = await self.store.write_batch(batch)
+                except Exception:
+                    self._reject(batch)
+                    break
+                self._failed_attempts = 0
+                written += inserted
+                self.stats.written += inserted
+                self.stats.duplicates += len(batch) - inserted
+                self.stats.batches += 1
+                SNAPSHOTS_WRITTEN.inc(inserted)
+        return written
+
+    async def _flush_forever(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.flush_interval):
+                    await self._wake.wait()
+            self._wake.clear()
+            await self.flush()
+
+    def _reject(self, batch: list[EngagementSnapshot]) -> None:
+        self.stats.failures += 1
+        self._failed_attempts += 1
+        if self._failed_attempts >= self.max_attempts:
+            logger.exception(
+                "snapshot batch failed %d times; %d snapshots dropped",
+                self._failed_attempts,
+                len(batch),
+            )
+            self._failed_attempts = 0
+            self._drop("write_error", len(batch))
+            return
+        logger.warning("snapshot batch of %d failed; will retry", len(batch))
+        self._pending.extendleft(reversed(batch))
+
+    def _drop(self, reason: str, count: int = 1) -> None:
+        self.stats.dropped += count
+        SNAPSHOTS_DROPPED.inc(count, reason=reason)
@@ -0,0 +1,84 @@
+"""
+Engagement Snapshot records (specs/technical.md §12.5.2).
+
+A snapshot is one poll of a publication's cumulative counters. Snapshots
+are the canonical engagement metrics; ``video_metadata`` counters and the
+hourly/daily rollups are derived from them (§12.5.4).
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.errors import ChimeraError
+
+HOUR = 3_600
+DAY = 86_400
+GRANULARITIES = {"hour": HOUR, "day": DAY}
+
+
+class AnalyticsError(ChimeraError):
+    """Raised when a snapshot is invalid or a store rejects a batch."""
+
+
+def engagement_rate(views: int, likes: int, comments: int, shares: int) -> float:
+    """Interactions per view; 0.0 before the first view."""
+    return (likes + comments + shares) / views if views else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class EngagementSnapshot:
+    """One row of ``engagement_snapshots``.
+
+    ``engagement_rate`` is computed from the counters when not given.
+    """
+
+    publication_id: str
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    share_count: int = 0
+    captured_at: float = field(default_factory=time.time)
+    engagement_rate: float | None = None
+    demographics: Mapping[str, Any] | None = None
+    snapshot_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def __post_init__(self) -> None:
+        if not self.publication_id:
+            raise AnalyticsError("publication_id is required")
+        counts = (self.view_count, self.like_count, self.comment_count)
+        if min(*counts, self.share_count) < 0:
+            raise AnalyticsError("Engagement counters cannot be negative")
+        if self.engagement_rate is None:
+            object.__setattr__(
+                self,
+                "engagement_rate",
+                engagement_rate(*counts, self.share_count),
+            )
+
+    @property
+    def rate(self) -> float:
+        return self.engagement_rate or 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RollupPoint:
+    """One hourly or daily bucket of a publication's engagement.
+
+    Counters are the last snapshot in the bucket; ``mean_rate`` averages
+    the engagement rate over its ``samples`` snapshots.
+    """
+
+    publication_id: str
+    bucket_start: float
+    samples: int
+    view_count: int
+    like_count: int
+    comment_count: int
+    share_count: int
+    mean_rate: float
+    last_captured_at: float
@@ -0,0 +1,303 @@
+"""
+SQLite engagement store: the single-node and test stand-in for PostgreSQL.
+
+Creates the §12.5.2 tables the pipeline touches (``video_metadata``,
+``publications``, ``engagement_snapshots``) with their §12.5.3 indexes,
+plus the derived ``engagement_latest``, ``engagement_hourly`` and
+``engagement_daily`` tables. Timestamps are epoch seconds. Each batch is
+one ``BEGIN IMMEDIATE`` transaction. The rows are loaded into a temporary
+staging table with ``executemany`` (SQLite's nearest equivalent to
+``COPY``); every later step is a single set-based statement over that
+table. Statements run on a worker thread so disk I/O never blocks the
+event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from chimera.analytics.base import SnapshotStore
+from chimera.analytics.snapshots import (
+    GRANULARITIES,
+    AnalyticsError,
+    EngagementSnapshot,
+    RollupPoint,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_metadata (
+    video_id TEXT PRIMARY KEY,
+    campaign_id TEXT,
+    agent_id TEXT,
+    platform TEXT,
+    external_id TEXT,
+    title TEXT,
+    description TEXT,
+    url TEXT,
+    thumbnail_url TEXT,
+    duration_seconds INTEGER,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    like_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    published_at REAL,
+    created_at REAL,
+    updated_at REAL,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_video_campaign ON video_metadata (campaign_id);
+CREATE TABLE IF NOT EXISTS publications (
+    publication_id TEXT PRIMARY KEY,
+    video_id TEXT REFERENCES video_metadata (video_id),
+    agent_id TEXT,
+    result_id TEXT,
+    platform TEXT,
+    account_id TEXT,
+    external_id TEXT,
+    content_snapshot TEXT,
+    disclosure_level TEXT,
+    published_at REAL,
+    approval_type TEXT,
+    approver_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pub_video ON publications (video_id);
+CREATE TABLE IF NOT EXISTS engagement_snapshots (
+    snapshot_id TEXT PRIMARY KEY,
+    publication_id TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    view_count INTEGER NOT NULL,
+    like_count INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    share_count INTEGER NOT NULL,
+    engagement_rate REAL NOT NULL,
+    demographics TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_eng_publication
+    ON engagement_snapshots (publication_id);
+CREATE INDEX IF NOT EXISTS idx_eng_time ON engagement_snapshots (captured_at DESC);
+CREATE TABLE IF NOT EXISTS engagement_latest (
+    publication_id TEXT PRIMARY KEY,
+    captured_at REAL NOT NULL,
+    view_count INTEGER NOT NULL,
+    like_count INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    share_count INTEGER NOT NULL
+);
+"""
+
+_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    publication_id TEXT NOT NULL,
+    bucket_start REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    rate_sum REAL NOT NULL,
+    first_captured_at REAL NOT NULL,
+    last_captured_at REAL NOT NULL,
+    view_count INTEGER NOT NULL,
+    like_count INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    share_count INTEGER NOT NULL,
+    PRIMARY KEY (publication_id, bucket_start)
+);
+"""
+
+_STAGING = """
+CREATE TEMP TABLE IF NOT EXISTS staged_snapshots (
+    snapshot_id TEXT PRIMARY KEY,
+    publication_id TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    view_count INTEGER NOT NULL,
+    like_count INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    share_count INTEGER NOT NULL,
+    engagement_rate REAL NOT NULL,
+    demographics TEXT
+)
+"""
+
+_STAGE = "INSERT INTO staged_snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_DISCARD_STORED = """
+DELETE FROM staged_snapshots
+WHERE snapshot_id IN (SELECT snapshot_id FROM engagement_snapshots)
+"""
+
+_APPEND = "INSERT INTO engagement_snapshots SELECT * FROM staged_snapshots"
+
+# One row per (publication, bucket) in the batch: its sample count, rate
+# sum and the counters of its newest snapshot, merged into the stored row.
+_ROLLUP = """
+INSERT INTO {table} AS r (
+    publication_id, bucket_start, samples, rate_sum, first_captured_at,
+    last_captured_at, view_count, like_count, comment_count, share_count
+)
+SELECT publication_id, bucket_start, samples, rate_sum, first_captured_at,
+    captured_at, view_count, like_count, comment_count, share_count
+FROM (
+    SELECT publication_id,
+        CAST(captured_at / {width} AS INTEGER) * {width} AS bucket_start,
+        COUNT(*) OVER w AS samples,
+        SUM(engagement_rate) OVER w AS rate_sum,
+        MIN(captured_at) OVER w AS first_captured_at,
+        captured_at, view_count, like_count, comment_count, share_count,
+        ROW_NUMBER() OVER (w ORDER BY captured_at DESC) AS newest
+    FROM staged_snapshots
+    WINDOW w AS (PARTITION BY publication_id, CAST(captured_at / {width} AS INTEGER))
+)
+WHERE newest = 1
+ON CONFLICT (publication_id, bucket_start) DO UPDATE SET
+    samples = r.samples + excluded.samples,
+    rate_sum = r.rate_sum + excluded.rate_sum,
+    first_captured_at = min(r.first_captured_at, excluded.first_captured_at),
+    view_count = CASE WHEN excluded.last_captured_at >= r.last_captured_at
+        THEN excluded.view_count ELSE r.view_count END,
+    like_count = CASE WHEN excluded.last_captured_at >= r.last_captured_at
+        THEN excluded.like_count ELSE r.like_count END,
+    comment_count = CASE WHEN excluded.last_captured_at >= r.last_captured_at
+        THEN excluded.comment_count ELSE r.comment_count END,
+    share_count = CASE WHEN excluded.last_captured_at >= r.last_captured_at
+        THEN excluded.share_count ELSE r.share_count END,
+    last_captured_at = max(r.last_captured_at, excluded.last_captured_at)
+"""
+
+_LATEST = """
+INSERT INTO engagement_latest AS l (
+    publication_id, captured_at, view_count, like_count, comment_count, share_count
+)
+SELECT publication_id, captured_at, view_count, like_count, comment_count,
+    share_count
+FROM (
+    SELECT *, ROW_NUMBER() OVER (
+        PARTITION BY publication_id ORDER BY captured_at DESC
+    ) AS newest
+    FROM staged_snapshots
+)
+WHERE newest = 1
+ON CONFLICT (publication_id) DO UPDATE SET
+    captured_at = excluded.captured_at,
+    view_count = excluded.view_count,
+    like_count = excluded.like_count,
+    comment_count = excluded.comment_count,
+    share_count = excluded.share_count
+WHERE excluded.captured_at >= l.captured_at
+"""
+
+_VIDEO_COUNTERS = """
+UPDATE video_metadata SET
+    view_count = t.view_count,
+    like_count = t.like_count,
+    comment_count = t.comment_count,
+    updated_at = ?
+FROM (
+    SELECT p.video_id,
+        SUM(l.view_count) AS view_count,
+        SUM(l.like_count) AS like_count,
+        SUM(l.comment_count) AS comment_count
+    FROM publications p
+    JOIN engagement_latest l ON l.publication_id = p.publication_id
+    WHERE p.video_id IN (
+        SELECT p2.video_id FROM staged_snapshots s
+        JOIN publications p2 ON p2.publication_id = s.publication_id
+    )
+    GROUP BY p.video_id
+) AS t
+WHERE video_metadata.video_id = t.video_id
+"""
+
+_SERIES = """
+SELECT publication_id, bucket_start, samples, view_count, like_count,
+    comment_count, share_count, rate_sum / samples, last_captured_at
+FROM {table}
+WHERE publication_id = ? AND bucket_start >= ? AND bucket_start < ?
+ORDER BY bucket_start
+"""
+
+ROLLUP_TABLES = {"hour": "engagement_hourly", "day": "engagement_daily"}
+
+
+class SQLiteSnapshotStore(SnapshotStore):
+    """:class:`SnapshotStore` persisted to a SQLite database file."""
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        synchronous: str = "NORMAL",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if synchronous not in ("OFF", "NORMAL", "FULL"):
+            raise AnalyticsError(f"Unknown synchronous mode {synchronous!r}")
+        self._clock = clock
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        self._rollups = [
+            _ROLLUP.format(table=ROLLUP_TABLES[name], width=width)
+            for name, width in GRANULARITIES.items()
+        ]
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.executescript(_SCHEMA)
+            for table in ROLLUP_TABLES.values():
+                self._conn.executescript(_ROLLUP_SCHEMA.format(table=table))
+            self._conn.execute(_STAGING)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    async def _write(self, snapshots: list[EngagementSnapshot]) -> int:
+        rows = [
+            (
+                s.snapshot_id,
+                s.publication_id,
+                s.captured_at,
+                s.view_count,
+                s.like_count,
+                s.comment_count,
+                s.share_count,
+                s.rate,
+                None if s.demographics is None else json.dumps(s.demographics),
+            )
+            for s in snapshots
+        ]
+        return await asyncio.to_thread(self._write_rows, rows, self._clock())
+
+    def _write_rows(self, rows: list[tuple[Any, ...]], now: float) -> int:
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM staged_snapshots")
+                conn.executemany(_STAGE, rows)
+                conn.execute(_DISCARD_STORED)
+                inserted = conn.execute(_APPEND).rowcount
+                if inserted:
+                    for rollup in self._rollups:
+                        conn.execute(rollup)
+                    conn.execute(_LATEST)
+                    conn.execute(_VIDEO_COUNTERS, (now,))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return inserted
+
+    async def _series(
+        self, publication_id: str, granularity: str, start: float, end: float
+    ) -> list[RollupPoint]:
+        sql = _SERIES.format(table=ROLLUP_TABLES[granularity])
+        rows = await asyncio.to_thread(self._fetch, sql, (publication_id, start, end))
+        return [RollupPoint(*row) for row in rows]
+
+    def _fetch(self, sql: str, params: tuple[object, ...]) -> list[Any]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
@@ -0,0 +1,90 @@
+"""
+Asyncio helpers shared by the runtime's caches and queues.
+
+:class:`SingleFlight` coalesces concurrent calls for one key: the first
+caller starts the call as its own task and later callers await the same
+result, so N simultaneous misses cost one LLM call, Resource read or file
+check. The task is shielded from each caller, so one caller's
+cancellation does not fail the others. It is cancelled once the last
+caller waiting on it is, so abandoned work does not keep running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Flight(Generic[V]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[V]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[K, V]):
+    """Calls in flight, by key.
+
+    Usage::
+
+        flights: SingleFlight[CacheKey, Signals] = SingleFlight()
+        if key in flights:
+            stats.coalesced += 1
+        signals = await flights.run(key, lambda: resource.read(key))
+
+    A call's outcome is never remembered: once it finishes, the next
+    :meth:`run` for its key starts a new call.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[K, _Flight[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._flights
+
+    async def run(self, key: K, call: Callable[[], Awaitable[V]]) -> V:
+        """The result of ``call()``, or of the call already in flight for ``key``."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self._landed, key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Every caller was cancelled; nobody is left to want the result.
+                self._cancel(key, flight)
+
+    def cancel(self, key: K) -> bool:
+        """Cancel the call in flight for ``key``; its callers see CancelledError."""
+        flight = self._flights.get(key)
+        if flight is None:
+            return False
+        self._cancel(key, flight)
+        return True
+
+    def _cancel(self, key: K, flight: _Flight[V]) -> None:
+        # Forget it at once, so a new caller starts afresh instead of
+        # joining a task that is being cancelled.
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        flight.task.cancel()
+
+    def _landed(self, key: K, flight: _Flight[V], task: asyncio.Future[Any]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the error as seen even if every caller was cancelled meanwhile.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,59 @@
+"""
+Audit trail: append-only event log (specs/technical.md §3.10, §11).
+
+:class:`AuditEmitter` buffers events in a :class:`RingBuffer` and a
+background flusher batch-writes them to rotating :class:`SegmentWriter`
+files, so emitting never blocks the caller on I/O. :class:`AuditIndex`
+maps ``correlation_id`` and ``parent_id`` to segment positions so a
+workflow can be traced without scanning the log. Skills build their
+events with :class:`SkillAuditor`.
+"""
+
+from chimera.audit.emitter import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CAPACITY,
+    DEFAULT_FLUSH_INTERVAL,
+    OVERFLOW_POLICIES,
+    AuditEmitter,
+    AuditStats,
+    BatchSink,
+)
+from chimera.audit.event import SEVERITIES, AuditError, AuditEvent
+from chimera.audit.index import AuditIndex, TraceNode, render_trace
+from chimera.audit.ring import RingBuffer
+from chimera.audit.segments import (
+    DEFAULT_SEGMENT_BYTES,
+    FSYNC_POLICIES,
+    SegmentPosition,
+    SegmentWriter,
+    list_segments,
+    read_lines,
+    read_segment,
+)
+from chimera.audit.skill import AuditSink, SkillAuditor
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_CAPACITY",
+    "DEFAULT_FLUSH_INTERVAL",
+    "DEFAULT_SEGMENT_BYTES",
+    "FSYNC_POLICIES",
+    "OVERFLOW_POLICIES",
+    "SEVERITIES",
+    "AuditEmitter",
+    "AuditError",
+    "AuditEvent",
+    "AuditIndex",
+    "AuditSink",
+    "AuditStats",
+    "BatchSink",
+    "RingBuffer",
+    "SegmentPosition",
+    "SegmentWriter",
+    "SkillAuditor",
+    "TraceNode",
+    "list_segments",
+    "read_lines",
+    "read_segment",
+    "render_trace",
+]
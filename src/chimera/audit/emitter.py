@@ -0,0 +1,248 @@
+"""
+Non-blocking audit emitter (specs/technical.md §3.10, §11).
+
+Producers (Workers, skills, the Judge) call :meth:`AuditEmitter.emit`, or
+pass the emitter itself as a skill's ``audit`` sink. The event goes into a
+:class:`~chimera.audit.ring.RingBuffer` and the call returns: no I/O, no
+await, no lock. A background flusher wakes every ``flush_interval`` seconds,
+or as soon as ``batch_size`` events are waiting, and writes whole batches
+to the :class:`~chimera.audit.segments.SegmentWriter` on a worker thread,
+then hands each batch to the optional ``sink`` (e.g. a database writer).
+With an :class:`~chimera.audit.index.AuditIndex` attached, each batch's
+segment positions are indexed right after the write; if indexing fails the
+index catches up from its checkpoint on the next batch.
+
+When the buffer is full, ``overflow`` decides what gives:
+
+- ``"drop_newest"`` reject the new event
+- ``"drop_oldest"`` evict the oldest buffered event
+- ``"block"``       :meth:`AuditEmitter.put` waits for the flusher to make
+  room (backpressure); the synchronous :meth:`~AuditEmitter.submit` path
+  cannot wait and rejects the new event instead
+
+Every drop is counted by reason in ``stats`` and in
+``chimera_audit_events_dropped``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from chimera.audit.event import AuditError, AuditEvent
+from chimera.audit.index import AuditIndex
+from chimera.audit.ring import RingBuffer
+from chimera.audit.segments import SegmentWriter
+from chimera.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 65_536
+DEFAULT_BATCH_SIZE = 1_024
+DEFAULT_FLUSH_INTERVAL = 0.2
+OVERFLOW_POLICIES = ("drop_newest", "drop_oldest", "block")
+
+BatchSink = Callable[[Sequence[AuditEvent]], Awaitable[None]]
+
+EVENTS_WRITTEN = counter(
+    "chimera_audit_events_written", "Audit events appended to segment files"
+)
+EVENTS_DROPPED = counter(
+    "chimera_audit_events_dropped",
+    "Audit events lost before reaching a segment file",
+    labelnames=("reason",),
+)
+SINK_FAILURES = counter(
+    "chimera_audit_sink_failures", "Audit batches the secondary sink rejected"
+)
+
+
+@dataclass(slots=True)
+class AuditStats:
+    emitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    sink_failures: int = 0
+
+
+class AuditEmitter:
+    """Buffers audit events in memory and batch-writes them in the background.
+
+    Usage::
+
+        async with AuditEmitter(SegmentWriter("/var/lib/chimera/audit")) as audit:
+            audit.emit("task.created", correlation_id=cid, actor="planner")
+    """
+
+    def __init__(
+        self,
+        writer: SegmentWriter,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: str = "drop_newest",
+        sink: BatchSink | None = None,
+        index: AuditIndex | None = None,
+        actor: str = "chimera",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise AuditError(f"Unknown overflow policy: {overflow!r}")
+        self.writer = writer
+        self.buffer: RingBuffer[AuditEvent] = RingBuffer(capacity)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.sink = sink
+        self.index = index
+        self.actor = actor
+        self.stats = AuditStats()
+        self._wake = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+        self._index_stale = index is not None
+
+    async def __aenter__(self) -> AuditEmitter:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_forever())
+
+    async def close(self) -> None:
+        """Stop the flusher, write everything still buffered, close the writer."""
+        if self._flusher is not None:
+            # Cancel between writes only: a batch already drained from the
+            # buffer but cut off mid-write would otherwise be lost.
+            async with self._flush_lock:
+                self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+        await asyncio.to_thread(self.writer.close)
+
+    def emit(
+        self,
+        event_type: str,
+        *,
+        correlation_id: str,
+        actor: str | None = None,
+        payload: dict[str, Any] | None = None,
+        severity: str = "info",
+        parent_id: str | None = None,
+    ) -> AuditEvent:
+        """Build and buffer one event; returns it (its ``event_id`` may parent others)."""
+        event = AuditEvent(
+            event_type,
+            correlation_id,
+            actor or self.actor,
+            payload or {},
+            severity,
+            parent_id,
+        )
+        self.submit(event)
+        return event
+
+    def __call__(self, event: Mapping[str, Any]) -> None:
+        """Accept a §11.4 event dict, so the emitter can serve as a skill's sink."""
+        self.submit(AuditEvent.from_dict(event, actor=self.actor))
+
+    def submit(self, event: AuditEvent) -> bool:
+        """Buffer ``event`` without waiting. False if it was dropped."""
+        self.stats.emitted += 1
+        buffer = self.buffer
+        if buffer.full:
+            if self.overflow != "drop_oldest":
+                self._drop("buffer_full")
+                return False
+            buffer.push_overwrite(event)
+            self._drop("evicted")
+        else:
+            buffer.push(event)
+        if len(buffer) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    async def put(self, event: AuditEvent) -> bool:
+        """Like :meth:`submit`, but waits for room under ``overflow="block"``.
+
+        Waiting needs the flusher to make room, so a full buffer with no
+        flusher running raises :class:`AuditError` instead of hanging.
+        """
+        while self.overflow == "block" and self.buffer.full:
+            if self._flusher is None or self._flusher.done():
+                raise AuditError("Audit buffer is full and no flusher is running")
+            self._space.clear()
+            self._wake.set()
+            await self._space.wait()
+        return self.submit(event)
+
+    async def flush(self) -> int:
+        """Write every buffered event now; returns how many were written."""
+        written = 0
+        async with self._flush_lock:
+            while batch := self.buffer.drain(self.batch_size):
+                self._space.set()
+                written += await self._write(batch)
+        return written
+
+    async def _flush_forever(self) -> None:
+        while True:
+            # asyncio.timeout, not wait_for: on 3.11 wait_for can swallow the
+            # cancellation from close() when the wake-up lands at the same time.
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.flush_interval):
+                    await self._wake.wait()
+            self._wake.clear()
+            await self.flush()
+
+    async def _write(self, batch: list[AuditEvent]) -> int:
+        try:
+            await asyncio.to_thread(self._append, batch)
+        except OSError:
+            logger.exception("audit segment write failed; %d events lost", len(batch))
+            self._drop("write_error", len(batch))
+            return 0
+        self.stats.written += len(batch)
+        self.stats.batches += 1
+        EVENTS_WRITTEN.inc(len(batch))
+        if self.sink is not None:
+            try:
+                await self.sink(batch)
+            except Exception:
+                # Segments are the system of record; the sink is best effort.
+                logger.exception("audit sink rejected a batch of %d", len(batch))
+                self.stats.sink_failures += 1
+                SINK_FAILURES.inc()
+        return len(batch)
+
+    def _append(self, batch: list[AuditEvent]) -> None:
+        positions = self.writer.write([event.to_json() for event in batch])
+        if self.index is None:
+            return
+        try:
+            if self._index_stale:
+                self.index.catch_up()
+                self._index_stale = False
+            else:
+                self.index.add(batch, positions)
+        except sqlite3.Error:
+            # The segments are written; the index is rebuilt from them later.
+            logger.exception("audit index update failed; will catch up")
+            self._index_stale = True
+
+    def _drop(self, reason: str, count: int = 1) -> None:
+        self.stats.dropped += count
+        EVENTS_DROPPED.inc(count, reason=reason)
@@ -0,0 +1,85 @@
+"""
+Audit Event data contract (specs/technical.md §3.10, §11.2, §11.4).
+
+Events are immutable. ``parent_id`` links an event to the event that
+caused it, so a workflow can be rebuilt from any event in its chain.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic_core import to_json
+
+from chimera.errors import ChimeraError
+
+SEVERITIES = ("info", "warning", "error", "critical")
+
+
+class AuditError(ChimeraError):
+    """Raised for malformed audit events or unusable audit storage."""
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEvent:
+    """One append-only audit record."""
+
+    event_type: str
+    correlation_id: str
+    actor: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    severity: str = "info"
+    parent_id: str | None = None
+    event_id: str = field(default_factory=_new_id)
+    timestamp: str = field(default_factory=_now)
+
+    def __post_init__(self) -> None:
+        if self.severity not in SEVERITIES:
+            raise AuditError(f"Unknown audit severity: {self.severity!r}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "event_id": self.event_id,
+            "correlation_id": self.correlation_id,
+            "parent_id": self.parent_id,
+            "event_type": self.event_type,
+            "actor": self.actor,
+            "timestamp": self.timestamp,
+            "severity": self.severity,
+            "payload": self.payload,
+        }
+
+    def to_json(self) -> bytes:
+        """One JSON line, newline-terminated, as stored in segment files."""
+        return to_json(self, fallback=str) + b"\n"
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], *, actor: str = "unknown"
+    ) -> AuditEvent:
+        """Build an event from a §11.4 dict, filling missing optional fields."""
+        try:
+            return cls(
+                event_type=data["event_type"],
+                correlation_id=data["correlation_id"],
+                actor=data.get("actor") or actor,
+                payload=dict(data.get("payload") or {}),
+                severity=data.get("severity") or "info",
+                parent_id=data.get("parent_id"),
+                event_id=data.get("event_id") or _new_id(),
+                timestamp=data.get("timestamp") or _now(),
+            )
+        except KeyError as exc:
+            raise AuditError(f"Audit event missing {exc.args[0]!r}") from None
@@ -0,0 +1,309 @@
+"""
+Correlation index over audit segments (specs/technical.md §3.10, §11.2).
+
+§11.2 promises workflow reconstruction from any event through
+``correlation_id`` and ``parent_id``. Scanning the append-only segments for
+one workflow is linear in total history, so :class:`AuditIndex` keeps a
+SQLite side table next to them that maps each event to where its line
+lives. It is indexed on ``correlation_id`` (all events of one workflow)
+and on ``parent_id`` (the child adjacency list), so a trace costs a few
+B-tree probes plus one seek per event, however long the history is.
+
+The index is derived data. The :class:`~chimera.audit.emitter.AuditEmitter`
+maintains it as it writes each batch; :meth:`AuditIndex.catch_up` indexes
+whatever the segments hold past the last checkpoint (events written while
+no index was attached), and :meth:`AuditIndex.rebuild` recreates it from
+the segments alone.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from chimera.audit.event import AuditError, AuditEvent
+from chimera.audit.segments import (
+    SegmentPosition,
+    list_segments,
+    read_lines,
+    segment_path,
+)
+
+INDEX_FILENAME = "index.sqlite"
+CATCH_UP_BATCH = 10_000
+_IN_BATCH = 500  # below SQLite's bound-parameter limit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    correlation_id TEXT NOT NULL,
+    parent_id TEXT,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_correlation
+    ON events (correlation_id, segment, offset);
+CREATE INDEX IF NOT EXISTS events_parent ON events (parent_id);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+"""
+
+_INSERT = """
+INSERT OR IGNORE INTO events
+    (event_id, correlation_id, parent_id, segment, offset, length)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_CHECKPOINT = """
+INSERT INTO checkpoint (id, segment, offset) VALUES (1, ?, ?)
+ON CONFLICT (id) DO UPDATE SET segment = excluded.segment, offset = excluded.offset
+WHERE (excluded.segment, excluded.offset) > (checkpoint.segment, checkpoint.offset)
+"""
+
+_Row = tuple[str, str, str | None, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class TraceNode:
+    """One event in a reconstructed workflow tree, with the events it caused."""
+
+    event: dict[str, Any]
+    children: list[TraceNode] = field(default_factory=list)
+
+
+class AuditIndex:
+    """``correlation_id`` and ``parent_id`` index over one segment directory.
+
+    Safe to share between the event loop and the emitter's writer thread.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        path: str | Path | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = Path(path) if path is not None else self.directory / INDEX_FILENAME
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        return count
+
+    @property
+    def checkpoint(self) -> SegmentPosition:
+        """End of the last indexed line; segments are indexed up to here."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT segment, offset FROM checkpoint WHERE id = 1"
+            ).fetchone()
+        return SegmentPosition(row[0], row[1], 0) if row else SegmentPosition(0, 0, 0)
+
+    # -- maintenance ---------------------------------------------------------
+
+    def add(
+        self, events: Sequence[AuditEvent], positions: Sequence[SegmentPosition]
+    ) -> None:
+        """Index a batch just written by :meth:`SegmentWriter.write`."""
+        if len(events) != len(positions):
+            raise AuditError("Every indexed event needs exactly one position")
+        rows = [
+            (e.event_id, e.correlation_id, e.parent_id, p.segment, p.offset, p.length)
+            for e, p in zip(events, positions, strict=True)
+        ]
+        if rows:
+            last = positions[-1]
+            self._insert(rows, last.segment, last.offset + last.length)
+
+    def catch_up(self) -> int:
+        """Index every complete line past the checkpoint; returns how many."""
+        start = self.checkpoint
+        indexed = 0
+        for sequence, path in list_segments(self.directory):
+            if sequence < start.segment:
+                continue
+            offset = start.offset if sequence == start.segment else 0
+            rows: list[_Row] = []
+            end = offset
+            for line_offset, line in read_lines(path, offset):
+                event = json.loads(line)
+                rows.append(
+                    (
+                        event["event_id"],
+                        event["correlation_id"],
+                        event.get("parent_id"),
+                        sequence,
+                        line_offset,
+                        len(line),
+                    )
+                )
+                end = line_offset + len(line)
+                if len(rows) >= CATCH_UP_BATCH:
+                    self._insert(rows, sequence, end)
+                    indexed += len(rows)
+                    rows = []
+            self._insert(rows, sequence, end)
+            indexed += len(rows)
+        return indexed
+
+    def rebuild(self) -> int:
+        """Drop every entry and re-index all segments from scratch."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM events")
+            self._conn.execute("DELETE FROM checkpoint")
+            self._conn.execute("COMMIT")
+        return self.catch_up()
+
+    # -- queries -------------------------------------------------------------
+
+    def positions(self, correlation_id: str) -> list[SegmentPosition]:
+        """Where every event of ``correlation_id`` lives, in write order."""
+        return [
+            SegmentPosition(*row)
+            for row in self._query(
+                "SELECT segment, offset, length FROM events"
+                " WHERE correlation_id = ? ORDER BY segment, offset",
+                (correlation_id,),
+            )
+        ]
+
+    def children(self, event_id: str) -> list[str]:
+        """``event_id`` of every event whose ``parent_id`` is ``event_id``."""
+        return [
+            row[0]
+            for row in self._query(
+                "SELECT event_id FROM events WHERE parent_id = ?"
+                " ORDER BY segment, offset",
+                (event_id,),
+            )
+        ]
+
+    def correlation_of(self, event_id: str) -> str | None:
+        rows = self._query(
+            "SELECT correlation_id FROM events WHERE event_id = ?", (event_id,)
+        )
+        return rows[0][0] if rows else None
+
+    def read(self, positions: Iterable[SegmentPosition]) -> list[dict[str, Any]]:
+        """Load the events at ``positions``, opening each segment once."""
+        by_segment: dict[int, list[SegmentPosition]] = {}
+        for position in positions:
+            by_segment.setdefault(position.segment, []).append(position)
+        events = []
+        for sequence in sorted(by_segment):
+            path = segment_path(self.directory, sequence)
+            with path.open("rb") as handle:
+                for position in sorted(by_segment[sequence], key=_offset):
+                    handle.seek(position.offset)
+                    events.append(json.loads(handle.read(position.length)))
+        return events
+
+    def trace(self, ref: str) -> list[TraceNode]:
+        """Rebuild the workflow tree for a correlation ID or any event ID in it.
+
+        Starts from every event sharing the ``correlation_id`` and follows
+        ``parent_id`` links to descendants filed under other correlation
+        IDs. Returns the roots: events whose parent is not in the workflow.
+        """
+        correlation_id = self.correlation_of(ref) or ref
+        known = {
+            row[0]: SegmentPosition(*row[1:])
+            for row in self._query(
+                "SELECT event_id, segment, offset, length FROM events"
+                " WHERE correlation_id = ?",
+                (correlation_id,),
+            )
+        }
+        if not known:
+            return []
+        frontier = list(known)
+        while frontier:
+            batch, frontier = frontier[:_IN_BATCH], frontier[_IN_BATCH:]
+            rows = self._query(
+                "SELECT event_id, segment, offset, length FROM events"
+                f" WHERE parent_id IN ({','.join('?' * len(batch))})",
+                tuple(batch),
+            )
+            for event_id, *position in rows:
+                if event_id not in known:
+                    known[event_id] = SegmentPosition(*position)
+                    frontier.append(event_id)
+        return _build_tree(self.read(known.values()))
+
+    # -- internals -----------------------------------------------------------
+
+    def _insert(self, rows: list[_Row], segment: int, offset: int) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_INSERT, rows)
+                self._conn.execute(_CHECKPOINT, (segment, offset))
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[Any]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+def _offset(position: SegmentPosition) -> int:
+    return position.offset
+
+
+def _build_tree(events: list[dict[str, Any]]) -> list[TraceNode]:
+    nodes = {event["event_id"]: TraceNode(event) for event in events}
+    roots = []
+    for event in events:  # already in write order
+        parent = nodes.get(event.get("parent_id") or "")
+        if parent is None:
+            roots.append(nodes[event["event_id"]])
+        else:
+            parent.children.append(nodes[event["event_id"]])
+    return roots
+
+
+def render_trace(roots: Sequence[TraceNode]) -> str:
+    """Draw a trace as an indented tree, one event per line."""
+    lines: list[str] = []
+
+    def draw(node: TraceNode, prefix: str, last: bool, top: bool) -> None:
+        event = node.event
+        branch = "" if top else ("└── " if last else "├── ")
+        lines.append(
+            f"{prefix}{branch}{event['event_type']} [{event.get('severity', 'info')}]"
+            f" {event.get('actor', '?')} {event.get('timestamp', '')}"
+            f" ({event['event_id']})"
+        )
+        child_prefix = prefix if top else prefix + ("    " if last else "│   ")
+        for i, child in enumerate(node.children):
+            draw(child, child_prefix, i == len(node.children) - 1, False)
+
+    for root in roots:
+        draw(root, "", True, True)
+    return "\n".join(lines)
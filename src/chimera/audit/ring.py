@@ -0,0 +1,68 @@
+"""
+Fixed-capacity ring buffer between audit producers and the flusher.
+
+Slots are preallocated and addressed by two ever-increasing counters, so
+push and drain never allocate per event and never lock. Both run without
+awaiting on the event loop thread, which makes each call atomic with
+respect to every other coroutine; producers on other threads must hop onto
+the loop first (``loop.call_soon_threadsafe``).
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """FIFO of at most ``capacity`` items."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._slots: list[T | None] = [None] * capacity
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def full(self) -> bool:
+        return self._tail - self._head >= self.capacity
+
+    def push(self, item: T) -> bool:
+        """Append ``item``; False (item dropped) if the buffer is full."""
+        if self.full:
+            return False
+        self._slots[self._tail % self.capacity] = item
+        self._tail += 1
+        return True
+
+    def push_overwrite(self, item: T) -> T | None:
+        """Append ``item``, evicting and returning the oldest item if full."""
+        evicted = None
+        if self.full:
+            index = self._head % self.capacity
+            evicted = self._slots[index]
+            self._slots[index] = None
+            self._head += 1
+        self._slots[self._tail % self.capacity] = item
+        self._tail += 1
+        return evicted
+
+    def drain(self, limit: int | None = None) -> list[T]:
+        """Remove and return up to ``limit`` items, oldest first."""
+        count = len(self) if limit is None else min(limit, len(self))
+        items: list[T] = []
+        slots, capacity = self._slots, self.capacity
+        for position in range(self._head, self._head + count):
+            index = position % capacity
+            item = slots[index]
+            assert item is not None
+            items.append(item)
+            slots[index] = None
+        self._head += count
+        return items
@@ -0,0 +1,197 @@
+"""
+Append-only audit segment files (specs/technical.md §3.10 system of record).
+
+Events are stored as JSON Lines in ``audit-<sequence>.jsonl`` files under
+one directory. The writer only ever appends; once the active segment
+reaches ``max_segment_bytes`` it is synced and closed, and the next batch
+starts a new segment. A segment whose last line is incomplete (a crash
+mid-write) is never appended to again; readers skip the partial line. A
+batch whose write or fsync fails is cut off again, so the segment size and
+every position handed out stay exact.
+
+``fsync`` controls durability per batch:
+
+- ``"always"``   fsync after every batch (no acknowledged event is lost)
+- ``"interval"`` fsync at most every ``fsync_interval`` seconds
+- ``"never"``    leave flushing to the OS (rotation and close still sync)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from chimera.audit.event import AuditError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_FSYNC_INTERVAL = 1.0
+FSYNC_POLICIES = ("always", "interval", "never")
+
+_SEGMENT_NAME = re.compile(r"^audit-(\d{12})\.jsonl$")
+
+
+def segment_path(directory: Path, sequence: int) -> Path:
+    return directory / f"audit-{sequence:012d}.jsonl"
+
+
+def list_segments(directory: str | Path) -> list[tuple[int, Path]]:
+    """``(sequence, path)`` of every segment in ``directory``, oldest first."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    found = []
+    for path in directory.iterdir():
+        match = _SEGMENT_NAME.match(path.name)
+        if match:
+            found.append((int(match.group(1)), path))
+    return sorted(found)
+
+
+def read_lines(path: Path, offset: int = 0) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for each complete raw line from ``offset`` on."""
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                return
+            yield offset, line
+            offset += len(line)
+
+
+def read_segment(path: Path, offset: int = 0) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(offset, event)`` for each complete line from ``offset`` on."""
+    for line_offset, line in read_lines(path, offset):
+        yield line_offset, json.loads(line)
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentPosition:
+    """Where one event's line lives: segment sequence, byte offset, length."""
+
+    segment: int
+    offset: int
+    length: int
+
+
+class SegmentWriter:
+    """Appends batches of encoded events to rotating segment files.
+
+    Not thread-safe; the :class:`~chimera.audit.emitter.AuditEmitter`
+    flusher is its only caller.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync: str = "interval",
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise AuditError(f"Unknown fsync policy: {fsync!r}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._clock = clock
+        self._last_sync = clock()
+        self._dirty = False
+        self._handle: IO[bytes] | None = None
+        self.sequence = 0
+        self.size = 0
+        segments = list_segments(self.directory)
+        if segments:
+            self.sequence, last = segments[-1]
+            if _ends_cleanly(last):
+                self._open(self.sequence)
+            else:
+                self.sequence += 1
+
+    def write(self, lines: Sequence[bytes]) -> list[SegmentPosition]:
+        """Append newline-terminated ``lines``; returns their positions."""
+        if not lines:
+            return []
+        if self._handle is None or (self.size and self.size >= self.max_segment_bytes):
+            self._rotate()
+        assert self._handle is not None
+        positions = []
+        offset = self.size
+        for line in lines:
+            positions.append(SegmentPosition(self.sequence, offset, len(line)))
+            offset += len(line)
+        try:
+            data = memoryview(b"".join(lines))
+            while data:
+                data = data[self._handle.write(data) :]
+            self._dirty = True
+            if self.fsync == "always" or (
+                self.fsync == "interval"
+                and self._clock() - self._last_sync >= self.fsync_interval
+            ):
+                self.sync()
+        except OSError:
+            self._cut_back()
+            raise
+        self.size = offset
+        return positions
+
+    def sync(self) -> None:
+        if self._handle is not None and self._dirty:
+            os.fsync(self._handle.fileno())
+            self._dirty = False
+        self._last_sync = self._clock()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self.sync()
+            self._handle.close()
+            self._handle = None
+
+    def _rotate(self) -> None:
+        if self._handle is not None:
+            self.close()
+            self.sequence += 1
+        elif self.sequence == 0:
+            self.sequence = 1
+        self._open(self.sequence)
+
+    def _cut_back(self) -> None:
+        """Drop whatever a failed batch left past the last good offset."""
+        assert self._handle is not None
+        try:
+            os.ftruncate(self._handle.fileno(), self.size)
+        except OSError:
+            # The tail cannot be removed: leave this segment like a crashed
+            # one and start the next batch in a new segment.
+            logger.exception("cannot truncate audit segment %d", self.sequence)
+            self._handle.close()
+            self._handle = None
+            self.sequence += 1
+
+    def _open(self, sequence: int) -> None:
+        path = segment_path(self.directory, sequence)
+        # Unbuffered: each batch is one write, and a failed one leaves no
+        # bytes behind in a buffer to land after the truncation.
+        self._handle = path.open("ab", buffering=0)
+        self.size = self._handle.tell()
+
+
+def _ends_cleanly(path: Path) -> bool:
+    size = path.stat().st_size
+    if size == 0:
+        return True
+    with path.open("rb") as handle:
+        handle.seek(size - 1)
+        return handle.read(1) == b"\n"
@@ -0,0 +1,41 @@
+"""
+Audit events from skills (specs/technical.md §11.4).
+
+Skills take an ``audit`` callable that receives one §11.4 event dict per
+call, so a test can pass ``list.append`` and a Worker can pass its
+:class:`~chimera.audit.AuditEmitter`. :class:`SkillAuditor` stamps those
+dicts with the invocation's ``correlation_id`` and the skill's actor.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from chimera.audit.event import AuditEvent
+
+AuditSink = Callable[[dict[str, Any]], None]
+
+
+class SkillAuditor:
+    """Builds one invocation's audit events and hands them to ``sink``.
+
+    Without a sink, events are not built at all.
+    """
+
+    def __init__(
+        self, sink: AuditSink | None, correlation_id: str, *, actor: str
+    ) -> None:
+        self.sink = sink
+        self.correlation_id = correlation_id
+        self.actor = actor
+
+    def __call__(
+        self, event_type: str, payload: dict[str, Any], *, severity: str = "info"
+    ) -> None:
+        if self.sink is None:
+            return
+        event = AuditEvent(
+            event_type, self.correlation_id, self.actor, payload, severity
+        )
+        self.sink(event.to_dict())
@@ -0,0 +1,50 @@
+"""
+Budget governance (specs/technical.md §10, §3.11–3.12).
+
+- :class:`BudgetLedger` — in-memory balances with atomic reservations
+  across nested ``global``/``campaign:``/``agent:`` scopes
+- :class:`BudgetLease` — lock-free Worker-local quota slice, refilled from
+  the ledger in bulk
+- :class:`SQLiteBudgetStore` — relational Budget State the ledger
+  reconciles to asynchronously
+"""
+
+from chimera.budget.base import (
+    DEFAULT_DAILY_LIMIT_USD,
+    GLOBAL_SCOPE,
+    BudgetError,
+    BudgetExceededError,
+    BudgetPolicy,
+    BudgetUsage,
+    agent_scope,
+    campaign_scope,
+    scopes_for,
+)
+from chimera.budget.ledger import (
+    DEFAULT_LEASE_SLICE_USD,
+    BudgetLease,
+    BudgetLedger,
+    BudgetStats,
+    Reservation,
+)
+from chimera.budget.store import BudgetDelta, BudgetStore, SQLiteBudgetStore
+
+__all__ = [
+    "DEFAULT_DAILY_LIMIT_USD",
+    "DEFAULT_LEASE_SLICE_USD",
+    "GLOBAL_SCOPE",
+    "BudgetDelta",
+    "BudgetError",
+    "BudgetExceededError",
+    "BudgetLease",
+    "BudgetLedger",
+    "BudgetPolicy",
+    "BudgetStats",
+    "BudgetStore",
+    "BudgetUsage",
+    "Reservation",
+    "SQLiteBudgetStore",
+    "agent_scope",
+    "campaign_scope",
+    "scopes_for",
+]
@@ -0,0 +1,117 @@
+"""
+Budget policies, scopes and errors (specs/technical.md §3.11, §10, §12.1).
+
+Budgets nest: every cost-incurring action is charged to the ``global``
+scope, its ``campaign:<id>`` scope and its ``agent:<id>`` scope, and must
+fit under the daily limit of each scope that has a :class:`BudgetPolicy`.
+Scopes without a policy are not limited.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from chimera.errors import ChimeraError
+
+MICROS_PER_USD = 1_000_000
+DEFAULT_DAILY_LIMIT_USD = 50.0
+DEFAULT_TRANSACTION_HITL_USD = 10.0
+PERIOD_SECONDS = 24 * 3600.0
+
+GLOBAL_SCOPE = "global"
+SCOPE_KINDS = ("global", "campaign", "agent")
+
+
+def campaign_scope(campaign_id: str) -> str:
+    return f"campaign:{campaign_id}"
+
+
+def agent_scope(agent_id: str) -> str:
+    return f"agent:{agent_id}"
+
+
+def scopes_for(
+    *, campaign_id: str | None = None, agent_id: str | None = None
+) -> tuple[str, ...]:
+    """The nested scopes one action is charged to, outermost first."""
+    scopes = [GLOBAL_SCOPE]
+    if campaign_id:
+        scopes.append(campaign_scope(campaign_id))
+    if agent_id:
+        scopes.append(agent_scope(agent_id))
+    return tuple(scopes)
+
+
+def to_micros(amount_usd: float) -> int:
+    """USD to integer micro-USD; rejects negative and non-finite amounts."""
+    if not math.isfinite(amount_usd) or amount_usd < 0:
+        raise BudgetError(f"Invalid amount {amount_usd!r}")
+    return round(amount_usd * MICROS_PER_USD)
+
+
+def to_usd(micros: int) -> float:
+    return micros / MICROS_PER_USD
+
+
+def period_start(now: float) -> float:
+    """Start of the UTC day containing ``now``."""
+    return now - now % PERIOD_SECONDS
+
+
+class BudgetError(ChimeraError):
+    """Raised when a budget operation is invalid."""
+
+
+class BudgetExceededError(BudgetError):
+    """An action does not fit under a scope's daily limit (§12.1 Budget
+    Failure: not retryable; block, then notify the Operator and Planner)."""
+
+    def __init__(self, scope: str, requested_usd: float, available_usd: float):
+        super().__init__(
+            f"Budget exceeded for {scope}: requested ${requested_usd:.6f},"
+            f" available ${available_usd:.6f}"
+        )
+        self.scope = scope
+        self.requested_usd = requested_usd
+        self.available_usd = available_usd
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetPolicy:
+    """Daily limit for one scope (§3.11 Budget Policy)."""
+
+    scope: str = GLOBAL_SCOPE
+    scope_id: str | None = None
+    daily_limit_usd: float = DEFAULT_DAILY_LIMIT_USD
+    transaction_hitl_threshold_usd: float = DEFAULT_TRANSACTION_HITL_USD
+    currency: str = "USD"
+
+    def __post_init__(self) -> None:
+        if self.scope not in SCOPE_KINDS:
+            raise BudgetError(f"Unknown budget scope {self.scope!r}")
+        if (self.scope == GLOBAL_SCOPE) != (self.scope_id is None):
+            raise BudgetError("scope_id is required for, and only for, scoped policies")
+        to_micros(self.daily_limit_usd)
+
+    @property
+    def key(self) -> str:
+        """The ledger scope key: ``global``, ``campaign:<id>`` or ``agent:<id>``."""
+        return self.scope if self.scope_id is None else f"{self.scope}:{self.scope_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetUsage:
+    """Point-in-time balance of one scope (§3.12 Budget State)."""
+
+    scope: str
+    limit_usd: float
+    spent_usd: float
+    committed_usd: float
+    period_start: float
+    period_end: float
+    saved_usd: float = 0.0  # spend avoided by cache hits this period
+
+    @property
+    def available_usd(self) -> float:
+        return max(0.0, self.limit_usd - self.spent_usd - self.committed_usd)
@@ -0,0 +1,503 @@
+"""
+Budget reservation ledger with Worker leases (specs/technical.md §10).
+
+The ledger keeps each scope's ``spent`` and ``committed`` balances in
+memory as integer micro-USD. A reservation is admitted only if it fits
+under the limit of every nested scope it is charged to. The check and the
+update of all those scopes happen in one step, so
+``spent + committed <= daily_limit`` (§3.12) holds at every scope.
+Admitting a reservation takes a few integer compares under one short
+lock. There is no database round trip.
+
+High-frequency callers take a :class:`BudgetLease` instead: a slice of
+quota reserved from the ledger up front. The Worker reserves, commits and
+releases against its slice with local arithmetic and no lock. It goes back
+to the ledger only when the slice runs out, refilling in bulk and settling
+the spend recorded so far. While held, the whole slice counts as committed
+at every scope, so the hard limit still holds. The price is that quota
+idle in one lease is unavailable to other Workers, so keep slices small
+relative to the limits.
+
+Settled spend is reconciled to the relational :class:`BudgetStore`
+asynchronously: call :meth:`BudgetLedger.reconcile`, or run the background
+loop with :meth:`BudgetLedger.start`. Periods are UTC days; when a period
+ends, spend resets and open reservations carry over.
+
+If the actual cost exceeds the reservation, the full cost is still
+charged, because the money is already spent. If that pushes a scope past
+its limit, it is an overrun. Overruns are counted in ``stats.overruns``
+and ``chimera_budget_overruns``, and that scope admits nothing more until
+the period rolls over.
+
+Caches that avoid a paid call, such as the completion cache, report the
+cost they saved with :meth:`BudgetLedger.record_savings`. Savings are
+tracked per scope and period next to spend (``BudgetUsage.saved_usd``).
+They never change what a scope may spend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from chimera.budget.base import (
+    PERIOD_SECONDS,
+    BudgetError,
+    BudgetExceededError,
+    BudgetPolicy,
+    BudgetUsage,
+    period_start,
+    to_micros,
+    to_usd,
+)
+from chimera.budget.store import BudgetDelta, BudgetStore
+from chimera.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SLICE_USD = 1.0
+DEFAULT_RECONCILE_INTERVAL = 5.0
+
+RESERVATIONS = counter(
+    "chimera_budget_reservations",
+    "Budget reservations admitted or denied at the ledger",
+    labelnames=("outcome",),
+)
+OVERRUNS = counter(
+    "chimera_budget_overruns", "Actual costs that pushed a scope past its limit"
+)
+SAVINGS = counter(
+    "chimera_budget_saved_usd",
+    "Spend avoided by cache hits, in USD",
+    labelnames=("source",),
+)
+
+
+@dataclass(slots=True)
+class BudgetStats:
+    reserved: int = 0
+    denied: int = 0
+    refills: int = 0
+    overruns: int = 0
+    reconciles: int = 0
+    estimated_micros: int = 0
+    actual_micros: int = 0
+    saved_micros: int = 0
+
+    @property
+    def variance_usd(self) -> float:
+        """Settled actual cost minus its estimates (§10.3)."""
+        return to_usd(self.actual_micros - self.estimated_micros)
+
+    @property
+    def saved_usd(self) -> float:
+        return to_usd(self.saved_micros)
+
+
+class Reservation:
+    """Quota held for one action until it is committed or released."""
+
+    __slots__ = ("_open", "_owner", "micros", "scopes")
+
+    def __init__(
+        self, owner: BudgetLedger | BudgetLease, scopes: tuple[str, ...], micros: int
+    ) -> None:
+        self._owner = owner
+        self._open = True
+        self.scopes = scopes
+        self.micros = micros
+
+    @property
+    def amount_usd(self) -> float:
+        return to_usd(self.micros)
+
+    @property
+    def open(self) -> bool:
+        return self._open
+
+    def commit(self, actual_usd: float | None = None) -> None:
+        """Record the action's actual cost (defaults to the reserved amount)."""
+        actual = self.micros if actual_usd is None else to_micros(actual_usd)
+        self._close()
+        self._owner._commit(self, actual)
+
+    def release(self) -> None:
+        """Return the quota unspent, e.g. because the action failed (§10.4)."""
+        self._close()
+        self._owner._release(self)
+
+    def _close(self) -> None:
+        if not self._open:
+            raise BudgetError("Reservation already committed or released")
+        self._open = False
+
+    def __repr__(self) -> str:
+        return f"Reservation({self.scopes!r}, ${self.amount_usd:.6f})"
+
+
+class _Account:
+    __slots__ = ("committed", "limit", "saved", "spent")
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.spent = 0
+        self.committed = 0
+        self.saved = 0
+
+
+class BudgetLedger:
+    """In-memory Budget State for all scopes, with atomic nested reservations.
+
+    Usage::
+
+        ledger = BudgetLedger([BudgetPolicy(daily_limit_usd=50.0)], store=store)
+        reservation = ledger.reserve(scopes_for(campaign_id="c1"), 0.02)
+        ...
+        reservation.commit(actual_usd=0.018)
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[BudgetPolicy] = (),
+        *,
+        store: BudgetStore | None = None,
+        reconcile_interval: float = DEFAULT_RECONCILE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store = store
+        self.reconcile_interval = reconcile_interval
+        self.stats = BudgetStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._accounts: dict[str, _Account] = {}
+        self._policies: dict[str, BudgetPolicy] = {}
+        self._period = period_start(clock())
+        self._pending: dict[tuple[str, float], int] = {}
+        self._reconciler: asyncio.Task[None] | None = None
+        for policy in policies:
+            self.set_policy(policy)
+        if store is not None:
+            for scope, spent in store.load(self._period).items():
+                self._account(scope).spent = spent
+
+    def set_policy(self, policy: BudgetPolicy) -> None:
+        """Install or replace a scope's limit; its balances are kept."""
+        with self._lock:
+            self._policies[policy.key] = policy
+            self._account(policy.key).limit = to_micros(policy.daily_limit_usd)
+
+    def policy_for(self, scope: str) -> BudgetPolicy | None:
+        return self._policies.get(scope)
+
+    # -- queries -------------------------------------------------------------
+
+    def usage(self, scope: str) -> BudgetUsage:
+        with self._lock:
+            self._roll()
+            account = self._accounts.get(scope) or _Account()
+            limit = math.inf if account.limit is None else to_usd(account.limit)
+            return BudgetUsage(
+                scope,
+                limit,
+                to_usd(account.spent),
+                to_usd(account.committed),
+                self._period,
+                self._period + PERIOD_SECONDS,
+                to_usd(account.saved),
+            )
+
+    def available_usd(self, scopes: Sequence[str]) -> float:
+        """Largest amount reservable across ``scopes`` right now (§10.1
+        pre-task check). Nothing is reserved."""
+        return min(self.usage(scope).available_usd for scope in scopes)
+
+    # -- reservations ----------------------------------------------------------
+
+    def reserve(self, scopes: Sequence[str], amount_usd: float) -> Reservation:
+        """Hold ``amount_usd`` at every scope or raise :class:`BudgetExceededError`."""
+        micros = to_micros(amount_usd)
+        scopes = tuple(scopes)
+        with self._lock:
+            self._roll()
+            try:
+                self._take(scopes, micros)
+            except BudgetExceededError:
+                self.stats.denied += 1
+                RESERVATIONS.inc(outcome="denied")
+                raise
+            self.stats.reserved += 1
+        RESERVATIONS.inc(outcome="reserved")
+        return Reservation(self, scopes, micros)
+
+    def lease(
+        self, scopes: Sequence[str], *, slice_usd: float = DEFAULT_LEASE_SLICE_USD
+    ) -> BudgetLease:
+        """A Worker-local quota slice over ``scopes``, filled on first use."""
+        return BudgetLease(self, tuple(scopes), to_micros(slice_usd))
+
+    def record_savings(
+        self, scopes: Sequence[str], amount_usd: float, *, source: str = "cache"
+    ) -> None:
+        """Record spend avoided at every scope, e.g. by a cache hit."""
+        micros = to_micros(amount_usd)
+        if not micros:
+            return
+        with self._lock:
+            self._roll()
+            for scope in scopes:
+                self._account(scope).saved += micros
+            self.stats.saved_micros += micros
+        SAVINGS.inc(to_usd(micros), source=source)
+
+    def _commit(self, reservation: Reservation, actual: int) -> None:
+        with self._lock:
+            self._roll()
+            self._settle(reservation.scopes, reservation.micros, actual, 0)
+            self.stats.estimated_micros += reservation.micros
+            self.stats.actual_micros += actual
+
+    def _release(self, reservation: Reservation) -> None:
+        with self._lock:
+            self._settle(reservation.scopes, reservation.micros, 0, 0)
+
+    def _exchange(
+        self,
+        lease: BudgetLease,
+        *,
+        held: int,
+        spent: int,
+        floor: int,
+        want: int,
+        need: int,
+    ) -> int:
+        """Settle ``lease`` and re-size its holding in one locked step.
+
+        The lease held ``held`` and spent ``spent`` of it. It keeps
+        ``floor`` (its open reservations) plus ``want`` more if that fits,
+        else plus ``need``, else raises holding just ``floor``. Returns the
+        new holding.
+        """
+        if lease._reservations:
+            RESERVATIONS.inc(lease._reservations, outcome="reserved")
+        with self._lock:
+            self._roll()
+            self._settle(lease.scopes, held, spent, floor)
+            self.stats.reserved += lease._reservations
+            self.stats.estimated_micros += lease._estimated
+            self.stats.actual_micros += lease._actual
+            error: BudgetExceededError | None = None
+            for extra in (want, need):
+                try:
+                    self._take(lease.scopes, extra)
+                except BudgetExceededError as exc:
+                    error = exc
+                    continue
+                if extra:
+                    self.stats.refills += 1
+                return floor + extra
+            if not need:
+                return floor
+            self.stats.denied += 1
+        RESERVATIONS.inc(outcome="denied")
+        assert error is not None
+        raise error
+
+    # -- balance updates (caller holds the lock) ---------------------------------
+
+    def _account(self, scope: str) -> _Account:
+        account = self._accounts.get(scope)
+        if account is None:
+            account = self._accounts[scope] = _Account()
+        return account
+
+    def _roll(self) -> None:
+        now = self._clock()
+        if now >= self._period + PERIOD_SECONDS:
+            self._period = period_start(now)
+            for account in self._accounts.values():
+                account.spent = 0
+                account.saved = 0
+
+    def _take(self, scopes: tuple[str, ...], micros: int) -> None:
+        accounts = [self._account(scope) for scope in scopes]
+        for scope, account in zip(scopes, accounts, strict=True):
+            limit = account.limit
+            if limit is not None and account.spent + account.committed + micros > limit:
+                raise BudgetExceededError(
+                    scope,
+                    to_usd(micros),
+                    to_usd(max(0, limit - account.spent - account.committed)),
+                )
+        for account in accounts:
+            account.committed += micros
+
+    def _settle(
+        self, scopes: tuple[str, ...], held: int, spent: int, keep: int
+    ) -> None:
+        """Swap ``held`` committed for ``spent`` spent plus ``keep`` committed."""
+        overrun = False
+        for scope in scopes:
+            account = self._account(scope)
+            account.committed += keep - held
+            if spent:
+                account.spent += spent
+                key = (scope, self._period)
+                self._pending[key] = self._pending.get(key, 0) + spent
+            limit = account.limit
+            if limit is not None and account.spent + account.committed > limit:
+                overrun = overrun or spent + keep > held
+        if overrun:
+            self.stats.overruns += 1
+            OVERRUNS.inc()
+            logger.warning("budget overrun: scopes=%s spent=%d", scopes, spent)
+
+    # -- reconciliation --------------------------------------------------------
+
+    async def reconcile(self) -> int:
+        """Write settled spend to the store; returns the rows written."""
+        if self.store is None:
+            return 0
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            deltas = [
+                BudgetDelta(
+                    scope,
+                    start,
+                    start + PERIOD_SECONDS,
+                    spent,
+                    self._accounts[scope].committed if start == self._period else 0,
+                )
+                for (scope, start), spent in pending.items()
+            ]
+        if not deltas:
+            return 0
+        try:
+            await asyncio.to_thread(self.store.apply, deltas, self._clock())
+        except BaseException:
+            with self._lock:
+                for key, spent in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + spent
+            raise
+        self.stats.reconciles += 1
+        return len(deltas)
+
+    def start(self) -> None:
+        if self._reconciler is None and self.store is not None:
+            self._reconciler = asyncio.create_task(self._reconcile_forever())
+
+    async def close(self) -> None:
+        """Stop the background loop and reconcile what is left."""
+        if self._reconciler is not None:
+            self._reconciler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reconciler
+            self._reconciler = None
+        await self.reconcile()
+
+    async def __aenter__(self) -> BudgetLedger:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def _reconcile_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("budget reconcile failed; will retry")
+
+
+class BudgetLease:
+    """A Worker-local slice of ledger quota over fixed ``scopes``.
+
+    Reserving, committing and releasing within the slice is local
+    arithmetic. The ledger is consulted only to refill, in slices of
+    ``slice_micros`` beyond the request. A lease is not thread-safe: give
+    each Worker (or event loop) its own, and :meth:`close` it to return
+    unused quota.
+    """
+
+    def __init__(
+        self, ledger: BudgetLedger, scopes: tuple[str, ...], slice_micros: int
+    ) -> None:
+        self.ledger = ledger
+        self.scopes = scopes
+        self.slice_micros = slice_micros
+        self._held = 0
+        self._reserved = 0
+        self._spent = 0
+        # Counted locally, folded into the ledger's stats at each settlement.
+        self._reservations = 0
+        self._estimated = 0
+        self._actual = 0
+
+    @property
+    def held_usd(self) -> float:
+        """Quota this lease holds at the ledger (counted as committed there)."""
+        return to_usd(self._held)
+
+    @property
+    def available_usd(self) -> float:
+        return to_usd(max(0, self._held - self._reserved - self._spent))
+
+    def reserve(self, amount_usd: float) -> Reservation:
+        """Hold ``amount_usd`` from the slice, refilling from the ledger if
+        short; raises :class:`BudgetExceededError` if the ledger cannot."""
+        micros = to_micros(amount_usd)
+        free = self._held - self._reserved - self._spent
+        if free < micros:
+            self._exchange(want=micros + self.slice_micros, need=micros)
+        self._reserved += micros
+        self._reservations += 1
+        return Reservation(self, self.scopes, micros)
+
+    def settle(self) -> None:
+        """Report recorded spend to the ledger, keeping the free quota."""
+        free = max(0, self._held - self._reserved - self._spent)
+        self._exchange(want=free, need=0)
+
+    def close(self) -> None:
+        """Settle and return every unreserved micro to the ledger."""
+        self._exchange(want=0, need=0)
+
+    def __enter__(self) -> BudgetLease:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _commit(self, reservation: Reservation, actual: int) -> None:
+        self._reserved -= reservation.micros
+        self._spent += actual
+        self._estimated += reservation.micros
+        self._actual += actual
+        if self._spent + self._reserved > self._held:
+            self._exchange(want=0, need=0)  # overran the slice: settle now
+
+    def _release(self, reservation: Reservation) -> None:
+        self._reserved -= reservation.micros
+
+    def _exchange(self, *, want: int, need: int) -> None:
+        try:
+            self._held = self.ledger._exchange(
+                self,
+                held=self._held,
+                spent=self._spent,
+                floor=self._reserved,
+                want=want,
+                need=need,
+            )
+        except BudgetExceededError:
+            self._held = self._reserved
+            raise
+        finally:
+            self._spent = self._reservations = self._estimated = self._actual = 0
@@ -0,0 +1,132 @@
+"""
+Relational system of record for Budget State (specs/technical.md §3.12).
+
+The ledger keeps live balances in memory and reconciles them here in bulk:
+each :meth:`BudgetStore.apply` call adds the spend accumulated since the
+last reconciliation and overwrites the committed amount, one row per
+``(scope, period_start)``. On startup the ledger reloads the current
+period's spend with :meth:`BudgetStore.load`, so a restart does not reset
+the daily limit.
+
+Amounts are integer micro-USD (1e-6), exact where floats are not.
+"""
+
+from __future__ import annotations
+
+import abc
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from chimera.budget.base import BudgetError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS budget_state (
+    scope TEXT NOT NULL,
+    period_start REAL NOT NULL,
+    period_end REAL NOT NULL,
+    spent_micros INTEGER NOT NULL,
+    committed_micros INTEGER NOT NULL,
+    last_updated REAL NOT NULL,
+    PRIMARY KEY (scope, period_start)
+);
+"""
+
+_APPLY = """
+INSERT INTO budget_state
+    (scope, period_start, period_end, spent_micros, committed_micros, last_updated)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (scope, period_start) DO UPDATE SET
+    spent_micros = spent_micros + excluded.spent_micros,
+    committed_micros = excluded.committed_micros,
+    last_updated = excluded.last_updated
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetDelta:
+    """Spend accrued by one scope in one period since the last reconcile."""
+
+    scope: str
+    period_start: float
+    period_end: float
+    spent_micros: int
+    committed_micros: int
+
+
+class BudgetStore(abc.ABC):
+    """Durable Budget State. Calls are synchronous; the ledger threads them."""
+
+    @abc.abstractmethod
+    def load(self, period_start: float) -> dict[str, int]:
+        """``{scope: spent_micros}`` recorded for the period."""
+
+    @abc.abstractmethod
+    def apply(self, deltas: Iterable[BudgetDelta], now: float) -> None:
+        """Atomically add ``deltas`` to the stored balances."""
+
+    def close(self) -> None:
+        return None
+
+
+class SQLiteBudgetStore(BudgetStore):
+    """:class:`BudgetStore` in a SQLite file (WAL mode, one transaction per
+    reconcile)."""
+
+    def __init__(
+        self, path: str | Path = ":memory:", *, synchronous: str = "NORMAL"
+    ) -> None:
+        if synchronous not in ("OFF", "NORMAL", "FULL"):
+            raise BudgetError(f"Unknown synchronous mode {synchronous!r}")
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def load(self, period_start: float) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scope, spent_micros FROM budget_state WHERE period_start = ?",
+                (period_start,),
+            ).fetchall()
+        return dict(rows)
+
+    def apply(self, deltas: Iterable[BudgetDelta], now: float) -> None:
+        rows = [
+            (
+                d.scope,
+                d.period_start,
+                d.period_end,
+                d.spent_micros,
+                d.committed_micros,
+                now,
+            )
+            for d in deltas
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_APPLY, rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def rows(self) -> list[BudgetDelta]:
+        """Every stored balance, for reporting and tests."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scope, period_start, period_end, spent_micros,"
+                " committed_micros FROM budget_state ORDER BY period_start, scope"
+            ).fetchall()
+        return [BudgetDelta(*row) for row in rows]
@@ -0,0 +1,77 @@
+"""
+Chimera command line (``chimera``, see ``[project.scripts]``).
+
+Commands:
+
+- ``chimera trace <id>``   rebuild a workflow tree (campaign → task → result →
+  publication) from the audit log, given its correlation ID or any event ID
+  in it (specs/technical.md §11.2)
+- ``chimera reindex``      rebuild the audit index from the segment files
+
+The audit directory defaults to ``$CHIMERA_AUDIT_DIR`` or ``./audit``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from chimera.audit import AuditIndex, TraceNode, render_trace
+
+app = typer.Typer(help="Project Chimera operations CLI.", no_args_is_help=True)
+
+AuditDir = Annotated[
+    Path,
+    typer.Option(
+        "--audit-dir",
+        envvar="CHIMERA_AUDIT_DIR",
+        file_okay=False,
+        help="Directory holding the audit segment files.",
+    ),
+]
+
+
+@app.command()
+def trace(
+    ref: Annotated[str, typer.Argument(help="Correlation ID or any event ID.")],
+    audit_dir: AuditDir = Path("audit"),
+    as_json: Annotated[
+        bool, typer.Option("--json", help="Print the tree as JSON.")
+    ] = False,
+) -> None:
+    """Rebuild the workflow tree for a correlation ID from the audit log."""
+    index = AuditIndex(audit_dir)
+    try:
+        index.catch_up()
+        roots = index.trace(ref)
+    finally:
+        index.close()
+    if not roots:
+        typer.echo(f"No audit events for {ref!r}", err=True)
+        raise typer.Exit(code=1)
+    if as_json:
+        typer.echo(json.dumps([_to_json(root) for root in roots], indent=2))
+    else:
+        typer.echo(render_trace(roots))
+
+
+@app.command()
+def reindex(audit_dir: AuditDir = Path("audit")) -> None:
+    """Rebuild the audit index from the segment files."""
+    index = AuditIndex(audit_dir)
+    try:
+        count = index.rebuild()
+    finally:
+        index.close()
+    typer.echo(f"Indexed {count} audit events in {audit_dir}")
+
+
+def _to_json(node: TraceNode) -> dict[str, Any]:
+    return {**node.event, "children": [_to_json(child) for child in node.children]}
+
+
+def main() -> None:
+    app()
@@ -0,0 +1,34 @@
+"""
+Completion caching for the ``text_completion`` MCP Tool (specs/technical.md §8.3).
+
+- :class:`CompletionKey` — canonical key: persona id and version, template,
+  normalised inputs and model parameters
+- :class:`CompletionCache` — TTL/LRU/size-bounded, single-flight cache that
+  reports the spend each hit avoided
+"""
+
+from chimera.completions.cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    CachedCompletion,
+    CompletionCache,
+    CompletionCacheStats,
+    CompletionKey,
+    CompletionLookup,
+    canonical,
+    digest,
+)
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_TTL_SECONDS",
+    "CachedCompletion",
+    "CompletionCache",
+    "CompletionCacheStats",
+    "CompletionKey",
+    "CompletionLookup",
+    "canonical",
+    "digest",
+]
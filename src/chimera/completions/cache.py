@@ -0,0 +1,267 @@
+"""
+Completion cache in front of the ``text_completion`` MCP Tool.
+
+Identical or near-identical prompts reach the LLM repeatedly. Sources
+include retries after ``CONTENT_QUALITY_LOW``, HITL "Defer"
+resubmissions, reruns after an OCC conflict (§6.6), and several agents of
+one campaign working the same trend. :class:`CompletionCache` answers
+those from memory.
+
+The key is canonical rather than the raw prompt text. A
+:class:`CompletionKey` hashes four parts:
+
+- the persona id and version (§3.2);
+- the prompt template identity;
+- the template inputs, normalised (keys sorted, whitespace collapsed,
+  Unicode NFC);
+- the model parameters.
+
+Two calls that would render the same prompt for the same persona and model
+therefore share an entry, even when their inputs differ in whitespace or
+key order.
+
+Entries expire after ``ttl`` seconds and are evicted least-recently-used
+once ``max_entries`` or ``max_bytes`` is exceeded. Concurrent misses for
+one key are coalesced into a single tool call
+(:class:`~chimera.asyncutil.SingleFlight`), which is cancelled if every
+caller waiting on it is. Each entry remembers what
+its completion cost, so every hit reports the spend it avoided.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from chimera.asyncutil import SingleFlight
+from chimera.metrics import counter
+
+DEFAULT_TTL_SECONDS = 3_600.0
+DEFAULT_MAX_ENTRIES = 4_096
+DEFAULT_MAX_BYTES = 32 * 2**20
+
+LOOKUPS = counter(
+    "chimera_completion_cache",
+    "text_completion lookups by outcome",
+    labelnames=("outcome",),
+)
+
+
+def canonical(value: Any) -> Any:
+    """``value`` with strings normalised and mappings made order-free."""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFC", value).split())
+    if isinstance(value, Mapping):
+        return {str(k): canonical(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list | tuple):
+        return [canonical(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def digest(value: Any) -> str:
+    """Stable short hash of ``canonical(value)``."""
+    text = json.dumps(
+        canonical(value), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CompletionKey:
+    persona: str
+    template: str
+    inputs: str
+    model: str
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        persona_id: str,
+        persona_version: str,
+        template: str,
+        inputs: Mapping[str, Any],
+        model_params: Mapping[str, Any] | None = None,
+    ) -> CompletionKey:
+        """Key for rendering ``template`` with ``inputs`` for one persona."""
+        return cls(
+            persona=f"{persona_id}@{persona_version}",
+            template=digest(template),
+            inputs=digest(inputs),
+            model=digest(model_params or {}),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedCompletion:
+    response: Mapping[str, Any]
+    cost_usd: float
+    expires_at: float
+    size: int
+
+
+@dataclass(slots=True)
+class CompletionCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    saved_usd: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class CompletionLookup:
+    """A completion and how it was obtained (for ``tool_usage``/provenance)."""
+
+    response: dict[str, Any]
+    source: str  # "cache", "coalesced", "tool" or "bypass"
+    saved_usd: float = 0.0
+
+    @property
+    def cached(self) -> bool:
+        return self.source in ("cache", "coalesced")
+
+
+class CompletionCache:
+    """TTL/LRU/size-bounded cache of ``text_completion`` responses.
+
+    Usage::
+
+        lookup = await cache.get_or_complete(key, lambda: call_tool(params))
+        if lookup.cached:
+            ledger.record_savings(scopes, lookup.saved_usd)
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.stats = CompletionCacheStats()
+        self.nbytes = 0
+        self._entries: OrderedDict[CompletionKey, CachedCompletion] = OrderedDict()
+        self._inflight: SingleFlight[CompletionKey, dict[str, Any]] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: CompletionKey) -> CachedCompletion | None:
+        """A fresh entry (refreshing its LRU position) or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self.clock():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CompletionKey, response: Mapping[str, Any]) -> None:
+        cost = response.get("cost_usd")
+        self._drop(key)
+        entry = CachedCompletion(
+            dict(response),
+            float(cost) if isinstance(cost, int | float) else 0.0,
+            self.clock() + self.ttl,
+            _size(response),
+        )
+        self._entries[key] = entry
+        self.nbytes += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.nbytes > self.max_bytes
+        ):
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, *, persona: str | None = None) -> int:
+        """Drop every entry, or those of one ``persona_id@version``."""
+        doomed = [k for k in self._entries if persona is None or k.persona == persona]
+        for key in doomed:
+            self._drop(key)
+        return len(doomed)
+
+    async def get_or_complete(
+        self,
+        key: CompletionKey,
+        complete: Callable[[], Awaitable[Mapping[str, Any]]],
+        *,
+        fresh: bool = False,
+        keep: Callable[[Mapping[str, Any]], bool] | None = None,
+    ) -> CompletionLookup:
+        """Serve ``key`` from cache, or call ``complete`` and cache the result.
+
+        ``fresh=True`` skips the lookup for prompts that need a new sample;
+        the new response still replaces the entry. Responses for which
+        ``keep`` returns False are returned but not cached, so a retry after
+        a low-quality completion samples again.
+        """
+        if fresh:
+            self.stats.bypassed += 1
+            LOOKUPS.inc(outcome="bypassed")
+            response = dict(await complete())
+            if keep is None or keep(response):
+                self.put(key, response)
+            return CompletionLookup(response, "bypass")
+        entry = self.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self.stats.saved_usd += entry.cost_usd
+            LOOKUPS.inc(outcome="hit")
+            return CompletionLookup(dict(entry.response), "cache", entry.cost_usd)
+        call = functools.partial(self._complete, key, complete, keep)
+        if key in self._inflight:
+            self.stats.coalesced += 1
+            LOOKUPS.inc(outcome="coalesced")
+            response = dict(await self._inflight.run(key, call))
+            cost = response.get("cost_usd")
+            saved = float(cost) if isinstance(cost, int | float) else 0.0
+            self.stats.saved_usd += saved
+            return CompletionLookup(response, "coalesced", saved)
+        self.stats.misses += 1
+        LOOKUPS.inc(outcome="miss")
+        return CompletionLookup(dict(await self._inflight.run(key, call)), "tool")
+
+    async def _complete(
+        self,
+        key: CompletionKey,
+        complete: Callable[[], Awaitable[Mapping[str, Any]]],
+        keep: Callable[[Mapping[str, Any]], bool] | None,
+    ) -> dict[str, Any]:
+        response = dict(await complete())
+        if keep is None or keep(response):
+            self.put(key, response)
+        return response
+
+    def _drop(self, key: CompletionKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.size
+
+
+def _size(response: Mapping[str, Any]) -> int:
+    return len(json.dumps(response, default=str).encode())
@@ -0,0 +1,81 @@
+"""
+Typed data contracts (specs/technical.md §3.1–3.13).
+
+Each contract is a frozen slots record whose fields are the spec's wire
+names, checked in ``__post_init__``. :func:`encode` and :func:`decode`
+move records to and from JSON; ``decode(..., trusted=True)`` and
+:func:`from_trusted` skip the checks for data this runtime already
+validated. :class:`Task`, :class:`ResultArtifact` and
+:class:`~chimera.audit.AuditEvent` are the hot-path types that every
+Planner → Worker → Judge hop carries.
+"""
+
+from chimera.audit import AuditEvent
+from chimera.contracts.base import (
+    AGENT_STATUSES,
+    APPROVAL_TYPES,
+    BUDGET_SCOPES,
+    CAMPAIGN_STATUSES,
+    CONTEXT_TYPES,
+    DISCLOSURE_LEVELS,
+    ENGAGEMENT_ACTIONS,
+    ESCALATION_REASONS,
+    MEMORY_TYPES,
+    PRIORITIES,
+    REVIEW_STATUSES,
+    REVIEWER_ACTIONS,
+    SUGGESTED_ACTIONS,
+    TASK_STATUSES,
+    ContractError,
+)
+from chimera.contracts.codec import decode, encode, from_dict, from_trusted, to_dict
+from chimera.contracts.records import (
+    Agent,
+    BudgetPolicyRecord,
+    BudgetState,
+    Campaign,
+    EngagementAction,
+    EpisodicMemory,
+    Persona,
+    PublicationRecord,
+    SemanticMemory,
+)
+from chimera.contracts.review import ReviewerDecision, ReviewItem
+from chimera.contracts.task import ResultArtifact, Task
+
+__all__ = [
+    "AGENT_STATUSES",
+    "APPROVAL_TYPES",
+    "BUDGET_SCOPES",
+    "CAMPAIGN_STATUSES",
+    "CONTEXT_TYPES",
+    "DISCLOSURE_LEVELS",
+    "ENGAGEMENT_ACTIONS",
+    "ESCALATION_REASONS",
+    "MEMORY_TYPES",
+    "PRIORITIES",
+    "REVIEWER_ACTIONS",
+    "REVIEW_STATUSES",
+    "SUGGESTED_ACTIONS",
+    "TASK_STATUSES",
+    "Agent",
+    "AuditEvent",
+    "BudgetPolicyRecord",
+    "BudgetState",
+    "Campaign",
+    "ContractError",
+    "EngagementAction",
+    "EpisodicMemory",
+    "Persona",
+    "PublicationRecord",
+    "ResultArtifact",
+    "ReviewItem",
+    "ReviewerDecision",
+    "SemanticMemory",
+    "Task",
+    "decode",
+    "encode",
+    "from_dict",
+    "from_trusted",
+    "to_dict",
+]
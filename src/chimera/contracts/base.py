@@ -0,0 +1,96 @@
+"""
+Shared enums and field checks for the data contracts (specs/technical.md §3).
+
+The checks raise :class:`ContractError` naming the offending field. They
+are plain functions instead of a schema library so that a record's
+``__post_init__`` costs a few attribute reads per field.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Collection, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from chimera.errors import ChimeraError
+
+PRIORITIES = ("high", "medium", "low")
+AGENT_STATUSES = ("active", "paused", "suspended")
+CAMPAIGN_STATUSES = ("active", "paused", "completed", "cancelled")
+TASK_STATUSES = ("pending", "in_progress", "review", "complete", "failed")
+ESCALATION_REASONS = ("low_confidence", "sensitive_topic", "mandatory_hitl", "anomaly")
+REVIEW_STATUSES = ("pending", "approved", "rejected", "edited", "deferred")
+REVIEWER_ACTIONS = ("approve", "approve_with_edit", "reject", "defer")
+SUGGESTED_ACTIONS = ("approve", "reject")
+DISCLOSURE_LEVELS = ("automated", "assisted", "none")
+APPROVAL_TYPES = ("auto", "hitl")
+ENGAGEMENT_ACTIONS = ("reply", "like", "repost", "follow")
+CONTEXT_TYPES = ("conversation", "action", "observation")
+MEMORY_TYPES = ("experience", "fact", "relationship")
+BUDGET_SCOPES = ("global", "campaign", "agent")
+
+_UUID = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+).fullmatch
+
+
+class ContractError(ChimeraError):
+    """Raised when a record does not satisfy its data contract."""
+
+
+def now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def check_uuid(name: str, value: Any) -> None:
+    if not isinstance(value, str) or _UUID(value) is None:
+        raise ContractError(f"{name} must be a UUID, got {value!r}")
+
+
+def check_uuids(name: str, values: Sequence[Any]) -> None:
+    for value in values:
+        check_uuid(name, value)
+
+
+def check_text(name: str, value: Any) -> None:
+    if not isinstance(value, str) or not value.strip():
+        raise ContractError(f"{name} must be a non-empty string")
+
+
+def check_enum(name: str, value: Any, allowed: Collection[str]) -> None:
+    if value not in allowed:
+        raise ContractError(f"{name} must be one of {', '.join(allowed)}: {value!r}")
+
+
+def check_timestamp(name: str, value: Any) -> None:
+    """``value`` must be an ISO-8601 string (``Z`` suffix allowed)."""
+    try:
+        datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ContractError(f"{name} must be an ISO-8601 timestamp") from None
+
+
+def check_unit(name: str, value: Any) -> None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise ContractError(f"{name} must be a number")
+    if not 0.0 <= value <= 1.0:
+        raise ContractError(f"{name} must be within [0.0, 1.0], got {value}")
+
+
+def check_count(name: str, value: Any) -> None:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ContractError(f"{name} must be a non-negative integer")
+
+
+def check_amount(name: str, value: Any) -> None:
+    if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+        raise ContractError(f"{name} must be a non-negative amount")
+
+
+def check_mapping(name: str, value: Any, *, keys: Sequence[str] = ()) -> None:
+    if not isinstance(value, Mapping):
+        raise ContractError(f"{name} must be an object")
+    for key in keys:
+        if key not in value:
+            raise ContractError(f"{name} is missing {key!r}")
@@ -0,0 +1,105 @@
+"""
+JSON codec for contract records (specs/technical.md §3.13).
+
+Records are frozen slots dataclasses whose field names are the wire names,
+so :func:`encode` hands the record itself to ``pydantic_core.to_json``,
+which serializes it natively without building an intermediate dict.
+:func:`decode` parses with ``pydantic_core.from_json``.
+
+Two ways in:
+
+- :func:`from_dict` / ``decode(..., trusted=False)`` runs the record's
+  ``__post_init__`` checks. Use it for anything that came from outside the
+  process or from another component.
+- :func:`from_trusted` / ``decode(..., trusted=True)`` fills the slots directly
+  and skips them. Use it only for data this runtime validated and encoded
+  itself, e.g. a task read back from our own queue. Every field must be
+  present; sequences are still converted to tuples.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from pydantic_core import from_json, to_json
+
+from chimera.contracts.base import ContractError
+
+R = TypeVar("R")
+
+_set = object.__setattr__
+
+
+_Layout = tuple[tuple[str, bool], ...]
+_LAYOUTS: dict[type, _Layout] = {}
+
+
+def _layout(cls: type) -> _Layout:
+    """``(name, is_tuple)`` for each field of ``cls``, in declaration order."""
+    layout = _LAYOUTS.get(cls)
+    if layout is None:
+        if not dataclasses.is_dataclass(cls):
+            raise ContractError(f"{cls.__name__} is not a contract record")
+        layout = _LAYOUTS[cls] = tuple(
+            (f.name, str(f.type).startswith(("tuple[", "Tuple[")))
+            for f in dataclasses.fields(cls)
+        )
+    return layout
+
+
+def from_dict(cls: type[R], data: Mapping[str, Any]) -> R:
+    """Build and validate ``cls`` from a wire dict; unknown keys are ignored."""
+    if not isinstance(data, Mapping):
+        raise ContractError(f"{cls.__name__} must be a JSON object")
+    kwargs = {}
+    for name, is_tuple in _layout(cls):
+        if name in data:
+            value = data[name]
+            kwargs[name] = tuple(value) if is_tuple and type(value) is list else value
+    try:
+        return cls(**kwargs)
+    except TypeError as exc:
+        raise ContractError(f"Malformed {cls.__name__}: {exc}") from None
+
+
+def from_trusted(cls: type[R], data: Mapping[str, Any]) -> R:
+    """Build ``cls`` from an already validated dict without re-checking it."""
+    record = object.__new__(cls)
+    setter = _set
+    try:
+        for name, is_tuple in _layout(cls):
+            value = data[name]
+            setter(record, name, tuple(value) if is_tuple else value)
+    except KeyError as exc:
+        raise ContractError(f"{cls.__name__} missing {exc.args[0]!r}") from None
+    return record
+
+
+def to_dict(record: Any) -> dict[str, Any]:
+    """The wire dict for ``record`` (tuples become lists)."""
+    result = {}
+    for name, is_tuple in _layout(type(record)):
+        value = getattr(record, name)
+        result[name] = list(value) if is_tuple else value
+    return result
+
+
+def encode(record: Any) -> bytes:
+    """Serialize a record to compact JSON."""
+    try:
+        return to_json(record)
+    except ValueError as exc:
+        raise ContractError(f"Cannot encode {type(record).__name__}: {exc}") from exc
+
+
+def decode(cls: type[R], data: bytes | str, *, trusted: bool = False) -> R:
+    """Parse ``data`` into ``cls``; see the module docstring for ``trusted``."""
+    try:
+        parsed = from_json(data)
+    except ValueError as exc:
+        raise ContractError(f"Invalid JSON for {cls.__name__}: {exc}") from None
+    if trusted:
+        return from_trusted(cls, parsed)
+    return from_dict(cls, parsed)
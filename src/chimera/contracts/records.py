@@ -0,0 +1,257 @@
+"""
+Agent, Persona, Campaign, Publication, Engagement, Memory and Budget
+records (specs/technical.md §3.1–3.3, §3.7–3.9, §3.11–3.12).
+
+These are the wire forms: field names follow the spec tables and
+timestamps are ISO-8601 strings. Runtime views with float clocks live
+with the subsystems that use them, e.g. :class:`chimera.budget.BudgetPolicy`
+and :class:`chimera.memory.LongTermMemory`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from chimera.contracts.base import (
+    AGENT_STATUSES,
+    APPROVAL_TYPES,
+    BUDGET_SCOPES,
+    CAMPAIGN_STATUSES,
+    CONTEXT_TYPES,
+    DISCLOSURE_LEVELS,
+    ENGAGEMENT_ACTIONS,
+    MEMORY_TYPES,
+    PRIORITIES,
+    ContractError,
+    check_amount,
+    check_count,
+    check_enum,
+    check_mapping,
+    check_text,
+    check_timestamp,
+    check_unit,
+    check_uuid,
+    check_uuids,
+    now_iso,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Agent:
+    """A persistent agent identity (§3.1)."""
+
+    agent_id: str
+    name: str
+    persona_ref: str
+    wallet_address: str
+    status: str = "active"
+    created_at: str = field(default_factory=now_iso)
+    config: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        check_uuid("agent_id", self.agent_id)
+        check_text("name", self.name)
+        check_text("persona_ref", self.persona_ref)
+        check_text("wallet_address", self.wallet_address)
+        check_enum("status", self.status, AGENT_STATUSES)
+        check_timestamp("created_at", self.created_at)
+        check_mapping("config", self.config)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Persona:
+    """The SOUL.md identity an agent references (§3.2)."""
+
+    name: str
+    id: str
+    backstory: str
+    voice_traits: tuple[str, ...]
+    directives: tuple[str, ...]
+    core_beliefs: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        check_text("name", self.name)
+        check_text("id", self.id)
+        check_text("backstory", self.backstory)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Campaign:
+    """A goal assigned to one or more agents (§3.3)."""
+
+    campaign_id: str
+    goal_description: str
+    agent_ids: tuple[str, ...]
+    priority: str = "medium"
+    budget_allocation: dict[str, Any] | None = None
+    status: str = "active"
+    created_at: str = field(default_factory=now_iso)
+    created_by: str
+    constraints: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("campaign_id", self.campaign_id)
+        check_text("goal_description", self.goal_description)
+        if not self.agent_ids:
+            raise ContractError("agent_ids must contain at least one agent")
+        check_uuids("agent_ids", self.agent_ids)
+        check_enum("priority", self.priority, PRIORITIES)
+        check_enum("status", self.status, CAMPAIGN_STATUSES)
+        check_timestamp("created_at", self.created_at)
+        check_text("created_by", self.created_by)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PublicationRecord:
+    """Content published to an external platform (§3.7)."""
+
+    publication_id: str
+    result_id: str
+    platform: str
+    account_id: str
+    external_id: str
+    content_snapshot: dict[str, Any]
+    disclosure_level: str
+    published_at: str = field(default_factory=now_iso)
+    approval_type: str
+    approver_id: str | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("publication_id", self.publication_id)
+        check_uuid("result_id", self.result_id)
+        check_text("platform", self.platform)
+        check_text("account_id", self.account_id)
+        check_text("external_id", self.external_id)
+        check_mapping("content_snapshot", self.content_snapshot)
+        check_enum("disclosure_level", self.disclosure_level, DISCLOSURE_LEVELS)
+        check_timestamp("published_at", self.published_at)
+        check_enum("approval_type", self.approval_type, APPROVAL_TYPES)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EngagementAction:
+    """A reply, like, repost or follow (§3.8)."""
+
+    engagement_id: str
+    action_type: str
+    target_id: str
+    platform: str
+    content: dict[str, Any] | None = None
+    result_id: str
+    executed_at: str = field(default_factory=now_iso)
+
+    def __post_init__(self) -> None:
+        check_uuid("engagement_id", self.engagement_id)
+        check_enum("action_type", self.action_type, ENGAGEMENT_ACTIONS)
+        check_text("target_id", self.target_id)
+        check_text("platform", self.platform)
+        check_uuid("result_id", self.result_id)
+        check_timestamp("executed_at", self.executed_at)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EpisodicMemory:
+    """A short-term memory item (§3.9)."""
+
+    memory_id: str
+    agent_id: str
+    content: str
+    context_type: str
+    created_at: str = field(default_factory=now_iso)
+    ttl_seconds: int
+
+    def __post_init__(self) -> None:
+        check_uuid("memory_id", self.memory_id)
+        check_uuid("agent_id", self.agent_id)
+        check_text("content", self.content)
+        check_enum("context_type", self.context_type, CONTEXT_TYPES)
+        check_timestamp("created_at", self.created_at)
+        check_count("ttl_seconds", self.ttl_seconds)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SemanticMemory:
+    """A long-term memory item with its embedding (§3.9)."""
+
+    memory_id: str
+    agent_id: str
+    memory_type: str
+    content: str
+    context: str | None = None
+    importance_score: float
+    embedding: tuple[float, ...]
+    created_at: str = field(default_factory=now_iso)
+
+    def __post_init__(self) -> None:
+        check_uuid("memory_id", self.memory_id)
+        check_uuid("agent_id", self.agent_id)
+        check_enum("memory_type", self.memory_type, MEMORY_TYPES)
+        check_text("content", self.content)
+        check_unit("importance_score", self.importance_score)
+        if not self.embedding:
+            raise ContractError("embedding must not be empty")
+        check_timestamp("created_at", self.created_at)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BudgetPolicyRecord:
+    """Cost governance configuration (§3.11); amounts in ``currency``."""
+
+    policy_id: str
+    scope: str = "global"
+    scope_id: str | None = None
+    daily_limit: float = 50.0
+    per_task_limit: float | None = None
+    transaction_hitl_threshold: float = 10.0
+    currency: str = "USDC"
+
+    def __post_init__(self) -> None:
+        check_uuid("policy_id", self.policy_id)
+        check_enum("scope", self.scope, BUDGET_SCOPES)
+        if (self.scope == "global") != (self.scope_id is None):
+            raise ContractError(
+                "scope_id is required for, and only for, scoped policies"
+            )
+        if self.scope_id is not None:
+            check_uuid("scope_id", self.scope_id)
+        check_amount("daily_limit", self.daily_limit)
+        if self.per_task_limit is not None:
+            check_amount("per_task_limit", self.per_task_limit)
+        check_amount("transaction_hitl_threshold", self.transaction_hitl_threshold)
+        check_text("currency", self.currency)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BudgetState:
+    """Spend in the current period of one policy (§3.12)."""
+
+    state_id: str
+    policy_id: str
+    period_start: str
+    period_end: str
+    spent: float = 0.0
+    committed: float = 0.0
+    last_updated: str = field(default_factory=now_iso)
+
+    def __post_init__(self) -> None:
+        check_uuid("state_id", self.state_id)
+        check_uuid("policy_id", self.policy_id)
+        check_timestamp("period_start", self.period_start)
+        check_timestamp("period_end", self.period_end)
+        try:
+            ordered = datetime.fromisoformat(
+                self.period_start
+            ) < datetime.fromisoformat(self.period_end)
+        except TypeError:  # one naive, one aware
+            ordered = False
+        if not ordered:
+            raise ContractError("period_end must be after period_start")
+        check_amount("spent", self.spent)
+        check_amount("committed", self.committed)
+        check_timestamp("last_updated", self.last_updated)
+
+    def fits(self, policy: BudgetPolicyRecord) -> bool:
+        """The §3.12 invariant: ``spent + committed`` within the daily limit."""
+        return self.spent + self.committed <= policy.daily_limit
@@ -0,0 +1,96 @@
+"""
+Review Item and Reviewer Decision (specs/technical.md §3.6, §3.13.3–3.13.4).
+
+A :class:`ReviewItem` carries the §3.6 record and the optional §3.13.3
+message fields (``content_preview``, ``suggested_action``,
+``correlation_id``), so the Judge → HITL message and the stored item are
+one type.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.contracts.base import (
+    ESCALATION_REASONS,
+    REVIEW_STATUSES,
+    REVIEWER_ACTIONS,
+    SUGGESTED_ACTIONS,
+    ContractError,
+    check_enum,
+    check_mapping,
+    check_text,
+    check_timestamp,
+    check_unit,
+    check_uuid,
+    now_iso,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReviewItem:
+    """An escalated result awaiting human review (§3.6)."""
+
+    review_id: str
+    result_id: str
+    escalation_reason: str
+    confidence_score: float
+    reasoning_trace: str
+    context_snapshot: dict[str, Any]
+    status: str = "pending"
+    created_at: str = field(default_factory=now_iso)
+    reviewed_at: str | None = None
+    reviewer_id: str | None = None
+    reviewer_action: str | None = None
+    edit_content: dict[str, Any] | None = None
+    content_preview: dict[str, Any] | None = None
+    suggested_action: str | None = None
+    correlation_id: str | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("review_id", self.review_id)
+        check_uuid("result_id", self.result_id)
+        check_enum("escalation_reason", self.escalation_reason, ESCALATION_REASONS)
+        check_unit("confidence_score", self.confidence_score)
+        check_text("reasoning_trace", self.reasoning_trace)
+        check_mapping(
+            "context_snapshot",
+            self.context_snapshot,
+            keys=("campaign_goal", "persona_name"),
+        )
+        check_enum("status", self.status, REVIEW_STATUSES)
+        check_timestamp("created_at", self.created_at)
+        if self.reviewed_at is not None:
+            check_timestamp("reviewed_at", self.reviewed_at)
+        if self.reviewer_action is not None:
+            check_enum("reviewer_action", self.reviewer_action, REVIEWER_ACTIONS)
+        if self.suggested_action is not None:
+            check_enum("suggested_action", self.suggested_action, SUGGESTED_ACTIONS)
+        if self.correlation_id is not None:
+            check_uuid("correlation_id", self.correlation_id)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReviewerDecision:
+    """The HITL → Runtime decision message (§3.13.4)."""
+
+    review_id: str
+    reviewer_id: str
+    action: str
+    edited_content: dict[str, Any] | None = None
+    rejection_reason: str | None = None
+    reviewed_at: str = field(default_factory=now_iso)
+    correlation_id: str | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("review_id", self.review_id)
+        check_text("reviewer_id", self.reviewer_id)
+        check_enum("action", self.action, REVIEWER_ACTIONS)
+        if self.action == "approve_with_edit" and not self.edited_content:
+            raise ContractError("approve_with_edit requires edited_content")
+        if self.edited_content is not None:
+            check_mapping("edited_content", self.edited_content)
+        check_timestamp("reviewed_at", self.reviewed_at)
+        if self.correlation_id is not None:
+            check_uuid("correlation_id", self.correlation_id)
@@ -0,0 +1,103 @@
+"""
+Task and Result Artifact (specs/technical.md §3.4–3.5, §3.13.1–3.13.2).
+
+These two cross every Planner → Worker → Judge hop, so they are compact
+slots records whose wire form is the §3.13 envelope: a :class:`Task`
+encodes to the Task Input message plus its lifecycle fields, and a
+:class:`ResultArtifact` to the Result Artifact Output message plus
+``created_at``. Use :func:`~chimera.contracts.from_trusted` to rebuild one
+this runtime has already validated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.contracts.base import (
+    PRIORITIES,
+    TASK_STATUSES,
+    ContractError,
+    check_count,
+    check_enum,
+    check_mapping,
+    check_text,
+    check_timestamp,
+    check_unit,
+    check_uuid,
+    now_iso,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Task:
+    """An atomic unit of work for a Worker (§3.4)."""
+
+    task_id: str
+    campaign_id: str
+    task_type: str
+    priority: str = "medium"
+    status: str = "pending"
+    context: dict[str, Any]
+    acceptance_criteria: tuple[str, ...]
+    assigned_worker_id: str | None = None
+    created_at: str = field(default_factory=now_iso)
+    deadline: str | None = None
+    retry_count: int = 0
+    max_retries: int = 3
+    correlation_id: str | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("task_id", self.task_id)
+        check_uuid("campaign_id", self.campaign_id)
+        check_text("task_type", self.task_type)
+        check_enum("priority", self.priority, PRIORITIES)
+        check_enum("status", self.status, TASK_STATUSES)
+        # §3.13.1: enough context for stateless execution, starting with a goal.
+        check_mapping("context", self.context)
+        check_text("context.goal_description", self.context.get("goal_description"))
+        if not self.acceptance_criteria:
+            raise ContractError("acceptance_criteria must contain at least one entry")
+        for criterion in self.acceptance_criteria:
+            check_text("acceptance_criteria", criterion)
+        check_timestamp("created_at", self.created_at)
+        if self.deadline is not None:
+            check_timestamp("deadline", self.deadline)
+        check_count("retry_count", self.retry_count)
+        check_count("max_retries", self.max_retries)
+        if self.correlation_id is not None:
+            check_uuid("correlation_id", self.correlation_id)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResultArtifact:
+    """A Worker's output awaiting Judge validation (§3.5)."""
+
+    result_id: str
+    task_id: str
+    worker_id: str
+    artifact_type: str
+    content: dict[str, Any]
+    confidence_score: float
+    tool_usage: tuple[dict[str, Any], ...] = ()
+    provenance: dict[str, Any]
+    created_at: str = field(default_factory=now_iso)
+    execution_duration_ms: int
+    correlation_id: str | None = None
+
+    def __post_init__(self) -> None:
+        check_uuid("result_id", self.result_id)
+        check_uuid("task_id", self.task_id)
+        check_text("worker_id", self.worker_id)
+        check_text("artifact_type", self.artifact_type)
+        check_mapping("content", self.content)
+        check_unit("confidence_score", self.confidence_score)
+        for call in self.tool_usage:
+            check_mapping("tool_usage[]", call, keys=("tool_name",))
+        check_mapping(
+            "provenance", self.provenance, keys=("memory_refs", "signal_refs")
+        )
+        check_timestamp("created_at", self.created_at)
+        check_count("execution_duration_ms", self.execution_duration_ms)
+        if self.correlation_id is not None:
+            check_uuid("correlation_id", self.correlation_id)
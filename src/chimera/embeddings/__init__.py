@@ -0,0 +1,27 @@
+"""
+Text embeddings with batching and a content-hash cache.
+
+- :class:`EmbeddingService` — coalesces concurrent requests into
+  micro-batched backend calls
+- :class:`VectorCache` — memory-mapped ``hash -> vector`` rows returned as
+  zero-copy views
+"""
+
+from chimera.embeddings.cache import EmbeddingError, VectorCache
+from chimera.embeddings.service import (
+    EmbeddingBackend,
+    EmbeddingService,
+    EmbeddingStats,
+    content_key,
+    mcp_backend,
+)
+
+__all__ = [
+    "EmbeddingBackend",
+    "EmbeddingError",
+    "EmbeddingService",
+    "EmbeddingStats",
+    "VectorCache",
+    "content_key",
+    "mcp_backend",
+]
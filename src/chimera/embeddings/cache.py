@@ -0,0 +1,167 @@
+"""
+Memory-mapped vector cache keyed by content hash.
+
+A cache directory holds three files:
+
+- ``meta.json``: ``dim`` and ``dtype``. Reopening with different values
+  raises.
+- ``vectors.bin``: ``capacity x dim`` rows, memory-mapped and grown by
+  doubling.
+- ``keys.bin``: append-only 16-byte content hashes, one per filled row.
+
+A row is written and flushed before its key is appended. A crash can
+therefore leave an unused row, but never a key that points at garbage. On
+open, the key file is read into a ``{hash: row}`` dict, so a lookup is one
+dict probe. Hits come back as read-only views into the map: no copy and no
+deserialisation. Each directory must have a single writer process.
+
+With ``directory=None`` the same cache lives in an in-process array.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from chimera.errors import ChimeraError
+
+KEY_BYTES = 16
+DTYPES = ("float32", "float16")
+DEFAULT_INITIAL_ROWS = 1_024
+
+
+class EmbeddingError(ChimeraError):
+    """Raised when embeddings cannot be computed or cached."""
+
+
+class VectorCache:
+    """``hash -> vector`` rows in one contiguous (optionally mmapped) array."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        dim: int,
+        dtype: str = "float32",
+        initial_rows: int = DEFAULT_INITIAL_ROWS,
+    ) -> None:
+        if dtype not in DTYPES:
+            raise EmbeddingError(f"Unsupported cache dtype {dtype!r}")
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.directory = Path(directory) if directory is not None else None
+        self._rows: dict[bytes, int] = {}
+        self._keys_file: Any = None
+        if self.directory is None:
+            self._vectors: npt.NDArray[Any] = np.zeros(
+                (initial_rows, dim), dtype=self.dtype
+            )
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._check_meta()
+        keys = self.directory / "keys.bin"
+        raw = keys.read_bytes() if keys.exists() else b""
+        count = len(raw) // KEY_BYTES
+        for row in range(count):
+            self._rows[raw[row * KEY_BYTES : (row + 1) * KEY_BYTES]] = row
+        self._keys_file = keys.open("ab")
+        if len(raw) % KEY_BYTES:  # torn final append: drop it
+            self._keys_file.truncate(count * KEY_BYTES)
+        self._vectors = self._map(max(initial_rows, count))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._rows) * self.dim * self.dtype.itemsize
+
+    def get(self, key: bytes) -> npt.NDArray[Any] | None:
+        """A read-only view of the cached vector, or ``None``."""
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        view: npt.NDArray[Any] = self._vectors[row]
+        view.flags.writeable = False
+        return view
+
+    def put_many(self, keys: Sequence[bytes], vectors: npt.ArrayLike) -> None:
+        """Store ``vectors[i]`` under ``keys[i]``; known keys are skipped."""
+        matrix = np.asarray(vectors)
+        if matrix.shape != (len(keys), self.dim):
+            raise EmbeddingError(
+                f"Expected {len(keys)} x {self.dim} vectors, got {matrix.shape}"
+            )
+        fresh: list[bytes] = []
+        positions: list[int] = []
+        for position, key in enumerate(keys):
+            if len(key) != KEY_BYTES:
+                raise EmbeddingError(f"Cache keys are {KEY_BYTES} bytes")
+            if key not in self._rows and key not in fresh:
+                fresh.append(key)
+                positions.append(position)
+        if not fresh:
+            return
+        first = len(self._rows)
+        needed = first + len(fresh)
+        if needed > len(self._vectors):
+            self._grow(needed)
+        self._vectors[first:needed] = matrix[positions].astype(self.dtype)
+        if self._keys_file is not None:
+            assert isinstance(self._vectors, np.memmap)
+            self._vectors.flush()
+            self._keys_file.write(b"".join(fresh))
+            self._keys_file.flush()
+        for offset, key in enumerate(fresh):
+            self._rows[key] = first + offset
+
+    def keys(self) -> Iterable[bytes]:
+        return iter(list(self._rows))
+
+    def close(self) -> None:
+        if self._keys_file is not None:
+            assert isinstance(self._vectors, np.memmap)
+            self._vectors.flush()
+            self._keys_file.close()
+            self._keys_file = None
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * len(self._vectors))
+        if self.directory is None:
+            grown = np.zeros((capacity, self.dim), dtype=self.dtype)
+            grown[: len(self._rows)] = self._vectors[: len(self._rows)]
+            self._vectors = grown
+        else:
+            # Views handed out earlier keep the old mapping alive and valid.
+            self._vectors = self._map(capacity)
+
+    def _map(self, capacity: int) -> np.memmap[Any, Any]:
+        assert self.directory is not None
+        path = self.directory / "vectors.bin"
+        size = capacity * self.dim * self.dtype.itemsize
+        with path.open("ab") as handle:
+            if handle.tell() < size:
+                handle.truncate(size)
+        rows = max(capacity, path.stat().st_size // (self.dim * self.dtype.itemsize))
+        return np.memmap(path, dtype=self.dtype, mode="r+", shape=(rows, self.dim))
+
+    def _check_meta(self) -> None:
+        assert self.directory is not None
+        meta_path = self.directory / "meta.json"
+        meta = {"dim": self.dim, "dtype": self.dtype.name}
+        if meta_path.exists():
+            stored = json.loads(meta_path.read_text())
+            if stored != meta:
+                raise EmbeddingError(
+                    f"Cache at {self.directory} holds {stored}, not {meta}"
+                )
+        else:
+            meta_path.write_text(json.dumps(meta))
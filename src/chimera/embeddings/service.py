@@ -0,0 +1,249 @@
+"""
+Batched, deduplicated text embeddings.
+
+Trend relevance, memory retrieval and persona adherence all embed text,
+and the same trending headlines are embedded by dozens of agents every
+hour. :class:`EmbeddingService` serves those requests in three layers:
+
+1. **Cache.** Each text is keyed by a 16-byte BLAKE2b hash of the model
+   name and the text, and looked up in a :class:`VectorCache`. A hit
+   returns a read-only view of the cached row, with no copy.
+2. **Coalescing.** A text already being computed for another task joins
+   that computation (:class:`~chimera.asyncutil.SingleFlight`) instead of
+   being sent twice.
+3. **Micro-batching.** Remaining texts are queued, and the backend is
+   called once per ``batch_size`` texts or ``batch_window`` seconds,
+   whichever comes first, with up to ``max_concurrent_batches`` calls in
+   flight.
+
+The backend is any ``async (texts) -> (n, dim) array`` callable. An
+embedding model served over MCP can be adapted with :func:`mcp_backend`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+from chimera.asyncutil import SingleFlight
+from chimera.embeddings.cache import EmbeddingError, VectorCache
+from chimera.mcp import tool_payload
+from chimera.metrics import counter
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_CONCURRENT_BATCHES = 4
+
+EmbeddingBackend = Callable[[list[str]], Awaitable[npt.ArrayLike]]
+
+# A queued text: its cache key, the text and the future its batch resolves.
+_Request = tuple[bytes, str, asyncio.Future[npt.NDArray[Any]]]
+
+EMBEDDINGS = counter(
+    "chimera_embeddings",
+    "Texts embedded, by how the vector was obtained",
+    labelnames=("outcome",),
+)
+
+
+def content_key(text: str, model: str) -> bytes:
+    """Cache key of ``text`` under ``model``."""
+    return hashlib.blake2b(
+        f"{model}\0{text}".encode(), digest_size=16, usedforsecurity=False
+    ).digest()
+
+
+class ToolClient(Protocol):
+    async def call_tool(
+        self, tool_name: str, params: dict[str, Any]
+    ) -> dict[str, Any]: ...
+
+
+def mcp_backend(
+    client: ToolClient, *, tool_name: str = "embed_texts", model: str | None = None
+) -> EmbeddingBackend:
+    """Backend calling an MCP embedding tool: ``{"texts": [...]}`` in,
+    ``{"embeddings": [[...], ...]}`` out, either as the tool's domain dict
+    or inside a ``CallToolResult`` dump (structured or JSON text content)."""
+
+    async def embed(texts: list[str]) -> npt.ArrayLike:
+        params: dict[str, Any] = {"texts": texts}
+        if model is not None:
+            params["model"] = model
+        result = await client.call_tool(tool_name, params)
+        if isinstance(result, Mapping) and "embeddings" not in result:
+            result = tool_payload(result)
+        embeddings = result.get("embeddings") if isinstance(result, Mapping) else None
+        if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+            raise EmbeddingError(
+                f"{tool_name} returned no embeddings for {len(texts)} texts"
+            )
+        return embeddings
+
+    return embed
+
+
+@dataclass(slots=True)
+class EmbeddingStats:
+    cached: int = 0
+    coalesced: int = 0
+    computed: int = 0
+    batches: int = 0
+    failures: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests that did not reach the backend."""
+        requests = self.cached + self.coalesced + self.computed
+        return (self.cached + self.coalesced) / requests if requests else 0.0
+
+
+class EmbeddingService:
+    """Shared embedding front end for all tasks on one event loop.
+
+    Usage::
+
+        async with EmbeddingService(backend, dim=384, cache=cache) as embeddings:
+            vector = await embeddings.embed("AI regulation passes")
+    """
+
+    def __init__(
+        self,
+        backend: EmbeddingBackend,
+        *,
+        dim: int,
+        model: str = "default",
+        cache: VectorCache | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_concurrent_batches: int = DEFAULT_CONCURRENT_BATCHES,
+    ) -> None:
+        self.backend = backend
+        self.dim = dim
+        self.model = model
+        self.cache = cache if cache is not None else VectorCache(dim=dim)
+        if self.cache.dim != dim:
+            raise EmbeddingError(f"Cache holds {self.cache.dim}-d vectors, not {dim}")
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.stats = EmbeddingStats()
+        self._inflight: SingleFlight[bytes, npt.NDArray[Any]] = SingleFlight()
+        self._pending: list[_Request] = []
+        self._ready = asyncio.Event()
+        self._full = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_concurrent_batches)
+        self._batches: set[asyncio.Task[None]] = set()
+        self._batcher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> EmbeddingService:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def embed(self, text: str) -> npt.NDArray[Any]:
+        """The embedding of ``text``: a read-only view into the cache."""
+        key = content_key(text, self.model)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.cached += 1
+            EMBEDDINGS.inc(outcome="cached")
+            return cached
+        if key in self._inflight:
+            self.stats.coalesced += 1
+            EMBEDDINGS.inc(outcome="coalesced")
+        return await self._inflight.run(
+            key, functools.partial(self._compute, key, text)
+        )
+
+    async def embed_many(self, texts: Iterable[str]) -> list[npt.NDArray[Any]]:
+        """Embeddings of ``texts`` in order (``np.stack`` them for a matrix)."""
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    async def _compute(self, key: bytes, text: str) -> npt.NDArray[Any]:
+        self.start()
+        future: asyncio.Future[npt.NDArray[Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.append((key, text, future))
+        self._ready.set()
+        if len(self._pending) >= self.batch_size:
+            self._full.set()
+        return await future
+
+    def start(self) -> None:
+        if self._batcher is None:
+            self._batcher = asyncio.create_task(self._batch_forever())
+
+    async def close(self) -> None:
+        """Stop batching after computing everything already requested."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._batcher
+            self._batcher = None
+        while self._pending:
+            await self._slots.acquire()
+            self._launch(self._take_batch())
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    async def _batch_forever(self) -> None:
+        while True:
+            await self._ready.wait()
+            if len(self._pending) < self.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.batch_window):
+                        await self._full.wait()
+            await self._slots.acquire()
+            self._launch(self._take_batch())
+
+    def _take_batch(self) -> list[_Request]:
+        batch = self._pending[: self.batch_size]
+        del self._pending[: self.batch_size]
+        if len(self._pending) < self.batch_size:
+            self._full.clear()
+        if not self._pending:
+            self._ready.clear()
+        return batch
+
+    def _launch(self, batch: list[_Request]) -> None:
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task[None]) -> None:
+        self._batches.discard(task)
+        self._slots.release()
+
+    async def _run_batch(self, batch: list[_Request]) -> None:
+        keys = [key for key, _, _ in batch]
+        try:
+            vectors = np.asarray(
+                await self.backend([text for _, text, _ in batch]), dtype=np.float32
+            )
+            self.cache.put_many(keys, vectors)
+        except Exception as exc:
+            self.stats.failures += 1
+            for _, _, future in batch:
+                # Done only if every caller of that text was cancelled.
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.stats.batches += 1
+        self.stats.computed += len(keys)
+        EMBEDDINGS.inc(len(keys), outcome="computed")
+        for key, _, future in batch:
+            if not future.done():
+                vector = self.cache.get(key)
+                assert vector is not None
+                future.set_result(vector)
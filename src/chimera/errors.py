@@ -0,0 +1,18 @@
+"""
+Base exception hierarchy for Project Chimera runtime components.
+
+Every subsystem raises subclasses of ``ChimeraError`` so callers can separate
+runtime failures from programming errors. ``retryable`` mirrors the error
+taxonomy in specs/technical.md §12.1 (transient vs. terminal).
+"""
+
+
+class ChimeraError(Exception):
+    """Base class for all Chimera runtime errors."""
+
+    retryable: bool = False
+
+    def __init__(self, message: str, *, retryable: bool | None = None) -> None:
+        super().__init__(message)
+        if retryable is not None:
+            self.retryable = retryable
@@ -0,0 +1,86 @@
+"""
+HITL review queue (specs/technical.md §3.6, §7).
+
+:class:`HITLQueue` holds escalated results ordered by SLA deadline and
+priority. It serves cursor-paginated summaries, assembles full review
+detail lazily on open, publishes a change feed for dashboards, and routes
+reviewer approvals back to the Judge for commit. :class:`EditLog` stores
+reviewer edits as token deltas against content-addressed originals and
+keeps per-confidence-band edit statistics.
+"""
+
+from chimera.hitl.diff import (
+    DEFAULT_BAND_WIDTH,
+    CalibrationBand,
+    CalibrationStats,
+    ContentStore,
+    Delta,
+    EditLog,
+    EditRecord,
+    EditStats,
+    apply_delta,
+    text_ref,
+    token_delta,
+    tokenize,
+)
+from chimera.hitl.items import (
+    ACTIONS,
+    APPROVE,
+    APPROVE_WITH_EDIT,
+    DEFER,
+    ESCALATION_REASONS,
+    PREVIEW_CHARS,
+    REJECT,
+    STATUSES,
+    ChangeFeed,
+    HITLError,
+    QueueChange,
+    ReviewDecision,
+    ReviewDetail,
+    ReviewOutcome,
+    ReviewPage,
+    ReviewSummary,
+)
+from chimera.hitl.queue import (
+    DEFAULT_MAX_CHANGES,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SLAS,
+    HITLQueue,
+    HITLStats,
+)
+
+__all__ = [
+    "ACTIONS",
+    "APPROVE",
+    "APPROVE_WITH_EDIT",
+    "DEFAULT_BAND_WIDTH",
+    "DEFAULT_MAX_CHANGES",
+    "DEFAULT_PAGE_SIZE",
+    "DEFAULT_SLAS",
+    "DEFER",
+    "ESCALATION_REASONS",
+    "PREVIEW_CHARS",
+    "REJECT",
+    "STATUSES",
+    "CalibrationBand",
+    "CalibrationStats",
+    "ChangeFeed",
+    "ContentStore",
+    "Delta",
+    "EditLog",
+    "EditRecord",
+    "EditStats",
+    "HITLError",
+    "HITLQueue",
+    "HITLStats",
+    "QueueChange",
+    "ReviewDecision",
+    "ReviewDetail",
+    "ReviewOutcome",
+    "ReviewPage",
+    "ReviewSummary",
+    "apply_delta",
+    "text_ref",
+    "token_delta",
+    "tokenize",
+]
@@ -0,0 +1,297 @@
+"""
+Compact edit history for Approve-with-Edit (specs/technical.md §7.3–7.4).
+
+Every reviewer action must log the original content, and every edit must be
+logged as a diff from the original. Writing full before/after snapshots
+for each edit and each platform variant bloats the append-only audit log.
+This module stores edits compactly instead:
+
+- **Content-addressed originals.** :class:`ContentStore` keys each original
+  text by a short hash of its bytes. A text that is escalated again (after
+  a Defer, on another platform variant, or for another agent of the
+  campaign) is stored and logged once. Later records carry only its
+  ``ref``.
+- **Token-level deltas.** :func:`token_delta` diffs the word and
+  punctuation tokens of the original and the edit. It encodes the
+  result as a flat list. A positive int keeps that many original tokens,
+  a negative int drops that many, and a string is inserted text. A
+  one-word fix to a 2,000-character post costs a few bytes. Every delta is
+  taken against the original rather than the previous edit, so
+  :meth:`EditLog.reconstruct` rebuilds any version with one linear pass.
+- **Edit statistics.** Each delta yields an :class:`EditStats`: tokens
+  inserted and deleted, and their share of both texts' tokens.
+  :class:`CalibrationStats` accumulates them per confidence band, showing
+  how much reviewers change content the Worker was, say, 0.85 confident
+  about. That is the evidence for moving ``auto_approve_threshold``.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from chimera.hitl.items import HITLError
+
+DEFAULT_BAND_WIDTH = 0.05
+
+Delta = tuple[int | str, ...]
+
+_TOKEN = re.compile(r"\w+\s*|[^\w\s]\s*|\s+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Words and punctuation marks, each with its trailing whitespace.
+
+    ``"".join(tokenize(text)) == text``. Keeping whitespace attached halves
+    the token count and stops ``" "`` from being the most common token,
+    which makes matching much cheaper.
+    """
+    return _TOKEN.findall(text)
+
+
+def text_ref(text: str) -> str:
+    """Content address of ``text``."""
+    return hashlib.blake2b(
+        text.encode(), digest_size=12, usedforsecurity=False
+    ).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class EditStats:
+    """Token-level size of one edit."""
+
+    tokens_before: int
+    tokens_after: int
+    inserted: int
+    deleted: int
+
+    @property
+    def distance(self) -> int:
+        """Tokens inserted plus tokens deleted (a token-level edit distance)."""
+        return self.inserted + self.deleted
+
+    @property
+    def ratio(self) -> float:
+        """``distance`` relative to the two texts' lengths, in ``[0, 1]``."""
+        total = self.tokens_before + self.tokens_after
+        return self.distance / total if total else 0.0
+
+
+def token_delta(before: str, after: str) -> tuple[Delta, EditStats]:
+    """Compact delta turning ``before`` into ``after``, with its statistics."""
+    old, new = tokenize(before), tokenize(after)
+    # Reviewer edits are local: match the untouched head and tail directly
+    # and leave only the changed middle to SequenceMatcher.
+    head = 0
+    limit = min(len(old), len(new))
+    while head < limit and old[head] == new[head]:
+        head += 1
+    tail = 0
+    limit -= head
+    while tail < limit and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+    delta: list[int | str] = [head] if head else []
+    inserted = deleted = 0
+    middle_old = old[head : len(old) - tail]
+    middle_new = new[head : len(new) - tail]
+    matcher = difflib.SequenceMatcher(None, middle_old, middle_new, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            _keep(delta, i2 - i1)
+            continue
+        if i2 > i1:
+            delta.append(i1 - i2)
+            deleted += i2 - i1
+        if j2 > j1:
+            delta.append("".join(middle_new[j1:j2]))
+            inserted += j2 - j1
+    # Trailing kept tokens are implied.
+    if delta and isinstance(delta[-1], int) and delta[-1] > 0:
+        delta.pop()
+    return tuple(delta), EditStats(len(old), len(new), inserted, deleted)
+
+
+def _keep(delta: list[int | str], count: int) -> None:
+    last = delta[-1] if delta else None
+    if isinstance(last, int) and last > 0:
+        delta[-1] = last + count
+    else:
+        delta.append(count)
+
+
+def apply_delta(before: str, delta: Sequence[int | str]) -> str:
+    """Rebuild the edited text from the original and its delta."""
+    old = tokenize(before)
+    out: list[str] = []
+    at = 0
+    for op in delta:
+        if isinstance(op, str):
+            out.append(op)
+        elif op > 0:
+            out += old[at : at + op]
+            at += op
+        else:
+            at -= op
+        if at > len(old):
+            raise HITLError("Delta does not match the original text")
+    out += old[at:]
+    return "".join(out)
+
+
+class ContentStore:
+    """Content-addressed original texts, each stored once."""
+
+    def __init__(self) -> None:
+        self._texts: dict[str, str] = {}
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._texts
+
+    def put(self, text: str) -> tuple[str, bool]:
+        """``(ref, new)``; ``new`` is False when the text was already stored."""
+        ref = text_ref(text)
+        if ref in self._texts:
+            return ref, False
+        self._texts[ref] = text
+        self.nbytes += len(text.encode())
+        return ref, True
+
+    def get(self, ref: str) -> str:
+        try:
+            return self._texts[ref]
+        except KeyError:
+            raise HITLError(f"Unknown content ref {ref!r}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class EditRecord:
+    """One reviewer edit, stored as a delta against its original."""
+
+    original_ref: str
+    version: int
+    delta: Delta
+    stats: EditStats
+    result_id: str = ""
+    reviewer_id: str = ""
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "original_ref": self.original_ref,
+            "version": self.version,
+            "delta": list(self.delta),
+            "tokens_inserted": self.stats.inserted,
+            "tokens_deleted": self.stats.deleted,
+            "edit_ratio": round(self.stats.ratio, 4),
+        }
+
+
+@dataclass(slots=True)
+class CalibrationBand:
+    """Reviewer outcomes for results whose confidence fell in ``[low, high)``."""
+
+    low: float
+    high: float
+    approved: int = 0
+    edited: int = 0
+    rejected: int = 0
+    edit_ratio_sum: float = 0.0
+
+    @property
+    def reviews(self) -> int:
+        return self.approved + self.edited + self.rejected
+
+    @property
+    def mean_edit_ratio(self) -> float:
+        """Mean edit ratio over approvals (an unedited approval counts as 0)."""
+        accepted = self.approved + self.edited
+        return self.edit_ratio_sum / accepted if accepted else 0.0
+
+    @property
+    def acceptance_rate(self) -> float:
+        """Share of reviews approved without any edit."""
+        return self.approved / self.reviews if self.reviews else 0.0
+
+
+@dataclass(slots=True)
+class CalibrationStats:
+    """Reviewer edit effort per confidence band, for threshold calibration."""
+
+    band_width: float = DEFAULT_BAND_WIDTH
+    bands: dict[int, CalibrationBand] = field(default_factory=dict)
+
+    def observe(
+        self, confidence: float, *, edit_ratio: float = 0.0, rejected: bool = False
+    ) -> None:
+        band = self.band(confidence)
+        if rejected:
+            band.rejected += 1
+        elif edit_ratio > 0.0:
+            band.edited += 1
+            band.edit_ratio_sum += edit_ratio
+        else:
+            band.approved += 1
+
+    def band(self, confidence: float) -> CalibrationBand:
+        # The epsilon keeps band edges (0.85 / 0.05 = 16.999...) in the upper band.
+        index = min(math.floor(confidence / self.band_width + 1e-9), self._last_band)
+        band = self.bands.get(index)
+        if band is None:
+            low = round(index * self.band_width, 6)
+            band = self.bands[index] = CalibrationBand(
+                low, round(low + self.band_width, 6)
+            )
+        return band
+
+    def table(self) -> list[CalibrationBand]:
+        """Bands with at least one review, lowest confidence first."""
+        return [self.bands[i] for i in sorted(self.bands)]
+
+    @property
+    def _last_band(self) -> int:
+        return math.ceil(1.0 / self.band_width) - 1
+
+
+class EditLog:
+    """Originals, edit deltas and calibration statistics for HITL edits."""
+
+    def __init__(self, *, band_width: float = DEFAULT_BAND_WIDTH) -> None:
+        self.store = ContentStore()
+        self.calibration = CalibrationStats(band_width)
+        self._versions: dict[str, list[EditRecord]] = {}
+
+    def original(self, text: str) -> tuple[str, bool]:
+        """Store ``text`` as an original; ``(ref, new)`` as for :meth:`ContentStore.put`."""
+        return self.store.put(text)
+
+    def record(
+        self,
+        original: str,
+        edited: str,
+        *,
+        result_id: str = "",
+        reviewer_id: str = "",
+    ) -> EditRecord:
+        """Store ``edited`` as the next version of ``original``."""
+        ref, _ = self.store.put(original)
+        delta, stats = token_delta(original, edited)
+        versions = self._versions.setdefault(ref, [])
+        record = EditRecord(
+            ref, len(versions) + 1, delta, stats, result_id, reviewer_id
+        )
+        versions.append(record)
+        return record
+
+    def versions(self, original_ref: str) -> list[EditRecord]:
+        return list(self._versions.get(original_ref, ()))
+
+    def reconstruct(self, record: EditRecord) -> str:
+        """The edited text of ``record``."""
+        return apply_delta(self.store.get(record.original_ref), record.delta)
@@ -0,0 +1,187 @@
+"""
+Review Item and Reviewer Decision records (specs/technical.md §3.6, §3.13.3–3.13.4).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from chimera.errors import ChimeraError
+from chimera.judge import Verdict
+
+if TYPE_CHECKING:
+    from chimera.hitl.diff import EditRecord
+
+ESCALATION_REASONS = frozenset(
+    {"low_confidence", "sensitive_topic", "mandatory_hitl", "anomaly"}
+)
+STATUSES = frozenset({"pending", "approved", "rejected", "edited", "deferred"})
+
+APPROVE = "approve"
+APPROVE_WITH_EDIT = "approve_with_edit"
+REJECT = "reject"
+DEFER = "defer"
+ACTIONS = (APPROVE, APPROVE_WITH_EDIT, REJECT, DEFER)
+
+# Status a review ends in for each reviewer action (§3.6).
+ACTION_STATUS = {
+    APPROVE: "approved",
+    APPROVE_WITH_EDIT: "edited",
+    REJECT: "rejected",
+    DEFER: "deferred",
+}
+
+PREVIEW_CHARS = 280
+
+
+class HITLError(ChimeraError):
+    """Raised when a review item or reviewer decision is invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewSummary:
+    """The queue-list view of a Review Item: small and cheap to page through.
+
+    ``preview`` is the first :data:`PREVIEW_CHARS` characters of the text;
+    the full content, reasoning trace and context snapshot come from
+    :meth:`~chimera.hitl.HITLQueue.open`.
+    """
+
+    review_id: str
+    result_id: str
+    campaign_id: str
+    priority: str
+    escalation_reason: str
+    confidence_score: float
+    status: str
+    created_at: float
+    sla_deadline: float
+    preview: str
+    media_count: int = 0
+    suggested_action: str | None = None
+    sla_breached: bool = False
+
+    @property
+    def urgent(self) -> bool:
+        """Flagged for urgent review (§7.5): high priority or past its SLA."""
+        return self.priority == "high" or self.sla_breached
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "review_id": self.review_id,
+            "result_id": self.result_id,
+            "campaign_id": self.campaign_id,
+            "priority": self.priority,
+            "escalation_reason": self.escalation_reason,
+            "confidence_score": self.confidence_score,
+            "status": self.status,
+            "created_at": self.created_at,
+            "sla_deadline": self.sla_deadline,
+            "content_preview": {"text": self.preview, "media_count": self.media_count},
+            "suggested_action": self.suggested_action,
+            "urgent": self.urgent,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewDetail:
+    """Everything a reviewer needs to decide on one item (§7.1, §3.13.3)."""
+
+    summary: ReviewSummary
+    content: Mapping[str, Any]
+    reasoning_trace: str
+    context_snapshot: Mapping[str, Any]
+    correlation_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """The §3.13.3 Review Item message."""
+        summary = self.summary
+        return {
+            "review_id": summary.review_id,
+            "result_id": summary.result_id,
+            "escalation_reason": summary.escalation_reason,
+            "confidence_score": summary.confidence_score,
+            "reasoning_trace": self.reasoning_trace,
+            "context_snapshot": dict(self.context_snapshot),
+            "content_preview": {
+                "text": self.content.get("text"),
+                "media_urls": list(self.content.get("media_urls") or []),
+            },
+            "suggested_action": summary.suggested_action,
+            "created_at": summary.created_at,
+            "correlation_id": self.correlation_id,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewDecision:
+    """A reviewer's decision on one item (§3.13.4)."""
+
+    review_id: str
+    reviewer_id: str
+    action: str
+    edited_content: Mapping[str, Any] | None = None
+    rejection_reason: str | None = None
+    reviewed_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        if self.action not in ACTIONS:
+            raise HITLError(f"Unknown reviewer action {self.action!r}")
+        if not self.reviewer_id:
+            raise HITLError("reviewer_id is required")
+        if self.action == APPROVE_WITH_EDIT and not self.edited_content:
+            raise HITLError("approve_with_edit requires edited_content")
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewOutcome:
+    """What resolving a decision did.
+
+    ``verdict`` is the Judge's commit verdict for approvals. A REJECT with
+    reason ``state_conflict`` means the approved result went stale and was
+    returned to the Planner (§6.6).
+    """
+
+    review_id: str
+    action: str
+    status: str
+    queue_seconds: float
+    verdict: Verdict | None = None
+    edit: EditRecord | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewPage:
+    items: tuple[ReviewSummary, ...]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class QueueChange:
+    """One entry of the change feed: ``added``, ``updated`` or ``removed``.
+
+    ``item`` is the new summary, or ``None`` for ``removed``.
+    """
+
+    seq: int
+    kind: str
+    review_id: str
+    item: ReviewSummary | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeFeed:
+    """Changes after a cursor.
+
+    Pass ``cursor`` as ``since`` on the next poll. ``reset`` means the
+    requested changes are no longer retained, so the client must reload
+    the queue from :meth:`~chimera.hitl.HITLQueue.page` and continue from
+    ``cursor``.
+    """
+
+    changes: tuple[QueueChange, ...]
+    cursor: int
+    reset: bool = False
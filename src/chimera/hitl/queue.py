@@ -0,0 +1,454 @@
+"""
+HITL review queue (specs/technical.md §3.6, §7).
+
+Escalated results wait here for a human decision. Everything in the
+0.70–0.90 confidence band lands here, so the queue holds thousands of
+items a day. Reviewer dashboards need to page through it and keep up with
+it cheaply:
+
+- **Index.** Pending items are kept in a sorted list keyed by
+  ``(sla_deadline, priority, arrival)``, so the item closest to breaching
+  its SLA comes first. A page is a binary search plus a slice.
+- **Cursor pagination.** :meth:`HITLQueue.page` returns an opaque cursor
+  that encodes the last key returned. Items added or removed meanwhile
+  neither shift nor repeat the following pages.
+- **Lazy detail.** List rows are :class:`~chimera.hitl.ReviewSummary`
+  objects, which hold a text preview and nothing heavier. The full
+  content, reasoning trace and context snapshot are assembled by
+  :meth:`HITLQueue.open` the first time a reviewer opens the item. The
+  expensive part, recent history, comes from ``context_loader``. Later
+  opens reuse the result.
+- **Change feed.** Every add, update and removal gets a sequence number.
+  :meth:`HITLQueue.changes` returns the deltas after a cursor, so
+  dashboards poll for what changed instead of re-fetching the queue.
+
+Each priority has its own SLA (``slas``, in seconds, deployment-
+configurable per §7.5). :meth:`HITLQueue.check_sla` flags overdue items as
+urgent and emits a ``hitl.sla_breached`` warning for the Operator.
+
+Approvals are committed by the Judge (§6.7) through
+:meth:`~chimera.judge.Judge.commit_reviewed`, under the same OCC check as
+automatic approvals. Every decision is audited as ``hitl.reviewed`` with
+the reviewer, the action, the original content, any edit and the time the
+item spent in the queue (§7.4). Originals and edits go through an
+:class:`~chimera.hitl.EditLog`: an original text is logged once and then
+referenced by hash, an edit is logged as a token delta, and every decision
+feeds the log's confidence-calibration statistics.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import functools
+import itertools
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+from chimera.asyncutil import SingleFlight
+from chimera.audit import AuditEmitter
+from chimera.hitl.diff import EditLog, EditRecord
+from chimera.hitl.items import (
+    ACTION_STATUS,
+    APPROVE,
+    APPROVE_WITH_EDIT,
+    DEFER,
+    ESCALATION_REASONS,
+    PREVIEW_CHARS,
+    REJECT,
+    ChangeFeed,
+    HITLError,
+    QueueChange,
+    ReviewDecision,
+    ReviewDetail,
+    ReviewOutcome,
+    ReviewPage,
+    ReviewSummary,
+)
+from chimera.judge import APPROVE as APPROVED
+from chimera.judge import ESCALATE, Judge, ReviewContext, Verdict
+from chimera.metrics import counter
+from chimera.queue import PRIORITY_RANK
+
+DEFAULT_SLAS: dict[str, float] = {"high": 900.0, "medium": 7_200.0, "low": 28_800.0}
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_CHANGES = 10_000
+
+ContextLoader = Callable[[ReviewSummary, ReviewContext], Awaitable[Mapping[str, Any]]]
+
+REVIEWS = counter(
+    "chimera_hitl_reviews", "Reviewer decisions by action", labelnames=("action",)
+)
+SLA_BREACHES = counter(
+    "chimera_hitl_sla_breaches", "Review items past their SLA", ("priority",)
+)
+
+_Key = tuple[float, int, int]
+
+
+@dataclass(slots=True)
+class HITLStats:
+    escalated: int = 0
+    resolved: int = 0
+    deferred: int = 0
+    sla_breaches: int = 0
+    details_loaded: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    summary: ReviewSummary
+    key: _Key
+    artifact: Mapping[str, Any]
+    verdict: Verdict
+    context: ReviewContext
+    judge: Judge | None
+    detail: ReviewDetail | None = None
+
+
+class HITLQueue:
+    """In-memory HITL queue with an SLA-ordered index and a change feed.
+
+    Usage::
+
+        queue = HITLQueue(context_loader=load_recent_history)
+        judge = Judge(hitl=queue, state=state)
+        page = queue.page(limit=50)
+        detail = await queue.open(page.items[0].review_id)
+        queue.resolve(ReviewDecision(detail.summary.review_id, "ana", "approve"))
+    """
+
+    def __init__(
+        self,
+        *,
+        slas: Mapping[str, float] | None = None,
+        context_loader: ContextLoader | None = None,
+        max_changes: int = DEFAULT_MAX_CHANGES,
+        edits: EditLog | None = None,
+        audit: AuditEmitter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.slas = {**DEFAULT_SLAS, **(slas or {})}
+        self.context_loader = context_loader
+        self.audit = audit
+        self.clock = clock
+        self.edits = edits if edits is not None else EditLog()
+        self.stats = HITLStats()
+        self._entries: dict[str, _Entry] = {}
+        self._order: list[_Key] = []
+        self._by_key: dict[_Key, str] = {}
+        self._arrivals = itertools.count()
+        self._seq = 0
+        self._changes: deque[QueueChange] = deque(maxlen=max_changes)
+        self._details: SingleFlight[str, ReviewDetail] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, review_id: object) -> bool:
+        return review_id in self._entries
+
+    # -- escalation ----------------------------------------------------------
+
+    def escalate(
+        self,
+        artifact: Mapping[str, Any],
+        verdict: Verdict,
+        context: ReviewContext,
+        *,
+        judge: Judge | None = None,
+        suggested_action: str | None = None,
+    ) -> ReviewSummary:
+        """Add an escalated result; ``judge`` commits it if approved."""
+        if verdict.outcome != ESCALATE:
+            raise HITLError(f"Only escalated results are queued, not {verdict.outcome}")
+        reason = verdict.reason or "anomaly"
+        if reason not in ESCALATION_REASONS:
+            raise HITLError(f"Unknown escalation_reason {reason!r}")
+        if not verdict.reasoning_trace:
+            raise HITLError("reasoning_trace must not be empty")  # §3.6
+        if context.priority not in self.slas:
+            raise HITLError(f"No SLA for priority {context.priority!r}")
+        now = self.clock()
+        content = artifact.get("content") or {}
+        summary = ReviewSummary(
+            review_id=str(uuid.uuid4()),
+            result_id=verdict.result_id,
+            campaign_id=context.campaign_id,
+            priority=context.priority,
+            escalation_reason=reason,
+            confidence_score=verdict.confidence_score,
+            status="pending",
+            created_at=now,
+            sla_deadline=now + self.slas[context.priority],
+            preview=(content.get("text") or "")[:PREVIEW_CHARS],
+            media_count=len(content.get("media_urls") or ()),
+            suggested_action=suggested_action,
+        )
+        key = (
+            summary.sla_deadline,
+            PRIORITY_RANK.get(summary.priority, len(PRIORITY_RANK)),
+            next(self._arrivals),
+        )
+        self._entries[summary.review_id] = _Entry(
+            summary, key, artifact, verdict, context, judge
+        )
+        bisect.insort(self._order, key)
+        self._by_key[key] = summary.review_id
+        self.stats.escalated += 1
+        self._changed("added", summary.review_id, summary)
+        return summary
+
+    # -- reading -------------------------------------------------------------
+
+    def get(self, review_id: str) -> ReviewSummary:
+        return self._entry(review_id).summary
+
+    def page(
+        self,
+        cursor: str | None = None,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        campaign_id: str | None = None,
+        priority: str | None = None,
+    ) -> ReviewPage:
+        """Up to ``limit`` items after ``cursor``, most urgent first."""
+        if limit < 1:
+            raise HITLError("limit must be at least 1")
+        start = bisect.bisect_right(self._order, _decode(cursor)) if cursor else 0
+        items: list[ReviewSummary] = []
+        last: _Key | None = None
+        for key in itertools.islice(self._order, start, None):
+            summary = self._entries[self._by_key[key]].summary
+            if (campaign_id is None or summary.campaign_id == campaign_id) and (
+                priority is None or summary.priority == priority
+            ):
+                if len(items) == limit:
+                    break
+                items.append(summary)
+            last = key
+        else:
+            return ReviewPage(tuple(items))
+        return ReviewPage(tuple(items), _encode(last) if last else None)
+
+    async def open(self, review_id: str) -> ReviewDetail:
+        """Full detail for a reviewer, assembled on first open and then reused."""
+        entry = self._entry(review_id)
+        detail = entry.detail
+        if detail is None:
+            detail = await self._details.run(
+                review_id, functools.partial(self._assemble, entry)
+            )
+            entry.detail = detail
+        if detail.summary is not entry.summary:
+            detail = replace(detail, summary=entry.summary)
+        return detail
+
+    def changes(self, since: int = 0, *, limit: int = 1_000) -> ChangeFeed:
+        """Changes with ``seq > since``; poll again with the returned cursor."""
+        if not self._changes or since >= self._seq:
+            return ChangeFeed((), self._seq)
+        first = self._changes[0].seq
+        if since < first - 1:
+            return ChangeFeed((), self._seq, reset=True)
+        batch = tuple(
+            itertools.islice(
+                self._changes, since - first + 1, since - first + 1 + limit
+            )
+        )
+        return ChangeFeed(batch, batch[-1].seq)
+
+    # -- decisions -----------------------------------------------------------
+
+    def resolve(self, decision: ReviewDecision) -> ReviewOutcome:
+        """Apply a reviewer's decision (§7.2).
+
+        Approvals are committed through the Judge. Approve, edit and reject
+        take the item off the queue; defer leaves it in place.
+        """
+        entry = self._entry(decision.review_id)
+        summary = entry.summary
+        status = ACTION_STATUS[decision.action]
+        verdict = None
+        if decision.action in (APPROVE, APPROVE_WITH_EDIT) and entry.judge:
+            verdict = entry.judge.commit_reviewed(
+                entry.artifact,
+                entry.context,
+                reviewer_id=decision.reviewer_id,
+                edited_content=decision.edited_content,
+            )
+            if verdict.outcome != APPROVED:
+                status = "rejected"
+        original = entry.artifact.get("content") or {}
+        ref, new = self.edits.original(original.get("text") or "")
+        edit = self._observe(entry, decision)
+        queue_seconds = max(0.0, decision.reviewed_at - summary.created_at)
+        if decision.action == DEFER:
+            self.stats.deferred += 1
+            entry.summary = replace(summary, status=status)
+            self._changed("updated", summary.review_id, entry.summary)
+        else:
+            self.stats.resolved += 1
+            self._remove(entry)
+        REVIEWS.inc(action=decision.action)
+        if self.audit is not None:
+            self._audit(entry, decision, status, queue_seconds, verdict, edit, ref, new)
+        return ReviewOutcome(
+            summary.review_id, decision.action, status, queue_seconds, verdict, edit
+        )
+
+    def check_sla(self) -> list[ReviewSummary]:
+        """Flag items newly past their SLA; returns them (§7.5)."""
+        now = self.clock()
+        breached = []
+        for key in self._order:
+            if key[0] > now:
+                break
+            entry = self._entries[self._by_key[key]]
+            if entry.summary.sla_breached:
+                continue
+            entry.summary = replace(entry.summary, sla_breached=True)
+            breached.append(entry.summary)
+            self.stats.sla_breaches += 1
+            SLA_BREACHES.inc(priority=entry.summary.priority)
+            self._changed("updated", entry.summary.review_id, entry.summary)
+            if self.audit is not None:
+                self.audit.emit(
+                    "hitl.sla_breached",
+                    correlation_id=entry.verdict.correlation_id
+                    or entry.summary.result_id,
+                    actor="hitl",
+                    payload={
+                        "review_id": entry.summary.review_id,
+                        "campaign_id": entry.summary.campaign_id,
+                        "priority": entry.summary.priority,
+                        "overdue_seconds": now - entry.summary.sla_deadline,
+                    },
+                    severity="warning",
+                )
+        return breached
+
+    # -- internals -----------------------------------------------------------
+
+    def _entry(self, review_id: str) -> _Entry:
+        entry = self._entries.get(review_id)
+        if entry is None:
+            raise HITLError(f"No pending review {review_id!r}")
+        return entry
+
+    def _remove(self, entry: _Entry) -> None:
+        del self._entries[entry.summary.review_id]
+        del self._order[bisect.bisect_left(self._order, entry.key)]
+        del self._by_key[entry.key]
+        self._details.cancel(entry.summary.review_id)
+        self._changed("removed", entry.summary.review_id, None)
+
+    def _observe(self, entry: _Entry, decision: ReviewDecision) -> EditRecord | None:
+        """Feed the decision to the edit log and calibration statistics."""
+        confidence = entry.summary.confidence_score
+        if decision.action == REJECT:
+            self.edits.calibration.observe(confidence, rejected=True)
+        elif decision.action == APPROVE:
+            self.edits.calibration.observe(confidence)
+        elif decision.action == APPROVE_WITH_EDIT:
+            assert decision.edited_content is not None
+            edit = self.edits.record(
+                (entry.artifact.get("content") or {}).get("text") or "",
+                decision.edited_content.get("text") or "",
+                result_id=entry.summary.result_id,
+                reviewer_id=decision.reviewer_id,
+            )
+            self.edits.calibration.observe(confidence, edit_ratio=edit.stats.ratio)
+            return edit
+        return None
+
+    def _changed(
+        self, kind: str, review_id: str, summary: ReviewSummary | None
+    ) -> None:
+        self._seq += 1
+        self._changes.append(QueueChange(self._seq, kind, review_id, summary))
+
+    async def _assemble(self, entry: _Entry) -> ReviewDetail:
+        context = entry.context
+        snapshot: dict[str, Any] = {"campaign_goal": context.goal_description}
+        if context.persona is not None:
+            snapshot["persona_id"] = context.persona.persona_id
+        if self.context_loader is not None:
+            snapshot.update(await self.context_loader(entry.summary, context))
+        verdict = entry.verdict
+        trace = [verdict.reasoning_trace]
+        if verdict.sensitive_topics:
+            trace.append(f"Sensitive topics: {', '.join(verdict.sensitive_topics)}")
+        trace += verdict.violations
+        self.stats.details_loaded += 1
+        return ReviewDetail(
+            entry.summary,
+            entry.artifact.get("content") or {},
+            "\n".join(trace),
+            snapshot,
+            verdict.correlation_id,
+        )
+
+    def _audit(
+        self,
+        entry: _Entry,
+        decision: ReviewDecision,
+        status: str,
+        queue_seconds: float,
+        verdict: Verdict | None,
+        edit: EditRecord | None,
+        ref: str,
+        new: bool,
+    ) -> None:
+        assert self.audit is not None
+        original = entry.artifact.get("content") or {}
+        payload: dict[str, Any] = {
+            "review_id": entry.summary.review_id,
+            "result_id": entry.summary.result_id,
+            "campaign_id": entry.summary.campaign_id,
+            "reviewer_id": decision.reviewer_id,
+            "action": decision.action,
+            "status": status,
+            "reviewed_at": decision.reviewed_at,
+            "queue_seconds": queue_seconds,
+            # The original text is logged the first time it is seen; later
+            # events reference it by content hash.
+            "original_ref": ref,
+            "original_content": dict(original) if new else _without_text(original),
+        }
+        if decision.edited_content is not None:
+            payload["edited_content"] = _without_text(decision.edited_content)
+        if edit is not None:
+            payload["edit"] = edit.to_dict()
+        if decision.rejection_reason is not None:
+            payload["rejection_reason"] = decision.rejection_reason
+        if verdict is not None:
+            payload["commit"] = verdict.outcome
+        self.audit.emit(
+            "hitl.reviewed",
+            correlation_id=entry.verdict.correlation_id or entry.summary.result_id,
+            actor=decision.reviewer_id,
+            payload=payload,
+        )
+
+
+def _encode(key: _Key) -> str:
+    raw = f"{key[0]!r}:{key[1]}:{key[2]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> _Key:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        deadline, rank, arrival = raw.split(":")
+        return (float(deadline), int(rank), int(arrival))
+    except (ValueError, UnicodeDecodeError):
+        raise HITLError(f"Invalid cursor {cursor!r}") from None
+
+
+def _without_text(content: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in content.items() if k != "text"}
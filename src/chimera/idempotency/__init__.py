@@ -0,0 +1,36 @@
+"""
+Idempotency store for publish and transaction tools (specs/technical.md §8.3.3).
+
+Three interchangeable backends implement :class:`IdempotencyStore`:
+
+- :class:`InMemoryIdempotencyStore` — ordered dict, bounded entries (tests,
+  single process)
+- :class:`SQLiteIdempotencyStore` — durable single-node file in WAL mode
+- :class:`RedisIdempotencyStore` — Lua-guarded keys shared across Workers
+
+Any of them can sit behind a :class:`BloomFilter` negative cache.
+"""
+
+from chimera.idempotency.base import (
+    DEFAULT_IDEMPOTENCY_TTL,
+    IdempotencyError,
+    IdempotencyRecord,
+    IdempotencyStats,
+    IdempotencyStore,
+)
+from chimera.idempotency.bloom import BloomFilter
+from chimera.idempotency.memory import InMemoryIdempotencyStore
+from chimera.idempotency.redis import RedisIdempotencyStore
+from chimera.idempotency.sqlite import SQLiteIdempotencyStore
+
+__all__ = [
+    "DEFAULT_IDEMPOTENCY_TTL",
+    "BloomFilter",
+    "IdempotencyError",
+    "IdempotencyRecord",
+    "IdempotencyStats",
+    "IdempotencyStore",
+    "InMemoryIdempotencyStore",
+    "RedisIdempotencyStore",
+    "SQLiteIdempotencyStore",
+]
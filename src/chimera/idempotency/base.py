@@ -0,0 +1,153 @@
+"""
+Idempotency store contract shared by all backends (specs/technical.md §8.3.3).
+
+Publish and transaction tools MUST NOT act twice for one idempotency key.
+A store records ``key -> outcome`` (``external_id``, ``external_url``, ...)
+after the first successful call, so a retry, including one after a
+timeout, returns the recorded outcome without another round trip to the
+platform. The first writer wins; records expire after ``ttl`` seconds.
+
+An optional :class:`~chimera.idempotency.bloom.BloomFilter` answers the
+common "never seen" lookup in memory. The filter only knows keys written or
+loaded (:meth:`IdempotencyStore.warm`) by this process, so enable it only
+when this process is the store's sole writer; with shared backends such as
+Redis leave it off.
+"""
+
+from __future__ import annotations
+
+import abc
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.errors import ChimeraError
+from chimera.idempotency.bloom import BloomFilter
+
+DEFAULT_IDEMPOTENCY_TTL = 7 * 24 * 3600.0
+
+
+class IdempotencyError(ChimeraError):
+    """Raised when an idempotency store operation cannot be completed."""
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Outcome of the first successful call made with ``key``."""
+
+    key: str
+    outcome: dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+    expires_at: float = 0.0
+
+
+@dataclass(slots=True)
+class IdempotencyStats:
+    hits: int = 0
+    misses: int = 0
+    bloom_skips: int = 0
+    stored: int = 0
+    evicted: int = 0
+
+
+class IdempotencyStore(abc.ABC):
+    """Key → outcome map with first-writer-wins puts and TTL expiry."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        bloom: BloomFilter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl <= 0:
+            raise IdempotencyError("ttl must be positive")
+        self.ttl = ttl
+        self.bloom = bloom
+        self.stats = IdempotencyStats()
+        self._clock = clock
+        # Filter being rebuilt; receives every add until it replaces ``bloom``.
+        self._next_bloom: BloomFilter | None = None
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        """Recorded outcome for ``key``, or None if unseen or expired."""
+        if self.bloom is not None and key not in self.bloom:
+            self.stats.bloom_skips += 1
+            self.stats.misses += 1
+            return None
+        record = await self._get(key, self._clock())
+        if record is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return record
+
+    async def put(
+        self, key: str, outcome: Mapping[str, Any], *, ttl: float | None = None
+    ) -> bool:
+        """Record ``outcome`` unless a live record exists. True if stored."""
+        now = self._clock()
+        record = IdempotencyRecord(
+            key, dict(outcome), now, now + (self.ttl if ttl is None else ttl)
+        )
+        stored = await self._put(record, now)
+        self._remember(key)
+        if stored:
+            self.stats.stored += 1
+        if self.bloom is not None and self.bloom.saturated and self._next_bloom is None:
+            await self._rebuild_bloom()
+        return stored
+
+    async def delete(self, key: str) -> bool:
+        """Forget ``key``, e.g. after a rolled-back transaction."""
+        return await self._delete(key)
+
+    async def warm(self) -> int:
+        """Load every live key into the Bloom filter; returns how many."""
+        if self.bloom is None:
+            return 0
+        await self._rebuild_bloom()
+        return len(self.bloom)
+
+    @abc.abstractmethod
+    async def purge_expired(self) -> int:
+        """Drop expired records; returns how many were removed."""
+
+    @abc.abstractmethod
+    async def size(self) -> int:
+        """Number of stored records, including not-yet-purged expired ones."""
+
+    @abc.abstractmethod
+    async def _get(self, key: str, now: float) -> IdempotencyRecord | None: ...
+
+    @abc.abstractmethod
+    async def _put(self, record: IdempotencyRecord, now: float) -> bool: ...
+
+    @abc.abstractmethod
+    async def _delete(self, key: str) -> bool: ...
+
+    @abc.abstractmethod
+    def _keys(self, now: float) -> AsyncIterator[str]:
+        """Every live key, for (re)building the Bloom filter."""
+
+    def _remember(self, key: str) -> None:
+        if self.bloom is not None:
+            self.bloom.add(key)
+        if self._next_bloom is not None:
+            self._next_bloom.add(key)
+
+    async def _rebuild_bloom(self) -> None:
+        # Expired keys cannot be removed from a Bloom filter, so a saturated
+        # filter is replaced by one built from the live keys. Keys stored
+        # while the scan runs go to both filters.
+        assert self.bloom is not None
+        live = await self.size()
+        fresh = BloomFilter(max(self.bloom.capacity, 2 * live), self.bloom.error_rate)
+        self._next_bloom = fresh
+        try:
+            async for key in self._keys(self._clock()):
+                fresh.add(key)
+        finally:
+            self._next_bloom = None
+        self.bloom = fresh
@@ -0,0 +1,67 @@
+"""
+Bloom filter used as a negative cache in front of idempotency stores.
+
+A lookup for a key that was never stored is answered "definitely absent"
+from memory, skipping the backend round trip. False positives only cost
+that round trip; there are no false negatives for keys added to the filter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+DEFAULT_CAPACITY = 100_000
+DEFAULT_ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys (Kirsch–Mitzenmacher hashing)."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+    ) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for i in self._positions(key):
+            bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    @property
+    def saturated(self) -> bool:
+        """True once more keys were added than the filter was sized for."""
+        return self.count >= self.capacity
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
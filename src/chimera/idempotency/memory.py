@@ -0,0 +1,85 @@
+"""
+In-process idempotency store.
+
+Records live in an insertion-ordered dict, which with a uniform TTL is also
+expiry order: purging pops from the front until it reaches a live record.
+``max_entries`` bounds memory; when full, the oldest records are evicted
+first (counted in ``stats.evicted``), trading the oldest keys' duplicate
+protection for a fixed footprint. Every operation runs without awaiting,
+so each call is atomic with respect to the event loop.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+
+from chimera.idempotency.base import (
+    DEFAULT_IDEMPOTENCY_TTL,
+    IdempotencyRecord,
+    IdempotencyStore,
+)
+from chimera.idempotency.bloom import BloomFilter
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Dict-backed :class:`IdempotencyStore` with O(1) get and put."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        bloom: BloomFilter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttl=ttl, bloom=bloom, clock=clock)
+        self.max_entries = max_entries
+        self._records: OrderedDict[str, IdempotencyRecord] = OrderedDict()
+
+    async def purge_expired(self) -> int:
+        return self._purge(self._clock())
+
+    async def size(self) -> int:
+        return len(self._records)
+
+    async def _get(self, key: str, now: float) -> IdempotencyRecord | None:
+        record = self._records.get(key)
+        if record is None or record.expires_at <= now:
+            return None
+        return record
+
+    async def _put(self, record: IdempotencyRecord, now: float) -> bool:
+        existing = self._records.get(record.key)
+        if existing is not None:
+            if existing.expires_at > now:
+                return False
+            del self._records[record.key]
+        self._purge(now)
+        while len(self._records) >= self.max_entries:
+            self._records.popitem(last=False)
+            self.stats.evicted += 1
+        self._records[record.key] = record
+        return True
+
+    async def _delete(self, key: str) -> bool:
+        return self._records.pop(key, None) is not None
+
+    async def _keys(self, now: float) -> AsyncIterator[str]:
+        for key, record in list(self._records.items()):
+            if record.expires_at > now:
+                yield key
+
+    def _purge(self, now: float) -> int:
+        purged = 0
+        records = self._records
+        while records:
+            key, record = next(iter(records.items()))
+            if record.expires_at > now:
+                break
+            del records[key]
+            purged += 1
+        return purged
@@ -0,0 +1,115 @@
+"""
+Redis idempotency store: shared by every Worker process.
+
+Each record is one string key ``{prefix}:{key}`` holding the JSON-encoded
+record. A short Lua script writes it only if no live record exists, so the
+first writer wins atomically, and sets ``PX`` so Redis expires it
+natively. Memory is bounded by the TTL and the server's ``maxmemory``
+policy. Because other processes write to the same keyspace,
+do not put a process-local Bloom filter in front of this backend.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from chimera.idempotency.base import (
+    DEFAULT_IDEMPOTENCY_TTL,
+    IdempotencyRecord,
+    IdempotencyStore,
+)
+from chimera.idempotency.bloom import BloomFilter
+
+KEY_SCAN_BATCH = 1024
+
+# Replace only a missing or expired record; expiry is judged by the caller's
+# clock (ARGV[3]) so every backend agrees on it.
+_PUT = """
+local raw = redis.call('GET', KEYS[1])
+if raw then
+    local ok, stored = pcall(cjson.decode, raw)
+    local expires_at = ok and type(stored) == 'table' and tonumber(stored.expires_at)
+    if expires_at and expires_at > tonumber(ARGV[3]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return 1
+"""
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """:class:`IdempotencyStore` on Redis strings with native expiry.
+
+    ``client`` is a ``redis.asyncio.Redis`` (or API-compatible) instance.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "chimera:idempotency",
+        ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        bloom: BloomFilter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttl=ttl, bloom=bloom, clock=clock)
+        self._client = client
+        self._prefix = prefix
+        self._put_script = client.register_script(_PUT)
+
+    async def purge_expired(self) -> int:
+        # Redis expires keys itself.
+        return 0
+
+    async def size(self) -> int:
+        count = 0
+        async for _ in self._client.scan_iter(
+            match=f"{self._prefix}:*", count=KEY_SCAN_BATCH
+        ):
+            count += 1
+        return count
+
+    async def _get(self, key: str, now: float) -> IdempotencyRecord | None:
+        raw = await self._client.get(self._key(key))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        if data["expires_at"] <= now:
+            return None
+        return IdempotencyRecord(
+            key, data["outcome"], data["created_at"], data["expires_at"]
+        )
+
+    async def _put(self, record: IdempotencyRecord, now: float) -> bool:
+        value = json.dumps(
+            {
+                "outcome": record.outcome,
+                "created_at": record.created_at,
+                "expires_at": record.expires_at,
+            },
+            separators=(",", ":"),
+        )
+        ttl_ms = max(1, int((record.expires_at - now) * 1000))
+        stored = await self._put_script(
+            keys=[self._key(record.key)], args=[value, ttl_ms, now]
+        )
+        return bool(stored)
+
+    async def _delete(self, key: str) -> bool:
+        return bool(await self._client.delete(self._key(key)))
+
+    async def _keys(self, now: float) -> AsyncIterator[str]:
+        start = len(self._prefix) + 1
+        async for name in self._client.scan_iter(
+            match=f"{self._prefix}:*", count=KEY_SCAN_BATCH
+        ):
+            if isinstance(name, bytes):
+                name = name.decode()
+            yield name[start:]
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
@@ -0,0 +1,155 @@
+"""
+SQLite idempotency store: durable across restarts on a single node.
+
+One table keyed by ``key`` (PRIMARY KEY, so lookups are a B-tree probe)
+with an index on ``expires_at`` for purging. The first writer wins through
+``INSERT ... ON CONFLICT DO UPDATE ... WHERE`` the existing row has expired.
+The database runs in WAL mode; ``synchronous`` defaults to ``NORMAL``
+(durable across process crashes, possibly not across power loss) and can
+be set to ``FULL``. Statements run on a worker thread so disk I/O never
+blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from chimera.idempotency.base import (
+    DEFAULT_IDEMPOTENCY_TTL,
+    IdempotencyError,
+    IdempotencyRecord,
+    IdempotencyStore,
+)
+from chimera.idempotency.bloom import BloomFilter
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency (
+    key TEXT PRIMARY KEY,
+    outcome TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idempotency_expires_at ON idempotency (expires_at);
+"""
+
+_PUT = """
+INSERT INTO idempotency (key, outcome, created_at, expires_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    outcome = excluded.outcome,
+    created_at = excluded.created_at,
+    expires_at = excluded.expires_at
+WHERE idempotency.expires_at <= ?
+"""
+
+KEY_SCAN_BATCH = 1024
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """:class:`IdempotencyStore` persisted to a SQLite database file."""
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        synchronous: str = "NORMAL",
+        bloom: BloomFilter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttl=ttl, bloom=bloom, clock=clock)
+        if synchronous not in ("OFF", "NORMAL", "FULL"):
+            raise IdempotencyError(f"Unknown synchronous mode {synchronous!r}")
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    async def purge_expired(self) -> int:
+        result = await self._run(
+            "DELETE FROM idempotency WHERE expires_at <= ?", (self._clock(),)
+        )
+        return result.rowcount
+
+    async def size(self) -> int:
+        result = await self._run("SELECT COUNT(*) FROM idempotency", ())
+        count: int = result.fetchone()[0]
+        return count
+
+    async def _get(self, key: str, now: float) -> IdempotencyRecord | None:
+        result = await self._run(
+            "SELECT outcome, created_at, expires_at FROM idempotency"
+            " WHERE key = ? AND expires_at > ?",
+            (key, now),
+        )
+        row = result.fetchone()
+        if row is None:
+            return None
+        return IdempotencyRecord(key, json.loads(row[0]), row[1], row[2])
+
+    async def _put(self, record: IdempotencyRecord, now: float) -> bool:
+        result = await self._run(
+            _PUT,
+            (
+                record.key,
+                json.dumps(record.outcome, separators=(",", ":")),
+                record.created_at,
+                record.expires_at,
+                now,
+            ),
+        )
+        return result.rowcount == 1
+
+    async def _delete(self, key: str) -> bool:
+        result = await self._run("DELETE FROM idempotency WHERE key = ?", (key,))
+        return result.rowcount == 1
+
+    async def _keys(self, now: float) -> AsyncIterator[str]:
+        after = ""
+        while True:
+            result = await self._run(
+                "SELECT key FROM idempotency WHERE key > ? AND expires_at > ?"
+                " ORDER BY key LIMIT ?",
+                (after, now, KEY_SCAN_BATCH),
+            )
+            rows = result.rows
+            for (key,) in rows:
+                yield key
+            if len(rows) < KEY_SCAN_BATCH:
+                return
+            after = rows[-1][0]
+
+    async def _run(self, sql: str, params: tuple[Any, ...]) -> _Rows:
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> _Rows:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            return _Rows(cursor.fetchall(), cursor.rowcount)
+
+
+@dataclass(frozen=True, slots=True)
+class _Rows:
+    """Result rows fetched while holding the connection lock."""
+
+    rows: list[Any]
+    rowcount: int
+
+    def fetchone(self) -> Any:
+        return self.rows[0] if self.rows else None
@@ -0,0 +1,54 @@
+"""
+Judge: validation and routing of Worker results (specs/technical.md §6).
+
+:class:`Judge` validates Result Artifacts against acceptance criteria,
+persona rules and the §6.4 sensitive-topic override, then routes each to
+APPROVE, ESCALATE or REJECT by the campaign's confidence thresholds.
+"""
+
+from chimera.judge.engine import (
+    APPROVE,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_WINDOW,
+    ESCALATE,
+    OUTCOMES,
+    REJECT,
+    Judge,
+    JudgeStats,
+    ReviewContext,
+    Verdict,
+)
+from chimera.judge.matcher import KeywordMatch, KeywordMatcher
+from chimera.judge.policy import (
+    DEFAULT_AUTO_APPROVE_THRESHOLD,
+    DEFAULT_FIRST_POSTS_HITL_COUNT,
+    DEFAULT_REVIEW_THRESHOLD,
+    DEFAULT_TRANSACTION_HITL_USD,
+    SENSITIVE_TOPICS,
+    CampaignPolicy,
+    JudgeError,
+    PersonaRules,
+)
+
+__all__ = [
+    "APPROVE",
+    "DEFAULT_AUTO_APPROVE_THRESHOLD",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_BATCH_WINDOW",
+    "DEFAULT_FIRST_POSTS_HITL_COUNT",
+    "DEFAULT_REVIEW_THRESHOLD",
+    "DEFAULT_TRANSACTION_HITL_USD",
+    "ESCALATE",
+    "OUTCOMES",
+    "REJECT",
+    "SENSITIVE_TOPICS",
+    "CampaignPolicy",
+    "Judge",
+    "JudgeError",
+    "JudgeStats",
+    "KeywordMatch",
+    "KeywordMatcher",
+    "PersonaRules",
+    "ReviewContext",
+    "Verdict",
+]
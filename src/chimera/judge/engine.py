@@ -0,0 +1,665 @@
+"""
+Judge engine: validation and routing of Result Artifacts (specs/technical.md §6).
+
+Every Worker result passes through the Judge, which makes it the
+serialization point of the swarm: its per-artifact cost caps total
+throughput. The expensive parts are therefore compiled once and reused:
+
+- per campaign, one :class:`~chimera.judge.matcher.KeywordMatcher` holds the
+  §6.4 sensitive-topic keywords, the campaign's extra keywords and its
+  safety block list, so each text is scanned once in linear time;
+- per persona, forbidden patterns are compiled into one alternation and
+  required patterns individually;
+- acceptance criteria are parsed once per distinct criteria tuple.
+
+:meth:`Judge.submit` collects concurrent submissions into micro-batches of
+up to ``batch_size`` (waiting at most ``batch_window`` seconds for a batch
+to fill). A batch's texts are keyword-scanned together, one automaton pass
+per campaign (:meth:`KeywordMatcher.find_many`). Persona patterns,
+criteria, routing, commits and audit events then run per artifact, in
+submission order, because the mandatory-HITL first-posts count depends on
+that order.
+
+Routing order (§6.2–6.5): validation failures (invalid artifact, safety
+block list, persona directives, acceptance criteria) REJECT; sensitive
+topics ESCALATE regardless of confidence; confidence below
+``review_threshold`` REJECTs; mandatory-HITL scenarios (first posts of a
+campaign, transactions above the limit) ESCALATE; confidence below
+``auto_approve_threshold`` ESCALATEs; everything else is APPROVED.
+
+With a :class:`~chimera.state.GlobalState`, the Judge takes the store's
+commit authority and commits each APPROVED result under ``result:<id>``,
+guarded by the ``state_version`` map the Worker's task was planned
+against (§6.6). If any of those keys has moved on, the result is
+invalidated: REJECT with reason ``state_conflict``, for the Planner to
+re-plan against fresh state.
+
+With a :class:`~chimera.hitl.HITLQueue`, every ESCALATE is queued for human
+review. Reviewer approvals come back through :meth:`Judge.commit_reviewed`,
+so the Judge stays the only committer (§6.7).
+
+Machine-checkable acceptance criteria are ``max_length:<n>``,
+``min_length:<n>``, ``must_include:<text>``, ``must_not_include:<text>``
+and ``media_required``; free-text criteria are left to HITL review.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import math
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from chimera.audit import AuditEmitter
+from chimera.judge.matcher import KeywordMatch, KeywordMatcher
+from chimera.judge.policy import (
+    SENSITIVE_TOPICS,
+    CampaignPolicy,
+    JudgeError,
+    PersonaRules,
+)
+from chimera.metrics import counter
+from chimera.state import GlobalState, StateConflictError, result_key
+
+if TYPE_CHECKING:
+    from chimera.hitl import HITLQueue
+
+APPROVE = "approve"
+ESCALATE = "escalate"
+REJECT = "reject"
+OUTCOMES = (APPROVE, ESCALATE, REJECT)
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_WINDOW = 0.002
+
+_BLOCKED = "__blocked__"
+_AUDIT_EVENTS = {
+    APPROVE: "result.approved",
+    ESCALATE: "result.escalated",
+    REJECT: "result.rejected",
+}
+
+VERDICTS = counter(
+    "chimera_judge_verdicts", "Result Artifacts routed by the Judge", ("outcome",)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewContext:
+    """What the Judge validates an artifact against (§6.1)."""
+
+    campaign_id: str
+    persona: PersonaRules | None = None
+    acceptance_criteria: tuple[str, ...] = ()
+    goal_description: str = ""
+    priority: str = "medium"
+
+
+@dataclass(frozen=True, slots=True)
+class Verdict:
+    """The Judge's routing decision for one Result Artifact (§6.2).
+
+    ``reason`` is the §3.13.3 ``escalation_reason`` for ESCALATE
+    (``low_confidence``, ``sensitive_topic``, ``mandatory_hitl``), or the
+    rejection cause for REJECT (``invalid_artifact``, ``safety_violation``,
+    ``persona_violation``, ``criteria_violation``, ``low_confidence``,
+    ``state_conflict``).
+    """
+
+    result_id: str
+    outcome: str
+    reason: str | None
+    confidence_score: float
+    reasoning_trace: str
+    sensitive_topics: tuple[str, ...] = ()
+    violations: tuple[str, ...] = ()
+    correlation_id: str | None = None
+
+
+@dataclass(slots=True)
+class JudgeStats:
+    approved: int = 0
+    escalated: int = 0
+    rejected: int = 0
+    batches: int = 0
+
+
+@dataclass(slots=True)
+class _CampaignState:
+    policy: CampaignPolicy
+    matcher: KeywordMatcher
+    posts_reviewed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledPersona:
+    forbidden: re.Pattern[str] | None
+    forbidden_each: tuple[re.Pattern[str], ...]
+    required: tuple[re.Pattern[str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Criterion:
+    kind: str
+    value: str
+    source: str
+
+
+_Pending = tuple[Mapping[str, Any], ReviewContext, "asyncio.Future[Verdict]"]
+
+
+class Judge:
+    """Validates Result Artifacts and routes them to APPROVE/ESCALATE/REJECT.
+
+    Usage::
+
+        async with Judge(policies=[CampaignPolicy("camp-1")]) as judge:
+            verdict = await judge.submit(result, ReviewContext("camp-1", persona))
+    """
+
+    def __init__(
+        self,
+        *,
+        policies: Iterable[CampaignPolicy] = (),
+        default_policy: CampaignPolicy | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        state: GlobalState | None = None,
+        audit: AuditEmitter | None = None,
+        hitl: HITLQueue | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise JudgeError("batch_size must be at least 1")
+        self.default_policy = default_policy or CampaignPolicy()
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.audit = audit
+        self.hitl = hitl
+        self.state = state
+        self._authority = (
+            state.grant_commit_authority("judge") if state is not None else None
+        )
+        self.stats = JudgeStats()
+        self._campaigns: dict[str, _CampaignState] = {}
+        self._personas: dict[PersonaRules, _CompiledPersona] = {}
+        for policy in policies:
+            self.set_policy(policy)
+        self._pending: list[_Pending] = []
+        self._ready = asyncio.Event()
+        self._full = asyncio.Event()
+        self._batcher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Judge:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    # -- configuration -------------------------------------------------------
+
+    def set_policy(self, policy: CampaignPolicy) -> None:
+        """Install or replace a campaign's policy, recompiling its matcher.
+
+        The mandatory-HITL first-posts count carries over a replacement.
+        """
+        previous = self._campaigns.get(policy.campaign_id)
+        self._campaigns[policy.campaign_id] = _CampaignState(
+            policy,
+            _compile_matcher(policy),
+            previous.posts_reviewed if previous else 0,
+        )
+
+    def policy_for(self, campaign_id: str) -> CampaignPolicy:
+        return self._campaign(campaign_id).policy
+
+    def register_persona(self, persona: PersonaRules) -> None:
+        """Compile ``persona``'s patterns now, raising on an invalid regex."""
+        self._persona(persona)
+
+    # -- reviewing -----------------------------------------------------------
+
+    def review(self, artifact: Mapping[str, Any], context: ReviewContext) -> Verdict:
+        """Validate and route one artifact synchronously."""
+        return self._route(artifact, context, None)
+
+    def review_batch(
+        self, items: Iterable[tuple[Mapping[str, Any], ReviewContext]]
+    ) -> list[Verdict]:
+        """Validate and route many artifacts, in order, scanning their texts
+        in one automaton pass per campaign."""
+        items = list(items)
+        verdicts = [
+            self._route(artifact, context, matches)
+            for (artifact, context), matches in zip(
+                items, self._scan_batch(items), strict=True
+            )
+        ]
+        self.stats.batches += 1
+        return verdicts
+
+    def _route(
+        self,
+        artifact: Mapping[str, Any],
+        context: ReviewContext,
+        matches: list[KeywordMatch] | None,
+    ) -> Verdict:
+        verdict = self._review(artifact, context, matches)
+        if verdict.outcome == APPROVE:
+            verdict = self._commit(artifact, context, verdict)
+        self._record(verdict, context)
+        if verdict.outcome == ESCALATE and self.hitl is not None:
+            self.hitl.escalate(artifact, verdict, context, judge=self)
+        return verdict
+
+    def commit_reviewed(
+        self,
+        artifact: Mapping[str, Any],
+        context: ReviewContext,
+        *,
+        reviewer_id: str,
+        edited_content: Mapping[str, Any] | None = None,
+    ) -> Verdict:
+        """Commit a result a human approved in the HITL queue (§6.7, §7.2).
+
+        Edited content replaces the original without re-validation (§7.3).
+        The OCC check still applies: a stale result is REJECTed with
+        ``state_conflict``.
+        """
+        score = artifact.get("confidence_score")
+        verdict = Verdict(
+            str(artifact.get("result_id") or ""),
+            APPROVE,
+            None,
+            float(score) if isinstance(score, int | float) else 0.0,
+            f"Approved by reviewer {reviewer_id}"
+            + (" with edits" if edited_content is not None else ""),
+            correlation_id=artifact.get("correlation_id"),
+        )
+        verdict = self._commit(
+            artifact,
+            context,
+            verdict,
+            approver_id=reviewer_id,
+            content=edited_content,
+        )
+        self._record(verdict, context)
+        return verdict
+
+    async def submit(
+        self, artifact: Mapping[str, Any], context: ReviewContext
+    ) -> Verdict:
+        """Queue ``artifact`` for the next micro-batch and await its verdict."""
+        self.start()
+        future: asyncio.Future[Verdict] = asyncio.get_running_loop().create_future()
+        self._pending.append((artifact, context, future))
+        self._ready.set()
+        if len(self._pending) >= self.batch_size:
+            self._full.set()
+        return await future
+
+    def start(self) -> None:
+        if self._batcher is None:
+            self._batcher = asyncio.create_task(self._batch_forever())
+
+    async def close(self) -> None:
+        """Stop batching after reviewing everything already submitted."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._batcher
+            self._batcher = None
+        while self._pending:
+            self._run_batch()
+
+    async def _batch_forever(self) -> None:
+        while True:
+            await self._ready.wait()
+            if len(self._pending) < self.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.batch_window):
+                        await self._full.wait()
+            self._run_batch()
+
+    def _run_batch(self) -> None:
+        batch = self._pending[: self.batch_size]
+        del self._pending[: self.batch_size]
+        if len(self._pending) < self.batch_size:
+            self._full.clear()
+        if not self._pending:
+            self._ready.clear()
+        batch = [entry for entry in batch if not entry[2].done()]
+        scanned = self._scan_batch(
+            [(artifact, context) for artifact, context, _ in batch]
+        )
+        for (artifact, context, future), matches in zip(batch, scanned, strict=True):
+            try:
+                future.set_result(self._route(artifact, context, matches))
+            except Exception as exc:
+                future.set_exception(exc)
+        self.stats.batches += 1
+
+    def _scan_batch(
+        self, items: Sequence[tuple[Mapping[str, Any], ReviewContext]]
+    ) -> list[list[KeywordMatch] | None]:
+        """Keyword matches per item, one :meth:`KeywordMatcher.find_many`
+        call per campaign. None where the text cannot be read; that item is
+        scanned, and fails, on its own."""
+        scanned: list[list[KeywordMatch] | None] = [None] * len(items)
+        groups: dict[str, tuple[list[int], list[str]]] = {}
+        for i, (artifact, context) in enumerate(items):
+            text = _text_of(artifact)
+            if text is not None:
+                indices, texts = groups.setdefault(context.campaign_id, ([], []))
+                indices.append(i)
+                texts.append(text)
+        for campaign_id, (indices, texts) in groups.items():
+            found = self._campaign(campaign_id).matcher.find_many(texts)
+            for i, matches in zip(indices, found, strict=True):
+                scanned[i] = matches
+        return scanned
+
+    # -- validation ----------------------------------------------------------
+
+    def _review(
+        self,
+        artifact: Mapping[str, Any],
+        context: ReviewContext,
+        matches: list[KeywordMatch] | None = None,
+    ) -> Verdict:
+        result_id = str(artifact.get("result_id") or "")
+        correlation_id = artifact.get("correlation_id")
+        score = artifact.get("confidence_score")
+        if (
+            not result_id
+            or isinstance(score, bool)
+            or not isinstance(score, int | float)
+            or not 0.0 <= score <= 1.0
+        ):
+            return Verdict(
+                result_id,
+                REJECT,
+                "invalid_artifact",
+                0.0,
+                "Artifact needs a result_id and a confidence_score in [0.0, 1.0]",
+                correlation_id=correlation_id,
+            )
+
+        state = self._campaign(context.campaign_id)
+        policy = state.policy
+        content = artifact.get("content") or {}
+        text = content.get("text") or ""
+
+        blocked: set[str] = set()
+        topics: set[str] = set()
+        if matches is None:
+            matches = state.matcher.find(text)
+        for match in matches:
+            if match.category == _BLOCKED:
+                blocked.add(match.keyword)
+            else:
+                topics.add(match.category)
+
+        violations = [f"safety: blocked term {term!r}" for term in sorted(blocked)]
+        reason = "safety_violation" if violations else None
+        if context.persona is not None:
+            found = self._persona_violations(context.persona, text)
+            violations += found
+            reason = reason or ("persona_violation" if found else None)
+        if context.acceptance_criteria:
+            found = _criteria_violations(
+                _parse_criteria(context.acceptance_criteria), text, content
+            )
+            violations += found
+            reason = reason or ("criteria_violation" if found else None)
+
+        def verdict(outcome: str, why: str | None, trace: str) -> Verdict:
+            return Verdict(
+                result_id,
+                outcome,
+                why,
+                float(score),
+                trace,
+                tuple(sorted(topics)),
+                tuple(violations),
+                correlation_id,
+            )
+
+        if violations:
+            return verdict(REJECT, reason, "; ".join(violations))
+        if topics:
+            return verdict(
+                ESCALATE,
+                "sensitive_topic",
+                f"Sensitive topics detected: {', '.join(sorted(topics))}",
+            )
+        if score < policy.review_threshold:
+            return verdict(
+                REJECT,
+                "low_confidence",
+                f"Confidence {score:.2f} below review_threshold"
+                f" {policy.review_threshold:.2f}",
+            )
+        mandatory = self._mandatory_hitl(state, artifact, content)
+        if mandatory:
+            return verdict(ESCALATE, "mandatory_hitl", mandatory)
+        if score < policy.auto_approve_threshold:
+            return verdict(
+                ESCALATE,
+                "low_confidence",
+                f"Confidence {score:.2f} below auto_approve_threshold"
+                f" {policy.auto_approve_threshold:.2f}",
+            )
+        return verdict(
+            APPROVE,
+            None,
+            f"Confidence {score:.2f} at or above auto_approve_threshold"
+            f" {policy.auto_approve_threshold:.2f}; all validation passed",
+        )
+
+    def _commit(
+        self,
+        artifact: Mapping[str, Any],
+        context: ReviewContext,
+        verdict: Verdict,
+        *,
+        approver_id: str | None = None,
+        content: Mapping[str, Any] | None = None,
+    ) -> Verdict:
+        """Commit an approved result to GlobalState under OCC (§6.6)."""
+        if self.state is None or self._authority is None:
+            return verdict
+        record = {
+            "result_id": verdict.result_id,
+            "task_id": artifact.get("task_id"),
+            "campaign_id": context.campaign_id,
+            "artifact_type": artifact.get("artifact_type", "content"),
+            "content": content or artifact.get("content") or {},
+            "confidence_score": verdict.confidence_score,
+            "correlation_id": verdict.correlation_id,
+            "approval_type": "auto" if approver_id is None else "hitl",
+            "approver_id": approver_id,
+        }
+        try:
+            self.state.commit(
+                self._authority,
+                {result_key(verdict.result_id): record},
+                expected=artifact.get("state_version") or {},
+            )
+        except StateConflictError as exc:
+            return dataclasses.replace(
+                verdict,
+                outcome=REJECT,
+                reason="state_conflict",
+                reasoning_trace=f"Result invalidated for re-planning: {exc}",
+            )
+        return verdict
+
+    def _mandatory_hitl(
+        self,
+        state: _CampaignState,
+        artifact: Mapping[str, Any],
+        content: Mapping[str, Any],
+    ) -> str | None:
+        """§6.5 scenarios that need a human regardless of confidence."""
+        policy = state.policy
+        artifact_type = artifact.get("artifact_type", "content")
+        if artifact_type == "transaction":
+            details = content.get("transaction_details") or {}
+            raw = details.get("amount_usd", details.get("amount", 0.0))
+            try:
+                amount = float(raw)
+            except (TypeError, ValueError):
+                amount = math.nan
+            if not math.isfinite(amount):
+                return f"Transaction amount {raw!r} cannot be parsed; requires HITL"
+            if amount > policy.transaction_hitl_usd:
+                return (
+                    f"Transaction of ${amount:.2f} exceeds"
+                    f" ${policy.transaction_hitl_usd:.2f} HITL limit"
+                )
+        elif artifact_type == "content":
+            state.posts_reviewed += 1
+            if state.posts_reviewed <= policy.first_posts_hitl_count:
+                return (
+                    f"First posts of campaign: {state.posts_reviewed}"
+                    f" of {policy.first_posts_hitl_count} require HITL"
+                )
+        return None
+
+    def _persona_violations(self, persona: PersonaRules, text: str) -> list[str]:
+        compiled = self._persona(persona)
+        violations = []
+        if compiled.forbidden is not None and compiled.forbidden.search(text):
+            violations += [
+                f"persona {persona.persona_id}: forbidden pattern {p.pattern!r}"
+                for p in compiled.forbidden_each
+                if p.search(text)
+            ]
+        violations += [
+            f"persona {persona.persona_id}: missing required pattern {p.pattern!r}"
+            for p in compiled.required
+            if not p.search(text)
+        ]
+        return violations
+
+    def _persona(self, persona: PersonaRules) -> _CompiledPersona:
+        compiled = self._personas.get(persona)
+        if compiled is None:
+            compiled = self._personas[persona] = _compile_persona(persona)
+        return compiled
+
+    def _campaign(self, campaign_id: str) -> _CampaignState:
+        state = self._campaigns.get(campaign_id)
+        if state is None:
+            self.set_policy(
+                dataclasses.replace(self.default_policy, campaign_id=campaign_id)
+            )
+            state = self._campaigns[campaign_id]
+        return state
+
+    def _record(self, verdict: Verdict, context: ReviewContext) -> None:
+        if verdict.outcome == APPROVE:
+            self.stats.approved += 1
+        elif verdict.outcome == ESCALATE:
+            self.stats.escalated += 1
+        else:
+            self.stats.rejected += 1
+        VERDICTS.inc(outcome=verdict.outcome)
+        if self.audit is not None:
+            self.audit.emit(
+                _AUDIT_EVENTS[verdict.outcome],
+                correlation_id=verdict.correlation_id or verdict.result_id,
+                actor="judge",
+                payload={
+                    "result_id": verdict.result_id,
+                    "campaign_id": context.campaign_id,
+                    "reason": verdict.reason,
+                    "confidence_score": verdict.confidence_score,
+                    "sensitive_topics": list(verdict.sensitive_topics),
+                    "violations": list(verdict.violations),
+                },
+                severity="warning" if verdict.outcome == REJECT else "info",
+            )
+
+
+def _compile_matcher(policy: CampaignPolicy) -> KeywordMatcher:
+    keywords: dict[str, list[str]] = {
+        topic: list(words) for topic, words in SENSITIVE_TOPICS.items()
+    }
+    for topic, words in policy.sensitive_keywords.items():
+        keywords.setdefault(topic, []).extend(words)
+    keywords[_BLOCKED] = list(policy.blocked_keywords)
+    return KeywordMatcher(keywords)
+
+
+def _text_of(artifact: Mapping[str, Any]) -> str | None:
+    """The text :meth:`Judge._review` would scan, if it can be read safely."""
+    content = artifact.get("content") or {}
+    if not isinstance(content, Mapping):
+        return None
+    text = content.get("text") or ""
+    return text if isinstance(text, str) else None
+
+
+def _compile_persona(persona: PersonaRules) -> _CompiledPersona:
+    try:
+        forbidden_each = tuple(
+            re.compile(p, re.IGNORECASE) for p in persona.forbidden_patterns
+        )
+        required = tuple(
+            re.compile(p, re.IGNORECASE) for p in persona.required_patterns
+        )
+        forbidden = (
+            re.compile(
+                "|".join(f"(?:{p})" for p in persona.forbidden_patterns), re.IGNORECASE
+            )
+            if persona.forbidden_patterns
+            else None
+        )
+    except re.error as exc:
+        raise JudgeError(
+            f"Invalid pattern for persona {persona.persona_id!r}: {exc}"
+        ) from None
+    return _CompiledPersona(forbidden, forbidden_each, required)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_criteria(criteria: tuple[str, ...]) -> tuple[_Criterion, ...]:
+    parsed = []
+    for source in criteria:
+        kind, _, value = source.partition(":")
+        kind, value = kind.strip().lower(), value.strip()
+        if kind in ("max_length", "min_length") and value.isdigit():
+            parsed.append(_Criterion(kind, value, source))
+        elif kind in ("must_include", "must_not_include") and value:
+            parsed.append(_Criterion(kind, value.casefold(), source))
+        elif kind == "media_required":
+            parsed.append(_Criterion(kind, "", source))
+    return tuple(parsed)
+
+
+def _criteria_violations(
+    criteria: tuple[_Criterion, ...], text: str, content: Mapping[str, Any]
+) -> list[str]:
+    violations = []
+    folded = text.casefold()
+    for criterion in criteria:
+        if criterion.kind == "max_length":
+            failed = len(text) > int(criterion.value)
+        elif criterion.kind == "min_length":
+            failed = len(text) < int(criterion.value)
+        elif criterion.kind == "must_include":
+            failed = criterion.value not in folded
+        elif criterion.kind == "must_not_include":
+            failed = criterion.value in folded
+        else:
+            failed = not content.get("media_urls")
+        if failed:
+            violations.append(f"acceptance criterion not met: {criterion.source}")
+    return violations
@@ -0,0 +1,133 @@
+"""
+Multi-keyword matcher for the Judge (specs/technical.md §6.4).
+
+Sensitive-topic and safety keywords are compiled into one Aho-Corasick
+automaton, so a text is scanned once, in time linear in its length,
+whatever the number of keywords. Matching is case-insensitive and on word
+boundaries: ``"vote"`` matches ``"Vote now"`` but not ``"devoted"``.
+:meth:`KeywordMatcher.find_many` scans a whole batch of texts as one
+NUL-separated string, paying the per-scan setup once per batch.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+# Joins the texts of a batch; never part of a keyword.
+_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordMatch:
+    category: str
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over ``{category: keywords}``.
+
+    The goto function is stored as one ``dict`` per state with failure
+    transitions folded in at build time, so scanning follows exactly one
+    edge per character.
+    """
+
+    def __init__(self, keywords: Mapping[str, Iterable[str]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[tuple[str, str]]] = [[]]
+        for category, words in keywords.items():
+            for word in words:
+                word = " ".join(word.casefold().split())
+                if not word or _SEPARATOR in word:
+                    continue
+                state = 0
+                for char in word:
+                    nxt = goto[state].get(char)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][char] = nxt
+                        goto.append({})
+                        outputs.append([])
+                    state = nxt
+                if (category, word) not in outputs[state]:
+                    outputs[state].append((category, word))
+        self._goto = goto
+        self._outputs = outputs
+        self._link()
+        self.size = sum(len(out) for out in outputs)
+
+    def _link(self) -> None:
+        # Breadth-first: a state's failure target is always shallower, so it
+        # is complete (including its own folded transitions) when reached.
+        goto, outputs = self._goto, self._outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in list(goto[state].items()):
+                queue.append(nxt)
+                fail[nxt] = goto[fail[state]].get(char, 0)
+                outputs[nxt] = outputs[nxt] + [
+                    out for out in outputs[fail[nxt]] if out not in outputs[nxt]
+                ]
+            for char, target in goto[fail[state]].items():
+                goto[state].setdefault(char, target)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def find(self, text: str) -> list[KeywordMatch]:
+        """Every whole-word keyword occurrence in ``text``."""
+        return self._scan(text.casefold())
+
+    def find_many(self, texts: Sequence[str]) -> list[list[KeywordMatch]]:
+        """:meth:`find` for each of ``texts``, in one automaton pass.
+
+        No keyword contains the separator, so no match spans two texts,
+        and the separator is a word boundary like either end of a text.
+        """
+        folded = [text.casefold() for text in texts]
+        starts = list(
+            itertools.accumulate((len(text) + 1 for text in folded), initial=0)
+        )
+        found: list[list[KeywordMatch]] = [[] for _ in folded]
+        for match in self._scan(_SEPARATOR.join(folded)):
+            i = bisect.bisect_right(starts, match.start) - 1
+            base = starts[i]
+            found[i].append(
+                KeywordMatch(
+                    match.category, match.keyword, match.start - base, match.end - base
+                )
+            )
+        return found
+
+    def _scan(self, text: str) -> list[KeywordMatch]:
+        goto, outputs = self._goto, self._outputs
+        root = goto[0]
+        matches = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            if char.isspace():
+                char = " "
+            state = goto[state].get(char) or root.get(char, 0)
+            if outputs[state]:
+                for category, keyword in outputs[state]:
+                    start = end - len(keyword)
+                    if _bounded(text, start, end):
+                        matches.append(KeywordMatch(category, keyword, start, end))
+        return matches
+
+    def categories(self, text: str) -> frozenset[str]:
+        """The categories with at least one keyword in ``text``."""
+        return frozenset(match.category for match in self.find(text))
+
+
+def _bounded(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not text[start - 1].isalnum()) and (
+        end == len(text) or not text[end].isalnum()
+    )
@@ -0,0 +1,155 @@
+"""
+Judge policies: campaign thresholds and persona rules (specs/technical.md §6).
+
+:class:`CampaignPolicy` carries the per-campaign knobs of §6.3–6.5 and
+Appendix A (thresholds, extra sensitive keywords, safety block list,
+mandatory-HITL counts). :class:`PersonaRules` carries the
+machine-checkable part of a persona's SOUL.md ``directives`` as regular
+expressions; ``version`` records which revision of the persona file they
+were taken from.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from chimera.errors import ChimeraError
+
+DEFAULT_AUTO_APPROVE_THRESHOLD = 0.90
+DEFAULT_REVIEW_THRESHOLD = 0.70
+DEFAULT_FIRST_POSTS_HITL_COUNT = 5
+DEFAULT_TRANSACTION_HITL_USD = 10.0
+
+
+class JudgeError(ChimeraError):
+    """Raised for invalid Judge configuration."""
+
+
+# §6.4: these categories MUST escalate regardless of confidence.
+SENSITIVE_TOPICS: Mapping[str, tuple[str, ...]] = {
+    "political": (
+        "election",
+        "elections",
+        "vote",
+        "voting",
+        "ballot",
+        "candidate",
+        "democrat",
+        "democrats",
+        "republican",
+        "republicans",
+        "parliament",
+        "congress",
+        "senator",
+        "political party",
+        "campaign rally",
+        "referendum",
+        "impeachment",
+    ),
+    "health": (
+        "diagnosis",
+        "diagnose",
+        "symptom",
+        "symptoms",
+        "treatment",
+        "cure",
+        "medication",
+        "dosage",
+        "prescription",
+        "vaccine",
+        "vaccines",
+        "medical advice",
+        "disease",
+        "cancer",
+        "therapy",
+    ),
+    "financial": (
+        "invest",
+        "investment",
+        "investing",
+        "buy now",
+        "stock tip",
+        "guaranteed returns",
+        "crypto",
+        "cryptocurrency",
+        "token sale",
+        "financial advice",
+        "trading signal",
+        "portfolio",
+        "retirement savings",
+    ),
+    "legal": (
+        "lawsuit",
+        "sue",
+        "legal advice",
+        "attorney",
+        "lawyer",
+        "illegal",
+        "court ruling",
+        "defamation",
+        "copyright infringement",
+        "liable",
+        "liability",
+    ),
+    "minors": (
+        "child",
+        "children",
+        "kid",
+        "kids",
+        "minor",
+        "minors",
+        "teen",
+        "teens",
+        "teenager",
+        "underage",
+        "school students",
+    ),
+    "crisis": (
+        "emergency",
+        "disaster",
+        "shooting",
+        "earthquake",
+        "hurricane",
+        "wildfire",
+        "evacuation",
+        "terror attack",
+        "suicide",
+        "self-harm",
+        "outbreak",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignPolicy:
+    """Per-campaign Judge configuration (specs/technical.md §6.3–6.5, App. A)."""
+
+    campaign_id: str = "*"
+    auto_approve_threshold: float = DEFAULT_AUTO_APPROVE_THRESHOLD
+    review_threshold: float = DEFAULT_REVIEW_THRESHOLD
+    sensitive_keywords: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    blocked_keywords: tuple[str, ...] = ()
+    first_posts_hitl_count: int = DEFAULT_FIRST_POSTS_HITL_COUNT
+    transaction_hitl_usd: float = DEFAULT_TRANSACTION_HITL_USD
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.review_threshold <= self.auto_approve_threshold <= 1.0:
+            raise JudgeError(
+                "Thresholds must satisfy 0 <= review_threshold"
+                " <= auto_approve_threshold <= 1"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class PersonaRules:
+    """Machine-checkable persona directives (SOUL.md, specs/technical.md §3.2).
+
+    ``forbidden_patterns`` must not match the content; each of
+    ``required_patterns`` must. Patterns are case-insensitive regexes.
+    """
+
+    persona_id: str
+    version: str = ""
+    forbidden_patterns: tuple[str, ...] = ()
+    required_patterns: tuple[str, ...] = ()
@@ -0,0 +1,42 @@
+"""
+MCP client runtime (specs/technical.md §2.2, §8).
+
+All external access flows through MCP Tools and Resources. :class:`ClientPool`
+keeps warm, multiplexed sessions per MCP server and routes calls to them.
+"""
+
+from chimera.mcp.pool import (
+    ClientPool,
+    MCPPoolTimeout,
+    MCPRoutingError,
+    ServerConfig,
+    ServerStats,
+)
+from chimera.mcp.session import (
+    MCPConnectionError,
+    MCPError,
+    MCPSession,
+    MCPToolError,
+    SdkSession,
+    SessionFactory,
+    resource_payload,
+    sdk_session_factory,
+    tool_payload,
+)
+
+__all__ = [
+    "ClientPool",
+    "MCPConnectionError",
+    "MCPError",
+    "MCPPoolTimeout",
+    "MCPRoutingError",
+    "MCPSession",
+    "MCPToolError",
+    "SdkSession",
+    "ServerConfig",
+    "ServerStats",
+    "SessionFactory",
+    "resource_payload",
+    "sdk_session_factory",
+    "tool_payload",
+]
@@ -0,0 +1,345 @@
+"""
+Pooled, multiplexed async MCP client (specs/technical.md §2.2, §8).
+
+The Agent Runtime is the MCP Host; :class:`ClientPool` is its client side.
+Each configured server gets a pool of long-lived sessions. A session carries
+up to ``max_in_flight_per_session`` concurrent requests, so a burst of calls
+shares a few warm sessions instead of paying one handshake per call. New
+sessions open only when every existing one is saturated, up to
+``max_sessions``; beyond that, callers wait for a free slot.
+
+Calls route by tool name or by resource URI scheme (``news://…`` →
+the server that declares ``"news"``). A background health check pings idle
+sessions and replaces any whose transport has failed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.mcp.session import (
+    MCPConnectionError,
+    MCPError,
+    MCPSession,
+    SessionFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MCPPoolTimeout(MCPError):
+    """No session slot became free within ``acquire_timeout``."""
+
+    retryable = True
+
+
+class MCPRoutingError(MCPError):
+    """No configured server provides the requested tool or resource."""
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Connection settings for one MCP server."""
+
+    name: str
+    factory: SessionFactory
+    tools: frozenset[str] = frozenset()
+    resource_schemes: frozenset[str] = frozenset()
+    min_sessions: int = 1
+    max_sessions: int = 4
+    max_in_flight_per_session: int = 32
+    acquire_timeout: float = 10.0
+    request_timeout: float = 30.0
+
+
+@dataclass(slots=True)
+class ServerStats:
+    sessions_opened: int = 0
+    sessions_closed: int = 0
+    requests: int = 0
+    failures: int = 0
+    health_check_failures: int = 0
+
+
+@dataclass(eq=False)
+class _PooledSession:
+    session: MCPSession
+    in_flight: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    broken: bool = False
+
+
+class _ServerPool:
+    def __init__(self, config: ServerConfig) -> None:
+        self.config = config
+        self.stats = ServerStats()
+        self.sessions: list[_PooledSession] = []
+        self._opening = 0
+        self._awaiting_open = 0
+        self._changed = asyncio.Condition()
+        self._closing: set[asyncio.Task[None]] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(pooled.in_flight for pooled in self.sessions)
+
+    async def warm(self) -> None:
+        while True:
+            async with self._changed:
+                if len(self.sessions) + self._opening >= self.config.min_sessions:
+                    return
+                self._opening += 1
+            await self._open(in_flight=0)
+
+    async def acquire(self) -> _PooledSession:
+        async with asyncio.timeout(self.config.acquire_timeout):
+            async with self._changed:
+                while True:
+                    pooled = self._least_loaded()
+                    if pooled is not None:
+                        pooled.in_flight += 1
+                        return pooled
+                    if self._awaiting_open < self._open_capacity():
+                        # A session being opened will have room for this call.
+                        self._awaiting_open += 1
+                        try:
+                            await self._changed.wait()
+                        finally:
+                            self._awaiting_open -= 1
+                        continue
+                    if len(self.sessions) + self._opening < self.config.max_sessions:
+                        self._opening += 1
+                        break
+                    await self._changed.wait()
+            return await self._open(in_flight=1)
+
+    async def release(self, pooled: _PooledSession, *, broken: bool = False) -> None:
+        async with self._changed:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+            if broken:
+                self._retire(pooled)
+            self._changed.notify_all()
+
+    async def check_health(self, idle_after: float) -> None:
+        now = time.monotonic()
+        idle = [
+            pooled
+            for pooled in list(self.sessions)
+            if pooled.in_flight == 0 and now - pooled.last_used >= idle_after
+        ]
+        for pooled in idle:
+            try:
+                async with asyncio.timeout(self.config.request_timeout):
+                    await pooled.session.ping()
+                pooled.last_used = time.monotonic()
+            except Exception:
+                self.stats.health_check_failures += 1
+                logger.warning("MCP session failed health check: %s", self.config.name)
+                async with self._changed:
+                    # Handed out during the ping: its callers own it now and
+                    # retire it themselves if it is really broken.
+                    if pooled.in_flight == 0:
+                        self._retire(pooled)
+                        self._changed.notify_all()
+        with contextlib.suppress(MCPError):
+            await self.warm()
+
+    async def close(self) -> None:
+        sessions, self.sessions = self.sessions, []
+        for pooled in sessions:
+            # Discarded below; a call still in flight must not retire it again.
+            pooled.broken = True
+        await asyncio.gather(
+            *(self._discard(pooled) for pooled in sessions),
+            *self._closing,
+            return_exceptions=True,
+        )
+
+    def _open_capacity(self) -> int:
+        # The caller that opens a session takes one of its slots.
+        return self._opening * (self.config.max_in_flight_per_session - 1)
+
+    def _least_loaded(self) -> _PooledSession | None:
+        limit = self.config.max_in_flight_per_session
+        candidates = [pooled for pooled in self.sessions if pooled.in_flight < limit]
+        return min(candidates, key=lambda p: p.in_flight, default=None)
+
+    async def _open(self, *, in_flight: int) -> _PooledSession:
+        """Open a session; the caller has already counted it in ``_opening``."""
+        try:
+            session = await self.config.factory()
+        except BaseException as exc:
+            self._opening -= 1
+            if not isinstance(exc, Exception):
+                raise
+            async with self._changed:
+                self._changed.notify_all()
+            raise MCPConnectionError(
+                f"Could not open MCP session to {self.config.name}: {exc!r}"
+            ) from exc
+        pooled = _PooledSession(session, in_flight=in_flight)
+        async with self._changed:
+            self._opening -= 1
+            self.sessions.append(pooled)
+            self.stats.sessions_opened += 1
+            self._changed.notify_all()
+        return pooled
+
+    def _retire(self, pooled: _PooledSession) -> None:
+        if pooled.broken:
+            return
+        pooled.broken = True
+        if pooled in self.sessions:
+            self.sessions.remove(pooled)
+        task = asyncio.get_running_loop().create_task(self._discard(pooled))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        self.stats.sessions_closed += 1
+        try:
+            await pooled.session.close()
+        except Exception:
+            logger.debug("error closing MCP session", exc_info=True)
+
+
+class ClientPool:
+    """Async MCP client with per-server session pools.
+
+    Mirrors the ``call_tool`` / ``read_resource`` interface skills already
+    use, plus fan-out helpers::
+
+        async with ClientPool([news, twitter]) as mcp:
+            trends = await mcp.gather_resources(
+                ["news://ai/latest", "twitter://trends/ai"]
+            )
+    """
+
+    def __init__(
+        self,
+        servers: Iterable[ServerConfig],
+        *,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        self._pools: dict[str, _ServerPool] = {}
+        self._tool_routes: dict[str, str] = {}
+        self._scheme_routes: dict[str, str] = {}
+        for config in servers:
+            self._pools[config.name] = _ServerPool(config)
+            for tool in config.tools:
+                self._tool_routes[tool] = config.name
+            for scheme in config.resource_schemes:
+                self._scheme_routes[scheme] = config.name
+        self.health_check_interval = health_check_interval
+        self._health_task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> ClientPool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Open ``min_sessions`` per server and start health checking."""
+        await asyncio.gather(*(pool.warm() for pool in self._pools.values()))
+        if self._health_task is None and self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        await asyncio.gather(*(pool.close() for pool in self._pools.values()))
+
+    def stats(self) -> Mapping[str, ServerStats]:
+        return {name: pool.stats for name, pool in self._pools.items()}
+
+    def sessions(self, server: str) -> int:
+        return len(self._pools[server].sessions)
+
+    async def call_tool(
+        self, tool_name: str, params: dict[str, Any], *, server: str | None = None
+    ) -> dict[str, Any]:
+        pool = self._pools_for(server or self._tool_routes.get(tool_name), tool_name)
+        return await self._request(pool, "call_tool", tool_name, params)
+
+    async def read_resource(
+        self, resource_uri: str, *, server: str | None = None
+    ) -> dict[str, Any]:
+        scheme = resource_uri.split("://", 1)[0]
+        pool = self._pools_for(server or self._scheme_routes.get(scheme), resource_uri)
+        return await self._request(pool, "read_resource", resource_uri)
+
+    async def gather_tools(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any]]],
+        *,
+        return_exceptions: bool = True,
+    ) -> list[Any]:
+        """Issue many tool calls concurrently; results keep input order."""
+        results: list[Any] = await asyncio.gather(
+            *(self.call_tool(name, params) for name, params in calls),
+            return_exceptions=return_exceptions,
+        )
+        return results
+
+    async def gather_resources(
+        self, uris: Iterable[str], *, return_exceptions: bool = True
+    ) -> list[Any]:
+        """Read many resources concurrently; results keep input order."""
+        results: list[Any] = await asyncio.gather(
+            *(self.read_resource(uri) for uri in uris),
+            return_exceptions=return_exceptions,
+        )
+        return results
+
+    def _pools_for(self, server: str | None, target: str) -> _ServerPool:
+        if server is None:
+            if len(self._pools) != 1:
+                raise MCPRoutingError(f"No MCP server routes {target!r}")
+            return next(iter(self._pools.values()))
+        try:
+            return self._pools[server]
+        except KeyError:
+            raise MCPRoutingError(f"Unknown MCP server {server!r}") from None
+
+    async def _request(
+        self, pool: _ServerPool, method: str, *args: Any
+    ) -> dict[str, Any]:
+        try:
+            pooled = await pool.acquire()
+        except TimeoutError:
+            raise MCPPoolTimeout(
+                f"No free MCP session for {pool.config.name}"
+            ) from None
+        broken = False
+        pool.stats.requests += 1
+        try:
+            async with asyncio.timeout(pool.config.request_timeout):
+                result: dict[str, Any] = await getattr(pooled.session, method)(*args)
+                return result
+        except MCPConnectionError:
+            broken = True
+            pool.stats.failures += 1
+            raise
+        except Exception:
+            pool.stats.failures += 1
+            raise
+        finally:
+            await pool.release(pooled, broken=broken)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for pool in self._pools.values():
+                await pool.check_health(self.health_check_interval)
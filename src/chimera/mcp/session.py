@@ -0,0 +1,205 @@
+"""
+MCP session interface and the adapter over the official ``mcp`` SDK.
+
+The pool only needs four operations from a session. Keeping them behind a
+small protocol lets tests substitute in-process fakes and keeps transport
+details (stdio, SSE, streamable HTTP) out of the Worker code path.
+
+Sessions return the domain dict a tool or resource produced (``status``,
+``embeddings``, ``memories``, ...), not the MCP envelope around it:
+:func:`tool_payload` and :func:`resource_payload` unwrap
+``structuredContent`` or JSON text content, and a tool result flagged
+``isError`` raises :class:`MCPToolError`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import Any, Protocol
+
+from chimera.errors import ChimeraError
+
+
+class MCPError(ChimeraError):
+    """Base class for MCP client failures."""
+
+
+class MCPConnectionError(MCPError):
+    """The session's transport failed; the session must be discarded."""
+
+    retryable = True
+
+
+class MCPToolError(MCPError):
+    """The server reported the tool call as failed (``isError``)."""
+
+
+def tool_payload(result: Mapping[str, Any]) -> dict[str, Any]:
+    """The domain dict inside a ``CallToolResult`` dump.
+
+    ``structuredContent`` wins; otherwise the first text content holding a
+    JSON object. A result with neither comes back as ``{"text": ...}``.
+    """
+    content = result.get("content") or []
+    if result.get("isError"):
+        raise MCPToolError(_text(content) or "MCP tool call failed")
+    structured = result.get("structuredContent")
+    if isinstance(structured, Mapping):
+        return dict(structured)
+    decoded = _json_object(content)
+    if decoded is not None:
+        return decoded
+    text = _text(content)
+    return {"text": text} if text else {}
+
+
+def resource_payload(result: Mapping[str, Any]) -> dict[str, Any]:
+    """The domain dict inside a ``ReadResourceResult`` dump.
+
+    The first text content holding a JSON object; otherwise the dump itself,
+    so a reader can still walk ``contents`` (e.g. blob resources).
+    """
+    decoded = _json_object(result.get("contents") or [])
+    return decoded if decoded is not None else dict(result)
+
+
+def _texts(content: Any) -> list[str]:
+    return [
+        item["text"]
+        for item in content
+        if isinstance(item, Mapping) and isinstance(item.get("text"), str)
+    ]
+
+
+def _text(content: Any) -> str:
+    return "\n".join(_texts(content))
+
+
+def _json_object(content: Any) -> dict[str, Any] | None:
+    for text in _texts(content):
+        try:
+            decoded = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(decoded, dict):
+            return decoded
+    return None
+
+
+class MCPSession(Protocol):
+    """One initialized MCP client session. Must allow concurrent requests."""
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]: ...
+
+    async def read_resource(self, uri: str) -> dict[str, Any]: ...
+
+    async def ping(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+SessionFactory = Callable[[], Awaitable[MCPSession]]
+TransportFactory = Callable[[], contextlib.AbstractAsyncContextManager[Any]]
+
+
+class SdkSession:
+    """:class:`MCPSession` backed by ``mcp.ClientSession``.
+
+    Results are unwrapped to their domain dicts (:func:`tool_payload`,
+    :func:`resource_payload`).
+
+    The SDK's transports use anyio cancel scopes that must be entered and
+    exited by the same task, so each session lives in a dedicated owner task
+    that holds the context open until :meth:`close`.
+    """
+
+    def __init__(self, transport: TransportFactory) -> None:
+        self._transport = transport
+        self._session: Any = None
+        self._ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._owner: asyncio.Task[None] | None = None
+
+    @classmethod
+    async def open(cls, transport: TransportFactory) -> SdkSession:
+        session = cls(transport)
+        session._owner = asyncio.create_task(session._run())
+        await session._ready
+        return session
+
+    async def _run(self) -> None:
+        from mcp import ClientSession
+
+        try:
+            async with self._transport() as streams:
+                read, write = streams[0], streams[1]
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self._session = session
+                    self._ready.set_result(None)
+                    await self._closing.wait()
+        except BaseException as exc:
+            if not self._ready.done():
+                self._ready.set_exception(
+                    MCPConnectionError(f"MCP session failed to open: {exc!r}")
+                )
+            if not isinstance(exc, Exception):
+                raise
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        async with self._translate_errors():
+            result = await self._session.call_tool(name, arguments)
+        return tool_payload(result.model_dump(mode="json", by_alias=True))
+
+    async def read_resource(self, uri: str) -> dict[str, Any]:
+        async with self._translate_errors():
+            result = await self._session.read_resource(uri)
+        return resource_payload(result.model_dump(mode="json", by_alias=True))
+
+    async def ping(self) -> None:
+        async with self._translate_errors():
+            await self._session.send_ping()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._owner is not None:
+            with contextlib.suppress(Exception):
+                await self._owner
+
+    @contextlib.asynccontextmanager
+    async def _translate_errors(self) -> AsyncIterator[None]:
+        import anyio
+
+        if self._session is None or self._closing.is_set():
+            raise MCPConnectionError("MCP session is closed")
+        try:
+            yield
+        except (
+            anyio.ClosedResourceError,
+            anyio.BrokenResourceError,
+            anyio.EndOfStream,
+            ConnectionError,
+        ) as exc:
+            raise MCPConnectionError(f"MCP transport failed: {exc!r}") from exc
+
+
+def sdk_session_factory(transport: TransportFactory) -> SessionFactory:
+    """Build a :data:`SessionFactory` from an SDK transport context manager.
+
+    Example::
+
+        from mcp import StdioServerParameters, stdio_client
+
+        params = StdioServerParameters(command="news-mcp-server")
+        factory = sdk_session_factory(lambda: stdio_client(params))
+    """
+
+    async def factory() -> MCPSession:
+        return await SdkSession.open(transport)
+
+    return factory
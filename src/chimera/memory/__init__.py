@@ -0,0 +1,33 @@
+"""
+Agent memory (specs/technical.md §3.9).
+
+- :class:`TieredMemory` — per-agent episodic cache and semantic hot tier in
+  front of the MCP vector store (``memory://search`` / ``memory_write``)
+- :class:`IVFIndex` — in-process approximate nearest-neighbour index over
+  NumPy arrays
+"""
+
+from chimera.memory.ann import IVFIndex, normalise
+from chimera.memory.items import (
+    AgentMemoryError,
+    LongTermMemory,
+    MemoryContext,
+    MemoryIsolationError,
+    ScoredMemory,
+    ShortTermMemory,
+)
+from chimera.memory.store import MemoryClient, MemoryStats, TieredMemory
+
+__all__ = [
+    "AgentMemoryError",
+    "IVFIndex",
+    "LongTermMemory",
+    "MemoryClient",
+    "MemoryContext",
+    "MemoryIsolationError",
+    "MemoryStats",
+    "ScoredMemory",
+    "ShortTermMemory",
+    "TieredMemory",
+    "normalise",
+]
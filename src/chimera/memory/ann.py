@@ -0,0 +1,215 @@
+"""
+In-process approximate nearest-neighbour index (inverted file over NumPy).
+
+:class:`IVFIndex` stores unit-normalised float32 vectors in one contiguous
+matrix and scores them by cosine similarity. Below ``train_threshold``
+vectors it searches exactly, which is one matrix-vector product and
+already fast at per-agent cache sizes. Past that size it trains k-means
+centroids (``nlist ≈ √n``), files every vector under its nearest centroid,
+and answers a query by scanning only the ``nprobe`` lists whose centroids
+are closest. It retrains whenever the index has doubled since the last
+training, so lists stay balanced as the cache grows.
+
+Adds and removes are O(list length): removed slots go on a free list and
+are reused, so the matrix never needs compacting.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+Vector = npt.NDArray[np.float32]
+
+DEFAULT_NPROBE = 8
+DEFAULT_TRAIN_THRESHOLD = 2_048
+KMEANS_ITERATIONS = 8
+MAX_LISTS = 4_096
+
+
+def normalise(vector: npt.ArrayLike) -> Vector:
+    """``vector`` as a unit-length float32 array (zero vectors stay zero)."""
+    array = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm else array
+
+
+class IVFIndex:
+    """Cosine-similarity ANN index keyed by string IDs.
+
+    Usage::
+
+        index = IVFIndex(384)
+        index.add("m1", embedding)
+        index.search(query, k=8)  # [("m1", 0.93), ...]
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD,
+        seed: int = 0,
+    ) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self._rng = np.random.default_rng(seed)
+        self._vectors: Vector = np.zeros((64, dim), dtype=np.float32)
+        self._keys: list[str | None] = []
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+        self._centroids: Vector | None = None
+        self._lists: list[list[int]] = []
+        self._list_of: npt.NDArray[np.int32] = np.full(64, -1, dtype=np.int32)
+        self._trained_size = 0
+        self._active: npt.NDArray[np.intp] | None = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._slots))
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def nlist(self) -> int:
+        return len(self._lists)
+
+    def vector(self, key: str) -> Vector:
+        vector: Vector = self._vectors[self._slots[key]].copy()
+        return vector
+
+    def add(self, key: str, vector: npt.ArrayLike) -> None:
+        """Insert ``key`` or replace its vector."""
+        unit = normalise(vector)
+        if unit.shape != (self.dim,):
+            raise ValueError(f"Expected a {self.dim}-d vector, got {unit.shape}")
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._allocate(key)
+        else:
+            self._unfile(slot)
+        self._vectors[slot] = unit
+        self._file(slot)
+        self._active = None
+        if len(self._slots) >= max(self.train_threshold, 2 * self._trained_size):
+            self.train()
+
+    def remove(self, key: str) -> bool:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        self._unfile(slot)
+        self._keys[slot] = None
+        self._free.append(slot)
+        self._active = None
+        return True
+
+    def train(self) -> None:
+        """(Re)build the coarse quantiser with k-means over current vectors."""
+        slots = self._active_slots()
+        size = len(slots)
+        if size == 0:
+            return
+        nlist = max(1, min(MAX_LISTS, round(math.sqrt(size))))
+        data = self._vectors[slots]
+        centroids = data[self._rng.choice(size, nlist, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = np.argmax(data @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, data)
+            counts = np.bincount(assignment, minlength=nlist)
+            filled = counts > 0
+            sums[filled] /= counts[filled, None]
+            # Empty clusters keep their previous centroid.
+            centroids[filled] = sums[filled]
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids /= np.where(norms == 0, 1, norms)
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._lists = [[] for _ in range(nlist)]
+        self._list_of[:] = -1
+        for slot, centroid in zip(slots.tolist(), assignment.tolist(), strict=True):
+            self._lists[centroid].append(slot)
+            self._list_of[slot] = centroid
+        self._trained_size = size
+
+    def search(
+        self, query: npt.ArrayLike, k: int, *, nprobe: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Up to ``k`` ``(key, cosine similarity)`` pairs, best first."""
+        if not self._slots or k <= 0:
+            return []
+        unit = normalise(query)
+        if self._centroids is None:
+            candidates = self._active_slots()
+        else:
+            probes = min(nprobe or self.nprobe, len(self._lists))
+            closeness = self._centroids @ unit
+            nearest = np.argpartition(-closeness, probes - 1)[:probes]
+            candidates = np.fromiter(
+                (slot for c in nearest.tolist() for slot in self._lists[c]),
+                dtype=np.intp,
+            )
+            if candidates.size == 0:
+                return []
+        scores = self._vectors[candidates] @ unit
+        if scores.size > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(scores.size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._key(int(candidates[i])), float(scores[i])) for i in top.tolist()]
+
+    def _key(self, slot: int) -> str:
+        key = self._keys[slot]
+        assert key is not None
+        return key
+
+    def _allocate(self, key: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+            if slot == len(self._vectors):
+                grow = len(self._vectors)
+                self._vectors = np.concatenate(
+                    [self._vectors, np.zeros((grow, self.dim), dtype=np.float32)]
+                )
+                self._list_of = np.concatenate(
+                    [self._list_of, np.full(grow, -1, dtype=np.int32)]
+                )
+        self._slots[key] = slot
+        return slot
+
+    def _file(self, slot: int) -> None:
+        if self._centroids is not None:
+            centroid = int(np.argmax(self._centroids @ self._vectors[slot]))
+            self._lists[centroid].append(slot)
+            self._list_of[slot] = centroid
+
+    def _unfile(self, slot: int) -> None:
+        centroid = int(self._list_of[slot])
+        if centroid >= 0:
+            self._lists[centroid].remove(slot)
+            self._list_of[slot] = -1
+
+    def _active_slots(self) -> npt.NDArray[np.intp]:
+        if self._active is None:
+            self._active = np.fromiter(self._slots.values(), dtype=np.intp)
+        return self._active
@@ -0,0 +1,126 @@
+"""
+Memory Item records (specs/technical.md §3.9).
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from chimera.errors import ChimeraError
+from chimera.memory.ann import Vector, normalise
+
+CONTEXT_TYPES = frozenset({"conversation", "action", "observation"})
+MEMORY_TYPES = frozenset({"experience", "fact", "relationship"})
+MIN_SHORT_TERM_TTL = 3_600
+MAX_SHORT_TERM_TTL = 24 * 3_600
+
+
+class AgentMemoryError(ChimeraError):
+    """Raised when a memory item or memory operation is invalid."""
+
+
+class MemoryIsolationError(AgentMemoryError):
+    """A memory belonging to another agent reached this agent (§3.9)."""
+
+
+@dataclass(frozen=True, slots=True)
+class ShortTermMemory:
+    """Episodic memory: recent context that expires after ``ttl_seconds``."""
+
+    agent_id: str
+    content: str
+    context_type: str = "conversation"
+    ttl_seconds: int = MIN_SHORT_TERM_TTL
+    memory_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        if self.context_type not in CONTEXT_TYPES:
+            raise AgentMemoryError(f"Unknown context_type {self.context_type!r}")
+        if not MIN_SHORT_TERM_TTL <= self.ttl_seconds <= MAX_SHORT_TERM_TTL:
+            raise AgentMemoryError("ttl_seconds must be between 1 and 24 hours")
+
+    @property
+    def expires_at(self) -> float:
+        return self.created_at + self.ttl_seconds
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LongTermMemory:
+    """Semantic memory with its embedding (stored unit-normalised)."""
+
+    agent_id: str
+    content: str
+    embedding: Vector
+    memory_type: str = "experience"
+    importance_score: float = 0.5
+    context: str | None = None
+    memory_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        if self.memory_type not in MEMORY_TYPES:
+            raise AgentMemoryError(f"Unknown memory_type {self.memory_type!r}")
+        if not 0.0 <= self.importance_score <= 1.0:
+            raise AgentMemoryError("importance_score must be within 0.0–1.0")
+        object.__setattr__(self, "embedding", normalise(self.embedding))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> LongTermMemory:
+        """Parse one item of a ``memory://search`` response."""
+        try:
+            return cls(
+                agent_id=data["agent_id"],
+                content=data["content"],
+                embedding=np.asarray(data["embedding"], dtype=np.float32),
+                memory_type=data.get("memory_type", "experience"),
+                importance_score=float(data.get("importance_score", 0.5)),
+                context=data.get("context"),
+                memory_id=data["memory_id"],
+                created_at=float(data.get("created_at", 0.0)),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise AgentMemoryError(f"Malformed memory item: {exc!r}") from exc
+
+    def to_dict(self) -> dict[str, Any]:
+        """``memory_write`` arguments for this item."""
+        return {
+            "memory_id": self.memory_id,
+            "agent_id": self.agent_id,
+            "memory_type": self.memory_type,
+            "content": self.content,
+            "context": self.context,
+            "importance_score": self.importance_score,
+            "embedding": self.embedding.tolist(),
+            "created_at": self.created_at,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ScoredMemory:
+    memory: LongTermMemory
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryContext:
+    """Memory assembled for one retrieval (§4.1 Memory Context)."""
+
+    agent_id: str
+    episodic: tuple[ShortTermMemory, ...]
+    semantic: tuple[ScoredMemory, ...]
+    from_cache: bool = False
+    degraded: bool = False
+
+    @property
+    def memory_refs(self) -> list[str]:
+        """IDs for the Result Artifact's ``provenance.memory_refs``."""
+        return [m.memory_id for m in self.episodic] + [
+            s.memory.memory_id for s in self.semantic
+        ]
@@ -0,0 +1,325 @@
+"""
+Tiered agent memory with a per-agent hot cache (specs/technical.md §3.9).
+
+Every content task retrieves memory before generation. The system of
+record is the long-term vector store behind MCP (``memory://search``,
+``memory_write``, §8.2.5). :class:`TieredMemory` keeps an in-process tier
+in front of it for each agent:
+
+- **Episodic.** Recent short-term items live in a bounded per-agent deque.
+  Expired items are dropped when read.
+- **Semantic.** Every long-term item fetched from the vector store is
+  cached in the agent's own :class:`~chimera.memory.ann.IVFIndex`,
+  together with the query embedding that fetched it. A later query close
+  to a covered query (cosine >= ``reuse_similarity``, within
+  ``coverage_ttl``) is answered from the local index, skipping the MCP
+  round trip. Repeated retrievals for one persona cluster tightly, so most
+  of them are served locally.
+
+Each agent's caches are separate objects and every fetched item's
+``agent_id`` is checked, so one agent's memories never reach another agent
+(§3.9). When the semantic cache is full, it evicts the items with the
+lowest importance-weighted recency, ``importance_score * 0.5 ** (idle /
+half_life)``. Important memories outlive trivia, and trivia that is still
+being retrieved stays. If the vector store fails or answers with a
+malformed payload, retrieval degrades to whatever is cached (§4.6) instead
+of failing the task. Another agent's memory in a response still raises
+:class:`~chimera.memory.MemoryIsolationError`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import urllib.parse
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+from chimera.mcp import MCPError, resource_payload
+from chimera.memory.ann import DEFAULT_NPROBE, IVFIndex, Vector, normalise
+from chimera.memory.items import (
+    AgentMemoryError,
+    LongTermMemory,
+    MemoryContext,
+    MemoryIsolationError,
+    ScoredMemory,
+    ShortTermMemory,
+)
+from chimera.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEMANTIC_CAPACITY = 4_096
+DEFAULT_EPISODIC_CAPACITY = 256
+DEFAULT_MAX_AGENTS = 1_024
+DEFAULT_REUSE_SIMILARITY = 0.92
+DEFAULT_COVERAGE_TTL = 600.0
+DEFAULT_HALF_LIFE = 3_600.0
+COVERED_QUERIES = 64
+EVICT_FRACTION = 0.1
+
+LOOKUPS = counter(
+    "chimera_memory_lookups",
+    "Semantic memory retrievals by tier",
+    labelnames=("outcome",),
+)
+
+
+class MemoryClient(Protocol):
+    """The MCP client surface memory needs (e.g. :class:`~chimera.mcp.ClientPool`)."""
+
+    async def read_resource(self, resource_uri: str) -> dict[str, Any]: ...
+
+    async def call_tool(
+        self, tool_name: str, params: dict[str, Any]
+    ) -> dict[str, Any]: ...
+
+
+@dataclass(slots=True)
+class MemoryStats:
+    hits: int = 0
+    misses: int = 0
+    degraded: int = 0
+    fetched: int = 0
+    evicted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _AgentCache:
+    """One agent's hot tier. Never shared between agents."""
+
+    def __init__(self, dim: int, episodic_capacity: int, nprobe: int) -> None:
+        self.episodic: deque[ShortTermMemory] = deque(maxlen=episodic_capacity)
+        self.index = IVFIndex(dim, nprobe=nprobe)
+        self.items: dict[str, LongTermMemory] = {}
+        self.last_used: dict[str, float] = {}
+        self.queries = np.zeros((COVERED_QUERIES, dim), dtype=np.float32)
+        self.query_k = np.zeros(COVERED_QUERIES, dtype=np.int64)
+        self.query_at = np.full(COVERED_QUERIES, -np.inf)
+        self.next_query = 0
+
+    def covers(
+        self, query: Vector, k: int, now: float, similarity: float, ttl: float
+    ) -> bool:
+        fresh = (self.query_at > now - ttl) & (self.query_k >= k)
+        return bool(np.any(fresh & (self.queries @ query >= similarity)))
+
+    def cover(self, query: Vector, k: int, now: float) -> None:
+        slot = self.next_query
+        self.queries[slot] = query
+        self.query_k[slot] = k
+        self.query_at[slot] = now
+        self.next_query = (slot + 1) % COVERED_QUERIES
+
+    def put(self, memory: LongTermMemory, now: float) -> None:
+        self.items[memory.memory_id] = memory
+        self.last_used[memory.memory_id] = now
+        self.index.add(memory.memory_id, memory.embedding)
+
+    def search(self, query: Vector, k: int, now: float) -> list[ScoredMemory]:
+        found = []
+        for memory_id, score in self.index.search(query, k):
+            self.last_used[memory_id] = now
+            found.append(ScoredMemory(self.items[memory_id], score))
+        return found
+
+    def evict(self, count: int, now: float, half_life: float) -> int:
+        ids = list(self.items)
+        importance = np.fromiter(
+            (self.items[i].importance_score for i in ids), dtype=np.float64
+        )
+        idle = now - np.fromiter((self.last_used[i] for i in ids), dtype=np.float64)
+        keep_score: npt.NDArray[np.float64] = importance * 0.5 ** (idle / half_life)
+        count = min(count, len(ids))
+        for position in np.argpartition(keep_score, count - 1)[:count].tolist():
+            memory_id = ids[position]
+            del self.items[memory_id]
+            del self.last_used[memory_id]
+            self.index.remove(memory_id)
+        # Coverage no longer guarantees the evicted items are cached.
+        self.query_at[:] = -np.inf
+        return count
+
+
+class TieredMemory:
+    """Per-agent hot cache and local ANN index in front of MCP memory.
+
+    Usage::
+
+        memory = TieredMemory(mcp_pool, dim=384)
+        memory.record("agent-1", "Replied to @fan about the launch")
+        context = await memory.retrieve("agent-1", "launch week", embedding)
+        context.memory_refs  # for provenance
+    """
+
+    def __init__(
+        self,
+        client: MemoryClient,
+        *,
+        dim: int,
+        semantic_capacity: int = DEFAULT_SEMANTIC_CAPACITY,
+        episodic_capacity: int = DEFAULT_EPISODIC_CAPACITY,
+        max_agents: int = DEFAULT_MAX_AGENTS,
+        reuse_similarity: float = DEFAULT_REUSE_SIMILARITY,
+        coverage_ttl: float = DEFAULT_COVERAGE_TTL,
+        half_life: float = DEFAULT_HALF_LIFE,
+        nprobe: int = DEFAULT_NPROBE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client = client
+        self.dim = dim
+        self.semantic_capacity = semantic_capacity
+        self.episodic_capacity = episodic_capacity
+        self.max_agents = max_agents
+        self.reuse_similarity = reuse_similarity
+        self.coverage_ttl = coverage_ttl
+        self.half_life = half_life
+        self.nprobe = nprobe
+        self.stats = MemoryStats()
+        self._clock = clock
+        self._agents: OrderedDict[str, _AgentCache] = OrderedDict()
+
+    # -- short-term ------------------------------------------------------------
+
+    def record(
+        self,
+        agent_id: str,
+        content: str,
+        *,
+        context_type: str = "conversation",
+        ttl_seconds: int = 3_600,
+    ) -> ShortTermMemory:
+        """Remember recent context for ``agent_id`` until its TTL expires."""
+        memory = ShortTermMemory(
+            agent_id, content, context_type, ttl_seconds, created_at=self._clock()
+        )
+        self._agent(agent_id).episodic.append(memory)
+        return memory
+
+    def recent(self, agent_id: str, limit: int | None = None) -> list[ShortTermMemory]:
+        """Unexpired episodic memories, newest first."""
+        cache = self._agents.get(agent_id)
+        if cache is None:
+            return []
+        now = self._clock()
+        while cache.episodic and cache.episodic[0].expires_at <= now:
+            cache.episodic.popleft()
+        live = [m for m in reversed(cache.episodic) if m.expires_at > now]
+        return live[:limit]
+
+    # -- long-term -------------------------------------------------------------
+
+    async def retrieve(
+        self,
+        agent_id: str,
+        query: str,
+        embedding: npt.ArrayLike,
+        *,
+        k: int = 8,
+        episodic_limit: int = 16,
+    ) -> MemoryContext:
+        """Episodic context plus the ``k`` most similar long-term memories."""
+        cache = self._agent(agent_id)
+        unit = normalise(embedding)
+        if unit.shape != (self.dim,):
+            raise AgentMemoryError(f"Expected a {self.dim}-d embedding")
+        now = self._clock()
+        episodic = tuple(self.recent(agent_id, episodic_limit))
+        if cache.covers(unit, k, now, self.reuse_similarity, self.coverage_ttl):
+            self.stats.hits += 1
+            LOOKUPS.inc(outcome="hit")
+            semantic = cache.search(unit, k, now)
+            return MemoryContext(agent_id, episodic, tuple(semantic), from_cache=True)
+        self.stats.misses += 1
+        try:
+            fetched = await self._search_remote(agent_id, query, k)
+        except MemoryIsolationError:
+            raise
+        except (MCPError, AgentMemoryError) as exc:
+            self.stats.degraded += 1
+            LOOKUPS.inc(outcome="degraded")
+            logger.warning(
+                "memory retrieval degraded to cache: agent_id=%s error=%s",
+                agent_id,
+                exc,
+            )
+            semantic = cache.search(unit, k, now)
+            return MemoryContext(agent_id, episodic, tuple(semantic), degraded=True)
+        LOOKUPS.inc(outcome="miss")
+        for memory in fetched:
+            cache.put(memory, now)
+        self._trim(cache, now)
+        cache.cover(unit, k, now)
+        semantic = cache.search(unit, k, now)
+        return MemoryContext(agent_id, episodic, tuple(semantic))
+
+    async def remember(self, memory: LongTermMemory) -> None:
+        """Persist ``memory`` with ``memory_write`` and cache it locally.
+
+        Per §3.9, call this only for interactions the Judge approved as
+        significant.
+        """
+        if memory.embedding.shape != (self.dim,):
+            raise AgentMemoryError(f"Expected a {self.dim}-d embedding")
+        await self.client.call_tool("memory_write", memory.to_dict())
+        cache = self._agent(memory.agent_id)
+        now = self._clock()
+        cache.put(memory, now)
+        self._trim(cache, now)
+
+    def forget(self, agent_id: str) -> None:
+        """Drop every cached tier for ``agent_id`` (the store is untouched)."""
+        self._agents.pop(agent_id, None)
+
+    def cached(self, agent_id: str) -> int:
+        cache = self._agents.get(agent_id)
+        return len(cache.items) if cache else 0
+
+    async def _search_remote(
+        self, agent_id: str, query: str, k: int
+    ) -> list[LongTermMemory]:
+        params = urllib.parse.urlencode({"agent_id": agent_id, "q": query, "k": k})
+        payload = await self.client.read_resource(f"memory://search?{params}")
+        if isinstance(payload, Mapping) and "memories" not in payload:
+            payload = resource_payload(payload)  # a ReadResourceResult dump
+        items = payload.get("memories") if isinstance(payload, Mapping) else None
+        if not isinstance(items, list):
+            raise AgentMemoryError("memory://search returned no memories list")
+        memories = [LongTermMemory.from_dict(item) for item in items]
+        for memory in memories:
+            if memory.agent_id != agent_id:
+                raise MemoryIsolationError(
+                    f"memory {memory.memory_id} of {memory.agent_id!r}"
+                    f" returned for {agent_id!r}"
+                )
+            if memory.embedding.shape != (self.dim,):
+                raise AgentMemoryError(f"Expected {self.dim}-d memory embeddings")
+        self.stats.fetched += len(memories)
+        return memories
+
+    def _agent(self, agent_id: str) -> _AgentCache:
+        cache = self._agents.get(agent_id)
+        if cache is None:
+            cache = _AgentCache(self.dim, self.episodic_capacity, self.nprobe)
+            self._agents[agent_id] = cache
+            if len(self._agents) > self.max_agents:
+                self._agents.popitem(last=False)
+        else:
+            self._agents.move_to_end(agent_id)
+        return cache
+
+    def _trim(self, cache: _AgentCache, now: float) -> None:
+        excess = len(cache.items) - self.semantic_capacity
+        if excess > 0:
+            # Evict a batch so a full cache is not re-scored on every insert.
+            batch = excess + int(self.semantic_capacity * EVICT_FRACTION)
+            self.stats.evicted += cache.evict(batch, now, self.half_life)
@@ -0,0 +1,84 @@
+"""
+In-process metric registry (specs/technical.md §11).
+
+Components record counters here under the names their contracts recommend
+(e.g. ``skill_fetch_trends_success_rate``). An exporter can read
+:meth:`MetricsRegistry.snapshot` and publish the values in any format; the
+runtime itself stays free of a metrics backend dependency.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+LabelValues = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(
+        self, name: str, description: str = "", labelnames: Iterable[str] = ()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counter can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple((name, labels[name]) for name in self.labelnames)
+
+
+class MetricsRegistry:
+    """Get-or-create registry so modules can declare metrics at import time."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, description: str = "", labelnames: Iterable[str] = ()
+    ) -> Counter:
+        with self._lock:
+            existing = self._counters.get(name)
+            if existing is None:
+                existing = Counter(name, description, labelnames)
+                self._counters[name] = existing
+            elif existing.labelnames != tuple(labelnames):
+                raise ValueError(f"Counter {name} already registered with other labels")
+            return existing
+
+    def snapshot(self) -> dict[str, dict[LabelValues, float]]:
+        with self._lock:
+            counters = list(self._counters.values())
+        return {counter.name: counter.samples() for counter in counters}
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(
+    name: str, description: str = "", labelnames: Iterable[str] = ()
+) -> Counter:
+    """Register (or fetch) a counter in the process-wide :data:`REGISTRY`."""
+    return REGISTRY.counter(name, description, labelnames)
@@ -0,0 +1,68 @@
+"""
+OpenClaw status beacons (specs/openclaw_integration.md).
+
+:class:`BeaconScheduler` publishes signed :class:`AgentStatus` beacons for
+a whole fleet. Heartbeats are spread over a :class:`TimingWheel`,
+signatures are produced in batches by a :class:`BatchSigner`, and
+failures back off per endpoint through a shared :class:`EndpointHealth`.
+"""
+
+from chimera.openclaw.backoff import (
+    BACKOFF_SCHEDULE,
+    EndpointHealth,
+    backoff_delay,
+)
+from chimera.openclaw.beacon import (
+    AVAILABILITY,
+    CAPABILITY_CATEGORIES,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    MAX_HEARTBEAT_INTERVAL,
+    MIN_HEARTBEAT_INTERVAL,
+    PROTOCOL_VERSION,
+    AgentStatus,
+    Capability,
+    OpenClawError,
+    RateLimited,
+    build_beacon,
+    signing_payload,
+)
+from chimera.openclaw.scheduler import (
+    BeaconScheduler,
+    BeaconStats,
+    PublishFn,
+    mcp_publisher,
+)
+from chimera.openclaw.signing import (
+    BatchSigner,
+    Secp256k1Signer,
+    SignFn,
+    verify_signature,
+)
+from chimera.openclaw.wheel import TimingWheel
+
+__all__ = [
+    "AVAILABILITY",
+    "BACKOFF_SCHEDULE",
+    "CAPABILITY_CATEGORIES",
+    "DEFAULT_HEARTBEAT_INTERVAL",
+    "MAX_HEARTBEAT_INTERVAL",
+    "MIN_HEARTBEAT_INTERVAL",
+    "PROTOCOL_VERSION",
+    "AgentStatus",
+    "BatchSigner",
+    "BeaconScheduler",
+    "BeaconStats",
+    "Capability",
+    "EndpointHealth",
+    "OpenClawError",
+    "PublishFn",
+    "RateLimited",
+    "Secp256k1Signer",
+    "SignFn",
+    "TimingWheel",
+    "backoff_delay",
+    "build_beacon",
+    "mcp_publisher",
+    "signing_payload",
+    "verify_signature",
+]
@@ -0,0 +1,85 @@
+"""
+Per-endpoint backoff and health (specs/openclaw_integration.md §6.2, §6.4, §8.1).
+
+When an endpoint goes down, every agent that publishes to it fails. If
+each agent kept its own backoff, ten thousand agents would each send their
+own retry. State is kept per endpoint instead. One
+:class:`EndpointHealth` decides when the endpoint may be tried again, and
+the scheduler holds that endpoint's due beacons until then. After the
+delay one batch acts as the probe: if it succeeds, the rest follow in the
+same tick.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from chimera.openclaw.beacon import OpenClawError, RateLimited
+
+BACKOFF_SCHEDULE = (30.0, 60.0, 120.0, 300.0, 600.0)
+DEFAULT_BACKOFF_MAX = 600.0
+DEFAULT_UNHEALTHY_AFTER = 3
+DEFAULT_MAX_FAILURES = 10
+
+
+def backoff_delay(failures: int, *, maximum: float = DEFAULT_BACKOFF_MAX) -> float:
+    """Delay after the ``failures``-th consecutive failure (§6.4 table)."""
+    if failures < 1:
+        return 0.0
+    return min(BACKOFF_SCHEDULE[min(failures, len(BACKOFF_SCHEDULE)) - 1], maximum)
+
+
+@dataclass(slots=True)
+class EndpointHealth:
+    """Shared publish state of one OpenClaw endpoint.
+
+    ``paused`` is set after ``max_failures`` consecutive failures. The
+    endpoint then stays paused until an Operator calls
+    :meth:`~chimera.openclaw.BeaconScheduler.resume`.
+    """
+
+    endpoint: str
+    failures: int = 0
+    retry_at: float = 0.0
+    paused: bool = False
+    published: int = 0
+    failed: int = 0
+    last_error: str | None = None
+
+    def ready(self, now: float) -> bool:
+        return not self.paused and now >= self.retry_at
+
+    def healthy(self, unhealthy_after: int = DEFAULT_UNHEALTHY_AFTER) -> bool:
+        return self.failures < unhealthy_after
+
+    def record_success(self, beacons: int) -> None:
+        self.failures = 0
+        self.retry_at = 0.0
+        self.published += beacons
+
+    def record_failure(
+        self,
+        error: Exception,
+        beacons: int,
+        now: float,
+        *,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+    ) -> None:
+        self.failures += 1
+        self.failed += beacons
+        self.last_error = type(error).__name__
+        delay = backoff_delay(self.failures, maximum=backoff_max)
+        if isinstance(error, RateLimited):
+            # NFR-OC-10: never retry sooner than the endpoint asked.
+            delay = max(delay, error.retry_after)
+        self.retry_at = now + delay
+        if self.failures >= max_failures:
+            self.paused = True
+
+    def resume(self) -> None:
+        if not self.paused:
+            raise OpenClawError(f"Endpoint {self.endpoint!r} is not paused")
+        self.paused = False
+        self.failures = 0
+        self.retry_at = 0.0
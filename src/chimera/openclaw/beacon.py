@@ -0,0 +1,156 @@
+"""
+Agent Status Beacon contract (specs/openclaw_integration.md §5, §7.4–7.5).
+
+:class:`AgentStatus` is what an agent declares about itself; it holds only
+whitelisted public fields, so nothing private can reach a beacon
+(NFR-OC-04..07). :func:`build_beacon` turns a status into the §5.1 payload
+with a fresh ``beacon_id`` and send-time ``timestamp``. The ``signature``
+covers ``agent_id``, ``timestamp``, ``availability`` and the capabilities
+hash (§7.5), see :func:`signing_payload`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from chimera import __version__
+from chimera.errors import ChimeraError
+
+PROTOCOL_VERSION = "1.0"
+AVAILABILITY = ("available", "busy", "away", "offline")
+CAPABILITY_CATEGORIES = ("content", "engagement", "commerce")
+
+DEFAULT_HEARTBEAT_INTERVAL = 300.0
+MIN_HEARTBEAT_INTERVAL = 60.0
+MAX_HEARTBEAT_INTERVAL = 3_600.0
+
+
+class OpenClawError(ChimeraError):
+    """Raised for invalid beacons and failed publishes."""
+
+
+class RateLimited(OpenClawError):
+    """An endpoint asked us to slow down (429); honour ``retry_after``."""
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        super().__init__(message, retryable=True)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class Capability:
+    """An abstract capability declaration (Appendix A)."""
+
+    capability_id: str
+    category: str
+    description: str = ""
+    constraints: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.category not in CAPABILITY_CATEGORIES:
+            raise OpenClawError(f"Unknown capability category {self.category!r}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "capability_id": self.capability_id,
+            "category": self.category,
+            "description": self.description,
+            "constraints": list(self.constraints),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AgentStatus:
+    """One agent's public status; the input to every beacon it publishes.
+
+    ``capabilities_hash`` is computed once here, not once per beacon.
+    """
+
+    agent_id: str
+    agent_name: str
+    availability: str = "available"
+    capabilities: tuple[Capability, ...] = ()
+    heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
+    last_activity: float = field(default_factory=time.time)
+    wallet_address: str | None = None
+    preferred_channel: str | None = None
+    region: str | None = None
+    correlation_id: str | None = None
+    capabilities_hash: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        if not self.agent_id or not self.agent_name:
+            raise OpenClawError("agent_id and agent_name are required")
+        if self.availability not in AVAILABILITY:
+            raise OpenClawError(f"Unknown availability {self.availability!r}")
+        if not (
+            MIN_HEARTBEAT_INTERVAL <= self.heartbeat_interval <= MAX_HEARTBEAT_INTERVAL
+        ):
+            raise OpenClawError(
+                f"heartbeat_interval must be within {MIN_HEARTBEAT_INTERVAL:g}"
+                f"–{MAX_HEARTBEAT_INTERVAL:g} seconds (§6.2)"
+            )
+        object.__setattr__(
+            self, "capabilities_hash", capabilities_hash(self.capabilities)
+        )
+
+    def changed(self, other: AgentStatus) -> bool:
+        """True when ``other`` must be published immediately (§6.1)."""
+        return (
+            self.availability != other.availability
+            or self.capabilities_hash != other.capabilities_hash
+        )
+
+
+def capabilities_hash(capabilities: Sequence[Capability]) -> str:
+    canonical = json.dumps(
+        [c.to_dict() for c in capabilities], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def isoformat(ts: float) -> str:
+    return datetime.fromtimestamp(ts, UTC).isoformat().replace("+00:00", "Z")
+
+
+def signing_payload(status: AgentStatus, timestamp: str) -> bytes:
+    """The bytes a beacon's signature covers (§7.5)."""
+    return "\n".join(
+        (status.agent_id, timestamp, status.availability, status.capabilities_hash)
+    ).encode()
+
+
+def build_beacon(
+    status: AgentStatus, *, now: float, beacon_id: str | None = None
+) -> dict[str, Any]:
+    """The §5.1 beacon for ``status``, with an empty ``signature`` to fill in."""
+    return {
+        "beacon_id": beacon_id or str(uuid.uuid4()),
+        "agent_id": status.agent_id,
+        "agent_name": status.agent_name,
+        "protocol_version": PROTOCOL_VERSION,
+        "timestamp": isoformat(now),
+        "availability": status.availability,
+        "capabilities": [c.to_dict() for c in status.capabilities],
+        "presence": {
+            "heartbeat_interval_seconds": int(status.heartbeat_interval),
+            "last_activity": isoformat(status.last_activity),
+        },
+        "contact": {
+            "wallet_address": status.wallet_address,
+            "preferred_channel": status.preferred_channel,
+        },
+        "metadata": {
+            "platform": "chimera",
+            "version": __version__,
+            "region": status.region,
+        },
+        "signature": "",
+    }
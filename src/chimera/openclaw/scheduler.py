@@ -0,0 +1,440 @@
+"""
+Fleet-level OpenClaw beacon scheduler (specs/openclaw_integration.md §4–6, §8).
+
+One :class:`BeaconScheduler` publishes the status beacons of every agent
+in the process:
+
+- **Heartbeats on a timing wheel.** Each agent's first heartbeat is
+  offset by a stable hash of its ``agent_id`` spread over its interval.
+  Each later one comes ``interval`` seconds later, ± ``jitter``. A fleet
+  started at once therefore heartbeats evenly instead of in one herd.
+  Startup, availability and capability changes publish immediately (§6.1).
+- **Per-endpoint outboxes.** A due beacon goes to each of its agent's
+  endpoints' outbox, keyed by agent. A newer status replaces one not yet
+  sent, so an outbox never holds more than one beacon per agent.
+- **Batched signing and publishing.** An outbox is drained
+  ``batch_size`` beacons at a time. Each beacon gets a fresh
+  ``beacon_id`` and timestamp (INV-OC-01/02). The batch is signed on
+  a :class:`~chimera.openclaw.signing.BatchSigner` and published in one
+  call.
+- **Shared backoff.** Failures are tracked per endpoint
+  (:class:`~chimera.openclaw.backoff.EndpointHealth`), not per agent. A
+  failed batch returns to the outbox and the whole endpoint waits out
+  the §6.4 delay, so one outage costs one retry per delay instead of one
+  per agent.
+
+Publishing goes through a :data:`PublishFn`; :func:`mcp_publisher` routes
+it through the ``mcp-server-openclaw`` tool (FR-OC-06). Responses are
+treated as success or failure only; their bodies are never read (§7.3).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import itertools
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from chimera.audit import AuditEmitter
+from chimera.mcp import ClientPool
+from chimera.metrics import counter
+from chimera.openclaw.backoff import (
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_MAX_FAILURES,
+    DEFAULT_UNHEALTHY_AFTER,
+    EndpointHealth,
+)
+from chimera.openclaw.beacon import (
+    MIN_HEARTBEAT_INTERVAL,
+    AgentStatus,
+    OpenClawError,
+    build_beacon,
+    signing_payload,
+)
+from chimera.openclaw.signing import BatchSigner
+from chimera.openclaw.wheel import DEFAULT_TICK, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_JITTER = 0.1
+PUBLISH_TOOL = "openclaw_publish_status"
+
+PublishFn = Callable[[str, list[dict[str, Any]]], Awaitable[None]]
+
+BEACONS_PUBLISHED = counter(
+    "openclaw_beacons_published_total", "Beacons accepted by OpenClaw endpoints"
+)
+BEACONS_FAILED = counter(
+    "openclaw_beacons_failed_total",
+    "Beacons in batches an OpenClaw endpoint rejected",
+    labelnames=("error_type",),
+)
+
+
+def mcp_publisher(mcp: ClientPool, *, tool: str = PUBLISH_TOOL) -> PublishFn:
+    """A :data:`PublishFn` that calls the OpenClaw MCP tool once per batch."""
+
+    async def publish(endpoint: str, beacons: list[dict[str, Any]]) -> None:
+        await mcp.call_tool(tool, {"endpoint": endpoint, "beacons": beacons})
+
+    return publish
+
+
+@dataclass(slots=True)
+class BeaconStats:
+    heartbeats: int = 0
+    published: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+@dataclass(slots=True)
+class _Agent:
+    status: AgentStatus
+    endpoints: tuple[str, ...]
+
+
+class BeaconScheduler:
+    """Publishes signed beacons for a fleet of agents.
+
+    Usage::
+
+        signer = BatchSigner(Secp256k1Signer(keys))
+        async with BeaconScheduler(
+            mcp_publisher(mcp), signer, endpoints=["https://registry.example"]
+        ) as beacons:
+            beacons.register(AgentStatus(agent_id, "Tech Analyst"))
+    """
+
+    def __init__(
+        self,
+        publish: PublishFn,
+        signer: BatchSigner,
+        *,
+        endpoints: Sequence[str] = (),
+        tick: float = DEFAULT_TICK,
+        jitter: float = DEFAULT_JITTER,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        unhealthy_after: int = DEFAULT_UNHEALTHY_AFTER,
+        audit: AuditEmitter | None = None,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not 0.0 <= jitter < 1.0:
+            raise OpenClawError("jitter must be in [0, 1)")
+        if batch_size < 1:
+            raise OpenClawError("batch_size must be at least 1")
+        self.publish = publish
+        self.signer = signer
+        self.endpoints = tuple(endpoints)
+        self.tick = tick
+        self.jitter = jitter
+        self.batch_size = batch_size
+        self.backoff_max = backoff_max
+        self.max_failures = max_failures
+        self.unhealthy_after = unhealthy_after
+        self.audit = audit
+        self.stats = BeaconStats()
+        self.health: dict[str, EndpointHealth] = {}
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._agents: dict[str, _Agent] = {}
+        self._wheel: TimingWheel[str] = TimingWheel(tick=tick, now=clock())
+        self._outbox: dict[str, dict[str, AgentStatus]] = {}
+        self._tick_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> BeaconScheduler:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def start(self) -> None:
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run_forever())
+
+    async def close(self, *, offline: bool = True) -> None:
+        """Stop the scheduler; by default publish ``offline`` for every agent."""
+        if self._runner is not None:
+            async with self._tick_lock:
+                self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+        if offline:
+            for agent_id in list(self._agents):
+                self.unregister(agent_id)
+            await self.run_once()
+
+    def register(
+        self, status: AgentStatus, *, endpoints: Iterable[str] | None = None
+    ) -> None:
+        """Add an agent and publish its startup beacon on the next tick."""
+        targets = tuple(endpoints) if endpoints is not None else self.endpoints
+        if not targets:
+            raise OpenClawError(f"Agent {status.agent_id!r} has no OpenClaw endpoint")
+        if status.agent_id in self._agents:
+            raise OpenClawError(f"Agent {status.agent_id!r} is already registered")
+        for endpoint in targets:
+            if endpoint not in self.health:
+                self.health[endpoint] = EndpointHealth(endpoint)
+                self._outbox[endpoint] = {}
+        self._agents[status.agent_id] = _Agent(status, targets)
+        first = self._clock() + _phase(status.agent_id) * status.heartbeat_interval
+        self._wheel.schedule(status.agent_id, first)
+        self._enqueue(targets, status)
+
+    def update(self, status: AgentStatus) -> bool:
+        """Record a new status; True if it was queued for immediate publish."""
+        agent = self._agent(status.agent_id)
+        old, agent.status = agent.status, status
+        if status.heartbeat_interval != old.heartbeat_interval:
+            self._wheel.schedule(status.agent_id, self._next_heartbeat(status))
+        if not status.changed(old):
+            return False
+        self._enqueue(agent.endpoints, status)
+        return True
+
+    def unregister(self, agent_id: str) -> None:
+        """Remove an agent, publishing its ``offline`` beacon (§6.1)."""
+        agent = self._agent(agent_id)
+        del self._agents[agent_id]
+        self._wheel.cancel(agent_id)
+        self._enqueue(agent.endpoints, replace(agent.status, availability="offline"))
+
+    def resume(self, endpoint: str) -> None:
+        """Resume an endpoint paused after ``max_failures`` failures."""
+        self.health[endpoint].resume()
+        self._emit_endpoint("openclaw.endpoint.recovered", endpoint)
+        self._wake.set()
+
+    def pending(self, endpoint: str) -> int:
+        """Beacons waiting for ``endpoint``."""
+        return len(self._outbox.get(endpoint, ()))
+
+    def next_heartbeat(self, agent_id: str) -> float | None:
+        return self._wheel.deadline(agent_id)
+
+    async def run_once(self, now: float | None = None) -> int:
+        """Queue due heartbeats and drain every ready endpoint.
+
+        Returns how many beacons were published.
+        """
+        async with self._tick_lock:
+            now = self._clock() if now is None else now
+            for agent_id in self._wheel.advance(now):
+                agent = self._agents[agent_id]
+                self._wheel.schedule(agent_id, self._next_heartbeat(agent.status, now))
+                self._enqueue(agent.endpoints, agent.status, wake=False)
+                self.stats.heartbeats += 1
+                if self.audit is not None:
+                    self.audit.emit(
+                        "openclaw.heartbeat.scheduled",
+                        correlation_id=agent.status.correlation_id or agent_id,
+                        actor="openclaw",
+                        payload={
+                            "agent_id": agent_id,
+                            "interval": agent.status.heartbeat_interval,
+                        },
+                    )
+            ready = [
+                endpoint
+                for endpoint, outbox in self._outbox.items()
+                if outbox and self.health[endpoint].ready(now)
+            ]
+            # Every drain finishes before the lock is released, even if one fails.
+            results = await asyncio.gather(
+                *map(self._drain, ready), return_exceptions=True
+            )
+            published = 0
+            for endpoint, result in zip(ready, results, strict=True):
+                if isinstance(result, int):
+                    published += result
+                elif isinstance(result, Exception):
+                    logger.error("draining %s failed", endpoint, exc_info=result)
+                else:
+                    raise result
+            return published
+
+    async def _run_forever(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.tick):
+                    await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("beacon scheduler tick failed")
+
+    async def _drain(self, endpoint: str) -> int:
+        outbox = self._outbox[endpoint]
+        health = self.health[endpoint]
+        published = 0
+        while outbox:
+            keys = list(itertools.islice(outbox, self.batch_size))
+            statuses = [outbox.pop(key) for key in keys]
+            try:
+                beacons = await self._sign(statuses)
+                await self.publish(endpoint, beacons)
+            except Exception as exc:
+                # A status queued meanwhile is newer; keep it over the retry.
+                for status in statuses:
+                    outbox.setdefault(status.agent_id, status)
+                self._failed(endpoint, health, exc, statuses)
+                break
+            recovered = not health.healthy(self.unhealthy_after)
+            health.record_success(len(beacons))
+            published += len(beacons)
+            self.stats.published += len(beacons)
+            self.stats.batches += 1
+            BEACONS_PUBLISHED.inc(len(beacons))
+            self._audit_published(endpoint, statuses, beacons)
+            if recovered:
+                self._emit_endpoint("openclaw.endpoint.recovered", endpoint)
+        return published
+
+    async def _sign(self, statuses: list[AgentStatus]) -> list[dict[str, Any]]:
+        now = self._clock()
+        beacons = [build_beacon(status, now=now) for status in statuses]
+        signatures = await self.signer.sign_many(
+            [
+                (status.agent_id, signing_payload(status, beacon["timestamp"]))
+                for status, beacon in zip(statuses, beacons, strict=True)
+            ]
+        )
+        for beacon, signature in zip(beacons, signatures, strict=True):
+            beacon["signature"] = signature
+        return beacons
+
+    def _failed(
+        self,
+        endpoint: str,
+        health: EndpointHealth,
+        error: Exception,
+        statuses: list[AgentStatus],
+    ) -> None:
+        health.record_failure(
+            error,
+            len(statuses),
+            self._clock(),
+            backoff_max=self.backoff_max,
+            max_failures=self.max_failures,
+        )
+        error_type = type(error).__name__
+        self.stats.failed += len(statuses)
+        BEACONS_FAILED.inc(len(statuses), error_type=error_type)
+        logger.warning(
+            "OpenClaw endpoint %s failed (%s, %d in a row); retry at %.0f",
+            endpoint,
+            error_type,
+            health.failures,
+            health.retry_at,
+        )
+        if self.audit is not None:
+            for status in statuses:
+                self.audit.emit(
+                    "openclaw.beacon.failed",
+                    correlation_id=status.correlation_id or status.agent_id,
+                    actor="openclaw",
+                    payload={
+                        "agent_id": status.agent_id,
+                        "endpoint": endpoint,
+                        "error_type": error_type,
+                        "retry_count": health.failures,
+                    },
+                    severity="warning",
+                )
+        if health.failures == self.unhealthy_after:
+            self._emit_endpoint(
+                "openclaw.endpoint.unhealthy",
+                endpoint,
+                failure_count=health.failures,
+                severity="warning",
+            )
+        if health.paused:
+            logger.error(
+                "OpenClaw endpoint %s paused after %d failures; Operator must resume",
+                endpoint,
+                health.failures,
+            )
+            self._emit_endpoint(
+                "openclaw.endpoint.unhealthy",
+                endpoint,
+                failure_count=health.failures,
+                paused=True,
+                severity="critical",
+            )
+
+    def _audit_published(
+        self, endpoint: str, statuses: list[AgentStatus], beacons: list[dict[str, Any]]
+    ) -> None:
+        if self.audit is None:
+            return
+        for status, beacon in zip(statuses, beacons, strict=True):
+            self.audit.emit(
+                "openclaw.beacon.published",
+                correlation_id=status.correlation_id or status.agent_id,
+                actor="openclaw",
+                payload={
+                    "agent_id": status.agent_id,
+                    "beacon_id": beacon["beacon_id"],
+                    "endpoint": endpoint,
+                    "timestamp": beacon["timestamp"],
+                },
+            )
+
+    def _emit_endpoint(
+        self, event_type: str, endpoint: str, *, severity: str = "info", **payload: Any
+    ) -> None:
+        if self.audit is not None:
+            self.audit.emit(
+                event_type,
+                correlation_id=endpoint,
+                actor="openclaw",
+                payload={"endpoint": endpoint, **payload},
+                severity=severity,
+            )
+
+    def _enqueue(
+        self, endpoints: Iterable[str], status: AgentStatus, *, wake: bool = True
+    ) -> None:
+        for endpoint in endpoints:
+            outbox = self._outbox[endpoint]
+            # Re-insert so the newest status goes to the back of the queue.
+            outbox.pop(status.agent_id, None)
+            outbox[status.agent_id] = status
+        if wake:
+            self._wake.set()
+
+    def _next_heartbeat(self, status: AgentStatus, now: float | None = None) -> float:
+        now = self._clock() if now is None else now
+        spread = 1.0 + self.jitter * (2.0 * self._rng.random() - 1.0)
+        return now + max(status.heartbeat_interval * spread, MIN_HEARTBEAT_INTERVAL)
+
+    def _agent(self, agent_id: str) -> _Agent:
+        try:
+            return self._agents[agent_id]
+        except KeyError:
+            raise OpenClawError(f"Agent {agent_id!r} is not registered") from None
+
+
+def _phase(agent_id: str) -> float:
+    """Stable position of ``agent_id`` in ``[0, 1)``, uniform across agents."""
+    digest = hashlib.blake2b(agent_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
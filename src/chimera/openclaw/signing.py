@@ -0,0 +1,126 @@
+"""
+Beacon signing (specs/openclaw_integration.md §5.3 INV-OC-03, §7.5).
+
+Signing is CPU-bound (an ECDSA secp256k1 signature costs the order of a
+millisecond). A fleet heartbeat signed inline on the event loop would stall
+every other coroutine for seconds. :class:`BatchSigner` moves the work
+off the loop instead. It splits a batch into chunks and runs each chunk on
+an executor: the loop's default thread pool, or a ``ProcessPoolExecutor``
+to use every core. One executor hand-off is paid per chunk rather than per
+signature.
+
+:class:`Secp256k1Signer` is picklable, so it can be shipped to worker
+processes. Parsed keys are cached per process, keyed by secret, so each
+process parses a key once, not once per chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from chimera.openclaw.beacon import OpenClawError
+
+DEFAULT_CHUNK_SIZE = 256
+
+SignFn = Callable[[str, bytes], str]
+
+_ECDSA = ec.ECDSA(hashes.SHA256())
+
+# Parsed keys of this process; deriving one costs more than a signature.
+_PRIVATE_KEYS: dict[bytes, ec.EllipticCurvePrivateKey] = {}
+
+
+class Secp256k1Signer:
+    """ECDSA over secp256k1 with SHA-256; returns hex DER signatures.
+
+    ``keys`` maps agent_id to the 32-byte private scalar held in the
+    secrets manager. The keys are used only to sign and never appear in a
+    beacon (NFR-OC-04).
+    """
+
+    def __init__(self, keys: Mapping[str, bytes]) -> None:
+        self._secrets = dict(keys)
+
+    def __call__(self, agent_id: str, payload: bytes) -> str:
+        return self._key(agent_id).sign(payload, _ECDSA).hex()
+
+    def public_key(self, agent_id: str) -> bytes:
+        """Compressed SEC1 public key for verifying ``agent_id``'s beacons."""
+        return (
+            self._key(agent_id)
+            .public_key()
+            .public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
+        )
+
+    def _key(self, agent_id: str) -> ec.EllipticCurvePrivateKey:
+        try:
+            secret = self._secrets[agent_id]
+        except KeyError:
+            raise OpenClawError(f"No signing key for agent {agent_id!r}") from None
+        key = _PRIVATE_KEYS.get(secret)
+        if key is None:
+            key = _PRIVATE_KEYS[secret] = ec.derive_private_key(
+                int.from_bytes(secret, "big"), ec.SECP256K1()
+            )
+        return key
+
+
+def verify_signature(public_key: bytes, payload: bytes, signature: str) -> bool:
+    """Check a :class:`Secp256k1Signer` signature (INV-OC-03)."""
+    key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), public_key)
+    try:
+        key.verify(bytes.fromhex(signature), payload, _ECDSA)
+    except (InvalidSignature, ValueError):
+        return False
+    return True
+
+
+def _sign_chunk(sign: SignFn, items: list[tuple[str, bytes]]) -> list[str]:
+    return [sign(agent_id, payload) for agent_id, payload in items]
+
+
+@dataclass(slots=True)
+class SignerStats:
+    signatures: int = 0
+    chunks: int = 0
+
+
+class BatchSigner:
+    """Signs batches of ``(agent_id, payload)`` pairs on an executor."""
+
+    def __init__(
+        self,
+        sign: SignFn,
+        *,
+        executor: Executor | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise OpenClawError("chunk_size must be at least 1")
+        self.sign = sign
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.stats = SignerStats()
+
+    async def sign_many(self, items: Sequence[tuple[str, bytes]]) -> list[str]:
+        """Signatures in the order of ``items``."""
+        loop = asyncio.get_running_loop()
+        size = self.chunk_size
+        chunks = [list(items[i : i + size]) for i in range(0, len(items), size)]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, _sign_chunk, self.sign, chunk)
+                for chunk in chunks
+            )
+        )
+        self.stats.signatures += len(items)
+        self.stats.chunks += len(chunks)
+        return [signature for chunk in results for signature in chunk]
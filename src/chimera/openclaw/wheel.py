@@ -0,0 +1,88 @@
+"""
+Hashed timing wheel for fleet heartbeats (specs/openclaw_integration.md §6.2).
+
+Thousands of agents each need a timer. One asyncio timer per agent puts
+every deadline in the event loop's heap, and agents started together fire
+together. A timing wheel keeps deadlines in ``slots`` buckets of ``tick``
+seconds each. :meth:`TimingWheel.schedule` and
+:meth:`TimingWheel.cancel` are O(1), and :meth:`TimingWheel.advance` only
+visits the buckets whose ticks have elapsed. A deadline more than one
+revolution away sits in its bucket until ``now`` reaches it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from chimera.openclaw.beacon import OpenClawError
+
+K = TypeVar("K", bound=Hashable)
+
+DEFAULT_TICK = 1.0
+DEFAULT_SLOTS = 4_096
+
+
+class TimingWheel(Generic[K]):
+    """Deadlines keyed by ``K``; each key is scheduled at most once."""
+
+    def __init__(
+        self,
+        *,
+        tick: float = DEFAULT_TICK,
+        slots: int = DEFAULT_SLOTS,
+        now: float = 0.0,
+    ) -> None:
+        if tick <= 0 or slots < 1:
+            raise OpenClawError("TimingWheel needs tick > 0 and slots >= 1")
+        self.tick = tick
+        self._buckets: list[dict[K, float]] = [{} for _ in range(slots)]
+        self._slot_of: dict[K, int] = {}
+        # Last tick whose bucket is fully drained.
+        self._done = math.floor(now / tick) - 1
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slot_of
+
+    def deadline(self, key: K) -> float | None:
+        slot = self._slot_of.get(key)
+        return None if slot is None else self._buckets[slot][key]
+
+    def schedule(self, key: K, at: float) -> None:
+        """Fire ``key`` at ``at``, replacing any earlier schedule for it."""
+        self.cancel(key)
+        # A deadline in an already drained tick goes to the next one.
+        tick = max(math.floor(at / self.tick), self._done + 1)
+        slot = tick % len(self._buckets)
+        self._buckets[slot][key] = at
+        self._slot_of[key] = slot
+
+    def cancel(self, key: K) -> bool:
+        slot = self._slot_of.pop(key, None)
+        if slot is None:
+            return False
+        del self._buckets[slot][key]
+        return True
+
+    def advance(self, now: float) -> list[K]:
+        """Remove and return every key due at ``now``, earliest tick first."""
+        target = math.floor(now / self.tick)
+        slots = len(self._buckets)
+        first = max(self._done + 1, target - slots + 1)
+        due: list[K] = []
+        for tick in range(first, target + 1):
+            bucket = self._buckets[tick % slots]
+            if not bucket:
+                continue
+            fired = [key for key, at in bucket.items() if at <= now]
+            for key in fired:
+                del bucket[key]
+                del self._slot_of[key]
+            due += fired
+        # The current tick may still receive deadlines later within it.
+        self._done = target - 1
+        return due
@@ -0,0 +1,39 @@
+"""
+Persona (SOUL.md) loading for agents (specs/technical.md §3.1–3.2).
+
+- :func:`compile_soul` — parse and validate one SOUL.md into an immutable
+  :class:`CompiledPersona` with precompiled directive patterns and a trait
+  embedding
+- :class:`PersonaRegistry` — content-hash-keyed, change-watching cache of
+  compiled personas shared by every task in the process
+"""
+
+from chimera.persona.registry import (
+    DEFAULT_CHECK_INTERVAL,
+    PersonaRegistry,
+    PersonaRegistryStats,
+)
+from chimera.persona.soul import (
+    TRAIT_EMBEDDING_DIM,
+    CompiledPersona,
+    PersonaError,
+    compile_soul,
+    content_hash,
+    hashed_embedding,
+    parse_soul,
+    render_soul,
+)
+
+__all__ = [
+    "DEFAULT_CHECK_INTERVAL",
+    "TRAIT_EMBEDDING_DIM",
+    "CompiledPersona",
+    "PersonaError",
+    "PersonaRegistry",
+    "PersonaRegistryStats",
+    "compile_soul",
+    "content_hash",
+    "hashed_embedding",
+    "parse_soul",
+    "render_soul",
+]
@@ -0,0 +1,279 @@
+"""
+Shared registry of compiled personas (specs/technical.md §3.1–3.2).
+
+Every task needs its agent's voice traits, directives and core beliefs.
+:class:`PersonaRegistry` reads and compiles each SOUL.md once and then
+serves the same immutable :class:`~chimera.persona.CompiledPersona` to
+every worker task in the process.
+
+- **Content-hash cache.** Compiled personas are keyed by the hash of the
+  file bytes. Several refs with identical content share one object, and
+  touching a file without changing it does not trigger a recompile.
+- **Change detection.** A ref is re-checked with ``stat`` at most once per
+  ``check_interval``. The file is re-read only when its mtime or size
+  changed. :meth:`start` additionally polls every known file in the
+  background, inotify-style, so edits are noticed before the next task
+  asks. ``on_change`` is called with the old and new persona. Use it, for
+  example, to invalidate completions cached under the old version.
+- **Preload.** :meth:`preload` compiles every SOUL.md under the root (or a
+  given list of refs) at startup and reports every invalid file at once.
+
+Concurrent requests for one ref while it loads share a single read
+(:class:`~chimera.asyncutil.SingleFlight`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy.typing as npt
+
+from chimera.asyncutil import SingleFlight
+from chimera.metrics import counter
+from chimera.persona.soul import (
+    CompiledPersona,
+    PersonaError,
+    compile_soul,
+    content_hash,
+    freeze,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL = 2.0
+
+TraitEmbedder = Callable[[str], Awaitable[npt.ArrayLike]]
+ChangeListener = Callable[[CompiledPersona, CompiledPersona | None], None]
+
+LOOKUPS = counter(
+    "chimera_persona_lookups",
+    "Persona registry lookups by outcome",
+    labelnames=("outcome",),
+)
+
+
+@dataclass(slots=True)
+class PersonaRegistryStats:
+    hits: int = 0
+    checks: int = 0
+    compiles: int = 0
+    shared: int = 0
+    reloads: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _Watched:
+    mtime_ns: int
+    size: int
+    version: str
+    checked_at: float
+
+
+class PersonaRegistry:
+    """Loads, caches and watches compiled SOUL.md personas.
+
+    ``persona_ref`` values such as ``/personas/analyst.md`` are resolved
+    under ``root``; refs escaping it are rejected.
+
+    Usage::
+
+        async with PersonaRegistry(root="souls") as registry:
+            await registry.preload()
+            persona = await registry.get(agent["persona_ref"])
+    """
+
+    def __init__(
+        self,
+        *,
+        root: str | os.PathLike[str],
+        embed: TraitEmbedder | None = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        on_change: ChangeListener | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.embed = embed
+        self.check_interval = check_interval
+        self.on_change = on_change
+        self.clock = clock
+        self.stats = PersonaRegistryStats()
+        self._watched: dict[Path, _Watched] = {}
+        self._compiled: dict[str, CompiledPersona] = {}
+        self._inflight: SingleFlight[Path, CompiledPersona] = SingleFlight()
+        self._poller: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> PersonaRegistry:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def resolve(self, persona_ref: str) -> Path:
+        """Absolute path of ``persona_ref`` under the root."""
+        path = (self.root / persona_ref.lstrip("/")).resolve()
+        if not path.is_relative_to(self.root):
+            raise PersonaError(f"persona_ref {persona_ref!r} is outside {self.root}")
+        return path
+
+    async def get(self, persona_ref: str) -> CompiledPersona:
+        """The compiled persona for ``persona_ref``, loading it if needed."""
+        path = self.resolve(persona_ref)
+        watched = self._watched.get(path)
+        if (
+            watched is not None
+            and self.clock() - watched.checked_at < self.check_interval
+        ):
+            self.stats.hits += 1
+            LOOKUPS.inc(outcome="hit")
+            return self._compiled[watched.version]
+        return await self._load(path)
+
+    async def validate(self, persona_ref: str) -> str | None:
+        """Why ``persona_ref`` is not a valid SOUL.md, or ``None`` (§3.1)."""
+        try:
+            await self.get(persona_ref)
+        except PersonaError as exc:
+            return str(exc)
+        return None
+
+    async def preload(
+        self, persona_refs: Iterable[str] | None = None
+    ) -> list[CompiledPersona]:
+        """Compile ``persona_refs`` (default: every ``*.md`` under the root).
+
+        Raises one :class:`PersonaError` listing every invalid file.
+        """
+        if persona_refs is None:
+            refs = [
+                str(p.relative_to(self.root)) for p in sorted(self.root.rglob("*.md"))
+            ]
+        else:
+            refs = list(persona_refs)
+        results = await asyncio.gather(
+            *(self.get(ref) for ref in refs), return_exceptions=True
+        )
+        errors = [str(r) for r in results if isinstance(r, PersonaError)]
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, PersonaError
+            ):
+                raise result
+        if errors:
+            raise PersonaError(
+                f"{len(errors)} invalid persona file(s): " + "; ".join(errors)
+            )
+        return [r for r in results if isinstance(r, CompiledPersona)]
+
+    async def refresh(self) -> list[CompiledPersona]:
+        """Re-check every known file now; returns the personas that changed."""
+        changed = []
+        for path in list(self._watched):
+            before = self._watched[path].version
+            try:
+                persona = await self._load(path)
+            except PersonaError as exc:
+                logger.warning("Persona file %s became invalid: %s", path, exc)
+                continue
+            if persona.version != before:
+                changed.append(persona)
+        return changed
+
+    def start(self) -> None:
+        """Poll known files in the background every ``check_interval``."""
+        if self._poller is None:
+            self._poller = asyncio.create_task(self._poll_forever())
+
+    async def close(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+
+    async def _poll_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.refresh()
+
+    async def _load(self, path: Path) -> CompiledPersona:
+        return await self._inflight.run(path, functools.partial(self._check, path))
+
+    async def _check(self, path: Path) -> CompiledPersona:
+        self.stats.checks += 1
+        watched = self._watched.get(path)
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            self._forget(path)
+            self.stats.errors += 1
+            LOOKUPS.inc(outcome="error")
+            raise PersonaError(f"Cannot read {path}: {exc.strerror}") from None
+        now = self.clock()
+        if watched is not None and (watched.mtime_ns, watched.size) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            watched.checked_at = now
+            LOOKUPS.inc(outcome="unchanged")
+            return self._compiled[watched.version]
+
+        data = path.read_bytes()
+        try:
+            persona = await self._compile(data, str(path))
+        except PersonaError:
+            self._forget(path)
+            self.stats.errors += 1
+            LOOKUPS.inc(outcome="error")
+            raise
+        previous = self._compiled.get(watched.version) if watched else None
+        self._watched[path] = _Watched(
+            stat.st_mtime_ns, stat.st_size, persona.version, now
+        )
+        if previous is not None and previous.version != persona.version:
+            self.stats.reloads += 1
+            self._release(previous.version)
+            if self.on_change is not None:
+                self.on_change(previous, persona)
+        return persona
+
+    async def _compile(self, data: bytes, source: str) -> CompiledPersona:
+        shared = self._compiled.get(content_hash(data))
+        if shared is not None:
+            self.stats.shared += 1
+            LOOKUPS.inc(outcome="shared")
+            return shared
+        persona = compile_soul(data, source=source)
+        if self.embed is not None:
+            vector = await self.embed(" ".join(persona.voice_traits))
+            persona = replace(persona, trait_embedding=freeze(vector))
+        self.stats.compiles += 1
+        LOOKUPS.inc(outcome="compiled")
+        self._compiled[persona.version] = persona
+        return persona
+
+    def _forget(self, path: Path) -> None:
+        watched = self._watched.pop(path, None)
+        if watched is None:
+            return
+        persona = self._compiled.get(watched.version)
+        self._release(watched.version)
+        if persona is not None and self.on_change is not None:
+            self.on_change(persona, None)
+
+    def _release(self, version: str) -> None:
+        # Drop a compiled persona once no watched file has its content.
+        if all(w.version != version for w in self._watched.values()):
+            self._compiled.pop(version, None)
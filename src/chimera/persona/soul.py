@@ -0,0 +1,285 @@
+"""
+SOUL.md parsing and compilation (specs/technical.md §3.2).
+
+A SOUL.md file opens with a front-matter block holding the scalar fields,
+followed by one ``##`` section per list or text field::
+
+    ---
+    id: tech-analyst
+    name: Tech Analyst
+    ---
+
+    ## Backstory
+    A data-driven technology analyst focused on AI/ML trends.
+
+    ## Voice Traits
+    - analytical
+    - concise
+
+    ## Directives
+    - cite sources when making claims
+
+    ## Core Beliefs
+    - Transparency builds trust
+
+    ## Forbidden Patterns
+    - `\\bguaranteed returns?\\b`
+
+``Forbidden Patterns`` and ``Required Patterns`` are optional,
+case-insensitive regexes. They are the machine-checkable part of the
+directives, and the Judge enforces them as :class:`~chimera.judge.PersonaRules`.
+
+:func:`compile_soul` turns the text into an immutable
+:class:`CompiledPersona` in one pass. The result holds the validated
+fields, the directive patterns compiled once, and a unit-length embedding
+of the voice traits. Its ``version`` is the hash of the file content, so
+any edit yields a new version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from chimera.errors import ChimeraError
+from chimera.judge import PersonaRules
+
+TRAIT_EMBEDDING_DIM = 256
+
+REQUIRED_SCALARS = ("id", "name")
+LIST_SECTIONS = (
+    "voice_traits",
+    "directives",
+    "core_beliefs",
+    "forbidden_patterns",
+    "required_patterns",
+)
+REQUIRED_SECTIONS = ("backstory", "voice_traits", "directives")
+
+_HEADING = re.compile(r"^##\s+(.+?)\s*#*\s*$")
+_ITEM = re.compile(r"^[-*+]\s+(.*)$")
+_TOKEN = re.compile(r"\w+")
+
+
+class PersonaError(ChimeraError):
+    """A persona_ref does not resolve to a valid, parseable SOUL.md (§3.1)."""
+
+
+def content_hash(data: bytes) -> str:
+    """Version of a SOUL.md file: a short hash of its exact bytes."""
+    return hashlib.blake2b(data, digest_size=8, usedforsecurity=False).hexdigest()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompiledPersona:
+    """One SOUL.md, parsed, validated and ready for every task that needs it.
+
+    Instances are shared between tasks and must not be modified; the trait
+    embedding is a read-only array.
+    """
+
+    id: str
+    name: str
+    version: str
+    backstory: str
+    voice_traits: tuple[str, ...]
+    directives: tuple[str, ...]
+    core_beliefs: tuple[str, ...]
+    rules: PersonaRules
+    trait_embedding: npt.NDArray[np.float32]
+    _forbidden: re.Pattern[str] | None
+    _forbidden_each: tuple[re.Pattern[str], ...]
+    _required: tuple[re.Pattern[str], ...]
+
+    @property
+    def key(self) -> str:
+        """``id@version``, as used by :class:`~chimera.completions.CompletionKey`."""
+        return f"{self.id}@{self.version}"
+
+    def violations(self, text: str) -> list[str]:
+        """Directive patterns ``text`` breaks; empty when it complies."""
+        found = []
+        if self._forbidden is not None and self._forbidden.search(text):
+            found += [
+                f"persona {self.id}: forbidden pattern {p.pattern!r}"
+                for p in self._forbidden_each
+                if p.search(text)
+            ]
+        found += [
+            f"persona {self.id}: missing required pattern {p.pattern!r}"
+            for p in self._required
+            if not p.search(text)
+        ]
+        return found
+
+    def as_constraints(self, persona_ref: str) -> dict[str, Any]:
+        """``persona_constraints`` for a task context (§3.4, §8.2)."""
+        return {
+            "persona_ref": persona_ref,
+            "persona_id": self.id,
+            "version": self.version,
+            "name": self.name,
+            "voice_traits": list(self.voice_traits),
+            "directives": list(self.directives),
+            "core_beliefs": list(self.core_beliefs),
+        }
+
+
+def parse_soul(text: str, *, source: str = "SOUL.md") -> dict[str, Any]:
+    """The §3.2 fields of a SOUL.md document; raises :class:`PersonaError`."""
+    lines = text.splitlines()
+    fields: dict[str, Any] = {}
+    start = 0
+    if lines and lines[0].strip() == "---":
+        try:
+            end = next(
+                i for i, line in enumerate(lines[1:], 1) if line.strip() == "---"
+            )
+        except StopIteration:
+            raise PersonaError(f"{source}: unterminated front matter") from None
+        for number, line in enumerate(lines[1:end], 2):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise PersonaError(f"{source}:{number}: expected 'key: value'")
+            fields[_field_name(name)] = value.strip().strip("\"'")
+        start = end + 1
+
+    section: str | None = None
+    body: dict[str, list[str]] = {}
+    for number, line in enumerate(lines[start:], start + 1):
+        heading = _HEADING.match(line)
+        if heading:
+            section = _field_name(heading.group(1))
+            if section in body:
+                raise PersonaError(f"{source}:{number}: duplicate section {section!r}")
+            body[section] = []
+        elif section is not None:
+            body[section].append(line)
+
+    for section, content in body.items():
+        if section in LIST_SECTIONS:
+            fields[section] = _items(content, source, section)
+        else:
+            fields[section] = " ".join(" ".join(content).split())
+    return fields
+
+
+def compile_soul(data: bytes, *, source: str = "SOUL.md") -> CompiledPersona:
+    """Parse, validate and compile one SOUL.md file's bytes."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise PersonaError(f"{source}: not UTF-8 ({exc.reason})") from None
+    fields = parse_soul(text, source=source)
+    missing = [
+        name for name in (*REQUIRED_SCALARS, *REQUIRED_SECTIONS) if not fields.get(name)
+    ]
+    if missing:
+        raise PersonaError(f"{source}: missing required fields {missing}")
+    version = content_hash(data)
+    rules = PersonaRules(
+        persona_id=fields["id"],
+        version=version,
+        forbidden_patterns=tuple(fields.get("forbidden_patterns", ())),
+        required_patterns=tuple(fields.get("required_patterns", ())),
+    )
+    try:
+        forbidden_each = tuple(
+            re.compile(p, re.IGNORECASE) for p in rules.forbidden_patterns
+        )
+        required = tuple(re.compile(p, re.IGNORECASE) for p in rules.required_patterns)
+        forbidden = (
+            re.compile(
+                "|".join(f"(?:{p})" for p in rules.forbidden_patterns), re.IGNORECASE
+            )
+            if rules.forbidden_patterns
+            else None
+        )
+    except re.error as exc:
+        raise PersonaError(f"{source}: invalid directive pattern: {exc}") from None
+    voice_traits = tuple(fields["voice_traits"])
+    return CompiledPersona(
+        id=fields["id"],
+        name=fields["name"],
+        version=version,
+        backstory=fields["backstory"],
+        voice_traits=voice_traits,
+        directives=tuple(fields["directives"]),
+        core_beliefs=tuple(fields.get("core_beliefs", ())),
+        rules=rules,
+        trait_embedding=hashed_embedding(" ".join(voice_traits)),
+        _forbidden=forbidden,
+        _forbidden_each=forbidden_each,
+        _required=required,
+    )
+
+
+def render_soul(persona: Mapping[str, Any]) -> str:
+    """SOUL.md text for a §3.2 persona mapping (the inverse of :func:`parse_soul`)."""
+    lines = ["---", f"id: {persona['id']}", f"name: {persona['name']}", "---", ""]
+    lines += ["## Backstory", str(persona["backstory"]), ""]
+    for name in LIST_SECTIONS:
+        items = persona.get(name)
+        if items:
+            lines.append(f"## {name.replace('_', ' ').title()}")
+            lines += [f"- {item}" for item in items]
+            lines.append("")
+    return "\n".join(lines)
+
+
+def hashed_embedding(
+    text: str, *, dim: int = TRAIT_EMBEDDING_DIM
+) -> npt.NDArray[np.float32]:
+    """Unit-length, read-only bag-of-words vector by signed feature hashing.
+
+    Deterministic and dependency-free; used when no embedding model is
+    configured. Texts sharing words have positive cosine similarity.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in _TOKEN.findall(text.lower()):
+        h = int.from_bytes(
+            hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+        )
+        vector[h % dim] += 1.0 if h >> 63 else -1.0
+    return freeze(vector)
+
+
+def freeze(vector: npt.ArrayLike) -> npt.NDArray[np.float32]:
+    """``vector`` as a unit-length, read-only float32 array."""
+    array = np.array(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(array))
+    if norm:
+        array /= norm
+    array.flags.writeable = False
+    return array
+
+
+def _field_name(heading: str) -> str:
+    return "_".join(heading.strip().lower().split())
+
+
+def _items(content: list[str], source: str, section: str) -> list[str]:
+    items: list[str] = []
+    for line in content:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        item = _ITEM.match(stripped)
+        if item:
+            value = item.group(1).strip()
+            if value.startswith("`") and value.endswith("`") and len(value) > 1:
+                value = value[1:-1]
+            items.append(value)
+        elif items and line[:1].isspace():
+            items[-1] = f"{items[-1]} {stripped}"  # wrapped list item
+        else:
+            raise PersonaError(f"{source}: section {section!r} must be a list")
+    return items
@@ -0,0 +1,26 @@
+"""
+Planner: campaign task DAGs and incremental re-planning (specs/technical.md §4).
+
+:class:`Planner` keeps every campaign's :class:`PlannedTask` objects as
+a dependency DAG in a :class:`TaskGraph` and reacts to the §4.4
+re-planning triggers by touching only the affected subgraph, then
+pushing the resulting queue changes as one batch.
+"""
+
+from chimera.planner.graph import PlannedTask, PlannerError, TaskGraph
+from chimera.planner.planner import (
+    DEFAULT_LOW_BUDGET_USD,
+    PlanDelta,
+    Planner,
+    PlannerStats,
+)
+
+__all__ = [
+    "DEFAULT_LOW_BUDGET_USD",
+    "PlanDelta",
+    "PlannedTask",
+    "Planner",
+    "PlannerError",
+    "PlannerStats",
+    "TaskGraph",
+]
@@ -0,0 +1,253 @@
+"""
+Per-campaign task DAG with reverse indexes (specs/technical.md §4.4).
+
+Each :class:`PlannedTask` may depend on earlier tasks of the same
+campaign. :class:`TaskGraph` keeps the forward edges (``children``) and
+the unfinished dependencies of every task (``waiting``). It also indexes
+tasks by campaign, by platform, and by budget scope for cost-incurring
+tasks. A re-planning trigger looks up the affected tasks in one index
+and walks only their descendants. It never scans or rebuilds a whole
+plan.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.budget import scopes_for
+from chimera.errors import ChimeraError
+from chimera.queue import PHASE_RANK, PRIORITY_RANK
+
+
+class PlannerError(ChimeraError):
+    """Raised when a plan change is invalid or not allowed."""
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedTask:
+    """One task the Planner intends to queue (§3.4).
+
+    ``platforms`` lists acceptable target platforms in order of
+    preference; the first one that is not down is used. A task with
+    ``estimated_cost_usd`` is cost-incurring (§4.5).
+    """
+
+    campaign_id: str
+    task_type: str
+    priority: str = "medium"
+    depends_on: tuple[str, ...] = ()
+    platforms: tuple[str, ...] = ()
+    agent_id: str | None = None
+    estimated_cost_usd: float = 0.0
+    deadline: float | None = None
+    campaign_phase: str = "active"
+    max_retries: int = 3
+    payload: dict[str, Any] = field(default_factory=dict)
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def __post_init__(self) -> None:
+        if self.priority not in PRIORITY_RANK:
+            raise PlannerError(f"Unknown task priority: {self.priority!r}")
+        if self.campaign_phase not in PHASE_RANK:
+            raise PlannerError(f"Unknown campaign phase: {self.campaign_phase!r}")
+        if self.estimated_cost_usd < 0:
+            raise PlannerError("estimated_cost_usd must not be negative")
+        if self.task_id in self.depends_on:
+            raise PlannerError(f"Task {self.task_id} depends on itself")
+
+    @property
+    def cost_incurring(self) -> bool:
+        return self.estimated_cost_usd > 0
+
+    @property
+    def scopes(self) -> tuple[str, ...]:
+        """Budget scopes this task is charged to, outermost first."""
+        return scopes_for(campaign_id=self.campaign_id, agent_id=self.agent_id)
+
+
+@dataclass(slots=True)
+class _Node:
+    task: PlannedTask
+    waiting: set[str]
+    children: set[str] = field(default_factory=set)
+    attempts: int = 0
+
+
+class TaskGraph:
+    """Tasks not yet finished, with their dependency edges and indexes."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, _Node] = {}
+        # Finished tasks per campaign, so later tasks may depend on them.
+        self._done: dict[str, set[str]] = defaultdict(set)
+        self._by_campaign: dict[str, set[str]] = defaultdict(set)
+        self._by_platform: dict[str, set[str]] = defaultdict(set)
+        self._by_scope: dict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._nodes
+
+    def task(self, task_id: str) -> PlannedTask:
+        return self._node(task_id).task
+
+    def waiting(self, task_id: str) -> frozenset[str]:
+        """Dependencies of ``task_id`` that have not finished yet."""
+        return frozenset(self._node(task_id).waiting)
+
+    def attempts(self, task_id: str) -> int:
+        return self._node(task_id).attempts
+
+    def record_attempt(self, task_id: str) -> int:
+        node = self._node(task_id)
+        node.attempts += 1
+        return node.attempts
+
+    # -- indexes -------------------------------------------------------------
+
+    def by_campaign(self, campaign_id: str) -> frozenset[str]:
+        return frozenset(self._by_campaign.get(campaign_id, ()))
+
+    def by_platform(self, platform: str) -> frozenset[str]:
+        return frozenset(self._by_platform.get(platform, ()))
+
+    def by_scope(self, scope: str) -> frozenset[str]:
+        """Cost-incurring tasks charged to ``scope``."""
+        return frozenset(self._by_scope.get(scope, ()))
+
+    # -- changes -------------------------------------------------------------
+
+    def add(self, tasks: Iterable[PlannedTask]) -> list[str]:
+        """Insert tasks, all or none. Dependencies must be finished, already
+        in the graph, or in ``tasks``; cycles are rejected."""
+        batch = {task.task_id: task for task in tasks}
+        for task_id, task in batch.items():
+            if task_id in self._nodes or task_id in self._done[task.campaign_id]:
+                raise PlannerError(f"Task {task_id} is already planned")
+            for dep in task.depends_on:
+                if dep in batch:
+                    owner = batch[dep]
+                elif dep in self._nodes:
+                    owner = self._nodes[dep].task
+                elif dep in self._done[task.campaign_id]:
+                    continue
+                else:
+                    raise PlannerError(f"Task {task_id} depends on unknown task {dep}")
+                if owner.campaign_id != task.campaign_id:
+                    raise PlannerError(
+                        f"Task {task_id} depends on {dep} of another campaign"
+                    )
+        order = _topological(batch)
+        for task_id in order:
+            task = batch[task_id]
+            done = self._done[task.campaign_id]
+            node = _Node(task, {dep for dep in task.depends_on if dep not in done})
+            self._nodes[task_id] = node
+            for dep in node.waiting:
+                self._nodes[dep].children.add(task_id)
+            self._by_campaign[task.campaign_id].add(task_id)
+            for platform in task.platforms:
+                self._by_platform[platform].add(task_id)
+            if task.cost_incurring:
+                for scope in task.scopes:
+                    self._by_scope[scope].add(task_id)
+        return order
+
+    def complete(self, task_id: str) -> list[str]:
+        """Mark a task finished; returns the dependents it unblocked."""
+        node = self._unlink(task_id)
+        self._done[node.task.campaign_id].add(task_id)
+        unblocked = []
+        for child in node.children:
+            waiting = self._nodes[child].waiting
+            waiting.discard(task_id)
+            if not waiting:
+                unblocked.append(child)
+        return unblocked
+
+    def remove(self, task_ids: Iterable[str]) -> list[str]:
+        """Drop tasks and every task that depends on them, transitively."""
+        doomed = list(self.descendants(task_ids))
+        for task_id in doomed:
+            self._unlink(task_id)
+        return doomed
+
+    def forget_campaign(self, campaign_id: str) -> list[str]:
+        """Drop every unfinished task of a campaign and its finished ids."""
+        removed = self.remove(self._by_campaign.get(campaign_id, ()))
+        self._done.pop(campaign_id, None)
+        return removed
+
+    def descendants(self, task_ids: Iterable[str]) -> Iterator[str]:
+        """``task_ids`` (those still in the graph) and all their dependents."""
+        seen: set[str] = set()
+        pending = deque(task_id for task_id in task_ids if task_id in self._nodes)
+        while pending:
+            task_id = pending.popleft()
+            if task_id in seen:
+                continue
+            seen.add(task_id)
+            yield task_id
+            pending.extend(self._nodes[task_id].children)
+
+    def _node(self, task_id: str) -> _Node:
+        try:
+            return self._nodes[task_id]
+        except KeyError:
+            raise PlannerError(f"Unknown task {task_id}") from None
+
+    def _unlink(self, task_id: str) -> _Node:
+        node = self._nodes.pop(task_id, None)
+        if node is None:
+            raise PlannerError(f"Unknown task {task_id}")
+        task = node.task
+        for dep in node.waiting:
+            parent = self._nodes.get(dep)
+            if parent is not None:
+                parent.children.discard(task_id)
+        _discard(self._by_campaign, task.campaign_id, task_id)
+        for platform in task.platforms:
+            _discard(self._by_platform, platform, task_id)
+        if task.cost_incurring:
+            for scope in task.scopes:
+                _discard(self._by_scope, scope, task_id)
+        return node
+
+
+def _discard(index: dict[str, set[str]], key: str, task_id: str) -> None:
+    members = index.get(key)
+    if members is not None:
+        members.discard(task_id)
+        if not members:
+            del index[key]
+
+
+def _topological(batch: dict[str, PlannedTask]) -> list[str]:
+    """Order ``batch`` so every task follows its in-batch dependencies."""
+    indegree = {
+        task_id: sum(dep in batch for dep in task.depends_on)
+        for task_id, task in batch.items()
+    }
+    dependents: dict[str, list[str]] = defaultdict(list)
+    for task_id, task in batch.items():
+        for dep in task.depends_on:
+            if dep in batch:
+                dependents[dep].append(task_id)
+    ready = deque(task_id for task_id, degree in indegree.items() if degree == 0)
+    order = []
+    while ready:
+        task_id = ready.popleft()
+        order.append(task_id)
+        for child in dependents[task_id]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    if len(order) != len(batch):
+        raise PlannerError("Planned tasks contain a dependency cycle")
+    return order
@@ -0,0 +1,394 @@
+"""
+Incremental Planner re-planning (specs/technical.md §4).
+
+The :class:`Planner` owns a :class:`~chimera.planner.TaskGraph` and keeps
+the Task Queue in step with it. A trigger only changes the state it is
+about: a campaign's status, a platform that is down, an exhausted budget
+scope, or one task finishing or failing. It then marks the tasks that the
+graph's indexes return as dirty. :meth:`Planner.flush` re-evaluates the
+dirty tasks, and nothing else. It pushes all resulting changes in one
+``remove_many`` and one ``enqueue_many`` call, so the cost of a trigger
+grows with the affected subgraph, not with the backlog.
+
+§4.4 triggers:
+
+- Worker failure: :meth:`Planner.fail` re-queues the task until
+  ``max_retries``, then cancels it and its dependents.
+- Context drift: :meth:`Planner.prune` cancels invalidated tasks and
+  their dependents, then plans replacements.
+- Budget exhausted: :meth:`Planner.budget_exhausted` holds the scope's
+  cost-incurring tasks and notifies the Operator.
+  :meth:`Planner.budget_restored` releases them.
+- Campaign paused or cancelled: :meth:`Planner.set_campaign_status`
+  holds the campaign's tasks, or drops them for good.
+- Persistent platform error: :meth:`Planner.platform_down` moves tasks
+  to their next acceptable platform, or holds them if none is left.
+
+A task is queued when its dependencies are finished, its campaign is
+active, one of its platforms is up, and, if it is cost-incurring, its
+budget scopes are not exhausted and the :class:`~chimera.budget.BudgetLedger`
+can cover its estimate (§4.5).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+
+from chimera.audit import AuditEmitter
+from chimera.budget import BudgetLedger
+from chimera.contracts import CAMPAIGN_STATUSES, Campaign
+from chimera.metrics import counter
+from chimera.planner.graph import PlannedTask, PlannerError, TaskGraph
+from chimera.queue import QueuedTask, TaskQueue
+
+logger = logging.getLogger(__name__)
+
+# Cost-incurring tasks are deprioritized below this much available budget (§4.3).
+DEFAULT_LOW_BUDGET_USD = 5.0
+
+QUEUE_CHANGES = counter(
+    "chimera_planner_queue_changes",
+    "Tasks the Planner added to or removed from the Task Queue",
+    labelnames=("change",),
+)
+
+
+@dataclass(slots=True)
+class PlannerStats:
+    planned: int = 0
+    completed: int = 0
+    retried: int = 0
+    cancelled: int = 0
+    enqueued: int = 0
+    removed: int = 0
+    flushes: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class PlanDelta:
+    """What one flush changed in the Task Queue.
+
+    ``held`` lists tasks that stay out of the queue for now (see
+    :meth:`Planner.hold_reasons`).
+    """
+
+    enqueued: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    held: tuple[str, ...] = ()
+
+
+class Planner:
+    """Keeps each campaign's task DAG and the Task Queue consistent."""
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        *,
+        budget: BudgetLedger | None = None,
+        low_budget_usd: float = DEFAULT_LOW_BUDGET_USD,
+        audit: AuditEmitter | None = None,
+    ) -> None:
+        self.queue = queue
+        self.budget = budget
+        self.low_budget_usd = low_budget_usd
+        self.audit = audit
+        self.graph = TaskGraph()
+        self.stats = PlannerStats()
+        self._campaigns: dict[str, str] = {}
+        self._platforms_down: set[str] = set()
+        self._scopes_exhausted: set[str] = set()
+        # What the queue holds for each task we put there, as last flushed.
+        self._queued: dict[str, QueuedTask] = {}
+        self._dirty: set[str] = set()
+        self._batch_depth = 0
+        self._flush_lock = asyncio.Lock()
+
+    # -- queries -------------------------------------------------------------
+
+    def campaign_status(self, campaign_id: str) -> str:
+        try:
+            return self._campaigns[campaign_id]
+        except KeyError:
+            raise PlannerError(f"Unknown campaign {campaign_id}") from None
+
+    def platform_for(self, task: PlannedTask) -> str | None:
+        """The first of ``task.platforms`` that is up; None if all are down."""
+        for platform in task.platforms:
+            if platform not in self._platforms_down:
+                return platform
+        return None
+
+    def hold_reasons(self, task_id: str) -> tuple[str, ...]:
+        """Why ``task_id`` is not queued; empty if it is (or may be)."""
+        task = self.graph.task(task_id)
+        reasons = []
+        if self.graph.waiting(task_id):
+            reasons.append("dependencies")
+        if self._campaigns.get(task.campaign_id) != "active":
+            reasons.append("campaign")
+        if task.platforms and self.platform_for(task) is None:
+            reasons.append("platform")
+        if task.cost_incurring and not self._budget_allows(task):
+            reasons.append("budget")
+        return tuple(reasons)
+
+    # -- triggers ------------------------------------------------------------
+
+    def add_campaign(self, campaign: Campaign) -> None:
+        """Track a campaign; its status decides whether its tasks are queued."""
+        self._campaigns[campaign.campaign_id] = campaign.status
+
+    async def plan(self, campaign_id: str, tasks: Iterable[PlannedTask]) -> PlanDelta:
+        """Add tasks to a campaign's plan and queue those that are ready.
+
+        Paused and finished campaigns must not generate tasks (§3.3), so
+        planning for them raises :class:`PlannerError`.
+        """
+        self._add(campaign_id, list(tasks))
+        return await self._changed()
+
+    async def complete(self, task_id: str) -> PlanDelta:
+        """A Worker finished ``task_id``; queue the dependents it unblocks.
+
+        Completing a task that was cancelled while it ran changes nothing.
+        """
+        self._queued.pop(task_id, None)
+        if task_id not in self.graph:
+            return PlanDelta()
+        self._dirty.update(self.graph.complete(task_id))
+        self.stats.completed += 1
+        return await self._changed()
+
+    async def fail(self, task_id: str, *, retryable: bool = True) -> PlanDelta:
+        """A Worker failed ``task_id`` (§5.6).
+
+        A retryable failure re-queues it until ``max_retries`` is used up.
+        After that, or for a terminal failure, the task and its dependents
+        are cancelled.
+        """
+        self._queued.pop(task_id, None)
+        if task_id not in self.graph:
+            return PlanDelta()
+        task = self.graph.task(task_id)
+        attempts = self.graph.record_attempt(task_id)
+        if retryable and attempts <= task.max_retries:
+            self.stats.retried += 1
+            self._dirty.add(task_id)
+        else:
+            self._cancel(self.graph.remove([task_id]))
+        return await self._changed()
+
+    async def prune(
+        self,
+        task_ids: Iterable[str],
+        *,
+        replacements: Iterable[PlannedTask] = (),
+    ) -> PlanDelta:
+        """Context drift: cancel ``task_ids`` and their dependents, then add
+        ``replacements``; both reach the queue in one flush."""
+        self._cancel(self.graph.remove(task_ids))
+        by_campaign: dict[str, list[PlannedTask]] = {}
+        for task in replacements:
+            by_campaign.setdefault(task.campaign_id, []).append(task)
+        for campaign_id, tasks in by_campaign.items():
+            self._add(campaign_id, tasks)
+        return await self._changed()
+
+    async def set_campaign_status(self, campaign_id: str, status: str) -> PlanDelta:
+        """Pause, resume, complete or cancel a campaign (§3.3, §4.4).
+
+        Pausing takes the campaign's pending tasks off the queue and keeps
+        them planned; resuming queues them again. Completing or
+        cancelling drops them for good.
+        """
+        if status not in CAMPAIGN_STATUSES:
+            raise PlannerError(f"Unknown campaign status {status!r}")
+        previous = self.campaign_status(campaign_id)
+        self._campaigns[campaign_id] = status
+        if status in ("completed", "cancelled"):
+            self._cancel(self.graph.forget_campaign(campaign_id))
+        elif status != previous:
+            self._dirty.update(self.graph.by_campaign(campaign_id))
+        return await self._changed()
+
+    async def platform_down(self, platform: str) -> PlanDelta:
+        """Route the platform's tasks to their next platform, or hold them."""
+        self._platforms_down.add(platform)
+        self._dirty.update(self.graph.by_platform(platform))
+        return await self._changed()
+
+    async def platform_up(self, platform: str) -> PlanDelta:
+        self._platforms_down.discard(platform)
+        self._dirty.update(self.graph.by_platform(platform))
+        return await self._changed()
+
+    async def budget_exhausted(self, scope: str) -> PlanDelta:
+        """Hold every cost-incurring task charged to ``scope`` and notify
+        the Operator (§4.4)."""
+        self._scopes_exhausted.add(scope)
+        affected = self.graph.by_scope(scope)
+        self._dirty.update(affected)
+        self._notify_budget(scope, affected)
+        return await self._changed()
+
+    async def budget_restored(self, scope: str) -> PlanDelta:
+        """Re-check the cost-incurring tasks charged to ``scope``."""
+        self._scopes_exhausted.discard(scope)
+        self._dirty.update(self.graph.by_scope(scope))
+        return await self._changed()
+
+    # -- batching ------------------------------------------------------------
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Defer flushing until the outermost ``batch`` exits, so several
+        triggers reach the queue as one change."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            await self.flush()
+
+    async def _changed(self) -> PlanDelta:
+        if self._batch_depth:
+            return PlanDelta()
+        return await self.flush()
+
+    async def flush(self) -> PlanDelta:
+        """Re-evaluate dirty tasks and push the differences to the queue."""
+        async with self._flush_lock:
+            dirty, self._dirty = self._dirty, set()
+            remove: list[str] = []
+            enqueue: list[QueuedTask] = []
+            held: list[str] = []
+            for task_id in dirty:
+                wanted = None
+                if task_id in self.graph:
+                    wanted = self._wanted(task_id)
+                    if wanted is None:
+                        held.append(task_id)
+                queued = self._queued.get(task_id)
+                if queued == wanted:
+                    continue
+                if queued is not None:
+                    remove.append(task_id)
+                if wanted is not None:
+                    enqueue.append(wanted)
+            try:
+                if remove:
+                    await self.queue.remove_many(remove)
+                if enqueue:
+                    await self.queue.enqueue_many(enqueue)
+            except BaseException:
+                self._dirty |= dirty
+                raise
+            for task_id in remove:
+                del self._queued[task_id]
+            for task in enqueue:
+                self._queued[task.task_id] = task
+            self._record(remove, enqueue)
+            return PlanDelta(
+                tuple(task.task_id for task in enqueue), tuple(remove), tuple(held)
+            )
+
+    # -- internals -----------------------------------------------------------
+
+    def _wanted(self, task_id: str) -> QueuedTask | None:
+        """The queue entry ``task_id`` should have now, or None to hold it."""
+        task = self.graph.task(task_id)
+        if self.graph.waiting(task_id):
+            return None
+        if self._campaigns.get(task.campaign_id) != "active":
+            return None
+        platform = self.platform_for(task)
+        if task.platforms and platform is None:
+            return None
+        constrained = False
+        if task.cost_incurring:
+            if self._scopes_exhausted.intersection(task.scopes):
+                return None
+            if self.budget is not None:
+                available = self.budget.available_usd(task.scopes)
+                if available < task.estimated_cost_usd:
+                    return None
+                constrained = available < self.low_budget_usd
+        payload = {
+            **task.payload,
+            "campaign_id": task.campaign_id,
+            "agent_id": task.agent_id,
+            "platform": platform,
+            "estimated_cost_usd": task.estimated_cost_usd,
+            "attempt": self.graph.attempts(task_id),
+        }
+        return QueuedTask(
+            task_id=task.task_id,
+            task_type=task.task_type,
+            priority=task.priority,
+            deadline=task.deadline,
+            campaign_id=task.campaign_id,
+            campaign_phase=task.campaign_phase,
+            budget_constrained=constrained,
+            payload=payload,
+        )
+
+    def _budget_allows(self, task: PlannedTask) -> bool:
+        if self._scopes_exhausted.intersection(task.scopes):
+            return False
+        if self.budget is None:
+            return True
+        return self.budget.available_usd(task.scopes) >= task.estimated_cost_usd
+
+    def _add(self, campaign_id: str, tasks: list[PlannedTask]) -> None:
+        status = self.campaign_status(campaign_id)
+        if status != "active":
+            raise PlannerError(f"Campaign {campaign_id} is {status}; not planning")
+        for task in tasks:
+            if task.campaign_id != campaign_id:
+                raise PlannerError(f"Task {task.task_id} belongs to another campaign")
+        added = self.graph.add(tasks)
+        self.stats.planned += len(added)
+        self._dirty.update(added)
+        if self.audit is not None:
+            for task in tasks:
+                self.audit.emit(
+                    "task.created",
+                    correlation_id=task.payload.get("correlation_id") or campaign_id,
+                    actor="planner",
+                    payload={
+                        "task_id": task.task_id,
+                        "campaign_id": campaign_id,
+                        "task_type": task.task_type,
+                        "depends_on": list(task.depends_on),
+                    },
+                )
+
+    def _cancel(self, task_ids: list[str]) -> None:
+        self.stats.cancelled += len(task_ids)
+        self._dirty.update(task_ids)
+
+    def _notify_budget(self, scope: str, task_ids: Iterable[str]) -> None:
+        held = sorted(task_ids)
+        logger.warning("budget exhausted: scope=%s held=%d", scope, len(held))
+        if self.audit is not None:
+            self.audit.emit(
+                "budget.threshold_reached",
+                correlation_id=scope,
+                actor="planner",
+                payload={"scope": scope, "held_tasks": held},
+                severity="warning",
+            )
+
+    def _record(self, remove: list[str], enqueue: list[QueuedTask]) -> None:
+        self.stats.flushes += 1
+        self.stats.enqueued += len(enqueue)
+        self.stats.removed += len(remove)
+        if enqueue:
+            QUEUE_CHANGES.inc(len(enqueue), change="enqueued")
+        if remove:
+            QUEUE_CHANGES.inc(len(remove), change="removed")
@@ -0,0 +1,34 @@
+"""
+Task Queue: Planner → Worker dispatch (specs/technical.md §2.1, §4.3).
+
+Two interchangeable backends implement :class:`TaskQueue`:
+
+- :class:`InMemoryTaskQueue` — heap-based, in-process (tests, single node)
+- :class:`RedisTaskQueue` — Redis sorted sets with Lua-scripted atomic claims
+"""
+
+from chimera.queue.base import (
+    DEFAULT_VISIBILITY_TIMEOUT,
+    PHASE_RANK,
+    PRIORITY_RANK,
+    Backlog,
+    Lease,
+    QueuedTask,
+    QueueError,
+    TaskQueue,
+)
+from chimera.queue.memory import InMemoryTaskQueue
+from chimera.queue.redis import RedisTaskQueue
+
+__all__ = [
+    "DEFAULT_VISIBILITY_TIMEOUT",
+    "PHASE_RANK",
+    "PRIORITY_RANK",
+    "Backlog",
+    "InMemoryTaskQueue",
+    "Lease",
+    "QueueError",
+    "QueuedTask",
+    "RedisTaskQueue",
+    "TaskQueue",
+]
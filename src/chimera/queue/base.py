@@ -0,0 +1,241 @@
+"""
+Task Queue contract shared by all backends.
+
+Ordering follows specs/technical.md §4.3, compared lexicographically:
+
+1. Explicit priority — ``high`` > ``medium`` > ``low``
+2. Deadline proximity — earlier deadlines first, no deadline last
+3. Campaign phase — ``launch`` before ``maintenance``
+4. Budget availability — budget-constrained cost-incurring tasks last
+
+Ties are broken FIFO by enqueue sequence. Workers claim tasks under a
+visibility-timeout lease; a lease that is neither acked nor released before
+it expires returns its task to the pending set for another Worker.
+
+:meth:`TaskQueue.backlog` reports pending depth and the age of the oldest
+pending task per priority, which the autoscaler (``chimera.scaling``)
+samples. A task's age counts from its first enqueue and survives leases
+that are released or expire.
+
+A claim can skip task types whose Worker-side limit is full
+(``exclude_types``), so those tasks stay pending instead of idling under a
+lease that may expire before they run.
+"""
+
+from __future__ import annotations
+
+import abc
+import time
+from collections.abc import Callable, Collection, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.errors import ChimeraError
+
+PRIORITY_RANK: dict[str, int] = {"high": 0, "medium": 1, "low": 2}
+PHASE_RANK: dict[str, int] = {"launch": 0, "active": 1, "maintenance": 2}
+
+# Sentinel deadline for tasks without one; sorts after every real deadline.
+NO_DEADLINE_MS = 10**15 - 1
+
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+# A claim that skips excluded task types passes over at most this many
+# pending tasks, so a deep backlog of one type cannot stall it.
+CLAIM_SCAN_LIMIT = 256
+
+
+class QueueError(ChimeraError):
+    """Raised when a Task Queue operation cannot be completed."""
+
+
+@dataclass(frozen=True, slots=True)
+class Backlog:
+    """Pending tasks of one priority. ``oldest_age`` is the seconds since
+    the oldest of them was first enqueued."""
+
+    depth: int = 0
+    oldest_age: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedTask:
+    """A Task (specs/technical.md §3.4) as seen by the Task Queue."""
+
+    task_id: str
+    task_type: str
+    priority: str = "medium"
+    deadline: float | None = None
+    campaign_id: str | None = None
+    campaign_phase: str = "active"
+    budget_constrained: bool = False
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.task_id or "|" in self.task_id:
+            # The Redis backend splits pending members on "|".
+            raise QueueError(f"Invalid task_id: {self.task_id!r}")
+        if self.priority not in PRIORITY_RANK:
+            raise QueueError(f"Unknown task priority: {self.priority!r}")
+        if self.campaign_phase not in PHASE_RANK:
+            raise QueueError(f"Unknown campaign phase: {self.campaign_phase!r}")
+
+    def rank(self) -> tuple[int, int, int, int]:
+        """Return the §4.3 ordering key (lower sorts first)."""
+        deadline_ms = (
+            NO_DEADLINE_MS if self.deadline is None else int(self.deadline * 1000)
+        )
+        return (
+            PRIORITY_RANK[self.priority],
+            deadline_ms,
+            PHASE_RANK[self.campaign_phase],
+            int(self.budget_constrained),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "task_type": self.task_type,
+            "priority": self.priority,
+            "deadline": self.deadline,
+            "campaign_id": self.campaign_id,
+            "campaign_phase": self.campaign_phase,
+            "budget_constrained": self.budget_constrained,
+            "payload": self.payload,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QueuedTask:
+        return cls(**data)
+
+
+@dataclass(frozen=True, slots=True)
+class Lease:
+    """Exclusive, time-bounded claim on a task by one Worker."""
+
+    task: QueuedTask
+    worker_id: str
+    token: str
+    expires_at: float
+
+    @property
+    def task_id(self) -> str:
+        return self.task.task_id
+
+
+class TaskQueue(abc.ABC):
+    """Priority Task Queue with atomic claim and visibility-timeout leases.
+
+    All operations are safe under concurrent access from many Workers
+    (specs/functional.md §5.4). Enqueue and claim are O(log n) per task.
+    """
+
+    def __init__(
+        self,
+        *,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.visibility_timeout = visibility_timeout
+        self._clock = clock
+
+    async def enqueue(self, task: QueuedTask) -> bool:
+        """Add one task. Returns False if ``task_id`` is already queued."""
+        return await self.enqueue_many([task]) == 1
+
+    @abc.abstractmethod
+    async def enqueue_many(self, tasks: Iterable[QueuedTask]) -> int:
+        """Add tasks in one round trip. Returns the number newly queued."""
+
+    async def claim(
+        self,
+        worker_id: str,
+        *,
+        visibility_timeout: float | None = None,
+        max_priority: str | None = None,
+        exclude_types: Collection[str] = (),
+    ) -> Lease | None:
+        """Claim the highest-ranked pending task, or None if empty."""
+        leases = await self.claim_batch(
+            worker_id,
+            1,
+            visibility_timeout=visibility_timeout,
+            max_priority=max_priority,
+            exclude_types=exclude_types,
+        )
+        return leases[0] if leases else None
+
+    @abc.abstractmethod
+    async def claim_batch(
+        self,
+        worker_id: str,
+        count: int,
+        *,
+        visibility_timeout: float | None = None,
+        max_priority: str | None = None,
+        exclude_types: Collection[str] = (),
+    ) -> list[Lease]:
+        """Atomically claim up to ``count`` tasks in rank order.
+
+        With ``max_priority``, only tasks of that priority or a higher one
+        are claimed; lower-priority tasks stay pending. Tasks whose
+        ``task_type`` is in ``exclude_types`` also stay pending; at most
+        :data:`CLAIM_SCAN_LIMIT` of them are passed over per claim.
+        """
+
+    @abc.abstractmethod
+    async def ack(self, lease: Lease) -> bool:
+        """Mark a leased task done. Returns False if the lease was lost."""
+
+    async def ack_many(self, leases: Sequence[Lease]) -> int:
+        acked = 0
+        for lease in leases:
+            acked += await self.ack(lease)
+        return acked
+
+    @abc.abstractmethod
+    async def release(self, lease: Lease) -> bool:
+        """Return a leased task to the pending set immediately."""
+
+    @abc.abstractmethod
+    async def extend(self, lease: Lease, seconds: float) -> Lease | None:
+        """Push a lease's expiry ``seconds`` from now; None if lost."""
+
+    @abc.abstractmethod
+    async def remove_many(self, task_ids: Iterable[str]) -> int:
+        """Drop pending tasks by id. Leased tasks are left alone."""
+
+    @abc.abstractmethod
+    async def requeue_expired(self) -> int:
+        """Return tasks whose lease expired to the pending set."""
+
+    @abc.abstractmethod
+    async def depth(self) -> int:
+        """Number of pending (unclaimed) tasks."""
+
+    @abc.abstractmethod
+    async def in_flight(self) -> int:
+        """Number of tasks currently under lease."""
+
+    @abc.abstractmethod
+    async def backlog(self) -> dict[str, Backlog]:
+        """Pending depth and oldest pending age for every priority."""
+
+    def _lease_timeout(self, visibility_timeout: float | None) -> float:
+        timeout = (
+            self.visibility_timeout
+            if visibility_timeout is None
+            else visibility_timeout
+        )
+        if timeout <= 0:
+            raise QueueError("visibility_timeout must be positive")
+        return timeout
+
+
+def priority_limit(max_priority: str | None) -> int:
+    """Rank of the lowest priority a claim may take (see ``max_priority``)."""
+    if max_priority is None:
+        return len(PRIORITY_RANK) - 1
+    try:
+        return PRIORITY_RANK[max_priority]
+    except KeyError:
+        raise QueueError(f"Unknown task priority: {max_priority!r}") from None
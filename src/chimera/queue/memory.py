@@ -0,0 +1,210 @@
+"""
+In-process Task Queue backend built on binary heaps.
+
+Intended for tests and single-process deployments. Every operation runs
+without awaiting, so each call is atomic with respect to the event loop and
+concurrent Workers in the same process never observe partial state.
+Removals and lease completions are lazy: stale heap entries are skipped when
+they surface instead of being searched for. The same holds for the
+per-priority arrival lists that :meth:`InMemoryTaskQueue.backlog` reads
+task ages from.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Collection, Iterable
+
+from chimera.queue.base import (
+    CLAIM_SCAN_LIMIT,
+    DEFAULT_VISIBILITY_TIMEOUT,
+    PRIORITY_RANK,
+    Backlog,
+    Lease,
+    QueuedTask,
+    TaskQueue,
+    priority_limit,
+)
+
+_HeapEntry = tuple[tuple[int, int, int, int], int, str]
+
+
+class InMemoryTaskQueue(TaskQueue):
+    """Heap-backed :class:`TaskQueue` with O(log n) enqueue and claim."""
+
+    def __init__(
+        self,
+        *,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(visibility_timeout=visibility_timeout, clock=clock)
+        self._seq = itertools.count()
+        self._heap: list[_HeapEntry] = []
+        # task_id -> (task, seq); seq identifies the live heap entry.
+        self._pending: dict[str, tuple[QueuedTask, int]] = {}
+        self._leases: dict[str, tuple[Lease, int]] = {}
+        self._expiry: list[tuple[float, str, str]] = []
+        # task_id -> first enqueue time, until the task is acked or removed.
+        self._enqueued: dict[str, float] = {}
+        # Per priority: (enqueue time, task_id) in arrival order.
+        self._arrivals: dict[str, deque[tuple[float, str]]] = {
+            priority: deque() for priority in PRIORITY_RANK
+        }
+        self._depths = dict.fromkeys(PRIORITY_RANK, 0)
+
+    async def enqueue_many(self, tasks: Iterable[QueuedTask]) -> int:
+        added = 0
+        now = self._clock()
+        for task in tasks:
+            if task.task_id in self._pending or task.task_id in self._leases:
+                continue
+            self._push(task, next(self._seq))
+            self._enqueued[task.task_id] = now
+            self._arrivals[task.priority].append((now, task.task_id))
+            self._trim(task.priority)
+            added += 1
+        return added
+
+    async def claim_batch(
+        self,
+        worker_id: str,
+        count: int,
+        *,
+        visibility_timeout: float | None = None,
+        max_priority: str | None = None,
+        exclude_types: Collection[str] = (),
+    ) -> list[Lease]:
+        timeout = self._lease_timeout(visibility_timeout)
+        limit = priority_limit(max_priority)
+        self._requeue_expired()
+        now = self._clock()
+        leases: list[Lease] = []
+        skipped: list[_HeapEntry] = []
+        # Priority leads the rank, so the first entry above the limit ends
+        # the claim.
+        while self._heap and len(leases) < count and self._heap[0][0][0] <= limit:
+            heap_entry = heapq.heappop(self._heap)
+            _, seq, task_id = heap_entry
+            entry = self._pending.get(task_id)
+            if entry is None or entry[1] != seq:
+                continue
+            if entry[0].task_type in exclude_types:
+                skipped.append(heap_entry)
+                if len(skipped) >= CLAIM_SCAN_LIMIT:
+                    break
+                continue
+            del self._pending[task_id]
+            self._depths[entry[0].priority] -= 1
+            lease = Lease(
+                task=entry[0],
+                worker_id=worker_id,
+                token=uuid.uuid4().hex,
+                expires_at=now + timeout,
+            )
+            self._leases[task_id] = (lease, seq)
+            heapq.heappush(self._expiry, (lease.expires_at, task_id, lease.token))
+            leases.append(lease)
+        for heap_entry in skipped:
+            heapq.heappush(self._heap, heap_entry)
+        return leases
+
+    async def ack(self, lease: Lease) -> bool:
+        if not self._owns(lease):
+            return False
+        del self._leases[lease.task_id]
+        del self._enqueued[lease.task_id]
+        return True
+
+    async def release(self, lease: Lease) -> bool:
+        if not self._owns(lease):
+            return False
+        _, seq = self._leases.pop(lease.task_id)
+        self._push(lease.task, seq)
+        return True
+
+    async def extend(self, lease: Lease, seconds: float) -> Lease | None:
+        if not self._owns(lease):
+            return None
+        _, seq = self._leases[lease.task_id]
+        renewed = Lease(
+            task=lease.task,
+            worker_id=lease.worker_id,
+            token=lease.token,
+            expires_at=self._clock() + seconds,
+        )
+        self._leases[lease.task_id] = (renewed, seq)
+        heapq.heappush(self._expiry, (renewed.expires_at, lease.task_id, lease.token))
+        return renewed
+
+    async def remove_many(self, task_ids: Iterable[str]) -> int:
+        removed = 0
+        for task_id in task_ids:
+            entry = self._pending.pop(task_id, None)
+            if entry is not None:
+                self._depths[entry[0].priority] -= 1
+                del self._enqueued[task_id]
+                removed += 1
+        return removed
+
+    async def requeue_expired(self) -> int:
+        return self._requeue_expired()
+
+    async def depth(self) -> int:
+        return len(self._pending)
+
+    async def in_flight(self) -> int:
+        return len(self._leases)
+
+    async def backlog(self) -> dict[str, Backlog]:
+        now = self._clock()
+        return {
+            priority: Backlog(depth, self._oldest_age(priority, now) if depth else 0.0)
+            for priority, depth in self._depths.items()
+        }
+
+    def _oldest_age(self, priority: str, now: float) -> float:
+        """Age of the oldest pending task of ``priority``, skipping leased ones."""
+        self._trim(priority)
+        for enqueued_at, task_id in self._arrivals[priority]:
+            if task_id in self._pending:
+                return now - enqueued_at
+        return 0.0
+
+    def _trim(self, priority: str) -> None:
+        """Drop arrivals of acked or removed tasks from the front."""
+        arrivals = self._arrivals[priority]
+        while arrivals and self._enqueued.get(arrivals[0][1]) != arrivals[0][0]:
+            arrivals.popleft()
+
+    def _push(self, task: QueuedTask, seq: int) -> None:
+        self._pending[task.task_id] = (task, seq)
+        self._depths[task.priority] += 1
+        heapq.heappush(self._heap, (task.rank(), seq, task.task_id))
+
+    def _owns(self, lease: Lease) -> bool:
+        held = self._leases.get(lease.task_id)
+        return (
+            held is not None
+            and held[0].token == lease.token
+            and held[0].expires_at > self._clock()
+        )
+
+    def _requeue_expired(self) -> int:
+        now = self._clock()
+        requeued = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, task_id, token = heapq.heappop(self._expiry)
+            held = self._leases.get(task_id)
+            if held is None or held[0].token != token:
+                continue
+            if held[0].expires_at != expires_at:
+                continue  # extended; a later expiry entry is live
+            del self._leases[task_id]
+            self._push(held[0].task, held[1])
+            requeued += 1
+        return requeued
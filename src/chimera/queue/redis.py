@@ -0,0 +1,373 @@
+"""
+Redis sorted-set Task Queue backend.
+
+Layout under ``{prefix}``:
+
+- ``pending``  ZSET, every score 0; members are ``<rank>|<seq>|<task_id>`` so
+  Redis' lexicographic tie-break yields the §4.3 ordering and ZPOPMIN claims
+  the best task in O(log n).
+- ``leases``   ZSET of task_id scored by lease expiry (epoch seconds).
+- ``tokens``   HASH task_id -> lease token of the current holder.
+- ``members``  HASH task_id -> pending member (restores rank on requeue).
+- ``tasks``    HASH task_id -> JSON-encoded task; tasks were validated on
+  enqueue, so claims decode them on the trusted path. A claim with
+  ``exclude_types`` reads ``task_type`` from here for the tasks it scans.
+- ``seq``      STRING counter for FIFO tie-breaks across producers.
+- ``age:<priority>``  ZSET per priority of unfinished task_ids scored by
+  first enqueue time; :meth:`RedisTaskQueue.backlog` reads task ages here.
+
+Task ids must not contain ``|``; :class:`QueuedTask` rejects them.
+
+Each multi-key operation is a single Lua script, so claim, ack, release and
+reaping are atomic even with many Workers across processes.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Callable, Collection, Iterable, Sequence
+from typing import Any
+
+from chimera.contracts import decode, encode
+from chimera.queue.base import (
+    CLAIM_SCAN_LIMIT,
+    DEFAULT_VISIBILITY_TIMEOUT,
+    PRIORITY_RANK,
+    Backlog,
+    Lease,
+    QueuedTask,
+    TaskQueue,
+    priority_limit,
+)
+
+# Expired leases are reaped in bounded slices so one claim never stalls Redis.
+REAP_LIMIT = 256
+# Backlog age scans skip at most this many leased tasks per priority.
+AGE_SCAN_LIMIT = 256
+
+# Keys 7.. are the per-priority age sets; a member's first character is
+# its priority rank.
+_AGE_KEY = """
+local function age_key(member)
+    return KEYS[7 + tonumber(string.sub(member, 1, 1))]
+end
+"""
+
+_ENQUEUE = """
+local added = 0
+local count = (#ARGV - 1) / 3
+local base = redis.call('INCRBY', KEYS[5], count) - count
+for i = 2, #ARGV, 3 do
+    local task_id = ARGV[i]
+    if redis.call('HSETNX', KEYS[4], task_id, ARGV[i + 2]) == 1 then
+        local member = ARGV[i + 1] .. '|' .. string.format('%015d', base + (i - 2) / 3)
+            .. '|' .. task_id
+        redis.call('HSET', KEYS[3], task_id, member)
+        redis.call('ZADD', KEYS[1], 0, member)
+        redis.call('ZADD', age_key(member), ARGV[1], task_id)
+        added = added + 1
+    end
+end
+return added
+"""
+
+_REAP = """
+local function reap(now, limit)
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, limit)
+    for _, task_id in ipairs(expired) do
+        redis.call('ZREM', KEYS[2], task_id)
+        redis.call('HDEL', KEYS[6], task_id)
+        local member = redis.call('HGET', KEYS[3], task_id)
+        if member then
+            redis.call('ZADD', KEYS[1], 0, member)
+        end
+    end
+    return #expired
+end
+"""
+
+_CLAIM = """
+local now = tonumber(ARGV[1])
+local count = tonumber(ARGV[2])
+reap(now, tonumber(ARGV[5]))
+local excluded = {}
+for i = 8, #ARGV do
+    excluded[ARGV[i]] = true
+end
+local members = {}
+local payloads = {}
+if ARGV[6] == '' and #ARGV < 8 then
+    local popped = redis.call('ZPOPMIN', KEYS[1], count)
+    for i = 1, #popped, 2 do
+        table.insert(members, popped[i])
+    end
+else
+    -- Only members ranked below ARGV[6], i.e. of high enough priority.
+    local upper = '+'
+    if ARGV[6] ~= '' then
+        upper = '(' .. ARGV[6] .. '|'
+    end
+    local scan = 0
+    if #ARGV >= 8 then
+        scan = tonumber(ARGV[7])
+    end
+    local candidates = redis.call('ZRANGEBYLEX', KEYS[1], '-', upper,
+        'LIMIT', 0, count + scan)
+    local skipped = 0
+    for _, member in ipairs(candidates) do
+        if #members == count or skipped == scan and scan > 0 then
+            break
+        end
+        local task = redis.call('HGET', KEYS[4], string.match(member, '([^|]+)$'))
+        if scan > 0 and excluded[cjson.decode(task).task_type] then
+            skipped = skipped + 1
+        else
+            table.insert(members, member)
+            table.insert(payloads, task)
+        end
+    end
+    if #members > 0 then
+        redis.call('ZREM', KEYS[1], unpack(members))
+    end
+end
+local out = {}
+for i, member in ipairs(members) do
+    local task_id = string.match(member, '([^|]+)$')
+    local token = ARGV[4] .. ':' .. i
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), task_id)
+    redis.call('HSET', KEYS[6], task_id, token)
+    table.insert(out, task_id)
+    table.insert(out, token)
+    table.insert(out, payloads[i] or redis.call('HGET', KEYS[4], task_id))
+end
+return out
+"""
+
+_REQUEUE_EXPIRED = """
+return reap(tonumber(ARGV[1]), tonumber(ARGV[2]))
+"""
+
+_LEASE_HELD = """
+local function held(task_id, token, now)
+    if redis.call('HGET', KEYS[6], task_id) ~= token then
+        return false
+    end
+    local expiry = redis.call('ZSCORE', KEYS[2], task_id)
+    return expiry and tonumber(expiry) > now
+end
+"""
+
+_ACK = """
+local now = tonumber(ARGV[1])
+local acked = 0
+for i = 2, #ARGV, 2 do
+    local task_id = ARGV[i]
+    if held(task_id, ARGV[i + 1], now) then
+        redis.call('ZREM', KEYS[2], task_id)
+        redis.call('HDEL', KEYS[6], task_id)
+        redis.call('ZREM', age_key(redis.call('HGET', KEYS[3], task_id)), task_id)
+        redis.call('HDEL', KEYS[3], task_id)
+        redis.call('HDEL', KEYS[4], task_id)
+        acked = acked + 1
+    end
+end
+return acked
+"""
+
+_RELEASE = """
+if not held(ARGV[1], ARGV[2], tonumber(ARGV[3])) then
+    return 0
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[6], ARGV[1])
+redis.call('ZADD', KEYS[1], 0, redis.call('HGET', KEYS[3], ARGV[1]))
+return 1
+"""
+
+_EXTEND = """
+if not held(ARGV[1], ARGV[2], tonumber(ARGV[3])) then
+    return 0
+end
+redis.call('ZADD', KEYS[2], 'XX', ARGV[4], ARGV[1])
+return 1
+"""
+
+_REMOVE = """
+local removed = 0
+for _, task_id in ipairs(ARGV) do
+    local member = redis.call('HGET', KEYS[3], task_id)
+    if member and redis.call('ZREM', KEYS[1], member) == 1 then
+        redis.call('ZREM', age_key(member), task_id)
+        redis.call('HDEL', KEYS[3], task_id)
+        redis.call('HDEL', KEYS[4], task_id)
+        removed = removed + 1
+    end
+end
+return removed
+"""
+
+_BACKLOG = """
+local out = {}
+for p = 0, #KEYS - 7 do
+    table.insert(out, redis.call('ZLEXCOUNT', KEYS[1], '[' .. p .. '|', '(' .. (p + 1) .. '|'))
+    -- The oldest unfinished task that holds no lease is the oldest pending.
+    local oldest = ''
+    local entries = redis.call('ZRANGE', KEYS[7 + p], 0, tonumber(ARGV[1]) - 1, 'WITHSCORES')
+    for i = 1, #entries, 2 do
+        if redis.call('HEXISTS', KEYS[6], entries[i]) == 0 then
+            oldest = entries[i + 1]
+            break
+        end
+    end
+    table.insert(out, oldest)
+end
+return out
+"""
+
+
+def encode_rank(task: QueuedTask) -> str:
+    """Encode :meth:`QueuedTask.rank` as a lexicographically ordered string."""
+    priority, deadline_ms, phase, budget = task.rank()
+    return f"{priority}|{deadline_ms:015d}|{phase}|{budget}"
+
+
+class RedisTaskQueue(TaskQueue):
+    """:class:`TaskQueue` backed by Redis sorted sets and Lua scripts.
+
+    ``client`` is a ``redis.asyncio.Redis`` (or API-compatible) instance.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "chimera:tasks",
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(visibility_timeout=visibility_timeout, clock=clock)
+        self._client = client
+        self._keys = [
+            f"{prefix}:pending",
+            f"{prefix}:leases",
+            f"{prefix}:members",
+            f"{prefix}:tasks",
+            f"{prefix}:seq",
+            f"{prefix}:tokens",
+        ]
+        self._priorities = sorted(PRIORITY_RANK, key=PRIORITY_RANK.__getitem__)
+        self._keys += [f"{prefix}:age:{priority}" for priority in self._priorities]
+        self._enqueue = client.register_script(_AGE_KEY + _ENQUEUE)
+        self._claim = client.register_script(_REAP + _CLAIM)
+        self._requeue = client.register_script(_REAP + _REQUEUE_EXPIRED)
+        self._ack = client.register_script(_AGE_KEY + _LEASE_HELD + _ACK)
+        self._release = client.register_script(_LEASE_HELD + _RELEASE)
+        self._extend = client.register_script(_LEASE_HELD + _EXTEND)
+        self._remove = client.register_script(_AGE_KEY + _REMOVE)
+        self._backlog = client.register_script(_BACKLOG)
+
+    async def enqueue_many(self, tasks: Iterable[QueuedTask]) -> int:
+        args: list[float | str | bytes] = [self._clock()]
+        for task in tasks:
+            args += [task.task_id, encode_rank(task), encode(task)]
+        if len(args) == 1:
+            return 0
+        return int(await self._enqueue(keys=self._keys, args=args))
+
+    async def claim_batch(
+        self,
+        worker_id: str,
+        count: int,
+        *,
+        visibility_timeout: float | None = None,
+        max_priority: str | None = None,
+        exclude_types: Collection[str] = (),
+    ) -> list[Lease]:
+        timeout = self._lease_timeout(visibility_timeout)
+        below = "" if max_priority is None else str(priority_limit(max_priority) + 1)
+        if count <= 0:
+            return []
+        now = self._clock()
+        token_prefix = f"{worker_id}:{uuid.uuid4().hex}"
+        args: list[Any] = [now, count, timeout, token_prefix, REAP_LIMIT, below]
+        if exclude_types:
+            args += [CLAIM_SCAN_LIMIT, *exclude_types]
+        raw = await self._claim(keys=self._keys, args=args)
+        leases = []
+        for i in range(0, len(raw), 3):
+            task = decode(QueuedTask, raw[i + 2], trusted=True)
+            leases.append(
+                Lease(
+                    task=task,
+                    worker_id=worker_id,
+                    token=_text(raw[i + 1]),
+                    expires_at=now + timeout,
+                )
+            )
+        return leases
+
+    async def ack(self, lease: Lease) -> bool:
+        return await self.ack_many([lease]) == 1
+
+    async def ack_many(self, leases: Sequence[Lease]) -> int:
+        if not leases:
+            return 0
+        args: list[Any] = [self._clock()]
+        for lease in leases:
+            args += [lease.task_id, lease.token]
+        return int(await self._ack(keys=self._keys, args=args))
+
+    async def release(self, lease: Lease) -> bool:
+        return bool(
+            await self._release(
+                keys=self._keys, args=[lease.task_id, lease.token, self._clock()]
+            )
+        )
+
+    async def extend(self, lease: Lease, seconds: float) -> Lease | None:
+        now = self._clock()
+        expires_at = now + seconds
+        ok = await self._extend(
+            keys=self._keys, args=[lease.task_id, lease.token, now, expires_at]
+        )
+        if not ok:
+            return None
+        return Lease(
+            task=lease.task,
+            worker_id=lease.worker_id,
+            token=lease.token,
+            expires_at=expires_at,
+        )
+
+    async def remove_many(self, task_ids: Iterable[str]) -> int:
+        ids = list(task_ids)
+        if not ids:
+            return 0
+        return int(await self._remove(keys=self._keys, args=ids))
+
+    async def requeue_expired(self) -> int:
+        return int(
+            await self._requeue(keys=self._keys, args=[self._clock(), REAP_LIMIT])
+        )
+
+    async def depth(self) -> int:
+        return int(await self._client.zcard(self._keys[0]))
+
+    async def in_flight(self) -> int:
+        return int(await self._client.zcard(self._keys[1]))
+
+    async def backlog(self) -> dict[str, Backlog]:
+        raw = await self._backlog(keys=self._keys, args=[AGE_SCAN_LIMIT])
+        now = self._clock()
+        return {
+            priority: Backlog(
+                int(raw[2 * i]),
+                now - float(raw[2 * i + 1]) if raw[2 * i + 1] else 0.0,
+            )
+            for i, priority in enumerate(self._priorities)
+        }
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,43 @@
+"""
+Autoscaling: Worker capacity from queue depth, task age and latency
+(specs/functional.md §5.3–5.4).
+
+:class:`Autoscaler` decides, :class:`ScalingController` applies its
+decisions to a local :class:`~chimera.worker.WorkerPool` and publishes them
+for external orchestrators, and :func:`simulate` replays a recorded load
+trace through the same decisions offline.
+"""
+
+from chimera.scaling.autoscaler import (
+    DEFAULT_SLO,
+    Autoscaler,
+    LoadSample,
+    ScaleDecision,
+    ScalingError,
+    ScalingPolicy,
+)
+from chimera.scaling.controller import DEFAULT_INTERVAL, RecommendFn, ScalingController
+from chimera.scaling.simulate import (
+    SimulationReport,
+    TraceEvent,
+    read_trace,
+    simulate,
+    write_trace,
+)
+
+__all__ = [
+    "DEFAULT_INTERVAL",
+    "DEFAULT_SLO",
+    "Autoscaler",
+    "LoadSample",
+    "RecommendFn",
+    "ScaleDecision",
+    "ScalingController",
+    "ScalingError",
+    "ScalingPolicy",
+    "SimulationReport",
+    "TraceEvent",
+    "read_trace",
+    "simulate",
+    "write_trace",
+]
@@ -0,0 +1,223 @@
+"""
+Worker capacity decisions from queue and latency signals.
+
+The architecture strategy scales Workers on queue depth (§"Scaling
+Strategy"), and specs/functional.md §5.3 sets latency tiers: real-time
+(seconds) for ``high`` priority interactions such as DM replies, minutes
+for content generation, hours for batch work. :class:`Autoscaler` turns
+one :class:`LoadSample` into a :class:`ScaleDecision`:
+
+- **Demand.** Each priority needs the slots its tasks occupy now, plus
+  enough to drain its pending backlog within its latency objective:
+  ``depth × latency / slo`` (Little's law). ``headroom`` is added on top.
+- **Pressure.** A pending task older than its priority's objective, or a
+  backlog beyond ``depth_trigger`` that is still growing, raises capacity
+  by at least ``step_up`` even when the demand estimate lags.
+- **Real-time reserve.** At least ``reserved`` slots, more if the
+  real-time demand is larger, are kept for ``high`` priority tasks; the
+  rest of the demand is sized on top of them.
+- **Hysteresis.** Scale-up applies at once when the target exceeds
+  capacity by more than ``up_band`` (under pressure, by any amount).
+  Scale-down uses the highest target of the last ``down_window`` seconds,
+  happens only if that is ``down_band`` below capacity and the last change
+  is ``down_window`` old, and sheds at most ``max_step_down`` of capacity
+  per step.
+
+The decision covers the whole fleet, up to ``max_replicas`` Workers of
+``max_concurrency`` slots each: ``concurrency`` is what this process's
+:class:`~chimera.worker.WorkerPool` should run, and ``replicas`` is how
+many such Workers an external orchestrator should keep to serve the full
+target. The default of one replica sizes the local pool only.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from chimera.errors import ChimeraError
+from chimera.queue import PRIORITY_RANK, Backlog
+from chimera.worker import REALTIME_PRIORITY
+
+# Latency objectives in seconds per priority (functional.md §5.3).
+DEFAULT_SLO: dict[str, float] = {"high": 5.0, "medium": 300.0, "low": 3600.0}
+
+
+class ScalingError(ChimeraError):
+    """Raised for an invalid scaling policy."""
+
+
+@dataclass(frozen=True, slots=True)
+class ScalingPolicy:
+    """Bounds, objectives and hysteresis for :class:`Autoscaler`."""
+
+    min_concurrency: int = 4
+    max_concurrency: int = 256
+    max_replicas: int = 1
+    reserved: int = 2
+    slo: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_SLO))
+    depth_trigger: int = 100
+    headroom: float = 0.25
+    step_up: float = 1.5
+    up_band: float = 0.1
+    down_band: float = 0.2
+    down_window: float = 300.0
+    max_step_down: float = 0.25
+    default_latency: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.reserved < self.min_concurrency <= self.max_concurrency:
+            raise ScalingError(
+                "need 0 <= reserved < min_concurrency <= max_concurrency"
+            )
+        missing = set(PRIORITY_RANK) - set(self.slo)
+        if missing:
+            raise ScalingError(f"No latency objective for {sorted(missing)}")
+        if min(self.slo.values()) <= 0 or self.default_latency <= 0:
+            raise ScalingError("Latency objectives must be positive")
+        if self.step_up <= 1.0 or not 0.0 < self.max_step_down < 1.0:
+            raise ScalingError("need step_up > 1 and 0 < max_step_down < 1")
+        if self.max_replicas < 1:
+            raise ScalingError("max_replicas must be at least 1")
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSample:
+    """Load observed at one instant; missing priorities count as idle."""
+
+    at: float
+    backlog: Mapping[str, Backlog]
+    in_flight: Mapping[str, int] = field(default_factory=dict)
+    latency: Mapping[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class ScaleDecision:
+    """What the fleet should run after one sample.
+
+    ``action`` is ``up``, ``down`` or ``hold``; ``demand`` is the estimated
+    number of busy slots before headroom and the real-time reserve.
+    """
+
+    at: float
+    action: str
+    reason: str
+    concurrency: int
+    reserved: int
+    replicas: int
+    demand: float
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "at": self.at,
+            "action": self.action,
+            "reason": self.reason,
+            "concurrency": self.concurrency,
+            "reserved": self.reserved,
+            "replicas": self.replicas,
+            "demand": round(self.demand, 3),
+        }
+
+
+class Autoscaler:
+    """Stateful decision core; it performs no I/O, so live control and
+    offline simulation share it."""
+
+    def __init__(
+        self, policy: ScalingPolicy | None = None, *, concurrency: int | None = None
+    ) -> None:
+        self.policy = policy or ScalingPolicy()
+        # Fleet-wide target in slots; may exceed one Worker's maximum.
+        self.target = self._bounded(concurrency or self.policy.min_concurrency)
+        # (at, target) of the samples within the scale-down window.
+        self._recent: deque[tuple[float, int]] = deque()
+        # Set on the first sample: without history there is no scale-down.
+        self._changed_at: float | None = None
+        self._last_depth: int | None = None
+
+    @property
+    def concurrency(self) -> int:
+        return min(self.target, self.policy.max_concurrency)
+
+    def demand(self, sample: LoadSample) -> dict[str, float]:
+        """Slots each priority needs to meet its latency objective."""
+        policy = self.policy
+        needs = {}
+        for priority in PRIORITY_RANK:
+            backlog = sample.backlog.get(priority, Backlog())
+            latency = sample.latency.get(priority, policy.default_latency)
+            needs[priority] = (
+                sample.in_flight.get(priority, 0)
+                + backlog.depth * latency / policy.slo[priority]
+            )
+        return needs
+
+    def decide(self, sample: LoadSample) -> ScaleDecision:
+        policy = self.policy
+        if self._changed_at is None:
+            self._changed_at = sample.at
+        needs = self.demand(sample)
+        realtime = needs[REALTIME_PRIORITY]
+        realtime_slots = math.ceil(realtime * (1 + policy.headroom))
+        wanted = max(policy.reserved, realtime_slots) + math.ceil(
+            (sum(needs.values()) - realtime) * (1 + policy.headroom)
+        )
+        reason = "demand"
+        pressure = self._pressure(sample)
+        if pressure is not None:
+            reason = pressure
+            wanted = max(wanted, math.ceil(self.target * policy.step_up))
+        wanted = self._bounded(wanted)
+
+        action = "hold"
+        recent = self._recent
+        recent.append((sample.at, wanted))
+        while sample.at - recent[0][0] > policy.down_window:
+            recent.popleft()
+        stable = max(target for _, target in recent)
+        band = 0.0 if pressure else policy.up_band
+        if wanted > self.target * (1 + band):
+            action, self.target = "up", wanted
+        elif stable < self.target * (1 - policy.down_band):
+            if sample.at - self._changed_at >= policy.down_window:
+                floor = math.floor(self.target * (1 - policy.max_step_down))
+                action, self.target = "down", max(stable, floor)
+            else:
+                reason = "hysteresis"
+        elif pressure is None:
+            reason = "steady"
+        if action != "hold":
+            self._changed_at = sample.at
+        concurrency = self.concurrency
+        replicas = math.ceil(self.target / policy.max_concurrency)
+        # Each Worker reserves its share of the fleet's real-time slots.
+        reserved = max(policy.reserved, math.ceil(realtime_slots / replicas))
+        return ScaleDecision(
+            at=sample.at,
+            action=action,
+            reason=reason,
+            concurrency=concurrency,
+            reserved=min(reserved, concurrency - 1),
+            replicas=replicas,
+            demand=sum(needs.values()),
+        )
+
+    def _pressure(self, sample: LoadSample) -> str | None:
+        """Why capacity must grow regardless of the demand estimate."""
+        depth = sum(backlog.depth for backlog in sample.backlog.values())
+        growing = self._last_depth is not None and depth > self._last_depth
+        self._last_depth = depth
+        for priority in PRIORITY_RANK:
+            backlog = sample.backlog.get(priority)
+            if backlog is not None and backlog.oldest_age > self.policy.slo[priority]:
+                return f"slo_breach:{priority}"
+        if depth > self.policy.depth_trigger and growing:
+            return "backlog_growth"
+        return None
+
+    def _bounded(self, target: int) -> int:
+        policy = self.policy
+        ceiling = policy.max_concurrency * policy.max_replicas
+        return max(policy.min_concurrency, min(target, ceiling))
@@ -0,0 +1,144 @@
+"""
+Live autoscaling loop for a Worker process (specs/functional.md §5.3–5.4).
+
+:class:`ScalingController` samples the Task Queue's per-priority backlog
+(:meth:`~chimera.queue.TaskQueue.backlog`) and the local
+:class:`~chimera.worker.WorkerPool`'s in-flight tasks and handler latency
+every ``interval`` seconds. It feeds them to an :class:`Autoscaler` and
+applies the decision to the pool with :meth:`WorkerPool.resize`.
+
+Every decision also goes to the ``recommend`` callbacks, which export it to
+an external orchestrator (a Kubernetes operator, KEDA, a metrics gateway).
+Only changes are audited. A failing callback is logged and never stops the
+loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+
+from chimera.audit import AuditEmitter
+from chimera.metrics import counter
+from chimera.queue import TaskQueue
+from chimera.scaling.autoscaler import (
+    Autoscaler,
+    LoadSample,
+    ScaleDecision,
+    ScalingPolicy,
+)
+from chimera.worker import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+RecommendFn = Callable[[ScaleDecision], Awaitable[None]]
+
+DEFAULT_INTERVAL = 5.0
+
+DECISIONS = counter(
+    "chimera_scaling_decisions",
+    "Autoscaler decisions by action",
+    labelnames=("action",),
+)
+
+
+class ScalingController:
+    """Keeps a :class:`WorkerPool` sized to the queue it drains.
+
+    Usage::
+
+        async with ScalingController(queue, pool, recommend=[publish]):
+            ...
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        pool: WorkerPool,
+        *,
+        policy: ScalingPolicy | None = None,
+        interval: float = DEFAULT_INTERVAL,
+        recommend: Iterable[RecommendFn] = (),
+        audit: AuditEmitter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.queue = queue
+        self.pool = pool
+        self.autoscaler = Autoscaler(policy, concurrency=pool.max_in_flight)
+        self.interval = interval
+        self.recommend = list(recommend)
+        self.audit = audit
+        self.last: ScaleDecision | None = None
+        self._clock = clock
+        self._runner: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> ScalingController:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+
+    async def sample(self) -> LoadSample:
+        return LoadSample(
+            at=self._clock(),
+            backlog=await self.queue.backlog(),
+            in_flight=self.pool.in_flight_by_priority,
+            latency=dict(self.pool.latency),
+        )
+
+    async def step(self) -> ScaleDecision:
+        """Sample, decide, resize the pool and publish the decision."""
+        decision = self.autoscaler.decide(await self.sample())
+        pool = self.pool
+        if (decision.concurrency, decision.reserved) != (
+            pool.max_in_flight,
+            pool.reserved,
+        ):
+            pool.resize(decision.concurrency, reserved=decision.reserved)
+        DECISIONS.inc(action=decision.action)
+        if decision.action != "hold":
+            logger.info(
+                "scaling %s: concurrency=%d reserved=%d replicas=%d (%s)",
+                decision.action,
+                decision.concurrency,
+                decision.reserved,
+                decision.replicas,
+                decision.reason,
+            )
+            if self.audit is not None:
+                self.audit.emit(
+                    "scaling.decision",
+                    correlation_id=pool.worker_id,
+                    actor="autoscaler",
+                    payload=decision.to_dict(),
+                )
+        for publish in self.recommend:
+            try:
+                await publish(decision)
+            except Exception:
+                logger.exception("scale recommendation publish failed")
+        self.last = decision
+        return decision
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.step()
+            except Exception:
+                logger.exception("autoscaler step failed")
+            await asyncio.sleep(self.interval)
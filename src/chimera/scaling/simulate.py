@@ -0,0 +1,226 @@
+"""
+Offline replay of a recorded load trace through the autoscaler.
+
+A trace is JSON lines, one task arrival per line::
+
+    {"at": 12.5, "priority": "high", "service": 1.8, "task_type": "reply_dm"}
+
+``at`` is seconds since the trace started and ``service`` is how long the
+task held a Worker slot. :func:`simulate` replays the arrivals on a virtual
+clock against a pool that behaves like :class:`~chimera.worker.WorkerPool`:
+
+- Tasks are taken in priority order, FIFO within a priority.
+- ``reserved`` slots only take ``high`` priority tasks.
+- Shrinking capacity never interrupts a running task.
+
+Every ``interval`` seconds the same :class:`Autoscaler` used in production
+gets a :class:`LoadSample`, so a policy change can be judged on recorded
+traffic before it ships. The fleet is modelled as one pool of the
+autoscaler's fleet-wide target. With ``autoscale=False`` the pool stays
+at a fixed size, which gives the static-sizing baseline.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import math
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from chimera.queue import PRIORITY_RANK, Backlog
+from chimera.scaling.autoscaler import (
+    Autoscaler,
+    LoadSample,
+    ScaleDecision,
+    ScalingError,
+    ScalingPolicy,
+)
+from chimera.scaling.controller import DEFAULT_INTERVAL
+from chimera.worker import REALTIME_PRIORITY
+from chimera.worker.pool import LATENCY_SMOOTHING
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    """One task arrival in a load trace."""
+
+    at: float
+    priority: str
+    service: float
+    task_type: str = "generate_content"
+
+    def __post_init__(self) -> None:
+        if self.priority not in PRIORITY_RANK:
+            raise ScalingError(f"Unknown task priority: {self.priority!r}")
+        if self.at < 0 or self.service < 0:
+            raise ScalingError("Trace times must not be negative")
+
+
+def read_trace(path: Path) -> list[TraceEvent]:
+    """Load a JSON-lines trace, sorted by arrival time."""
+    events = []
+    with path.open(encoding="utf-8") as lines:
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                events.append(TraceEvent(**json.loads(line)))
+            except (TypeError, ValueError, ScalingError) as exc:
+                raise ScalingError(f"{path}:{number}: bad trace line: {exc}") from None
+    events.sort(key=lambda event: event.at)
+    return events
+
+
+def write_trace(path: Path, events: Iterable[TraceEvent]) -> int:
+    """Write a JSON-lines trace; returns the number of events."""
+    written = 0
+    with path.open("w", encoding="utf-8") as out:
+        for event in events:
+            record = {
+                "at": event.at,
+                "priority": event.priority,
+                "service": event.service,
+                "task_type": event.task_type,
+            }
+            out.write(json.dumps(record) + "\n")
+            written += 1
+    return written
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    """Outcome of one replay. Waits are seconds from arrival to start."""
+
+    slo: Mapping[str, float]
+    waits: dict[str, list[float]] = field(
+        default_factory=lambda: {priority: [] for priority in PRIORITY_RANK}
+    )
+    duration: float = 0.0
+    slot_seconds: float = 0.0
+    peak_concurrency: int = 0
+    decisions: list[ScaleDecision] = field(default_factory=list)
+
+    @property
+    def changes(self) -> int:
+        return sum(decision.action != "hold" for decision in self.decisions)
+
+    def percentile(self, priority: str, q: float) -> float:
+        """Nearest-rank percentile of waits, ``q`` in [0, 100]."""
+        waits = sorted(self.waits[priority])
+        if not waits:
+            return 0.0
+        return waits[max(0, math.ceil(q / 100 * len(waits)) - 1)]
+
+    def slo_misses(self, priority: str) -> int:
+        limit = self.slo[priority]
+        return sum(wait > limit for wait in self.waits[priority])
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "duration": self.duration,
+            "slot_hours": round(self.slot_seconds / 3600, 3),
+            "peak_concurrency": self.peak_concurrency,
+            "changes": self.changes,
+            "priorities": {
+                priority: {
+                    "tasks": len(self.waits[priority]),
+                    "p50_wait": self.percentile(priority, 50),
+                    "p95_wait": self.percentile(priority, 95),
+                    "slo_misses": self.slo_misses(priority),
+                }
+                for priority in PRIORITY_RANK
+            },
+        }
+
+
+def simulate(
+    trace: Iterable[TraceEvent],
+    policy: ScalingPolicy | None = None,
+    *,
+    interval: float = DEFAULT_INTERVAL,
+    concurrency: int | None = None,
+    autoscale: bool = True,
+) -> SimulationReport:
+    """Replay ``trace`` and report waits, SLO misses and capacity used.
+
+    ``concurrency`` is the starting pool size (the policy minimum by
+    default) and, with ``autoscale=False``, the fixed one.
+    """
+    policy = policy or ScalingPolicy()
+    scaler = Autoscaler(policy, concurrency=concurrency)
+    capacity = scaler.target
+    reserved = min(policy.reserved, capacity - 1)
+    report = SimulationReport(slo=policy.slo, peak_concurrency=capacity)
+
+    arrivals = sorted(trace, key=lambda event: event.at)
+    pending: dict[str, deque[tuple[float, float]]] = {
+        priority: deque() for priority in PRIORITY_RANK
+    }
+    running: list[tuple[float, int, str, float]] = []
+    active = dict.fromkeys(PRIORITY_RANK, 0)
+    latency: dict[str, float] = {}
+    seq = itertools.count()
+    now, next_tick, i = 0.0, 0.0, 0
+
+    def dispatch() -> None:
+        busy = len(running)
+        while busy < capacity:
+            shared = capacity - reserved - (busy - active[REALTIME_PRIORITY]) > 0
+            for priority, queued in pending.items():
+                if queued and (shared or priority == REALTIME_PRIORITY):
+                    break
+            else:
+                return
+            arrived, service = queued.popleft()
+            report.waits[priority].append(now - arrived)
+            heapq.heappush(running, (now + service, next(seq), priority, service))
+            active[priority] += 1
+            busy += 1
+
+    while i < len(arrivals) or running or any(pending.values()):
+        next_arrival = arrivals[i].at if i < len(arrivals) else math.inf
+        next_finish = running[0][0] if running else math.inf
+        at = min(next_arrival, next_finish, next_tick if autoscale else math.inf)
+        report.slot_seconds += capacity * (at - now)
+        now = at
+        while running and running[0][0] <= now:
+            _, _, priority, service = heapq.heappop(running)
+            active[priority] -= 1
+            previous = latency.get(priority, service)
+            latency[priority] = previous + LATENCY_SMOOTHING * (service - previous)
+        while i < len(arrivals) and arrivals[i].at <= now:
+            event = arrivals[i]
+            pending[event.priority].append((event.at, event.service))
+            i += 1
+        if autoscale and next_tick <= now:
+            decision = scaler.decide(_sample(now, pending, active, latency))
+            report.decisions.append(decision)
+            capacity = scaler.target
+            # The fleet reserves what each of its Workers does.
+            reserved = min(decision.reserved * decision.replicas, capacity - 1)
+            report.peak_concurrency = max(report.peak_concurrency, capacity)
+            next_tick += interval
+        dispatch()
+    report.duration = now
+    return report
+
+
+def _sample(
+    now: float,
+    pending: Mapping[str, deque[tuple[float, float]]],
+    active: Mapping[str, int],
+    latency: Mapping[str, float],
+) -> LoadSample:
+    return LoadSample(
+        at=now,
+        backlog={
+            priority: Backlog(len(queued), now - queued[0][0] if queued else 0.0)
+            for priority, queued in pending.items()
+        },
+        in_flight=dict(active),
+        latency=dict(latency),
+    )
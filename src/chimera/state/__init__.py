@@ -0,0 +1,30 @@
+"""
+GlobalState: versioned shared state with optimistic concurrency control
+(specs/technical.md §2.1, §6.6, §6.7).
+"""
+
+from chimera.state.store import (
+    DEFAULT_MAX_RETRIES,
+    CommitAuthority,
+    GlobalState,
+    Snapshot,
+    StateConflictError,
+    StateError,
+    StateStats,
+    agent_key,
+    campaign_key,
+    result_key,
+)
+
+__all__ = [
+    "DEFAULT_MAX_RETRIES",
+    "CommitAuthority",
+    "GlobalState",
+    "Snapshot",
+    "StateConflictError",
+    "StateError",
+    "StateStats",
+    "agent_key",
+    "campaign_key",
+    "result_key",
+]
@@ -0,0 +1,251 @@
+"""
+GlobalState with optimistic concurrency control (specs/technical.md §6.6).
+
+State is a map of scoped keys (``campaign:<id>``, ``agent:<id>``,
+``result:<id>``) to immutable :class:`Snapshot` objects, each carrying its
+own version counter. Versioning per key rather than per store means a
+commit to one campaign never invalidates results computed against another,
+so conflicts (and the retries they cause) stay proportional to real
+contention instead of to swarm size.
+
+Reads are copy-on-write: a commit builds a new value dict and swaps in a
+new :class:`Snapshot`, so a reader's snapshot is never mutated underneath
+it and reading costs one dict lookup, no copy and no lock. Treat snapshot
+values as read-only all the way down.
+
+Commits are compare-and-swap over a read set: every key in ``expected``
+must still be at the recorded version or the whole commit fails with
+:class:`StateConflictError` and nothing is written. Only the holder of the
+store's single :class:`CommitAuthority` (the Judge, §6.7) can commit.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from chimera.errors import ChimeraError
+from chimera.metrics import counter
+
+DEFAULT_MAX_RETRIES = 3
+
+COMMITS = counter(
+    "chimera_state_commits", "GlobalState commit attempts", labelnames=("outcome",)
+)
+RETRIES = counter("chimera_state_retries", "GlobalState commits retried on conflict")
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def campaign_key(campaign_id: str) -> str:
+    return f"campaign:{campaign_id}"
+
+
+def agent_key(agent_id: str) -> str:
+    return f"agent:{agent_id}"
+
+
+def result_key(result_id: str) -> str:
+    return f"result:{result_id}"
+
+
+class StateError(ChimeraError):
+    """Raised when a GlobalState operation is not permitted."""
+
+
+class StateConflictError(StateError):
+    """A commit's read set drifted: ``{key: (expected, actual)}`` versions."""
+
+    retryable = True
+
+    def __init__(self, conflicts: Mapping[str, tuple[int, int]]) -> None:
+        detail = ", ".join(
+            f"{key} expected v{expected} found v{actual}"
+            for key, (expected, actual) in sorted(conflicts.items())
+        )
+        super().__init__(f"State version conflict: {detail}")
+        self.conflicts = dict(conflicts)
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """One key's value at one version. Version 0 means the key is unset."""
+
+    key: str
+    version: int
+    value: Mapping[str, Any]
+    committed_at: float | None = None
+    committed_by: str | None = None
+
+
+class CommitAuthority:
+    """Capability to commit to one :class:`GlobalState` (specs §6.7).
+
+    Issued once per store by :meth:`GlobalState.grant_commit_authority`.
+    """
+
+    __slots__ = ("_state", "holder")
+
+    def __init__(self, state: GlobalState, holder: str) -> None:
+        self._state = state
+        self.holder = holder
+
+    def __repr__(self) -> str:
+        return f"CommitAuthority(holder={self.holder!r})"
+
+
+@dataclass(slots=True)
+class StateStats:
+    commits: int = 0
+    conflicts: int = 0
+    retries: int = 0
+
+    @property
+    def conflict_rate(self) -> float:
+        attempts = self.commits + self.conflicts
+        return self.conflicts / attempts if attempts else 0.0
+
+
+Changes = Mapping[str, Mapping[str, Any]]
+UpdateFn = Callable[[dict[str, Snapshot]], Awaitable[Changes]]
+
+
+class GlobalState:
+    """Versioned, copy-on-write key/value state with CAS commits.
+
+    Usage::
+
+        state = GlobalState({campaign_key("c1"): {"status": "active"}})
+        authority = state.grant_commit_authority("judge")
+        seen = state.versions([campaign_key("c1")])
+        ...
+        state.commit(authority, {result_key(rid): result}, expected=seen)
+    """
+
+    def __init__(
+        self,
+        initial: Mapping[str, Mapping[str, Any]] | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._entries: dict[str, Snapshot] = {}
+        self._lock = threading.Lock()
+        self._authority: CommitAuthority | None = None
+        self.stats = StateStats()
+        for key, value in (initial or {}).items():
+            self._entries[key] = Snapshot(
+                key, 1, MappingProxyType(dict(value)), clock(), "initial"
+            )
+
+    def grant_commit_authority(self, holder: str = "judge") -> CommitAuthority:
+        """Issue the store's only commit capability; a second call raises."""
+        with self._lock:
+            if self._authority is not None:
+                raise StateError(
+                    f"Commit authority already held by {self._authority.holder!r}"
+                )
+            self._authority = CommitAuthority(self, holder)
+            return self._authority
+
+    # -- reads ---------------------------------------------------------------
+
+    def read(self, key: str) -> Snapshot:
+        """The current snapshot of ``key`` (version 0 and empty if unset)."""
+        return self._entries.get(key) or Snapshot(key, 0, _EMPTY)
+
+    def snapshot(self, keys: Iterable[str]) -> dict[str, Snapshot]:
+        """Snapshots of ``keys``, taken together under the commit lock."""
+        with self._lock:
+            return {key: self.read(key) for key in keys}
+
+    def versions(self, keys: Iterable[str]) -> dict[str, int]:
+        """``{key: version}`` to stamp on work derived from ``keys``."""
+        return {key: snap.version for key, snap in self.snapshot(keys).items()}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    # -- writes --------------------------------------------------------------
+
+    def commit(
+        self,
+        authority: CommitAuthority,
+        changes: Changes,
+        *,
+        expected: Mapping[str, int] | None = None,
+    ) -> dict[str, int]:
+        """Atomically merge ``changes`` into their keys if ``expected`` holds.
+
+        Each change is merged over the key's current value (new fields win)
+        and bumps that key's version. Returns the new versions of the
+        written keys; raises :class:`StateConflictError` without writing
+        anything if any key in ``expected`` is at a different version.
+        """
+        if authority is not self._authority or authority._state is not self:
+            raise StateError("Only the commit authority holder may commit")
+        now = self._clock()
+        with self._lock:
+            entries = self._entries
+            conflicts = {
+                key: (version, actual)
+                for key, version in (expected or {}).items()
+                if (actual := entries[key].version if key in entries else 0) != version
+            }
+            if conflicts:
+                self.stats.conflicts += 1
+                COMMITS.inc(outcome="conflict")
+                raise StateConflictError(conflicts)
+            versions = {}
+            for key, patch in changes.items():
+                current = entries.get(key)
+                value = {**current.value, **patch} if current else dict(patch)
+                version = (current.version if current else 0) + 1
+                entries[key] = Snapshot(
+                    key, version, MappingProxyType(value), now, authority.holder
+                )
+                versions[key] = version
+            self.stats.commits += 1
+            COMMITS.inc(outcome="committed")
+            return versions
+
+    async def update(
+        self,
+        authority: CommitAuthority,
+        keys: Iterable[str],
+        fn: UpdateFn,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> dict[str, int]:
+        """Read ``keys``, compute changes with ``fn``, commit; retry on conflict.
+
+        ``fn`` receives fresh snapshots on every attempt. After
+        ``max_retries`` conflicting retries the last conflict is raised.
+        """
+        keys = list(keys)
+        attempt = 0
+        while True:
+            snapshots = self.snapshot(keys)
+            changes = await fn(snapshots)
+            try:
+                return self.commit(
+                    authority,
+                    changes,
+                    expected={key: snap.version for key, snap in snapshots.items()},
+                )
+            except StateConflictError:
+                if attempt >= max_retries:
+                    raise
+                attempt += 1
+                self.stats.retries += 1
+                RETRIES.inc()
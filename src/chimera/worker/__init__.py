@@ -0,0 +1,27 @@
+"""
+Worker runtime: stateless task execution (specs/technical.md §5).
+"""
+
+from chimera.worker.pool import (
+    DEFAULT_TASK_CONCURRENCY,
+    DEFAULT_TASK_TIMEOUT,
+    REALTIME_PRIORITY,
+    Limiter,
+    TaskFailure,
+    TaskHandler,
+    TaskTypePolicy,
+    WorkerPool,
+    WorkerPoolStats,
+)
+
+__all__ = [
+    "DEFAULT_TASK_CONCURRENCY",
+    "DEFAULT_TASK_TIMEOUT",
+    "REALTIME_PRIORITY",
+    "Limiter",
+    "TaskFailure",
+    "TaskHandler",
+    "TaskTypePolicy",
+    "WorkerPool",
+    "WorkerPoolStats",
+]
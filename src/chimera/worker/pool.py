@@ -0,0 +1,577 @@
+"""
+Asyncio Worker Pool per specs/technical.md §5 (Worker Contract).
+
+One event loop keeps many stateless task executions in flight. Each task
+receives only its :class:`~chimera.queue.QueuedTask`; nothing is shared
+between executions, and a handler that raises or hangs affects only its own
+task. Concurrency is bounded globally (``max_in_flight``) and per
+``task_type``; timeouts cancel the handler coroutine.
+
+Task types at their limit are excluded from claims, so their backlog stays
+in the queue rather than holding leases and in-flight slots that other
+task types could use. A claim batch that overshoots a type's limit hands
+the surplus straight back. A task that still has to wait for its type's
+limiter (after :meth:`WorkerPool.set_concurrency` lowers it) renews its
+lease before running and is dropped if the lease was lost meanwhile, since
+the queue has already given it to another claim.
+
+``reserved`` of the ``max_in_flight`` slots are kept for the real-time tier
+(``high`` priority, functional.md §5.3): other tasks never occupy them, so
+a backlog of slow content generation cannot starve a DM reply. Both
+numbers can change at runtime through :meth:`WorkerPool.resize`, which the
+autoscaler in ``chimera.scaling`` drives from the pool's measured latency.
+
+Results go to the Review Queue and failure reports (§5.6) to the failure
+queue. Both are bounded ``asyncio.Queue`` objects: when the Judge falls
+behind, ``put`` blocks, in-flight slots stay occupied, and the pool stops
+claiming new tasks until capacity frees up.
+
+With an :class:`~chimera.audit.AuditEmitter`, the pool records the §11.1
+``task.assigned``/``task.completed``/``task.failed`` events; emitting only
+buffers them, so auditing adds no I/O to a task's critical path.
+
+With a :class:`~chimera.budget.BudgetLedger`, a task whose payload carries
+``estimated_cost_usd`` must reserve that much before its handler runs
+(§10.1). Reservations come from one :class:`~chimera.budget.BudgetLease`
+per scope set held by this pool, so the check is local arithmetic. A
+handler reports its actual cost as ``cost_usd`` in its artifact. A failed
+task releases its reservation (§10.4), and a task that does not fit the
+budget fails with ``budget_exceeded`` without running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from chimera.audit import AuditEmitter
+from chimera.budget import (
+    DEFAULT_LEASE_SLICE_USD,
+    BudgetExceededError,
+    BudgetLease,
+    BudgetLedger,
+    Reservation,
+    scopes_for,
+)
+from chimera.errors import ChimeraError
+from chimera.queue import PRIORITY_RANK, Lease, QueuedTask, TaskQueue
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[QueuedTask], Awaitable[dict[str, Any]]]
+
+DEFAULT_TASK_TIMEOUT = 60.0
+DEFAULT_TASK_CONCURRENCY = 64
+REALTIME_PRIORITY = "high"
+# Weight of the newest sample in the per-priority latency averages.
+LATENCY_SMOOTHING = 0.2
+
+
+class TaskFailure(ChimeraError):
+    """Raised by a handler to report a typed failure (specs/technical.md §5.6)."""
+
+    def __init__(
+        self,
+        failure_type: str,
+        reason: str,
+        *,
+        partial_result: dict[str, Any] | None = None,
+        tool_failures: list[str] | None = None,
+        retryable: bool | None = None,
+    ) -> None:
+        super().__init__(reason, retryable=retryable)
+        self.failure_type = failure_type
+        self.partial_result = partial_result
+        self.tool_failures = tool_failures or []
+
+
+@dataclass(frozen=True, slots=True)
+class TaskTypePolicy:
+    """Execution limits for one ``task_type``."""
+
+    timeout: float = DEFAULT_TASK_TIMEOUT
+    concurrency: int = DEFAULT_TASK_CONCURRENCY
+
+
+@dataclass(slots=True)
+class WorkerPoolStats:
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    released: int = 0
+    deferred: int = 0
+    lost_leases: int = 0
+
+
+class Limiter:
+    """Counting semaphore whose capacity can change at runtime."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._active = 0
+        self._changed = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def full(self) -> bool:
+        return self._active >= self._limit
+
+    async def resize(self, limit: int) -> None:
+        async with self._changed:
+            self._limit = limit
+            self._changed.notify_all()
+
+    async def __aenter__(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc: object) -> None:
+        async with self._changed:
+            self._active -= 1
+            self._changed.notify_all()
+
+
+class WorkerPool:
+    """Executes tasks claimed from a :class:`TaskQueue` on one event loop.
+
+    Usage::
+
+        async with WorkerPool(queue, handlers, review_queue=results) as pool:
+            ...
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        handlers: Mapping[str, TaskHandler],
+        *,
+        review_queue: asyncio.Queue[dict[str, Any]],
+        failure_queue: asyncio.Queue[dict[str, Any]] | None = None,
+        policies: Mapping[str, TaskTypePolicy] | None = None,
+        default_policy: TaskTypePolicy | None = None,
+        max_in_flight: int = 256,
+        reserved: int = 0,
+        claim_batch: int = 32,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 1.0,
+        worker_id: str | None = None,
+        audit: AuditEmitter | None = None,
+        budget: BudgetLedger | None = None,
+        budget_slice_usd: float = DEFAULT_LEASE_SLICE_USD,
+    ) -> None:
+        if not 0 <= reserved < max_in_flight:
+            raise ValueError("need 0 <= reserved < max_in_flight")
+        self.queue = queue
+        self.handlers = handlers
+        self.review_queue = review_queue
+        self.failure_queue = failure_queue
+        self.policies = dict(policies or {})
+        self.default_policy = default_policy or TaskTypePolicy()
+        self.max_in_flight = max_in_flight
+        self.reserved = reserved
+        self.claim_batch = claim_batch
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.audit = audit
+        self.budget = budget
+        self.budget_slice_usd = budget_slice_usd
+        self._budget_leases: dict[tuple[str, ...], BudgetLease] = {}
+        self.stats = WorkerPoolStats()
+        self._limiters: dict[str, Limiter] = {}
+        self._running: dict[asyncio.Task[None], Lease] = {}
+        self._active = dict.fromkeys(PRIORITY_RANK, 0)
+        # Claimed tasks per task_type that have not left their limiter yet.
+        self._unfinished: dict[str, int] = {}
+        # Exponentially weighted handler latency in seconds, per priority.
+        self.latency: dict[str, float] = {}
+        self._slot_freed = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._claim_loop: asyncio.Task[None] | None = None
+        slowest = max(
+            [self.default_policy.timeout]
+            + [policy.timeout for policy in self.policies.values()]
+        )
+        # Leases outlive the slowest task type so a live task is never reclaimed.
+        self._visibility_timeout = slowest * 1.5 + 5.0
+
+    async def __aenter__(self) -> WorkerPool:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._running)
+
+    @property
+    def in_flight_by_priority(self) -> dict[str, int]:
+        return dict(self._active)
+
+    def resize(self, max_in_flight: int, *, reserved: int | None = None) -> None:
+        """Change the global in-flight bound and, optionally, the slots
+        reserved for the real-time tier. Running tasks are never cancelled;
+        a smaller bound takes effect as they finish."""
+        reserved = self.reserved if reserved is None else reserved
+        if not 0 <= reserved < max_in_flight:
+            raise ValueError("need 0 <= reserved < max_in_flight")
+        self.max_in_flight = max_in_flight
+        self.reserved = reserved
+        self._slot_freed.set()
+
+    def start(self) -> None:
+        if self._claim_loop is None:
+            self._stopping.clear()
+            self._claim_loop = asyncio.create_task(self._claim_forever())
+
+    async def stop(self, *, drain: bool = True, timeout: float | None = 30.0) -> None:
+        """Stop claiming; wait for in-flight tasks, then cancel stragglers.
+
+        Cancelled tasks have their leases released so another Worker picks
+        them up immediately instead of waiting for the visibility timeout.
+        """
+        self._stopping.set()
+        claim_loop, self._claim_loop = self._claim_loop, None
+        if claim_loop is not None:
+            claim_loop.cancel()
+        # Nothing is claimed from here on.
+        running = dict(self._running)
+        if not drain:
+            for task in running:
+                task.cancel()
+        if claim_loop is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await claim_loop
+        if drain and running:
+            await asyncio.wait(set(running), timeout=timeout)
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        # Released here rather than in _execute: a task cancelled before its
+        # first step never ran any of its code.
+        cancelled = [lease for task, lease in running.items() if task.cancelled()]
+        self.stats.released += len(cancelled)
+        await asyncio.gather(*(self.queue.release(lease) for lease in cancelled))
+        # A task cancelled before its first step never decremented its type.
+        self._unfinished.clear()
+        for budget_lease in self._budget_leases.values():
+            budget_lease.close()
+        self._budget_leases.clear()
+
+    def policy_for(self, task_type: str) -> TaskTypePolicy:
+        return self.policies.get(task_type, self.default_policy)
+
+    async def set_concurrency(self, task_type: str, limit: int) -> None:
+        """Change the concurrency bound of one ``task_type`` at runtime."""
+        await self._limiter(task_type).resize(limit)
+
+    async def _claim_forever(self) -> None:
+        idle = self.poll_interval
+        while not self._stopping.is_set():
+            free = self.max_in_flight - len(self._running)
+            if free <= 0:
+                self._slot_freed.clear()
+                await self._slot_freed.wait()
+                continue
+            # Slots other tasks may still use; beyond them, only the
+            # real-time tier is claimed.
+            shared = (
+                self.max_in_flight
+                - self.reserved
+                - (len(self._running) - self._active[REALTIME_PRIORITY])
+            )
+            full = self._full_types()
+            self._slot_freed.clear()
+            leases = await self.queue.claim_batch(
+                self.worker_id,
+                min(free, shared if shared > 0 else free, self.claim_batch),
+                visibility_timeout=self._visibility_timeout,
+                max_priority=None if shared > 0 else REALTIME_PRIORITY,
+                exclude_types=full,
+            )
+            leases = await self._defer_surplus(leases)
+            if not leases:
+                # Wake early if a shared slot or a full task type frees up
+                # while we wait.
+                wake = self._stopping if shared > 0 and not full else self._slot_freed
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wake.wait(), idle)
+                idle = min(idle * 2, self.max_poll_interval)
+                continue
+            idle = self.poll_interval
+            for lease in leases:
+                task = asyncio.create_task(self._execute(lease))
+                self._running[task] = lease
+                self._active[lease.task.priority] += 1
+                task.add_done_callback(self._on_done)
+
+    def _full_types(self) -> set[str]:
+        """Task types whose claimed tasks already fill their limit."""
+        return {
+            task_type
+            for task_type, count in self._unfinished.items()
+            if count >= self._limiter(task_type).limit
+        }
+
+    async def _defer_surplus(self, leases: list[Lease]) -> list[Lease]:
+        """Keep the leases their task type has room for; release the rest."""
+        kept, surplus = [], []
+        for lease in leases:
+            task_type = lease.task.task_type
+            count = self._unfinished.get(task_type, 0)
+            if count >= self._limiter(task_type).limit:
+                surplus.append(lease)
+                continue
+            self._unfinished[task_type] = count + 1
+            kept.append(lease)
+        self.stats.claimed += len(kept)
+        if surplus:
+            self.stats.deferred += len(surplus)
+            await asyncio.gather(*(self.queue.release(lease) for lease in surplus))
+        return kept
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._active[self._running.pop(task).task.priority] -= 1
+        self._slot_freed.set()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("worker task crashed", exc_info=task.exception())
+
+    def _limiter(self, task_type: str) -> Limiter:
+        limiter = self._limiters.get(task_type)
+        if limiter is None:
+            limiter = Limiter(self.policy_for(task_type).concurrency)
+            self._limiters[task_type] = limiter
+        return limiter
+
+    async def _execute(self, lease: Lease) -> None:
+        task = lease.task
+        assigned = self._audit(task, "task.assigned", {"task_type": task.task_type})
+        limiter = self._limiter(task.task_type)
+        try:
+            waited = limiter.full
+            async with limiter:
+                if waited:
+                    renewed = await self.queue.extend(lease, self._visibility_timeout)
+                    if renewed is None:
+                        self.stats.lost_leases += 1
+                        logger.warning(
+                            "lease lost while waiting: task_id=%s", task.task_id
+                        )
+                        return
+                    lease = renewed
+                outcome = await self._run_handler(task)
+        finally:
+            self._unfinished[task.task_type] -= 1
+            self._slot_freed.set()
+        self._observe(task.priority, outcome["execution_duration_ms"] / 1000)
+        if outcome.get("failure_type") is None:
+            held = await self._hand_off(self.review_queue, outcome, lease)
+            if held is None:
+                return
+            lease = held
+            self.stats.completed += 1
+            self._audit(
+                task,
+                "task.completed",
+                {"result_id": outcome["result_id"]},
+                parent_id=assigned,
+            )
+        else:
+            if self.failure_queue is not None:
+                held = await self._hand_off(self.failure_queue, outcome, lease)
+                if held is None:
+                    return
+                lease = held
+            self.stats.failed += 1
+            self._audit(
+                task,
+                "task.failed",
+                {
+                    "failure_type": outcome["failure_type"],
+                    "failure_reason": outcome["failure_reason"],
+                },
+                parent_id=assigned,
+                severity="error",
+            )
+        if not await self.queue.ack(lease):
+            self.stats.lost_leases += 1
+            logger.warning("lease lost before ack: task_id=%s", task.task_id)
+
+    async def _hand_off(
+        self,
+        queue: asyncio.Queue[dict[str, Any]],
+        outcome: dict[str, Any],
+        lease: Lease,
+    ) -> Lease | None:
+        """Put ``outcome`` on a bounded ``queue``, renewing ``lease`` while
+        the queue stays full; None if the lease is lost meanwhile (the task
+        has been or will be re-delivered, so the outcome is dropped)."""
+        while True:
+            try:
+                async with asyncio.timeout(self._visibility_timeout / 3):
+                    await queue.put(outcome)
+                return lease
+            except TimeoutError:
+                renewed = await self.queue.extend(lease, self._visibility_timeout)
+                if renewed is None:
+                    self.stats.lost_leases += 1
+                    logger.warning(
+                        "lease lost while handing off: task_id=%s", lease.task_id
+                    )
+                    return None
+                lease = renewed
+
+    def _observe(self, priority: str, seconds: float) -> None:
+        previous = self.latency.get(priority)
+        self.latency[priority] = (
+            seconds
+            if previous is None
+            else previous + LATENCY_SMOOTHING * (seconds - previous)
+        )
+
+    def _audit(
+        self,
+        task: QueuedTask,
+        event_type: str,
+        payload: dict[str, Any],
+        *,
+        parent_id: str | None = None,
+        severity: str = "info",
+    ) -> str | None:
+        """Emit a §11.1 task event (non-blocking); returns its ``event_id``."""
+        if self.audit is None:
+            return None
+        event = self.audit.emit(
+            event_type,
+            correlation_id=task.payload.get("correlation_id") or task.task_id,
+            actor=f"worker:{self.worker_id}",
+            payload={"task_id": task.task_id, **payload},
+            severity=severity,
+            parent_id=parent_id,
+        )
+        return event.event_id
+
+    async def _run_handler(self, task: QueuedTask) -> dict[str, Any]:
+        handler = self.handlers.get(task.task_type)
+        if handler is None:
+            return self._failure(
+                task, "internal_error", f"No handler for {task.task_type!r}", 0
+            )
+        try:
+            reservation = self._reserve_budget(task)
+        except BudgetExceededError as exc:
+            return self._failure(task, "budget_exceeded", str(exc), 0)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.policy_for(task.task_type).timeout):
+                artifact = await handler(task)
+            if reservation is not None:
+                reservation.commit(artifact.get("cost_usd"))
+        except TimeoutError:
+            self.stats.timed_out += 1
+            return self._failure(
+                task, "timeout", "Task timeout exceeded", _elapsed_ms(start)
+            )
+        except TaskFailure as exc:
+            return self._failure(
+                task,
+                exc.failure_type,
+                str(exc),
+                _elapsed_ms(start),
+                partial_result=exc.partial_result,
+                tool_failures=exc.tool_failures,
+            )
+        except Exception as exc:
+            logger.exception("handler failed: task_id=%s", task.task_id)
+            return self._failure(task, "internal_error", repr(exc), _elapsed_ms(start))
+        finally:
+            if reservation is not None and reservation.open:
+                reservation.release()
+        return self._result(task, artifact, _elapsed_ms(start))
+
+    def _reserve_budget(self, task: QueuedTask) -> Reservation | None:
+        """Reserve a cost-incurring task's estimate from this pool's lease."""
+        estimate = task.payload.get("estimated_cost_usd")
+        if self.budget is None or not estimate:
+            return None
+        scopes = scopes_for(
+            campaign_id=task.payload.get("campaign_id"),
+            agent_id=task.payload.get("agent_id"),
+        )
+        budget_lease = self._budget_leases.get(scopes)
+        if budget_lease is None:
+            budget_lease = self.budget.lease(scopes, slice_usd=self.budget_slice_usd)
+            self._budget_leases[scopes] = budget_lease
+        return budget_lease.reserve(float(estimate))
+
+    def _result(
+        self, task: QueuedTask, artifact: dict[str, Any], duration_ms: int
+    ) -> dict[str, Any]:
+        """Complete a handler's artifact into a §3.13.2 Result Artifact.
+
+        The task's ``state_version`` map rides along for the Judge's §6.6
+        OCC check.
+        """
+        return {
+            "result_id": str(uuid.uuid4()),
+            "task_id": task.task_id,
+            "worker_id": self.worker_id,
+            "artifact_type": artifact.get("artifact_type", "content"),
+            "content": artifact.get("content", {}),
+            "confidence_score": artifact.get("confidence_score", 0.0),
+            "tool_usage": artifact.get("tool_usage", []),
+            "provenance": artifact.get(
+                "provenance", {"memory_refs": [], "signal_refs": []}
+            ),
+            "created_at": datetime.now(UTC).isoformat(),
+            "execution_duration_ms": duration_ms,
+            "correlation_id": task.payload.get("correlation_id"),
+            "state_version": task.payload.get("state_version") or {},
+        }
+
+    def _failure(
+        self,
+        task: QueuedTask,
+        failure_type: str,
+        reason: str,
+        duration_ms: int,
+        *,
+        partial_result: dict[str, Any] | None = None,
+        tool_failures: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build a §5.6 failure report."""
+        return {
+            "task_id": task.task_id,
+            "worker_id": self.worker_id,
+            "failure_type": failure_type,
+            "failure_reason": reason,
+            "partial_result": partial_result,
+            "tool_failures": tool_failures or [],
+            "execution_duration_ms": duration_ms,
+            "correlation_id": task.payload.get("correlation_id"),
+        }
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
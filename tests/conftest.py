@@ -6,8 +6,10 @@ Fixtures provide:
 - Sample data contracts (Agent, Campaign, Task, Result Artifact)
 - Mock Persona (SOUL.md) objects
 - Correlation ID generators
+- A controllable clock for time-dependent components
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -15,6 +17,32 @@ from typing import Any
 import pytest
 
 
+class FakeClock:
+    """Callable clock for components that take ``clock=``; tests move
+    ``now`` by hand. ``sleep`` advances it instead of waiting."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A :class:`FakeClock` starting at an arbitrary fixed epoch."""
+    return FakeClock()
+
+
 @pytest.fixture
 def correlation_id() -> str:
     """Generate a unique correlation ID for tracing."""
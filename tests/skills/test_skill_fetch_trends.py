@@ -2,117 +2,445 @@
 Tests for skill_fetch_trends contract per skills/skill_fetch_trends/README.md
 
 These tests validate the input/output contract, failure modes, and observability
-requirements defined in the skill's README. They will fail until the skill is
-implemented.
+requirements defined in the skill's README, plus the shared trend cache and
+near-duplicate trend index.
 
 Reference: skills/skill_fetch_trends/README.md
 """
 
+import asyncio
+
+import numpy as np
 import pytest
 
+import skills.skill_fetch_trends.skill as skill_module
+from chimera.metrics import REGISTRY
+from skills.skill_fetch_trends import (
+    CacheKey,
+    RelevanceScorer,
+    Signal,
+    TrendCache,
+    TrendIndex,
+    execute,
+    rank_trends,
+    top_k,
+)
+from tests.conftest import FakeClock
+
+SIGNALS = {
+    "news": [
+        {
+            "topic": "AI regulation debate",
+            "text": "EU finalizes AI Act enforcement timeline",
+            "volume": 1200,
+            "sentiment": "neutral",
+        },
+        {"topic": "Celebrity gossip", "text": "Red carpet looks", "volume": 9000},
+    ],
+    "twitter": [
+        {
+            "topic": "ai regulation debate",
+            "text": "Founders react to data-driven AI rules",
+            "volume": 800,
+            "sentiment": "negative",
+        },
+    ],
+}
+
+
+class FakeMCP:
+    """Async MCP client serving canned signals per platform."""
+
+    def __init__(self, *, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.reads = []
+
+    async def read_resource(self, uri):
+        self.reads.append(uri)
+        await asyncio.sleep(self.delay)
+        platform = uri.split("://", 1)[0]
+        if platform in self.failing:
+            raise ConnectionError(f"{platform} unavailable")
+        return {"signals": SIGNALS.get(platform, [])}
+
+
+@pytest.fixture
+def request_args(correlation_id, mock_agent, mock_campaign, mock_persona):
+    return {
+        "correlation_id": correlation_id,
+        "agent_id": mock_agent["agent_id"],
+        "campaign_id": mock_campaign["campaign_id"],
+        "persona_constraints": mock_persona,
+        "campaign_goal": mock_campaign["goal_description"],
+    }
+
+
+@pytest.fixture
+def cache():
+    return TrendCache()
+
 
 class TestFetchTrendsInputContract:
     """Test input contract per skill_fetch_trends README §3"""
 
-    def test_requires_correlation_id(
-        self, correlation_id, mock_agent, mock_campaign, mock_persona
-    ):
+    async def assert_required(self, request_args, cache, field):
+        del request_args[field]
+        with pytest.raises(TypeError):
+            await execute(FakeMCP(), cache=cache, **request_args)
+
+    async def test_requires_correlation_id(self, request_args, cache):
         """Skill MUST accept correlation_id as required field."""
-        # This will fail until skill is implemented
-        pytest.skip("Not implemented: skill_fetch_trends")
+        await self.assert_required(request_args, cache, "correlation_id")
 
-    def test_requires_agent_id(self):
+    async def test_requires_agent_id(self, request_args, cache):
         """Skill MUST accept agent_id as required field."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        await self.assert_required(request_args, cache, "agent_id")
 
-    def test_requires_campaign_id(self):
+    async def test_requires_campaign_id(self, request_args, cache):
         """Skill MUST accept campaign_id as required field."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        await self.assert_required(request_args, cache, "campaign_id")
 
-    def test_requires_persona_constraints(self):
+    async def test_requires_persona_constraints(self, request_args, cache):
         """Skill MUST accept persona_constraints as required field."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        await self.assert_required(request_args, cache, "persona_constraints")
 
-    def test_accepts_optional_time_window_hours(self):
+    async def test_accepts_optional_time_window_hours(self, request_args, cache):
         """Skill MAY accept time_window_hours as optional field (default 24)."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        mcp = FakeMCP()
+        await execute(mcp, cache=cache, **request_args)
+        await execute(mcp, cache=cache, time_window_hours=48, **request_args)
+        assert "window_hours=24" in mcp.reads[0]
+        assert any("window_hours=48" in uri for uri in mcp.reads[2:])
 
-    def test_accepts_optional_max_trends(self):
+    async def test_accepts_optional_max_trends(self, request_args, cache):
         """Skill MAY accept max_trends as optional field (default 10)."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        result = await execute(FakeMCP(), cache=cache, max_trends=1, **request_args)
+        assert len(result["trends"]) == 1
 
 
 class TestFetchTrendsOutputContract:
     """Test output contract per skill_fetch_trends README §4"""
 
-    def test_success_output_has_status_field(self):
+    async def test_success_output_has_status_field(self, request_args, cache):
         """Success output MUST include status field with value 'success'."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        assert result["status"] == "success"
+        assert result["metadata"]["total_signals_processed"] == 3
+        assert result["metadata"]["sources_failed"] == []
 
-    def test_success_output_has_trends_list(self):
+    async def test_success_output_has_trends_list(self, request_args, cache):
         """Success output MUST include trends as List[TrendObject]."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        assert isinstance(result["trends"], list)
+        assert len(result["trends"]) == 2
 
-    def test_trend_object_has_required_fields(self):
+    async def test_trend_object_has_required_fields(self, request_args, cache):
         """Each TrendObject MUST have: trend_id, topic, relevance_score, volume, sentiment."""
-        pytest.skip("Not implemented: skill_fetch_trends")
-
-    def test_relevance_score_in_valid_range(self):
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        required = {
+            "trend_id",
+            "topic",
+            "relevance_score",
+            "volume",
+            "sentiment",
+            "sources",
+            "detected_at",
+        }
+        for trend in result["trends"]:
+            assert required <= trend.keys()
+
+    async def test_relevance_score_in_valid_range(self, request_args, cache):
         """TrendObject.relevance_score MUST be between 0.0 and 1.0."""
-        pytest.skip("Not implemented: skill_fetch_trends")
-
-    def test_failure_output_has_error_code(self):
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        assert all(0.0 <= t["relevance_score"] <= 1.0 for t in result["trends"])
+
+    async def test_ranks_by_persona_relevance(self, request_args, cache):
+        """Persona-relevant trends outrank louder irrelevant ones."""
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        top = result["trends"][0]
+        assert top["topic"] == "AI regulation debate"
+        assert top["volume"] == 2000
+        assert top["sources"] == ["news", "twitter"]
+
+    async def test_failure_output_has_error_code(self, request_args, cache):
         """Failure output MUST include error_code and retry_eligible."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        result = await execute(FakeMCP(), cache=cache, platforms=[], **request_args)
+        assert result["status"] == "failure"
+        assert result["error_code"] == "NO_MCP_RESOURCES"
+        assert result["retry_eligible"] is False
+
+    async def test_partial_results_when_one_source_fails(self, request_args, cache):
+        """≥1 successful Resource returns success with sources_failed set."""
+        result = await execute(
+            FakeMCP(failing={"twitter"}), cache=cache, **request_args
+        )
+        assert result["status"] == "success"
+        assert result["metadata"]["sources_failed"] == ["twitter"]
 
 
 class TestFetchTrendsMCPDependencies:
     """Test MCP dependencies per skill_fetch_trends README §5"""
 
-    def test_uses_mcp_resources_only(self, mock_mcp_client):
+    async def test_uses_mcp_resources_only(self, mock_mcp_client, request_args, cache):
         """Skill MUST use MCP Resources for trend data (no direct APIs)."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        await execute(mock_mcp_client, cache=cache, **request_args)
+        assert mock_mcp_client.calls
+        assert all("resource" in call for call in mock_mcp_client.calls)
 
-    def test_queries_news_trends_resource(self):
+    async def test_queries_news_trends_resource(self, request_args, cache):
         """Skill MUST query at least one news/trends MCP Resource."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        mcp = FakeMCP()
+        await execute(mcp, cache=cache, **request_args)
+        assert any(uri.startswith("news://") for uri in mcp.reads)
 
-    def test_handles_mcp_resource_unavailable(self):
+    async def test_handles_mcp_resource_unavailable(self, request_args, cache):
         """Skill MUST handle MCP_RESOURCE_UNAVAILABLE with retry_eligible=true."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        mcp = FakeMCP(failing={"news", "twitter"})
+        result = await execute(mcp, cache=cache, **request_args)
+        assert result["status"] == "failure"
+        assert result["error_code"] == "MCP_RESOURCE_UNAVAILABLE"
+        assert result["retry_eligible"] is True
 
 
 class TestFetchTrendsFailureModes:
-    """Test failure modes per skill_fetch_trends README §7"""
+    """Test failure modes per skill_fetch_trends README §8"""
 
-    def test_returns_retryable_failure_on_mcp_timeout(self):
+    async def test_returns_retryable_failure_on_mcp_timeout(
+        self, request_args, cache, monkeypatch
+    ):
         """MCP timeout MUST return failure with retry_eligible=true."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        monkeypatch.setattr(skill_module, "SKILL_TIMEOUT_SECONDS", 0.01)
+        result = await execute(FakeMCP(delay=1), cache=cache, **request_args)
+        assert result["error_code"] == "TIMEOUT"
+        assert result["retry_eligible"] is True
 
-    def test_returns_terminal_failure_on_invalid_persona(self):
+    async def test_returns_terminal_failure_on_invalid_persona(
+        self, request_args, cache
+    ):
         """Invalid persona MUST return failure with retry_eligible=false."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        request_args["persona_constraints"] = "not a persona"
+        result = await execute(FakeMCP(), cache=cache, **request_args)
+        assert result["error_code"] == "INVALID_PERSONA"
+        assert result["retry_eligible"] is False
 
-    def test_returns_terminal_failure_on_inactive_campaign(self):
+    async def test_returns_terminal_failure_on_inactive_campaign(
+        self, request_args, cache
+    ):
         """Inactive campaign MUST return failure with retry_eligible=false."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        mcp = FakeMCP()
+        result = await execute(
+            mcp, cache=cache, campaign_status="completed", **request_args
+        )
+        assert result["error_code"] == "CAMPAIGN_INACTIVE"
+        assert result["retry_eligible"] is False
+        assert mcp.reads == []
 
 
 class TestFetchTrendsObservability:
-    """Test observability requirements per skill_fetch_trends README §8"""
+    """Test observability requirements per skill_fetch_trends README §9"""
 
-    def test_emits_skill_invocation_start_event(self):
+    async def audit_events(self, request_args, cache):
+        events = []
+        await execute(FakeMCP(), cache=cache, audit=events.append, **request_args)
+        return events
+
+    async def test_emits_skill_invocation_start_event(self, request_args, cache):
         """Skill MUST emit 'skill.fetch_trends.start' audit event."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        events = await self.audit_events(request_args, cache)
+        assert events[0]["event_type"] == "skill.fetch_trends.start"
+        assert events[0]["payload"]["agent_id"] == request_args["agent_id"]
 
-    def test_emits_mcp_query_events(self):
+    async def test_emits_mcp_query_events(self, request_args, cache):
         """Skill MUST emit 'skill.fetch_trends.mcp_query' for each resource."""
-        pytest.skip("Not implemented: skill_fetch_trends")
-
-    def test_emits_skill_invocation_complete_event(self):
+        events = await self.audit_events(request_args, cache)
+        queried = [
+            e["payload"]["resource_name"]
+            for e in events
+            if e["event_type"] == "skill.fetch_trends.mcp_query"
+        ]
+        assert sorted(queried) == ["news", "twitter"]
+
+    async def test_emits_skill_invocation_complete_event(self, request_args, cache):
         """Skill MUST emit 'skill.fetch_trends.complete' audit event."""
-        pytest.skip("Not implemented: skill_fetch_trends")
-
-    def test_propagates_correlation_id(self, correlation_id):
-        """Skill MUST propagate correlation_id to all audit events and MCP calls."""
-        pytest.skip("Not implemented: skill_fetch_trends")
+        events = await self.audit_events(request_args, cache)
+        assert events[-1]["event_type"] == "skill.fetch_trends.complete"
+        assert events[-1]["payload"]["status"] == "success"
+        assert events[-1]["payload"]["trends_count"] == 2
+
+    async def test_propagates_correlation_id(self, request_args, cache):
+        """Skill MUST propagate correlation_id to all audit events and output."""
+        events = []
+        result = await execute(
+            FakeMCP(), cache=cache, audit=events.append, **request_args
+        )
+        correlation_id = request_args["correlation_id"]
+        assert {e["correlation_id"] for e in events} == {correlation_id}
+        assert result["metadata"]["correlation_id"] == correlation_id
+
+
+class TestTrendCache:
+    """Test the shared trend cache (README §12 Q1)"""
+
+    async def test_repeat_fetch_is_served_from_cache(self, request_args, cache):
+        mcp = FakeMCP()
+        await execute(mcp, cache=cache, **request_args)
+        await execute(mcp, cache=cache, query="  ", **request_args)
+        assert len(mcp.reads) == 2
+        assert cache.stats.hits == 2
+
+    async def test_concurrent_identical_fetches_coalesce(self, request_args, cache):
+        mcp = FakeMCP(delay=0.02)
+        before = REGISTRY.snapshot().get("skill_fetch_trends_cache_coalesced", {})
+        results = await asyncio.gather(
+            *(execute(mcp, cache=cache, **request_args) for _ in range(10))
+        )
+        assert len(mcp.reads) == 2
+        assert cache.stats.misses == 2
+        assert cache.stats.coalesced == 18
+        assert all(r["status"] == "success" for r in results)
+        after = REGISTRY.snapshot()["skill_fetch_trends_cache_coalesced"]
+        news = (("source", "news"),)
+        assert after[news] - before.get(news, 0) == 9
+
+    async def test_ranking_stays_per_agent(self, request_args, cache, mock_persona):
+        mcp = FakeMCP()
+        analyst = await execute(mcp, cache=cache, **request_args)
+        gossip_persona = {"voice_traits": ["celebrity"], "directives": ["gossip"]}
+        request_args.update(persona_constraints=gossip_persona, campaign_goal=None)
+        gossip = await execute(mcp, cache=cache, **request_args)
+        assert len(mcp.reads) == 2
+        assert analyst["trends"][0]["topic"] == "AI regulation debate"
+        assert gossip["trends"][0]["topic"] == "Celebrity gossip"
+
+    async def test_ttl_expiry_and_lru_eviction(self):
+        now = [0.0]
+        cache = TrendCache(ttl=60, max_entries=2, clock=lambda: now[0])
+        keys = [CacheKey.build("news", 24, q) for q in ("a", "b", "c")]
+        cache.put(keys[0], ("a",))
+        cache.put(keys[1], ("b",))
+        assert cache.get(keys[0]) == ("a",)
+        cache.put(keys[2], ("c",))
+        assert cache.get(keys[1]) is None
+        assert cache.stats.evictions == 1
+        now[0] = 61
+        assert cache.get(keys[0]) is None
+
+    async def test_failed_fetch_is_not_cached(self):
+        cache = TrendCache()
+        key = CacheKey.build("news", 24, "AI  Regulation")
+        assert key == CacheKey.build("NEWS", 24, "ai regulation")
+
+        async def fail():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await cache.get_or_fetch(key, fail)
+
+        async def succeed():
+            return ("ok",)
+
+        assert await cache.get_or_fetch(key, succeed) == ("ok",)
+        assert cache.stats.misses == 2
+
+
+class TestRelevanceScoring:
+    """Test vectorized scoring and top-k selection (README §4 relevance_score)"""
+
+    def test_scores_match_scalar_formula(self):
+        terms = {"ai", "regulation", "founders"}
+        texts = [
+            "AI regulation debate",
+            "the AI act and AI regulation",
+            "celebrity gossip",
+            "",
+        ]
+        scores = RelevanceScorer(terms).score(texts)
+        assert scores.dtype == np.float32
+        # hits / sqrt(words * terms); the repeated "ai" counts twice.
+        np.testing.assert_allclose(
+            scores, [2 / np.sqrt(3 * 3), 3 / np.sqrt(4 * 3), 0.0, 0.0], rtol=1e-6
+        )
+
+    def test_top_k_matches_full_sort(self):
+        rng = np.random.default_rng(7)
+        scores = rng.integers(0, 20, 5000).astype(np.float32)
+        volume = rng.permutation(5000)
+        expected = sorted(range(5000), key=lambda i: (-scores[i], -volume[i]))[:25]
+        assert top_k(scores, 25, tiebreak=volume).tolist() == expected
+        assert top_k(scores, 0).size == 0
+        assert len(top_k(scores[:3], 10)) == 3
+
+    def test_chunked_ranking_matches_single_pass(self):
+        signals = [
+            Signal(topic=f"topic {i % 50}", text=f"ai story {i}", source="news")
+            if i % 3
+            else Signal(topic=f"topic {i % 50}", text="gossip", source="twitter")
+            for i in range(1000)
+        ]
+        terms = {"ai", "story", "7"}
+        whole = rank_trends(signals, terms, max_trends=10, chunk_size=10_000)
+        chunked = rank_trends(iter(signals), terms, max_trends=10, chunk_size=64)
+        assert whole == chunked
+        assert whole[0]["volume"] == 20
+
+
+class TestTrendDedup:
+    """Test MinHash/LSH near-duplicate trend merging (README §4 trend_id)"""
+
+    def signals(self):
+        return [
+            Signal(topic="AI regulation debate", text="EU AI Act", source="news"),
+            Signal(topic="#AIRegulation", text="founders react", source="twitter"),
+            Signal(topic="ai regulations", text="new rules", source="reddit"),
+            Signal(topic="Celebrity gossip", text="red carpet", source="news"),
+        ]
+
+    def test_near_duplicates_merge_into_one_trend(self):
+        trends = rank_trends(self.signals(), {"ai"}, max_trends=10, index=TrendIndex())
+        assert len(trends) == 2
+        merged = trends[0]
+        assert merged["volume"] == 3
+        assert merged["sources"] == ["news", "reddit", "twitter"]
+        assert len(merged["sample_posts"]) == 3
+
+    def test_trend_id_is_stable_across_polls(self):
+        clock = FakeClock()
+        index = TrendIndex(clock=clock)
+        first = rank_trends(self.signals(), {"ai"}, max_trends=10, index=index)
+        clock.now += 3600
+        again = rank_trends(
+            [Signal(topic="#aiRegulation", text="more", source="news")],
+            {"ai"},
+            max_trends=10,
+            index=index,
+        )
+        assert again[0]["trend_id"] == first[0]["trend_id"]
+
+    def test_seen_topics_are_not_rehashed(self):
+        index = TrendIndex()
+        rank_trends(self.signals(), {"ai"}, max_trends=10, index=index)
+        rank_trends(self.signals(), {"gossip"}, max_trends=10, index=index)
+        assert index.stats.topics_hashed == 4
+        assert index.stats.clusters_created == 2
+        assert index.stats.merged == 2
+
+    def test_idle_clusters_expire(self):
+        clock = FakeClock()
+        index = TrendIndex(ttl=100.0, clock=clock)
+        index.assign(["AI regulation debate"])
+        clock.now += 50
+        index.assign(["Celebrity gossip"])
+        clock.now += 60
+        assert index.expire() == 1
+        assert [c.topic for c in index.clusters.values()] == ["Celebrity gossip"]
+        assert index.assign(["AI regulation debate"]) == [2]
+
+    def test_topics_without_text_never_merge(self):
+        index = TrendIndex()
+        assert len(set(index.assign(["🔥🔥", "🚀", "!!!"]))) == 3
+
+    async def test_execute_uses_index(self, request_args, cache):
+        index = TrendIndex()
+        result = await execute(FakeMCP(), **request_args, cache=cache, index=index)
+        assert len(index) == len(result["trends"]) == 2
@@ -0,0 +1,290 @@
+"""
+Tests for engagement snapshot ingestion and rollups.
+
+The SQLite store is the stand-in for PostgreSQL. The PostgreSQL store runs
+against a real server when ``CHIMERA_TEST_POSTGRES_DSN`` is set.
+
+Reference: specs/technical.md §12.5
+"""
+
+import asyncio
+import os
+import sqlite3
+import uuid
+
+import pytest
+
+from chimera.analytics import (
+    AnalyticsError,
+    EngagementSnapshot,
+    IngestionPipeline,
+    PostgresSnapshotStore,
+    SnapshotStore,
+    SQLiteSnapshotStore,
+)
+from tests.conftest import FakeClock
+
+HOUR = 3_600.0
+T0 = 1_700_000_000.0 - 1_700_000_000.0 % 86_400  # midnight UTC
+
+
+def seed(path):
+    """Two videos; v1 is cross-posted as p1 and p2, v2 is published as p3."""
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executemany(
+        "INSERT INTO video_metadata (video_id, campaign_id) VALUES (?, 'c1')",
+        [("v1",), ("v2",)],
+    )
+    conn.executemany(
+        "INSERT INTO publications (publication_id, video_id, platform) VALUES (?, ?, ?)",
+        [("p1", "v1", "twitter"), ("p2", "v1", "tiktok"), ("p3", "v2", "twitter")],
+    )
+    return conn
+
+
+def snap(publication_id, at, views, likes=0, **kwargs):
+    return EngagementSnapshot(
+        publication_id, view_count=views, like_count=likes, captured_at=at, **kwargs
+    )
+
+
+def counters(conn, video_id):
+    return conn.execute(
+        "SELECT view_count, like_count, comment_count FROM video_metadata"
+        " WHERE video_id = ?",
+        (video_id,),
+    ).fetchone()
+
+
+@pytest.fixture
+async def store(tmp_path):
+    store = SQLiteSnapshotStore(tmp_path / "analytics.db", clock=FakeClock())
+    yield store
+    await store.close()
+
+
+@pytest.fixture
+def db(tmp_path, store):
+    conn = seed(tmp_path / "analytics.db")
+    yield conn
+    conn.close()
+
+
+class TestEngagementSnapshot:
+    """Test the engagement_snapshots record per specs/technical.md §12.5.2"""
+
+    def test_engagement_rate_is_derived(self):
+        snapshot = EngagementSnapshot(
+            "p1", view_count=200, like_count=10, comment_count=5, share_count=5
+        )
+        assert snapshot.engagement_rate == pytest.approx(0.1)
+        assert EngagementSnapshot("p1").rate == 0.0
+        assert EngagementSnapshot("p1", engagement_rate=0.3).rate == 0.3
+
+    def test_invalid_snapshots_are_rejected(self):
+        with pytest.raises(AnalyticsError, match="publication_id"):
+            EngagementSnapshot("")
+        with pytest.raises(AnalyticsError, match="negative"):
+            EngagementSnapshot("p1", like_count=-1)
+
+
+class TestSQLiteSnapshotStore:
+    """Test set-based batch loading per specs/technical.md §12.5.2–12.5.4"""
+
+    async def test_batch_updates_video_counters(self, store, db):
+        assert (
+            await store.write_batch(
+                [
+                    snap("p1", T0 + 10, 100, 5),
+                    snap("p1", T0 + 20, 150, 7),
+                    snap("p2", T0 + 15, 40, 2, comment_count=3),
+                    snap("p3", T0 + 30, 9),
+                ]
+            )
+            == 4
+        )
+        # Latest counters of each publication, summed over cross-posts.
+        assert counters(db, "v1") == (190, 9, 3)
+        assert counters(db, "v2") == (9, 0, 0)
+        await store.write_batch([snap("p2", T0 + 5, 1)])  # older than stored
+        assert counters(db, "v1") == (190, 9, 3)
+        await store.write_batch([snap("p2", T0 + 60, 60)])
+        assert counters(db, "v1") == (210, 7, 0)
+
+    async def test_retried_batch_is_not_counted_twice(self, store, db):
+        batch = [snap("p1", T0 + i, 10 * i) for i in range(1, 4)]
+        assert await store.write_batch(batch + batch[:1]) == 3
+        assert await store.write_batch(batch) == 0
+        (point,) = await store.series("p1", start=T0, end=T0 + HOUR)
+        assert point.samples == 3
+        assert db.execute("SELECT COUNT(*) FROM engagement_snapshots").fetchone() == (
+            3,
+        )
+
+    async def test_hourly_and_daily_rollups(self, store, db):
+        await store.write_batch(
+            [
+                snap("p1", T0 + 100, 10, engagement_rate=0.1),
+                snap("p1", T0 + 200, 20, engagement_rate=0.3),
+                snap("p1", T0 + HOUR + 1, 50, engagement_rate=0.2),
+            ]
+        )
+        # A later batch lands in an existing bucket and merges with it.
+        await store.write_batch([snap("p1", T0 + 150, 15, engagement_rate=0.2)])
+        hours = await store.series("p1", start=T0 + 1_000, end=T0 + 2 * HOUR)
+        assert [(p.bucket_start - T0, p.samples, p.view_count) for p in hours] == [
+            (0, 3, 20),
+            (HOUR, 1, 50),
+        ]
+        assert hours[0].mean_rate == pytest.approx(0.2)
+        assert hours[0].last_captured_at == T0 + 200
+        (day,) = await store.series("p1", start=T0, end=T0 + 1, granularity="day")
+        assert (day.bucket_start, day.samples, day.view_count) == (T0, 4, 50)
+        assert await store.series("p1", start=T0 + 2 * HOUR, end=T0 + 3 * HOUR) == []
+        with pytest.raises(AnalyticsError, match="granularity"):
+            await store.series("p1", start=T0, end=T0, granularity="week")
+
+    async def test_series_does_not_scan_raw_snapshots(self, store, db):
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM engagement_hourly"
+            " WHERE publication_id = 'p1' AND bucket_start >= 0 AND bucket_start < 1"
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "engagement_snapshots" not in detail and "SEARCH" in detail
+
+    async def test_failed_batch_rolls_back(self, store, db):
+        db.execute("DROP TABLE engagement_daily")
+        with pytest.raises(sqlite3.OperationalError):
+            await store.write_batch([snap("p1", T0, 10)])
+        assert db.execute("SELECT COUNT(*) FROM engagement_snapshots").fetchone() == (
+            0,
+        )
+        assert counters(db, "v1") == (0, 0, 0)
+
+
+class FlakyStore(SnapshotStore):
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    async def _write(self, snapshots):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("database unavailable")
+        self.batches.append([s.snapshot_id for s in snapshots])
+        return len(snapshots)
+
+    async def _series(self, publication_id, granularity, start, end):
+        return []
+
+
+class TestIngestionPipeline:
+    """Test batching, retries and backpressure per specs/technical.md §12.5"""
+
+    async def test_flushes_in_batches(self):
+        store = FlakyStore()
+        pipeline = IngestionPipeline(store, batch_size=4, capacity=8)
+        assert pipeline.submit_many(snap("p1", T0 + i, i) for i in range(10)) == 8
+        assert await pipeline.flush() == 8
+        assert [len(b) for b in store.batches] == [4, 4]
+        assert (pipeline.stats.batches, pipeline.stats.dropped) == (2, 2)
+
+    async def test_full_batch_wakes_the_flusher(self):
+        store = FlakyStore()
+        async with IngestionPipeline(
+            store, batch_size=3, flush_interval=60
+        ) as pipeline:
+            pipeline.submit_many(snap("p1", T0 + i, i) for i in range(3))
+            async with asyncio.timeout(1):
+                while not store.batches:
+                    await asyncio.sleep(0)
+        assert len(store.batches) == 1 and len(pipeline) == 0
+
+    async def test_failed_batch_is_retried_in_order(self):
+        store = FlakyStore(failures=1)
+        pipeline = IngestionPipeline(store, batch_size=2)
+        snapshots = [snap("p1", T0 + i, i) for i in range(3)]
+        pipeline.submit_many(snapshots)
+        assert await pipeline.flush() == 0 and len(pipeline) == 3
+        assert await pipeline.flush() == 3
+        assert sum(store.batches, []) == [s.snapshot_id for s in snapshots]
+        assert pipeline.stats.failures == 1 and pipeline.stats.dropped == 0
+
+    async def test_poison_batch_is_dropped_on_close(self):
+        store = FlakyStore(failures=3)
+        pipeline = IngestionPipeline(store, batch_size=2, max_attempts=3)
+        pipeline.submit_many(snap("p1", T0 + i, i) for i in range(3))
+        await pipeline.close()
+        assert (pipeline.stats.dropped, pipeline.stats.written) == (2, 1)
+        assert len(pipeline) == 0
+
+    async def test_put_waits_for_room(self):
+        store = FlakyStore()
+        async with IngestionPipeline(
+            store, batch_size=2, capacity=2, flush_interval=60
+        ) as pipeline:
+            async with asyncio.timeout(1):
+                for i in range(5):
+                    assert await pipeline.put(snap("p1", T0 + i, i))
+        assert pipeline.stats.written == 5 and pipeline.stats.dropped == 0
+
+    async def test_end_to_end_with_sqlite(self, store, db):
+        async with IngestionPipeline(store, batch_size=100) as pipeline:
+            for minute in range(120):
+                pipeline.submit(snap("p3", T0 + 60 * minute, minute))
+        assert counters(db, "v2") == (119, 0, 0)
+        hours = await store.series("p3", start=T0, end=T0 + 2 * HOUR)
+        assert [p.samples for p in hours] == [60, 60]
+
+
+@pytest.mark.skipif(
+    not os.environ.get("CHIMERA_TEST_POSTGRES_DSN"),
+    reason="CHIMERA_TEST_POSTGRES_DSN not set",
+)
+class TestPostgresSnapshotStore:
+    """Test COPY-based loading against PostgreSQL per specs/technical.md §12.5"""
+
+    async def test_copy_batch_matches_sqlite_semantics(self):
+        import asyncpg
+
+        pool = await asyncpg.create_pool(os.environ["CHIMERA_TEST_POSTGRES_DSN"])
+        schema = f"test_{uuid.uuid4().hex[:8]}"
+        video, pub = str(uuid.uuid4()), str(uuid.uuid4())
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute(f"CREATE SCHEMA {schema}")
+            await pool.close()
+            pool = await asyncpg.create_pool(
+                os.environ["CHIMERA_TEST_POSTGRES_DSN"],
+                server_settings={"search_path": schema},
+            )
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    "CREATE TABLE video_metadata (video_id UUID PRIMARY KEY,"
+                    " view_count BIGINT DEFAULT 0, like_count BIGINT DEFAULT 0,"
+                    " comment_count BIGINT DEFAULT 0, updated_at TIMESTAMPTZ);"
+                    "CREATE TABLE publications (publication_id UUID PRIMARY KEY,"
+                    " video_id UUID REFERENCES video_metadata)"
+                )
+                await conn.execute(
+                    "INSERT INTO video_metadata (video_id) VALUES ($1)", video
+                )
+                await conn.execute(
+                    "INSERT INTO publications VALUES ($1, $2)", pub, video
+                )
+            store = PostgresSnapshotStore(pool)
+            await store.ensure_schema()
+            batch = [snap(pub, T0 + i, 10 * i, i) for i in range(1, 4)]
+            assert await store.write_batch(batch) == 3
+            assert await store.write_batch(batch) == 0
+            (point,) = await store.series(pub, start=T0, end=T0 + HOUR)
+            assert (point.samples, point.view_count) == (3, 30)
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    "SELECT view_count, like_count FROM video_metadata"
+                )
+            assert tuple(row) == (30, 3)
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute(f"DROP SCHEMA {schema} CASCADE")
+            await pool.close()
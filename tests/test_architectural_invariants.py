@@ -7,8 +7,30 @@ constraints. They will fail until architectural enforcement is implemented.
 Reference: specs/_meta.md §5 (Architectural Invariants)
 """
 
+import asyncio
+
 import pytest
 
+from chimera.judge import APPROVE, REJECT, CampaignPolicy, Judge, ReviewContext
+from chimera.queue import InMemoryTaskQueue, QueuedTask
+from chimera.state import (
+    GlobalState,
+    StateConflictError,
+    StateError,
+    campaign_key,
+    result_key,
+)
+from chimera.worker import WorkerPool
+
+
+def approvable(result_id, state_version):
+    return {
+        "result_id": result_id,
+        "content": {"text": "A calm note on open source tooling."},
+        "confidence_score": 0.95,
+        "state_version": state_version,
+    }
+
 
 class TestHierarchicalSwarmInvariant:
     """Test Planner/Worker/Judge pattern per specs/_meta.md §5.1"""
@@ -18,15 +40,66 @@ class TestHierarchicalSwarmInvariant:
         # This will fail until Planner implementation exists
         pytest.skip("Not implemented: Planner component")
 
-    def test_worker_is_stateless(self):
+    async def test_worker_is_stateless(self):
         """Workers MUST be stateless (architectural invariant)."""
-        # This will fail until Worker implementation exists
-        pytest.skip("Not implemented: Worker component")
-
-    def test_judge_is_governance_gatekeeper(self):
+        seen = []
+
+        async def handler(task):
+            seen.append(task)
+            if task.task_id == "crash":
+                raise RuntimeError("worker crash")
+            return {"content": {"text": task.payload["goal"]}}
+
+        queue = InMemoryTaskQueue()
+        await queue.enqueue_many(
+            QueuedTask(task_id=task_id, task_type="t", payload={"goal": task_id})
+            for task_id in ("a", "crash", "b")
+        )
+        review, failures = asyncio.Queue(), asyncio.Queue()
+        async with WorkerPool(
+            queue, {"t": handler}, review_queue=review, failure_queue=failures
+        ):
+            results = [await asyncio.wait_for(review.get(), 1) for _ in range(2)]
+            failure = await asyncio.wait_for(failures.get(), 1)
+
+        # Each execution sees only its own task; a crash stays isolated.
+        assert all(isinstance(task, QueuedTask) for task in seen)
+        assert sorted(r["content"]["text"] for r in results) == ["a", "b"]
+        assert failure["task_id"] == "crash"
+
+    async def test_judge_is_governance_gatekeeper(self):
         """Judge MUST be the only component that commits to GlobalState."""
-        # This will fail until Judge implementation exists
-        pytest.skip("Not implemented: Judge component")
+        state = GlobalState({campaign_key("c1"): {"status": "active"}})
+        judge = Judge(
+            policies=[CampaignPolicy("c1", first_posts_hitl_count=0)], state=state
+        )
+
+        async def handler(task):
+            return {"content": {"text": task.payload["text"]}, "confidence_score": 0.95}
+
+        queue = InMemoryTaskQueue()
+        seen = state.versions([campaign_key("c1")])
+        await queue.enqueue_many(
+            QueuedTask(
+                task_id=f"t{i}",
+                task_type="t",
+                payload={"text": text, "state_version": seen},
+            )
+            for i, text in enumerate(["Ship notes", "Remember to vote"])
+        )
+        review = asyncio.Queue()
+        async with WorkerPool(queue, {"t": handler}, review_queue=review):
+            results = [await asyncio.wait_for(review.get(), 1) for _ in range(2)]
+
+        # Worker output reaches GlobalState only through an APPROVE verdict.
+        assert not any(result_key(r["result_id"]) in state for r in results)
+        verdicts = {
+            r["content"]["text"]: judge.review(r, ReviewContext("c1")) for r in results
+        }
+        assert verdicts["Ship notes"].outcome == APPROVE
+        assert verdicts["Remember to vote"].reason == "sensitive_topic"
+        committed = [r for r in results if result_key(r["result_id"]) in state]
+        assert [r["content"]["text"] for r in committed] == ["Ship notes"]
 
     def test_publication_requires_judge_approval(self):
         """No component may publish without Judge approval (invariant)."""
@@ -53,18 +126,33 @@ class TestStateConsistencyInvariant:
 
     def test_state_updates_use_optimistic_concurrency_control(self):
         """State updates MUST use OCC with state_version (invariant)."""
-        # This will fail until OCC is implemented
-        pytest.skip("Not implemented: Optimistic Concurrency Control")
+        state = GlobalState({campaign_key("c1"): {"status": "active"}})
+        authority = state.grant_commit_authority()
+        seen = state.versions([campaign_key("c1")])
+        state.commit(authority, {campaign_key("c1"): {"status": "paused"}})
+        with pytest.raises(StateConflictError):
+            state.commit(authority, {result_key("r1"): {}}, expected=seen)
 
     def test_conflicting_updates_are_rejected(self):
         """Concurrent updates with stale state_version MUST be rejected."""
-        # This will fail until conflict detection is implemented
-        pytest.skip("Not implemented: OCC conflict detection")
+        state = GlobalState({campaign_key("c1"): {"status": "active"}})
+        judge = Judge(
+            default_policy=CampaignPolicy(first_posts_hitl_count=0), state=state
+        )
+        # Two Workers raced on the same task, both reading r1 as unset.
+        seen = state.versions([campaign_key("c1"), result_key("r1")])
+        first = judge.review(approvable("r1", seen), ReviewContext("c1"))
+        second = judge.review(approvable("r1", seen), ReviewContext("c1"))
+        assert first.outcome == APPROVE
+        assert (second.outcome, second.reason) == (REJECT, "state_conflict")
+        assert state.read(result_key("r1")).version == 1
 
     def test_judge_is_only_globalstate_mutator(self):
         """Only Judge may commit to GlobalState (architectural invariant)."""
-        # This will fail until Judge-only mutation is enforced
-        pytest.skip("Not implemented: Judge-only GlobalState mutation")
+        state = GlobalState()
+        Judge(state=state)
+        with pytest.raises(StateError):
+            state.grant_commit_authority("planner")
 
 
 class TestSkillsVsToolsInvariant:
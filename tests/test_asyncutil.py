@@ -0,0 +1,69 @@
+"""
+Tests for the shared asyncio helpers.
+
+Reference: specs/technical.md §5
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.asyncutil import SingleFlight
+
+
+class TestSingleFlight:
+    """Test per-key coalescing and cancellation"""
+
+    async def test_concurrent_calls_share_one_run(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def call(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            *(flights.run(key, lambda key=key: call(key)) for key in "aaab")
+        )
+        assert results == list("aaab") and sorted(calls) == ["a", "b"]
+        assert len(flights) == 0
+
+    async def test_failure_reaches_every_caller_and_is_not_kept(self):
+        flights = SingleFlight()
+
+        async def broken():
+            await asyncio.sleep(0)
+            raise ConnectionError("down")
+
+        results = await asyncio.gather(
+            flights.run("k", broken), flights.run("k", broken), return_exceptions=True
+        )
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert "k" not in flights
+
+    async def test_cancelled_caller_leaves_others_their_result(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return 42
+
+        first = asyncio.create_task(flights.run("k", call))
+        second = asyncio.create_task(flights.run("k", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_cancel_fails_waiters_and_frees_the_key(self):
+        flights = SingleFlight()
+        waiter = asyncio.create_task(flights.run("k", asyncio.Event().wait))
+        await asyncio.sleep(0)
+        assert flights.cancel("k") and not flights.cancel("k")
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert await flights.run("k", lambda: asyncio.sleep(0, "again")) == "again"
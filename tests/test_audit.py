@@ -0,0 +1,369 @@
+"""
+Tests for the audit event pipeline, index and trace CLI per
+specs/technical.md §3.10 and §11.
+
+Reference: specs/technical.md §3.10, §11.1–11.4
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from chimera.audit import (
+    AuditEmitter,
+    AuditError,
+    AuditEvent,
+    AuditIndex,
+    RingBuffer,
+    SegmentWriter,
+    SkillAuditor,
+    list_segments,
+    read_segment,
+)
+from chimera.cli import app
+from chimera.queue import InMemoryTaskQueue, QueuedTask
+from chimera.worker import WorkerPool
+
+
+def read_all(directory):
+    return [
+        event for _, path in list_segments(directory) for _, event in read_segment(path)
+    ]
+
+
+def make_event(n: int, correlation_id: str = "corr-1") -> AuditEvent:
+    return AuditEvent("task.created", correlation_id, "planner", {"n": n})
+
+
+class TestAuditEvent:
+    """Test the Audit Event contract per specs/technical.md §3.10, §11.4"""
+
+    def test_event_has_minimum_fields(self):
+        event = AuditEvent("task.created", "corr-1", "planner", {"task_id": "t1"})
+        data = json.loads(event.to_json())
+        assert set(data) == {
+            "event_id",
+            "correlation_id",
+            "parent_id",
+            "event_type",
+            "actor",
+            "timestamp",
+            "severity",
+            "payload",
+        }
+        assert event.to_json().endswith(b"\n")
+
+    def test_rejects_unknown_severity_and_missing_fields(self):
+        with pytest.raises(AuditError):
+            AuditEvent("task.created", "corr-1", "planner", severity="fatal")
+        with pytest.raises(AuditError):
+            AuditEvent.from_dict({"event_type": "task.created"})
+
+    def test_skill_auditor_stamps_invocation_events(self):
+        events = []
+        emit = SkillAuditor(events.append, "corr-1", actor="skill_x")
+        emit("skill.x.start", {"n": 1})
+        emit("skill.x.failure", {}, severity="error")
+        assert [e["severity"] for e in events] == ["info", "error"]
+        assert {e["correlation_id"] for e in events} == {"corr-1"}
+        assert AuditEvent.from_dict(events[0]).actor == "skill_x"
+        SkillAuditor(None, "corr-1", actor="skill_x")("skill.x.start", {})
+
+
+class TestRingBuffer:
+    """Test the bounded in-memory buffer between producers and flusher"""
+
+    def test_fifo_with_wraparound(self):
+        ring = RingBuffer(3)
+        for i in range(3):
+            assert ring.push(i)
+        assert not ring.push(99)
+        assert ring.drain(2) == [0, 1]
+        ring.push(3)
+        ring.push(4)
+        assert ring.drain() == [2, 3, 4]
+        assert len(ring) == 0
+
+    def test_push_overwrite_evicts_oldest(self):
+        ring = RingBuffer(2)
+        assert ring.push_overwrite("a") is None
+        ring.push_overwrite("b")
+        assert ring.push_overwrite("c") == "a"
+        assert ring.drain() == ["b", "c"]
+
+
+class TestSegmentFiles:
+    """Test append-only segment storage per specs/technical.md §3.10"""
+
+    def test_rotates_and_reports_positions(self, tmp_path):
+        writer = SegmentWriter(tmp_path, max_segment_bytes=200, fsync="always")
+        lines = [make_event(i).to_json() for i in range(6)]
+        positions = writer.write(lines[:3]) + writer.write(lines[3:])
+        writer.close()
+        segments = list_segments(tmp_path)
+        assert [seq for seq, _ in segments] == [1, 2]
+        assert positions[3].segment == 2 and positions[3].offset == 0
+        for line, position in zip(lines, positions, strict=True):
+            path = dict(segments)[position.segment]
+            with path.open("rb") as handle:
+                handle.seek(position.offset)
+                assert handle.read(position.length) == line
+
+    def test_never_appends_after_a_torn_write(self, tmp_path):
+        writer = SegmentWriter(tmp_path)
+        writer.write([make_event(0).to_json()])
+        writer.close()
+        ((_, path),) = list_segments(tmp_path)
+        with path.open("ab") as handle:
+            handle.write(b'{"event_id": "torn')
+
+        writer = SegmentWriter(tmp_path)
+        writer.write([make_event(1).to_json()])
+        writer.close()
+        assert len(list_segments(tmp_path)) == 2
+        assert [e["payload"]["n"] for e in read_all(tmp_path)] == [0, 1]
+
+    def test_failed_batch_is_cut_back(self, tmp_path, monkeypatch):
+        writer = SegmentWriter(tmp_path, fsync="always")
+        writer.write([make_event(0).to_json()])
+        good = writer.size
+
+        def fail(fd):
+            raise OSError("disk gone")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(os, "fsync", fail)
+            with pytest.raises(OSError):
+                writer.write([make_event(1).to_json()])
+        assert writer.size == good
+        ((_, path),) = list_segments(tmp_path)
+        assert path.stat().st_size == good
+        [position] = writer.write([make_event(2).to_json()])
+        writer.close()
+        assert position.offset == good
+        assert [e["payload"]["n"] for e in read_all(tmp_path)] == [0, 2]
+
+    def test_rejects_unknown_fsync_policy(self, tmp_path):
+        with pytest.raises(AuditError):
+            SegmentWriter(tmp_path, fsync="sometimes")
+
+
+class TestAuditEmitter:
+    """Test non-blocking, batched audit emission per specs/technical.md §11"""
+
+    async def test_emit_buffers_and_flusher_writes_batches(self, tmp_path):
+        emitter = AuditEmitter(SegmentWriter(tmp_path), batch_size=100)
+        async with emitter:
+            for i in range(250):
+                emitter.emit("task.created", correlation_id="corr-1", payload={"n": i})
+            assert emitter.stats.written == 0  # nothing written synchronously
+            await asyncio.sleep(0.05)
+        assert emitter.stats.written == 250
+        assert emitter.stats.batches == 3
+        assert [e["payload"]["n"] for e in read_all(tmp_path)] == list(range(250))
+
+    async def test_flush_interval_writes_partial_batches(self, tmp_path):
+        emitter = AuditEmitter(SegmentWriter(tmp_path), flush_interval=0.01)
+        emitter.start()
+        emitter.emit("task.created", correlation_id="corr-1")
+        await asyncio.sleep(0.05)
+        assert emitter.stats.written == 1
+        await emitter.close()
+
+    async def test_accepts_skill_event_dicts(self, tmp_path):
+        async with AuditEmitter(SegmentWriter(tmp_path), actor="worker") as emitter:
+            emitter(
+                {
+                    "event_type": "skill.fetch_trends.start",
+                    "correlation_id": "corr-1",
+                    "payload": {"agent_id": "a1"},
+                }
+            )
+        (event,) = read_all(tmp_path)
+        assert event["actor"] == "worker"
+        assert event["severity"] == "info"
+
+    @pytest.mark.parametrize(
+        ("overflow", "kept"),
+        [("drop_newest", [0, 1, 2]), ("drop_oldest", [2, 3, 4])],
+    )
+    async def test_overflow_policies(self, tmp_path, overflow, kept):
+        emitter = AuditEmitter(SegmentWriter(tmp_path), capacity=3, overflow=overflow)
+        for i in range(5):
+            emitter.submit(make_event(i))
+        assert emitter.stats.dropped == 2
+        await emitter.close()
+        assert [e["payload"]["n"] for e in read_all(tmp_path)] == kept
+
+    async def test_block_policy_applies_backpressure(self, tmp_path):
+        emitter = AuditEmitter(
+            SegmentWriter(tmp_path), capacity=4, batch_size=2, overflow="block"
+        )
+        async with emitter:
+            for i in range(20):
+                assert await emitter.put(make_event(i))
+        assert emitter.stats.dropped == 0
+        assert len(read_all(tmp_path)) == 20
+
+    async def test_block_policy_without_flusher_raises(self, tmp_path):
+        emitter = AuditEmitter(SegmentWriter(tmp_path), capacity=1, overflow="block")
+        assert await emitter.put(make_event(0))
+        with pytest.raises(AuditError):
+            await asyncio.wait_for(emitter.put(make_event(1)), 1.0)
+        await emitter.close()
+
+    async def test_sink_receives_batches_and_failures_are_contained(self, tmp_path):
+        received = []
+
+        async def sink(batch):
+            received.extend(batch)
+            if len(received) > 2:
+                raise ConnectionError("database down")
+
+        emitter = AuditEmitter(SegmentWriter(tmp_path), batch_size=2, sink=sink)
+        for i in range(4):
+            emitter.submit(make_event(i))
+        await emitter.close()
+        assert len(received) == 4
+        assert emitter.stats.sink_failures == 1
+        assert len(read_all(tmp_path)) == 4
+
+
+class TestWorkerAuditEvents:
+    """Test task lifecycle events per specs/technical.md §11.1, §11.2"""
+
+    async def test_worker_pool_emits_task_events(self, tmp_path):
+        queue = InMemoryTaskQueue()
+        results = asyncio.Queue()
+
+        async def handler(task):
+            return {"content": {"text": "ok"}}
+
+        await queue.enqueue(
+            QueuedTask(
+                task_id="t1",
+                task_type="generate_content",
+                payload={"correlation_id": "corr-9"},
+            )
+        )
+        async with AuditEmitter(SegmentWriter(tmp_path)) as audit:
+            async with WorkerPool(
+                queue, {"generate_content": handler}, review_queue=results, audit=audit
+            ):
+                result = await asyncio.wait_for(results.get(), 2.0)
+
+        assigned, completed = read_all(tmp_path)
+        assert assigned["event_type"] == "task.assigned"
+        assert completed["event_type"] == "task.completed"
+        assert completed["parent_id"] == assigned["event_id"]
+        assert completed["payload"]["result_id"] == result["result_id"]
+        assert {assigned["correlation_id"], completed["correlation_id"]} == {"corr-9"}
+
+
+def write_workflow(directory, correlation_id="camp-1"):
+    """campaign → task → result → publication, plus an unrelated workflow."""
+    writer = SegmentWriter(directory, max_segment_bytes=600)
+    campaign = AuditEvent("campaign.created", correlation_id, "planner")
+    task = AuditEvent(
+        "task.created", correlation_id, "planner", parent_id=campaign.event_id
+    )
+    other = AuditEvent("campaign.created", "camp-2", "planner")
+    result = AuditEvent(
+        "task.completed", correlation_id, "worker", parent_id=task.event_id
+    )
+    # Publication filed under the publish call's own correlation ID.
+    publication = AuditEvent(
+        "skill.publish_content.success", "pub-1", "worker", parent_id=result.event_id
+    )
+    events = [campaign, task, other, result, publication]
+    positions = []
+    for event in events:
+        positions += writer.write([event.to_json()])
+    writer.close()
+    return events, positions
+
+
+class TestAuditIndex:
+    """Test correlation/parent indexing per specs/technical.md §11.2"""
+
+    def test_trace_rebuilds_tree_across_segments(self, tmp_path):
+        events, positions = write_workflow(tmp_path)
+        campaign, task, _, result, publication = events
+        index = AuditIndex(tmp_path)
+        index.add(events, positions)
+        assert len(list_segments(tmp_path)) > 1
+
+        (root,) = index.trace("camp-1")
+        assert root.event["event_id"] == campaign.event_id
+        (task_node,) = root.children
+        (result_node,) = task_node.children
+        (publication_node,) = result_node.children
+        assert publication_node.event["event_id"] == publication.event_id
+        assert [node.event["event_type"] for node in (task_node, result_node)] == [
+            "task.created",
+            "task.completed",
+        ]
+
+    def test_trace_from_any_event_id(self, tmp_path):
+        events, positions = write_workflow(tmp_path)
+        index = AuditIndex(tmp_path)
+        index.add(events, positions)
+        (root,) = index.trace(events[3].event_id)
+        assert root.event["event_id"] == events[0].event_id
+        assert index.trace("camp-unknown") == []
+
+    def test_catch_up_and_rebuild_from_segments(self, tmp_path):
+        events, _ = write_workflow(tmp_path)
+        index = AuditIndex(tmp_path)
+        assert index.catch_up() == 5
+        assert index.catch_up() == 0
+        assert index.children(events[1].event_id) == [events[3].event_id]
+
+        index.close()
+        (tmp_path / "index.sqlite").unlink()
+        index = AuditIndex(tmp_path)
+        assert index.rebuild() == 5
+        assert len(index.positions("camp-1")) == 3
+        assert index.correlation_of(events[4].event_id) == "pub-1"
+
+    async def test_emitter_maintains_index(self, tmp_path):
+        writer = SegmentWriter(tmp_path)
+        writer.write([make_event(0).to_json()])  # written before the index existed
+        index = AuditIndex(tmp_path)
+        async with AuditEmitter(writer, batch_size=1, index=index) as audit:
+            root = audit.emit("campaign.created", correlation_id="corr-1")
+            await asyncio.sleep(0.01)
+            audit.emit("task.created", correlation_id="corr-1", parent_id=root.event_id)
+        assert len(index) == 3
+        (tree,) = index.trace("corr-1")[1:]
+        assert tree.children[0].event["event_type"] == "task.created"
+
+
+class TestTraceCommand:
+    """Test ``chimera trace`` per specs/technical.md §11.2"""
+
+    def test_prints_workflow_tree(self, tmp_path):
+        events, _ = write_workflow(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(app, ["trace", "camp-1", "--audit-dir", str(tmp_path)])
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert lines[0].startswith("campaign.created")
+        assert lines[-1].startswith("        └── skill.publish_content.success")
+
+        result = runner.invoke(
+            app, ["trace", events[4].event_id, "--json", "--audit-dir", str(tmp_path)]
+        )
+        (root,) = json.loads(result.output)
+        # The publication's own correlation ID holds just the publication.
+        assert root["event_type"] == "skill.publish_content.success"
+        assert root["children"] == []
+
+    def test_unknown_id_exits_nonzero(self, tmp_path):
+        result = CliRunner().invoke(
+            app, ["trace", "nope", "--audit-dir", str(tmp_path)]
+        )
+        assert result.exit_code == 1
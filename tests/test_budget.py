@@ -0,0 +1,246 @@
+"""
+Tests for the budget ledger per specs/technical.md §10.
+
+Reference: specs/technical.md §3.11, §3.12, §10.1–10.4, §12.1
+"""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from chimera.budget import (
+    BudgetError,
+    BudgetExceededError,
+    BudgetLedger,
+    BudgetPolicy,
+    SQLiteBudgetStore,
+    campaign_scope,
+    scopes_for,
+)
+from chimera.queue import InMemoryTaskQueue, QueuedTask
+from chimera.worker import WorkerPool
+from tests.conftest import FakeClock
+
+C1 = scopes_for(campaign_id="c1")
+C2 = scopes_for(campaign_id="c2")
+DAY = 24 * 3600.0
+
+
+def make_ledger(global_usd=50.0, campaign_usd=10.0, **kwargs):
+    return BudgetLedger(
+        [
+            BudgetPolicy(daily_limit_usd=global_usd),
+            BudgetPolicy("campaign", "c1", daily_limit_usd=campaign_usd),
+        ],
+        **kwargs,
+    )
+
+
+class TestNestedReservations:
+    """Test atomic reserve/commit/release per specs/technical.md §10.4"""
+
+    def test_narrowest_limit_wins_and_denial_holds_nothing(self):
+        ledger = make_ledger()
+        ledger.reserve(C1, 8.0)
+        with pytest.raises(BudgetExceededError) as exc:
+            ledger.reserve(C1, 3.0)
+        assert exc.value.scope == campaign_scope("c1")
+        assert not exc.value.retryable
+        assert ledger.usage("global").committed_usd == 8.0
+        ledger.reserve(C2, 30.0)  # c2 has no policy of its own
+
+    def test_commit_records_actual_cost(self):
+        ledger = make_ledger()
+        ledger.reserve(C1, 2.0).commit(actual_usd=1.5)
+        usage = ledger.usage(campaign_scope("c1"))
+        assert (usage.spent_usd, usage.committed_usd) == (1.5, 0.0)
+        assert ledger.stats.variance_usd == pytest.approx(-0.5)
+
+    def test_release_returns_quota(self):
+        ledger = make_ledger()
+        reservation = ledger.reserve(C1, 10.0)
+        reservation.release()
+        assert ledger.available_usd(C1) == 10.0
+        with pytest.raises(BudgetError):
+            reservation.commit()
+
+    def test_overrun_is_charged_and_blocks_further_spend(self):
+        ledger = make_ledger()
+        ledger.reserve(C1, 1.0).commit(actual_usd=12.0)
+        assert ledger.usage(campaign_scope("c1")).spent_usd == 12.0
+        assert ledger.stats.overruns == 1
+        with pytest.raises(BudgetExceededError):
+            ledger.reserve(C1, 0.01)
+
+    def test_spend_resets_each_utc_day(self):
+        clock = FakeClock()
+        ledger = make_ledger(clock=clock)
+        ledger.reserve(C1, 10.0).commit()
+        held = ledger.reserve(C2, 5.0)
+        clock.now += DAY
+        assert ledger.usage("global").spent_usd == 0.0
+        assert ledger.usage("global").committed_usd == 5.0  # carried over
+        held.commit()
+        ledger.reserve(C1, 10.0)
+
+    def test_savings_are_tracked_without_affecting_limits(self):
+        clock = FakeClock()
+        ledger = make_ledger(clock=clock)
+        ledger.record_savings(C1, 0.25)
+        ledger.record_savings(C1, 0.0)
+        usage = ledger.usage(campaign_scope("c1"))
+        assert (usage.saved_usd, usage.spent_usd, usage.available_usd) == (
+            0.25,
+            0.0,
+            10.0,
+        )
+        assert ledger.stats.saved_usd == 0.25
+        clock.now += DAY
+        assert ledger.usage("global").saved_usd == 0.0
+
+    def test_invariant_holds_under_thread_contention(self):
+        ledger = make_ledger(global_usd=5.0)
+        admitted = []
+
+        def reserver():
+            for _ in range(500):
+                try:
+                    ledger.reserve(C1, 0.01).commit()
+                    admitted.append(1)
+                except BudgetExceededError:
+                    pass
+
+        threads = [threading.Thread(target=reserver) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(admitted) == 500
+        assert ledger.usage("global").spent_usd == pytest.approx(5.0)
+
+
+class TestLeases:
+    """Test Worker-local quota slices"""
+
+    def test_reservations_within_slice_stay_local(self):
+        ledger = make_ledger()
+        lease = ledger.lease(C1, slice_usd=1.0)
+        for _ in range(10):
+            lease.reserve(0.1).commit()
+        assert ledger.stats.refills == 1
+        # The slice is committed at the ledger; its spend is not settled yet.
+        usage = ledger.usage(campaign_scope("c1"))
+        assert (usage.spent_usd, usage.committed_usd) == (0.0, pytest.approx(1.1))
+        lease.close()
+        usage = ledger.usage(campaign_scope("c1"))
+        assert (usage.spent_usd, usage.committed_usd) == (pytest.approx(1.0), 0.0)
+        assert ledger.stats.reserved == 10
+
+    def test_lease_is_denied_when_ledger_is_exhausted(self):
+        ledger = make_ledger()
+        lease = ledger.lease(C1, slice_usd=4.0)
+        open_reservation = lease.reserve(6.0)  # refill: 6.0 plus a 4.0 slice
+        lease.reserve(4.0).commit()
+        with pytest.raises(BudgetExceededError):
+            lease.reserve(0.5)
+        assert lease.held_usd == 6.0  # only the open reservation stays held
+        open_reservation.release()
+        lease.close()
+        assert ledger.available_usd(C1) == pytest.approx(6.0)
+
+    def test_many_leases_never_exceed_limits(self):
+        ledger = make_ledger(global_usd=3.0, campaign_usd=2.0)
+        admitted, violations = [], []
+
+        def worker(scopes):
+            with ledger.lease(scopes, slice_usd=0.25) as lease:
+                for _ in range(200):
+                    try:
+                        lease.reserve(0.01).commit()
+                    except BudgetExceededError:
+                        return
+                    admitted.append(1)
+                    for scope in ("global", campaign_scope("c1")):
+                        usage = ledger.usage(scope)
+                        if usage.spent_usd + usage.committed_usd > usage.limit_usd:
+                            violations.append(usage)
+
+        threads = [
+            threading.Thread(target=worker, args=(C1 if i % 2 else C2,))
+            for i in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert violations == []
+        assert ledger.usage("global").spent_usd == pytest.approx(3.0)
+        assert ledger.usage("global").spent_usd == pytest.approx(len(admitted) / 100)
+        assert ledger.usage("global").committed_usd == 0.0
+
+
+class TestReconciliation:
+    """Test asynchronous reconciliation per specs/technical.md §3.12"""
+
+    async def test_settled_spend_is_written_and_reloaded(self, tmp_path):
+        clock = FakeClock()
+        store = SQLiteBudgetStore(tmp_path / "budget.db")
+        async with make_ledger(store=store, clock=clock) as ledger:
+            ledger.reserve(C1, 2.0).commit(1.25)
+            assert await ledger.reconcile() == 2
+            ledger.reserve(C1, 1.0).commit()
+        rows = {row.scope: row.spent_micros for row in store.rows()}
+        assert rows == {"global": 2_250_000, "campaign:c1": 2_250_000}
+
+        restarted = make_ledger(store=store, clock=clock)
+        assert restarted.usage(campaign_scope("c1")).spent_usd == 2.25
+        clock.now += DAY
+        assert make_ledger(store=store, clock=clock).usage("global").spent_usd == 0
+
+    async def test_failed_reconcile_keeps_pending_spend(self, tmp_path):
+        store = SQLiteBudgetStore(tmp_path / "budget.db")
+        ledger = make_ledger(store=store)
+        ledger.reserve(C1, 1.0).commit()
+        store.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            await ledger.reconcile()
+        ledger.store = SQLiteBudgetStore(tmp_path / "budget.db")
+        assert await ledger.reconcile() == 2
+
+
+class TestWorkerPoolBudget:
+    """Test pre-execution budget checks per specs/technical.md §10.1"""
+
+    async def test_tasks_reserve_their_estimate(self):
+        ledger = make_ledger(campaign_usd=1.0)
+        queue = InMemoryTaskQueue()
+        await queue.enqueue_many(
+            QueuedTask(
+                task_id=f"t{i}",
+                task_type="render",
+                payload={"campaign_id": "c1", "estimated_cost_usd": 0.45},
+            )
+            for i in range(3)
+        )
+
+        async def handler(task):
+            return {"content": {}, "cost_usd": 0.3}
+
+        review, failures = asyncio.Queue(), asyncio.Queue()
+        async with WorkerPool(
+            queue,
+            {"render": handler},
+            review_queue=review,
+            failure_queue=failures,
+            budget=ledger,
+            budget_slice_usd=0.0,
+            max_in_flight=1,
+        ):
+            await asyncio.wait_for(review.get(), 1)
+            await asyncio.wait_for(review.get(), 1)
+            failure = await asyncio.wait_for(failures.get(), 1)
+        assert failure["failure_type"] == "budget_exceeded"
+        usage = ledger.usage(campaign_scope("c1"))
+        assert (usage.spent_usd, usage.committed_usd) == (pytest.approx(0.6), 0.0)
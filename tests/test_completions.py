@@ -0,0 +1,171 @@
+"""
+Tests for the text_completion cache.
+
+Reference: specs/technical.md §3.2, §6.6, §8.3, §10
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.completions import CompletionCache, CompletionKey
+from tests.conftest import FakeClock
+
+
+class FakeCompletion:
+    def __init__(self, *, delay=0.0, cost=0.02):
+        self.calls = 0
+        self.delay = delay
+        self.cost = cost
+
+    async def __call__(self, text="An analysis of the EU AI Act"):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"text": f"{text} #{self.calls}", "cost_usd": self.cost}
+
+
+def key(persona_version="v1", **inputs):
+    return CompletionKey.build(
+        persona_id="tech-analyst",
+        persona_version=persona_version,
+        template="post/1",
+        inputs={"content_prompt": "EU AI Act", **inputs},
+        model_params={"model": "gpt-4-turbo", "temperature": 0.7},
+    )
+
+
+class TestCompletionKey:
+    """Test canonical keys"""
+
+    def test_equivalent_inputs_share_a_key(self):
+        assert key(platform="twitter", tone=None) == CompletionKey.build(
+            persona_id="tech-analyst",
+            persona_version="v1",
+            template="post/1",
+            inputs={"platform": "twitter", "content_prompt": "  EU   AI Act\n"},
+            model_params={"temperature": 0.7, "model": "gpt-4-turbo"},
+        )
+
+    def test_persona_version_template_and_params_matter(self):
+        base = key()
+        assert key(persona_version="v2") != base
+        assert key(platform="linkedin") != base
+        assert (
+            CompletionKey.build(
+                persona_id="tech-analyst",
+                persona_version="v1",
+                template="post/2",
+                inputs={"content_prompt": "EU AI Act"},
+                model_params={"model": "gpt-4-turbo", "temperature": 0.7},
+            )
+            != base
+        )
+
+
+class TestCompletionCache:
+    """Test reuse, coalescing, bypass and eviction"""
+
+    async def test_hit_reports_saved_cost(self):
+        cache = CompletionCache()
+        complete = FakeCompletion()
+        first = await cache.get_or_complete(key(), complete)
+        again = await cache.get_or_complete(key(), complete)
+        assert (first.source, again.source) == ("tool", "cache")
+        assert again.response == first.response and again.cached
+        assert again.saved_usd == 0.02
+        assert complete.calls == 1
+        again.response["text"] = "mutated"
+        assert cache.get(key()).response["text"].endswith("#1")
+
+    async def test_concurrent_misses_are_coalesced(self):
+        cache = CompletionCache()
+        complete = FakeCompletion(delay=0.01)
+        lookups = await asyncio.gather(
+            *(cache.get_or_complete(key(), complete) for _ in range(10))
+        )
+        assert complete.calls == 1
+        assert sorted(lookup.source for lookup in lookups) == ["coalesced"] * 9 + [
+            "tool"
+        ]
+        assert cache.stats.saved_usd == pytest.approx(0.18)
+        assert cache.stats.hit_rate == 0.9
+
+    async def test_call_is_cancelled_with_its_last_caller(self):
+        cache = CompletionCache()
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def complete():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {"text": "never"}
+
+        callers = [
+            asyncio.create_task(cache.get_or_complete(key(), complete))
+            for _ in range(2)
+        ]
+        await started.wait()
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set(), "Another caller still waits for it"
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        lookup = await cache.get_or_complete(key(), FakeCompletion())
+        assert lookup.source == "tool"
+
+    async def test_fresh_bypasses_lookup_and_refreshes(self):
+        cache = CompletionCache()
+        complete = FakeCompletion()
+        await cache.get_or_complete(key(), complete)
+        fresh = await cache.get_or_complete(key(), complete, fresh=True)
+        assert fresh.source == "bypass"
+        assert cache.get(key()).response["text"].endswith("#2")
+
+    async def test_rejected_responses_are_not_cached(self):
+        cache = CompletionCache()
+        complete = FakeCompletion()
+        keep = lambda response: not response["text"].endswith("#1")  # noqa: E731
+        await cache.get_or_complete(key(), complete, keep=keep)
+        retry = await cache.get_or_complete(key(), complete, keep=keep)
+        assert (retry.source, complete.calls) == ("tool", 2)
+        assert key() in cache
+
+    async def test_failures_are_not_cached(self):
+        cache = CompletionCache()
+
+        async def broken():
+            raise ConnectionError("llm down")
+
+        with pytest.raises(ConnectionError):
+            await cache.get_or_complete(key(), broken)
+        assert len(cache) == 0
+        assert (await cache.get_or_complete(key(), FakeCompletion())).source == "tool"
+
+    async def test_ttl_lru_and_size_eviction(self):
+        clock = FakeClock()
+        cache = CompletionCache(ttl=60, max_entries=2, clock=clock)
+        complete = FakeCompletion()
+        for platform in ("a", "b"):
+            await cache.get_or_complete(key(platform=platform), complete)
+        cache.get(key(platform="a"))  # a is now most recently used
+        await cache.get_or_complete(key(platform="c"), complete)
+        assert key(platform="a") in cache and key(platform="b") not in cache
+        clock.now += 61
+        assert cache.get(key(platform="a")) is None
+
+        small = CompletionCache(max_bytes=150)
+        for platform in ("a", "b", "c"):
+            await small.get_or_complete(key(platform=platform), complete)
+        assert len(small) < 3 and small.nbytes <= 150
+        assert small.stats.evictions >= 1
+
+    async def test_invalidate_one_persona_version(self):
+        cache = CompletionCache()
+        complete = FakeCompletion()
+        await cache.get_or_complete(key(), complete)
+        await cache.get_or_complete(key(persona_version="v2"), complete)
+        assert cache.invalidate(persona="tech-analyst@v1") == 1
+        assert list(cache._entries) == [key(persona_version="v2")]
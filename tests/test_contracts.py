@@ -0,0 +1,285 @@
+"""
+Tests for the typed data contracts and their JSON codec.
+
+Reference: specs/technical.md §3.1–3.13
+"""
+
+import json
+import uuid
+
+import pytest
+
+from chimera.contracts import (
+    Agent,
+    AuditEvent,
+    BudgetPolicyRecord,
+    BudgetState,
+    Campaign,
+    ContractError,
+    EngagementAction,
+    EpisodicMemory,
+    Persona,
+    PublicationRecord,
+    ResultArtifact,
+    ReviewerDecision,
+    ReviewItem,
+    SemanticMemory,
+    Task,
+    decode,
+    encode,
+    from_dict,
+    from_trusted,
+    to_dict,
+)
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def make_task(**overrides) -> Task:
+    fields = {
+        "task_id": new_id(),
+        "campaign_id": new_id(),
+        "task_type": "generate_content",
+        "priority": "high",
+        "context": {
+            "goal_description": "Explain the EU AI Act to founders",
+            "persona_constraints": ["cite sources"],
+            "required_resources": ["news://ai/latest"],
+            "memory_refs": [],
+        },
+        "acceptance_criteria": ("Content aligns with persona voice",),
+        "correlation_id": new_id(),
+    }
+    fields.update(overrides)
+    return Task(**fields)
+
+
+def make_result(**overrides) -> ResultArtifact:
+    fields = {
+        "result_id": new_id(),
+        "task_id": new_id(),
+        "worker_id": "worker-001",
+        "artifact_type": "content",
+        "content": {"text": "The EU AI Act ...", "media_urls": []},
+        "confidence_score": 0.92,
+        "tool_usage": ({"tool_name": "text_completion", "inputs": {}, "outputs": {}},),
+        "provenance": {"memory_refs": [], "signal_refs": [], "inputs_hash": "ab"},
+        "execution_duration_ms": 1200,
+    }
+    fields.update(overrides)
+    return ResultArtifact(**fields)
+
+
+class TestFixtureContracts:
+    """Test that the shared fixtures satisfy the typed contracts per specs/technical.md §3"""
+
+    def test_fixtures_validate(
+        self, mock_agent, mock_persona, mock_campaign, mock_result_artifact
+    ):
+        assert from_dict(Agent, mock_agent).agent_id == mock_agent["agent_id"]
+        persona = from_dict(Persona, mock_persona)
+        assert persona.directives == tuple(mock_persona["directives"])
+        campaign = from_dict(Campaign, mock_campaign)
+        assert campaign.agent_ids == (mock_agent["agent_id"],)
+        result = from_dict(ResultArtifact, mock_result_artifact)
+        assert result.confidence_score == 0.85
+
+    def test_task_context_requires_goal_description(self, mock_task):
+        # §3.13.1: context.goal_description MUST NOT be empty.
+        with pytest.raises(ContractError, match="goal_description"):
+            from_dict(Task, mock_task)
+        mock_task["context"]["goal_description"] = mock_task["context"]["goal"]
+        assert from_dict(Task, mock_task).status == "pending"
+
+
+class TestValidation:
+    """Test contract invariants per specs/technical.md §3"""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"task_id": "not-a-uuid"},
+            {"priority": "urgent"},
+            {"status": "done"},
+            {"acceptance_criteria": ()},
+            {"context": {"goal_description": "  "}},
+            {"deadline": "tomorrow"},
+            {"max_retries": -1},
+        ],
+    )
+    def test_task_rejects(self, overrides):
+        with pytest.raises(ContractError):
+            make_task(**overrides)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"confidence_score": 1.01},
+            {"confidence_score": -0.1},
+            {"confidence_score": True},
+            {"tool_usage": ({"inputs": {}},)},
+            {"provenance": {"memory_refs": []}},
+            {"execution_duration_ms": 1.5},
+        ],
+    )
+    def test_result_artifact_rejects(self, overrides):
+        with pytest.raises(ContractError):
+            make_result(**overrides)
+
+    def test_campaign_needs_an_agent(self):
+        with pytest.raises(ContractError, match="at least one"):
+            Campaign(
+                campaign_id=new_id(),
+                goal_description="goal",
+                agent_ids=(),
+                created_by="operator",
+            )
+
+    def test_review_item_needs_reasoning_and_context(self):
+        fields = {
+            "review_id": new_id(),
+            "result_id": new_id(),
+            "escalation_reason": "low_confidence",
+            "confidence_score": 0.8,
+            "reasoning_trace": "Below auto-approve threshold",
+            "context_snapshot": {"campaign_goal": "g", "persona_name": "p"},
+        }
+        assert ReviewItem(**fields).status == "pending"
+        with pytest.raises(ContractError, match="reasoning_trace"):
+            ReviewItem(**fields | {"reasoning_trace": ""})
+        with pytest.raises(ContractError, match="persona_name"):
+            ReviewItem(**fields | {"context_snapshot": {"campaign_goal": "g"}})
+
+    def test_reviewer_decision_edit_needs_content(self):
+        with pytest.raises(ContractError, match="edited_content"):
+            ReviewerDecision(
+                review_id=new_id(), reviewer_id="alice", action="approve_with_edit"
+            )
+
+    def test_budget_records(self):
+        policy = BudgetPolicyRecord(policy_id=new_id())
+        with pytest.raises(ContractError, match="scope_id"):
+            BudgetPolicyRecord(policy_id=new_id(), scope="campaign")
+        state = BudgetState(
+            state_id=new_id(),
+            policy_id=policy.policy_id,
+            period_start="2026-01-01T00:00:00+00:00",
+            period_end="2026-01-02T00:00:00+00:00",
+            spent=30.0,
+            committed=15.0,
+        )
+        assert state.fits(policy)
+        with pytest.raises(ContractError, match="period_end"):
+            BudgetState(
+                state_id=new_id(),
+                policy_id=policy.policy_id,
+                period_start="2026-01-02T00:00:00+00:00",
+                period_end="2026-01-01T00:00:00",
+            )
+
+    def test_records_are_frozen_slots(self):
+        task = make_task()
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.status = "complete"
+
+
+class TestCodec:
+    """Test the JSON envelope codec per specs/technical.md §3.13"""
+
+    def test_task_encodes_to_task_input_envelope(self):
+        task = make_task()
+        data = json.loads(encode(task))
+        for key in (
+            "task_id",
+            "campaign_id",
+            "task_type",
+            "priority",
+            "context",
+            "acceptance_criteria",
+            "deadline",
+            "max_retries",
+            "correlation_id",
+        ):
+            assert key in data
+        assert data["acceptance_criteria"] == list(task.acceptance_criteria)
+        assert data == to_dict(task)
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            make_task(),
+            make_result(),
+            Agent(
+                agent_id=new_id(), name="a", persona_ref="/p.md", wallet_address="0x1"
+            ),
+            PublicationRecord(
+                publication_id=new_id(),
+                result_id=new_id(),
+                platform="twitter",
+                account_id="acct",
+                external_id="123",
+                content_snapshot={"text": "hi"},
+                disclosure_level="automated",
+                approval_type="auto",
+            ),
+            EngagementAction(
+                engagement_id=new_id(),
+                action_type="like",
+                target_id="post-1",
+                platform="twitter",
+                result_id=new_id(),
+            ),
+            EpisodicMemory(
+                memory_id=new_id(),
+                agent_id=new_id(),
+                content="said hi",
+                context_type="conversation",
+                ttl_seconds=3600,
+            ),
+            SemanticMemory(
+                memory_id=new_id(),
+                agent_id=new_id(),
+                memory_type="fact",
+                content="likes tea",
+                importance_score=0.4,
+                embedding=(0.1, 0.2),
+            ),
+            ReviewerDecision(review_id=new_id(), reviewer_id="alice", action="reject"),
+            AuditEvent("task.created", new_id(), "planner", {"n": 1}),
+        ],
+        ids=lambda record: type(record).__name__,
+    )
+    def test_round_trip(self, record):
+        encoded = encode(record)
+        assert decode(type(record), encoded) == record
+        assert decode(type(record), encoded, trusted=True) == record
+
+    def test_trusted_path_skips_validation(self):
+        data = to_dict(make_result()) | {"confidence_score": 7.0}
+        with pytest.raises(ContractError):
+            from_dict(ResultArtifact, data)
+        result = from_trusted(ResultArtifact, data)
+        assert result.confidence_score == 7.0
+        assert isinstance(result.tool_usage, tuple)
+
+    def test_trusted_path_requires_every_field(self):
+        data = to_dict(make_task())
+        del data["max_retries"]
+        assert from_dict(Task, data).max_retries == 3
+        with pytest.raises(ContractError, match="max_retries"):
+            from_trusted(Task, data)
+
+    def test_decode_errors(self):
+        with pytest.raises(ContractError, match="Invalid JSON"):
+            decode(Task, b"{not json")
+        with pytest.raises(ContractError, match="JSON object"):
+            decode(Task, b"[]")
+        with pytest.raises(ContractError, match="Malformed Task"):
+            decode(Task, b'{"task_id": "x"}')
+
+    def test_unknown_fields_are_ignored(self):
+        data = to_dict(make_task()) | {"added_in_v2": True}
+        assert from_dict(Task, data).task_type == "generate_content"
@@ -10,6 +10,11 @@ Reference: specs/technical.md §3.1-3.12
 
 import pytest
 
+from chimera.contracts import Campaign, from_dict
+from chimera.persona import PersonaRegistry, render_soul
+from chimera.planner import PlannedTask, Planner, PlannerError
+from chimera.queue import InMemoryTaskQueue
+
 
 class TestAgentContract:
     """Test Agent data contract per specs/technical.md §3.1"""
@@ -32,10 +37,19 @@ class TestAgentContract:
         # This will fail until immutability enforcement is implemented
         pytest.skip("Not implemented: Agent ID immutability enforcement")
 
-    def test_persona_ref_points_to_valid_file(self, mock_agent):
+    async def test_persona_ref_points_to_valid_file(
+        self, mock_agent, mock_persona, tmp_path
+    ):
         """Persona ref MUST point to a valid, parseable SOUL.md file."""
-        # This will fail until persona validation is implemented
-        pytest.skip("Not implemented: Persona file validation")
+        soul = tmp_path / mock_agent["persona_ref"].lstrip("/")
+        soul.parent.mkdir(parents=True)
+        soul.write_text(render_soul(mock_persona))
+        registry = PersonaRegistry(root=tmp_path)
+        assert await registry.validate(mock_agent["persona_ref"]) is None
+        persona = await registry.get(mock_agent["persona_ref"])
+        assert persona.id == mock_persona["id"]
+        assert persona.directives == tuple(mock_persona["directives"])
+        assert await registry.validate("/personas/missing.md") is not None
 
     def test_wallet_address_is_valid(self, mock_agent):
         """Wallet address MUST be valid on configured blockchain."""
@@ -66,10 +80,28 @@ class TestCampaignContract:
             "Campaign must have at least one agent assigned"
         )
 
-    def test_paused_campaign_does_not_generate_tasks(self):
+    async def test_paused_campaign_does_not_generate_tasks(self, mock_campaign):
         """Paused campaigns MUST NOT generate new tasks (invariant)."""
-        # This will fail until campaign state enforcement is implemented
-        pytest.skip("Not implemented: Campaign pause enforcement")
+        queue = InMemoryTaskQueue()
+        planner = Planner(queue)
+        campaign = from_dict(Campaign, mock_campaign | {"status": "paused"})
+        planner.add_campaign(campaign)
+        with pytest.raises(PlannerError, match="paused"):
+            await planner.plan(
+                campaign.campaign_id,
+                [PlannedTask(campaign.campaign_id, "generate_content")],
+            )
+        assert await queue.depth() == 0
+
+        # Pausing an active campaign withdraws its queued tasks.
+        await planner.set_campaign_status(campaign.campaign_id, "active")
+        await planner.plan(
+            campaign.campaign_id,
+            [PlannedTask(campaign.campaign_id, "generate_content")],
+        )
+        assert await queue.depth() == 1
+        await planner.set_campaign_status(campaign.campaign_id, "paused")
+        assert await queue.depth() == 0
 
 
 class TestTaskContract:
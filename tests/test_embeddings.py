@@ -0,0 +1,196 @@
+"""
+Tests for batched embeddings and the memory-mapped vector cache.
+
+Reference: specs/technical.md §3.9 (embedding), §8.1
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from chimera.embeddings import (
+    EmbeddingError,
+    EmbeddingService,
+    VectorCache,
+    content_key,
+    mcp_backend,
+)
+
+DIM = 8
+
+
+def fake_vector(text):
+    rng = np.random.default_rng(abs(hash(text)) % 2**32)
+    return rng.normal(size=DIM).astype(np.float32)
+
+
+class FakeBackend:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self.fail = False
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("embedding model unavailable")
+        return np.stack([fake_vector(t) for t in texts])
+
+
+def keys(*texts):
+    return [content_key(t, "m") for t in texts]
+
+
+class TestVectorCache:
+    """Test the content-hash vector cache"""
+
+    def test_hits_are_read_only_zero_copy_views(self, tmp_path):
+        cache = VectorCache(tmp_path, dim=DIM)
+        cache.put_many(keys("a", "b"), [fake_vector("a"), fake_vector("b")])
+        view = cache.get(content_key("a", "m"))
+        np.testing.assert_array_equal(view, fake_vector("a"))
+        assert np.shares_memory(view, cache._vectors)
+        with pytest.raises(ValueError):
+            view[0] = 1.0
+        assert cache.get(content_key("c", "m")) is None
+
+    def test_persists_and_survives_growth(self, tmp_path):
+        cache = VectorCache(tmp_path, dim=DIM, initial_rows=4)
+        cache.put_many(keys("first"), [fake_vector("first")])
+        early = cache.get(content_key("first", "m"))
+        texts = [f"t{n}" for n in range(50)]
+        cache.put_many(keys(*texts), [fake_vector(t) for t in texts])
+        np.testing.assert_array_equal(early, fake_vector("first"))
+        cache.close()
+
+        reopened = VectorCache(tmp_path, dim=DIM)
+        assert len(reopened) == 51
+        np.testing.assert_array_equal(
+            reopened.get(content_key("t49", "m")), fake_vector("t49")
+        )
+
+    def test_torn_key_append_is_dropped(self, tmp_path):
+        cache = VectorCache(tmp_path, dim=DIM)
+        cache.put_many(keys("a"), [fake_vector("a")])
+        cache.close()
+        with (tmp_path / "keys.bin").open("ab") as handle:
+            handle.write(b"\x01\x02\x03")
+        reopened = VectorCache(tmp_path, dim=DIM)
+        reopened.put_many(keys("b"), [fake_vector("b")])
+        reopened.close()
+        assert len(VectorCache(tmp_path, dim=DIM)) == 2
+
+    def test_float16_and_layout_checks(self, tmp_path):
+        cache = VectorCache(tmp_path, dim=DIM, dtype="float16")
+        cache.put_many(keys("a"), [fake_vector("a")])
+        assert cache.get(content_key("a", "m")).dtype == np.float16
+        cache.close()
+        with pytest.raises(EmbeddingError):
+            VectorCache(tmp_path, dim=DIM)  # stored as float16
+        with pytest.raises(EmbeddingError):
+            cache.put_many(keys("x"), np.zeros((1, DIM + 1)))
+
+
+class TestEmbeddingService:
+    """Test micro-batching, coalescing and cache reuse"""
+
+    async def test_concurrent_duplicates_are_computed_once(self):
+        backend = FakeBackend(delay=0.01)
+        headlines = [f"headline {n % 20}" for n in range(200)]
+        async with EmbeddingService(backend, dim=DIM, batch_size=8) as service:
+            vectors = await service.embed_many(headlines)
+            again = await service.embed("headline 3")
+        sent = [text for call in backend.calls for text in call]
+        assert sorted(sent) == sorted({*headlines})
+        assert max(len(call) for call in backend.calls) <= 8
+        np.testing.assert_array_equal(vectors[3], fake_vector("headline 3"))
+        assert np.shares_memory(again, vectors[3])
+        assert service.stats.computed == 20
+        assert service.stats.coalesced == 180
+        assert service.stats.cached == 1
+
+    async def test_cancelled_caller_leaves_others_their_vector(self):
+        backend = FakeBackend(delay=0.01)
+        async with EmbeddingService(backend, dim=DIM) as service:
+            first = asyncio.create_task(service.embed("headline"))
+            second = asyncio.create_task(service.embed("headline"))
+            await asyncio.sleep(0)
+            first.cancel()
+            vector = await second
+        assert first.cancelled()
+        np.testing.assert_array_equal(vector, fake_vector("headline"))
+        assert service.stats.coalesced == 1 and len(backend.calls) == 1
+
+    async def test_cache_is_shared_across_restarts(self, tmp_path):
+        backend = FakeBackend()
+        async with EmbeddingService(
+            backend, dim=DIM, cache=VectorCache(tmp_path, dim=DIM)
+        ) as service:
+            await service.embed("AI regulation passes")
+        service.cache.close()
+        async with EmbeddingService(
+            backend, dim=DIM, cache=VectorCache(tmp_path, dim=DIM)
+        ) as service:
+            await service.embed("AI regulation passes")
+            await service.embed("AI regulation passes")
+        assert len(backend.calls) == 1
+        assert service.stats.hit_rate == 1.0
+
+    async def test_models_do_not_share_vectors(self):
+        backend = FakeBackend()
+        cache = VectorCache(dim=DIM)
+        for model in ("small", "large"):
+            async with EmbeddingService(
+                backend, dim=DIM, cache=cache, model=model
+            ) as service:
+                await service.embed("same text")
+        assert len(backend.calls) == 2
+
+    async def test_backend_failure_reaches_every_waiter_then_retries(self):
+        backend = FakeBackend(delay=0.01)
+        backend.fail = True
+        async with EmbeddingService(backend, dim=DIM) as service:
+            results = await asyncio.gather(
+                *(service.embed("x") for _ in range(5)), return_exceptions=True
+            )
+            assert all(isinstance(r, RuntimeError) for r in results)
+            backend.fail = False
+            np.testing.assert_array_equal(await service.embed("x"), fake_vector("x"))
+        assert service.stats.failures == 1
+
+    async def test_mcp_backend(self):
+        class Client:
+            async def call_tool(self, tool_name, params):
+                assert (tool_name, params["model"]) == ("embed_texts", "small")
+                return {
+                    "embeddings": [fake_vector(t).tolist() for t in params["texts"]]
+                }
+
+        backend = mcp_backend(Client(), model="small")
+        async with EmbeddingService(backend, dim=DIM) as service:
+            [a, b] = await service.embed_many(["a", "b"])
+        np.testing.assert_allclose(b, fake_vector("b"))
+
+    async def test_mcp_backend_reads_tool_result_envelopes(self):
+        class Client:
+            def __init__(self, shape):
+                self.shape = shape
+
+            async def call_tool(self, tool_name, params):
+                body = {
+                    "embeddings": [fake_vector(t).tolist() for t in params["texts"]]
+                }
+                if self.shape == "structured":
+                    return {"content": [], "structuredContent": body}
+                if self.shape == "text":
+                    return {"content": [{"type": "text", "text": json.dumps(body)}]}
+                return {"content": [{"type": "text", "text": "no vectors"}]}
+
+        for shape in ("structured", "text"):
+            vectors = await mcp_backend(Client(shape))(["a", "b"])
+            np.testing.assert_allclose(vectors[1], fake_vector("b"))
+        with pytest.raises(EmbeddingError):
+            await mcp_backend(Client("missing"))(["a"])
@@ -0,0 +1,144 @@
+"""
+Tests for GlobalState optimistic concurrency control per specs/technical.md §6.6.
+
+Reference: specs/technical.md §6.6, §6.7; specs/_meta.md §5.4
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from chimera.state import (
+    GlobalState,
+    StateConflictError,
+    StateError,
+    agent_key,
+    campaign_key,
+)
+
+C1, C2 = campaign_key("c1"), campaign_key("c2")
+
+
+@pytest.fixture
+def state():
+    return GlobalState({C1: {"status": "active"}, C2: {"status": "active"}})
+
+
+@pytest.fixture
+def authority(state):
+    return state.grant_commit_authority("judge")
+
+
+class TestVersionedSnapshots:
+    """Test copy-on-write snapshot reads"""
+
+    def test_snapshot_is_unchanged_by_later_commits(self, state, authority):
+        before = state.read(C1)
+        state.commit(authority, {C1: {"status": "paused"}})
+        after = state.read(C1)
+        assert (before.version, before.value["status"]) == (1, "active")
+        assert (after.version, after.value["status"]) == (2, "paused")
+        assert after.committed_by == "judge"
+
+    def test_snapshot_values_are_read_only(self, state):
+        with pytest.raises(TypeError):
+            state.read(C1).value["status"] = "paused"
+
+    def test_unset_key_reads_as_version_zero(self, state):
+        snapshot = state.read(agent_key("a1"))
+        assert (snapshot.version, dict(snapshot.value)) == (0, {})
+        assert agent_key("a1") not in state
+
+    def test_commit_merges_fields(self, state, authority):
+        state.commit(authority, {C1: {"goal": "launch"}})
+        assert dict(state.read(C1).value) == {"status": "active", "goal": "launch"}
+
+
+class TestCompareAndSwap:
+    """Test conflict detection per specs/technical.md §6.6"""
+
+    def test_stale_read_set_is_rejected_without_writing(self, state, authority):
+        seen = state.versions([C1])
+        state.commit(authority, {C1: {"status": "paused"}})
+        with pytest.raises(StateConflictError) as exc:
+            state.commit(authority, {"result:r1": {"ok": True}}, expected=seen)
+        assert exc.value.conflicts == {C1: (1, 2)}
+        assert exc.value.retryable
+        assert "result:r1" not in state
+
+    def test_unrelated_keys_do_not_conflict(self, state, authority):
+        seen = state.versions([C1])
+        state.commit(authority, {C2: {"status": "paused"}})
+        assert state.commit(authority, {"result:r1": {"ok": True}}, expected=seen) == {
+            "result:r1": 1
+        }
+
+    def test_expecting_an_unset_key(self, state, authority):
+        state.commit(authority, {"result:r1": {}}, expected={"result:r1": 0})
+        with pytest.raises(StateConflictError):
+            state.commit(authority, {"result:r1": {}}, expected={"result:r1": 0})
+
+    def test_concurrent_threads_commit_exactly_once_per_version(self, state, authority):
+        wins = []
+
+        def contend():
+            for _ in range(200):
+                seen = state.read(C1).version
+                try:
+                    state.commit(authority, {C1: {"n": seen}}, expected={C1: seen})
+                    wins.append(seen)
+                except StateConflictError:
+                    pass
+
+        threads = [threading.Thread(target=contend) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(wins) == list(range(1, len(wins) + 1))
+        assert state.read(C1).version == len(wins) + 1
+        assert state.stats.commits == len(wins)
+
+
+class TestRetriesAndMetrics:
+    """Test retry semantics and conflict metrics"""
+
+    async def test_update_retries_with_fresh_state(self, state, authority):
+        calls = []
+
+        async def bump(snapshots):
+            calls.append(snapshots[C1].version)
+            if len(calls) == 1:  # someone else commits while we compute
+                state.commit(authority, {C1: {"status": "paused"}})
+            await asyncio.sleep(0)
+            return {C1: {"seen": snapshots[C1].value["status"]}}
+
+        versions = await state.update(authority, [C1], bump)
+        assert calls == [1, 2]
+        assert versions == {C1: 3}
+        assert state.read(C1).value["seen"] == "paused"
+        assert state.stats.retries == 1
+        assert state.stats.conflict_rate == pytest.approx(1 / 3)
+
+    async def test_update_gives_up_after_max_retries(self, state, authority):
+        async def always_stale(snapshots):
+            state.commit(authority, {C1: {}})
+            return {C1: {}}
+
+        with pytest.raises(StateConflictError):
+            await state.update(authority, [C1], always_stale, max_retries=2)
+        assert state.stats.retries == 2
+
+
+class TestCommitAuthority:
+    """Test Judge-only commits per specs/technical.md §6.7"""
+
+    def test_authority_is_granted_once(self, state, authority):
+        with pytest.raises(StateError):
+            state.grant_commit_authority("planner")
+
+    def test_foreign_authority_is_refused(self, state):
+        other = GlobalState()
+        with pytest.raises(StateError):
+            state.commit(other.grant_commit_authority(), {C1: {"status": "x"}})
@@ -0,0 +1,381 @@
+"""
+Tests for the HITL review queue.
+
+Reference: specs/technical.md §3.6, §3.13.3–3.13.4, §6.7, §7
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.audit import AuditEmitter, SegmentWriter, list_segments, read_segment
+from chimera.hitl import (
+    EditLog,
+    HITLError,
+    HITLQueue,
+    ReviewDecision,
+    apply_delta,
+    text_ref,
+    token_delta,
+    tokenize,
+)
+from chimera.judge import (
+    APPROVE,
+    ESCALATE,
+    REJECT,
+    CampaignPolicy,
+    Judge,
+    PersonaRules,
+    ReviewContext,
+    Verdict,
+)
+from chimera.state import GlobalState, campaign_key, result_key
+from tests.conftest import FakeClock
+
+NO_FIRST_POSTS = CampaignPolicy("camp-1", first_posts_hitl_count=0)
+
+
+def artifact(result_id="r1", text="A measured take on rates.", score=0.8, **extra):
+    return {
+        "result_id": result_id,
+        "artifact_type": "content",
+        "content": {"text": text, "media_urls": ["https://cdn/x.png"]},
+        "confidence_score": score,
+        "correlation_id": f"corr-{result_id}",
+        **extra,
+    }
+
+
+def escalated(result_id="r1", score=0.8):
+    return Verdict(
+        result_id,
+        ESCALATE,
+        "low_confidence",
+        score,
+        f"Confidence {score:.2f} below auto_approve_threshold 0.90",
+        correlation_id=f"corr-{result_id}",
+    )
+
+
+def fill(queue, priorities, clock=None):
+    ids = []
+    for i, priority in enumerate(priorities):
+        if clock is not None:
+            clock.now += 1
+        summary = queue.escalate(
+            artifact(f"r{i}"),
+            escalated(f"r{i}"),
+            ReviewContext("camp-1", priority=priority),
+        )
+        ids.append(summary.review_id)
+    return ids
+
+
+class TestOrdering:
+    """Test SLA/priority ordering and cursor pagination per §7.5"""
+
+    def test_most_urgent_sla_first(self):
+        clock = FakeClock()
+        queue = HITLQueue(clock=clock)
+        low, high, medium = fill(queue, ["low", "high", "medium"], clock)
+        assert [s.review_id for s in queue.page().items] == [high, medium, low]
+        assert queue.get(high).urgent and not queue.get(medium).urgent
+
+    def test_equal_deadlines_break_by_priority_then_arrival(self):
+        queue = HITLQueue(slas={"high": 60, "medium": 60}, clock=FakeClock())
+        first, second, high = fill(queue, ["medium", "medium", "high"])
+        assert [s.review_id for s in queue.page().items] == [high, first, second]
+
+    def test_cursor_pages_are_stable_under_concurrent_changes(self):
+        clock = FakeClock()
+        queue = HITLQueue(clock=clock)
+        ids = fill(queue, ["medium"] * 10, clock)
+        page = queue.page(limit=4)
+        assert [s.review_id for s in page.items] == ids[:4]
+        queue.resolve(ReviewDecision(ids[0], "ana", "reject"))  # already seen
+        queue.resolve(ReviewDecision(ids[5], "ana", "reject"))  # not yet seen
+        page = queue.page(page.next_cursor, limit=4)
+        assert [s.review_id for s in page.items] == [ids[4], ids[6], ids[7], ids[8]]
+        last = queue.page(page.next_cursor, limit=4)
+        assert [s.review_id for s in last.items] == [ids[9]]
+        assert last.next_cursor is None
+
+    def test_filters_and_bad_cursor(self):
+        queue = HITLQueue(clock=FakeClock())
+        _, high, _ = fill(queue, ["low", "high", "low"])
+        assert [s.review_id for s in queue.page(priority="high").items] == [high]
+        assert queue.page(campaign_id="other").items == ()
+        with pytest.raises(HITLError, match="Invalid cursor"):
+            queue.page("not-a-cursor")
+
+
+class TestLazyDetail:
+    """Test the §7.1 queue item contract, assembled on open"""
+
+    async def test_context_is_loaded_once_on_open(self):
+        calls = []
+
+        async def load(summary, context):
+            calls.append(summary.review_id)
+            await asyncio.sleep(0)
+            return {
+                "persona_name": "Tech Analyst",
+                "persona_voice_traits": ["concise"],
+                "recent_history": ["earlier post"],
+            }
+
+        queue = HITLQueue(context_loader=load)
+        review_id = queue.escalate(
+            artifact(text="x" * 500),
+            escalated(),
+            ReviewContext(
+                "camp-1",
+                persona=PersonaRules("tech-analyst"),
+                goal_description="Explain rate moves",
+            ),
+        ).review_id
+        summary = queue.get(review_id)
+        assert len(summary.preview) == 280 and summary.media_count == 1
+        assert calls == []  # listing never loads context
+
+        details = await asyncio.gather(*(queue.open(review_id) for _ in range(3)))
+        assert calls == [review_id] and queue.stats.details_loaded == 1
+        assert await queue.open(review_id) == details[0]
+        assert calls == [review_id]
+        message = details[0].to_dict()
+        assert message["context_snapshot"] == {
+            "campaign_goal": "Explain rate moves",
+            "persona_id": "tech-analyst",
+            "persona_name": "Tech Analyst",
+            "persona_voice_traits": ["concise"],
+            "recent_history": ["earlier post"],
+        }
+        assert message["content_preview"]["text"] == "x" * 500
+        assert message["reasoning_trace"].startswith("Confidence 0.80")
+        assert message["correlation_id"] == "corr-r1"
+
+    async def test_failed_load_is_retried(self):
+        attempts = []
+
+        async def load(summary, context):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("memory store down")
+            return {"recent_history": []}
+
+        queue = HITLQueue(context_loader=load)
+        review_id = fill(queue, ["medium"])[0]
+        with pytest.raises(ConnectionError):
+            await queue.open(review_id)
+        assert (await queue.open(review_id)).context_snapshot["recent_history"] == []
+
+    def test_only_valid_escalations_are_queued(self):
+        queue = HITLQueue()
+        approved = Verdict("r1", APPROVE, None, 0.95, "ok")
+        with pytest.raises(HITLError, match="Only escalated"):
+            queue.escalate(artifact(), approved, ReviewContext("camp-1"))
+        blank = Verdict("r1", ESCALATE, "low_confidence", 0.8, "")
+        with pytest.raises(HITLError, match="reasoning_trace"):
+            queue.escalate(artifact(), blank, ReviewContext("camp-1"))
+
+
+class TestChangeFeed:
+    """Test incremental dashboard polling"""
+
+    def test_deltas_since_cursor(self):
+        queue = HITLQueue(clock=FakeClock())
+        feed = queue.changes()
+        a, b = fill(queue, ["medium", "high"])
+        feed = queue.changes(feed.cursor)
+        assert [(c.kind, c.review_id) for c in feed.changes] == [
+            ("added", a),
+            ("added", b),
+        ]
+        queue.resolve(ReviewDecision(a, "ana", "defer"))
+        queue.resolve(ReviewDecision(b, "ana", "reject", rejection_reason="off"))
+        feed = queue.changes(feed.cursor)
+        assert [(c.kind, c.review_id) for c in feed.changes] == [
+            ("updated", a),
+            ("removed", b),
+        ]
+        assert feed.changes[0].item.status == "deferred"
+        assert queue.changes(feed.cursor).changes == ()
+
+    def test_limit_and_reset_after_truncation(self):
+        queue = HITLQueue(max_changes=3, clock=FakeClock())
+        fill(queue, ["low"] * 5)
+        assert queue.changes(0).reset
+        feed = queue.changes(2, limit=2)
+        assert [c.seq for c in feed.changes] == [3, 4] and feed.cursor == 4
+        assert not feed.reset
+
+
+class TestReviewerActions:
+    """Test §7.2 reviewer actions committed through the Judge (§6.7)"""
+
+    def setup_judge(self, **kwargs):
+        state = GlobalState({campaign_key("camp-1"): {"status": "active"}})
+        queue = HITLQueue(**kwargs)
+        judge = Judge(policies=[NO_FIRST_POSTS], state=state, hitl=queue)
+        return state, queue, judge
+
+    def test_judge_escalations_land_in_queue(self):
+        state, queue, judge = self.setup_judge()
+        verdict = judge.review(artifact(), ReviewContext("camp-1", priority="high"))
+        assert verdict.outcome == ESCALATE
+        (summary,) = queue.page().items
+        assert (summary.result_id, summary.priority) == ("r1", "high")
+        assert result_key("r1") not in state
+
+    def test_approval_is_committed_by_judge(self):
+        state, queue, judge = self.setup_judge()
+        judge.review(artifact(), ReviewContext("camp-1"))
+        review_id = queue.page().items[0].review_id
+        outcome = queue.resolve(ReviewDecision(review_id, "ana", "approve"))
+        assert (outcome.status, outcome.verdict.outcome) == ("approved", APPROVE)
+        record = state.read(result_key("r1"))
+        assert record.committed_by == "judge"
+        assert record.value["approval_type"] == "hitl"
+        assert record.value["approver_id"] == "ana"
+        assert review_id not in queue
+
+    def test_edit_commits_edited_content(self):
+        state, queue, judge = self.setup_judge()
+        judge.review(artifact(), ReviewContext("camp-1"))
+        review_id = queue.page().items[0].review_id
+        edited = {"text": "A measured take on interest rates.", "media_urls": []}
+        outcome = queue.resolve(
+            ReviewDecision(review_id, "ana", "approve_with_edit", edited)
+        )
+        assert outcome.status == "edited"
+        assert state.read(result_key("r1")).value["content"] == edited
+
+    def test_stale_approval_is_returned_to_planner(self):
+        state, queue, judge = self.setup_judge()
+        stale = {campaign_key("camp-1"): 0}
+        judge.review(artifact(state_version=stale), ReviewContext("camp-1"))
+        review_id = queue.page().items[0].review_id
+        outcome = queue.resolve(ReviewDecision(review_id, "ana", "approve"))
+        assert outcome.status == "rejected"
+        assert (outcome.verdict.outcome, outcome.verdict.reason) == (
+            REJECT,
+            "state_conflict",
+        )
+        assert result_key("r1") not in state
+
+    def test_decision_validation(self):
+        queue = HITLQueue()
+        with pytest.raises(HITLError, match="edited_content"):
+            ReviewDecision("x", "ana", "approve_with_edit")
+        with pytest.raises(HITLError, match="Unknown reviewer action"):
+            ReviewDecision("x", "ana", "publish")
+        with pytest.raises(HITLError, match="No pending review"):
+            queue.resolve(ReviewDecision("x", "ana", "approve"))
+
+    async def test_actions_and_sla_breaches_are_audited(self, tmp_path):
+        clock = FakeClock()
+        async with AuditEmitter(SegmentWriter(tmp_path)) as audit:
+            queue = HITLQueue(audit=audit, clock=clock, slas={"high": 60})
+            urgent, later = fill(queue, ["high", "low"])
+            clock.now += 61
+            assert [s.review_id for s in queue.check_sla()] == [urgent]
+            assert queue.check_sla() == []  # flagged once
+            assert queue.get(urgent).sla_breached
+            queue.resolve(
+                ReviewDecision(
+                    urgent,
+                    "ana",
+                    "approve_with_edit",
+                    {"text": "A calmer take on rates."},
+                    reviewed_at=clock.now,
+                )
+            )
+        events = [e for _, p in list_segments(tmp_path) for _, e in read_segment(p)]
+        assert [e["event_type"] for e in events] == [
+            "hitl.sla_breached",
+            "hitl.reviewed",
+        ]
+        reviewed = events[1]
+        assert reviewed["actor"] == "ana"
+        assert reviewed["correlation_id"] == "corr-r0"
+        payload = reviewed["payload"]
+        assert payload["queue_seconds"] == 61
+        assert payload["original_content"]["text"] == "A measured take on rates."
+        assert payload["original_ref"] == text_ref("A measured take on rates.")
+        assert payload["edit"]["delta"] == [1, -1, "calmer "]
+        assert payload["edited_content"] == {}
+
+
+class TestEditDeltas:
+    """Test compact edit storage per specs/technical.md §7.3"""
+
+    ORIGINAL = (
+        "The EU AI Act takes effect in 2026. Founders should audit their models,"
+        " document training data, and budget for compliance reviews."
+    )
+
+    @pytest.mark.parametrize(
+        "edited",
+        [
+            ORIGINAL,
+            ORIGINAL.replace("2026", "August 2026"),
+            ORIGINAL.replace("Founders", "Startup founders") + " Sources: eur-lex.",
+            "Completely different text.",
+            "",
+        ],
+    )
+    def test_round_trip(self, edited):
+        delta, _ = token_delta(self.ORIGINAL, edited)
+        assert apply_delta(self.ORIGINAL, delta) == edited
+        assert "".join(tokenize(edited)) == edited
+
+    def test_delta_is_compact(self):
+        edited = self.ORIGINAL.replace("audit", "test")
+        delta, stats = token_delta(self.ORIGINAL, edited)
+        assert delta == (11, -1, "test ")
+        assert (stats.inserted, stats.deleted, stats.distance) == (1, 1, 2)
+        assert stats.ratio == pytest.approx(2 / (2 * stats.tokens_before))
+        assert token_delta(self.ORIGINAL, self.ORIGINAL)[0] == ()
+
+    def test_delta_against_wrong_original(self):
+        with pytest.raises(HITLError, match="does not match"):
+            apply_delta("short", (5, "x"))
+
+    def test_versions_share_one_original(self):
+        log = EditLog()
+        first = log.record(self.ORIGINAL, self.ORIGINAL.replace("2026", "2027"))
+        second = log.record(self.ORIGINAL, self.ORIGINAL + " #AI")
+        assert len(log.store) == 1
+        assert (first.version, second.version) == (1, 2)
+        assert log.versions(first.original_ref) == [first, second]
+        assert log.reconstruct(second) == self.ORIGINAL + " #AI"
+        assert log.original(self.ORIGINAL) == (first.original_ref, False)
+
+    def test_calibration_bands(self):
+        log = EditLog()
+        log.calibration.observe(0.86)
+        log.calibration.observe(0.85, edit_ratio=0.2)
+        log.calibration.observe(0.72, rejected=True)
+        log.calibration.observe(1.0)
+        table = log.calibration.table()
+        assert [(b.low, b.high, b.reviews) for b in table] == [
+            (0.7, 0.75, 1),
+            (0.85, 0.9, 2),
+            (0.95, 1.0, 1),
+        ]
+        assert table[1].mean_edit_ratio == pytest.approx(0.1)
+        assert table[1].acceptance_rate == 0.5
+
+    def test_queue_feeds_calibration_and_dedups_originals(self):
+        queue = HITLQueue(clock=FakeClock())
+        ids = fill(queue, ["medium"] * 3)
+        edited = {"text": "A measured take on interest rates."}
+        outcome = queue.resolve(
+            ReviewDecision(ids[0], "ana", "approve_with_edit", edited)
+        )
+        queue.resolve(ReviewDecision(ids[1], "ana", "approve"))
+        queue.resolve(ReviewDecision(ids[2], "ana", "reject"))
+        assert queue.edits.reconstruct(outcome.edit) == edited["text"]
+        assert len(queue.edits.store) == 1  # all three share the original text
+        (band,) = queue.edits.calibration.table()
+        assert (band.approved, band.edited, band.rejected) == (1, 1, 1)
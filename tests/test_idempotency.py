@@ -0,0 +1,154 @@
+"""
+Tests for the idempotency store per specs/technical.md §8.3.3.
+
+Every store test runs against the in-memory, SQLite and Redis backends
+(the latter against an in-process fake Redis server), with and without a
+Bloom filter in front.
+
+Reference: specs/technical.md §8.3.3, skills/skill_publish_content/README.md §5
+"""
+
+import fakeredis
+import pytest
+
+from chimera.idempotency import (
+    BloomFilter,
+    IdempotencyError,
+    InMemoryIdempotencyStore,
+    RedisIdempotencyStore,
+    SQLiteIdempotencyStore,
+)
+
+OUTCOME = {
+    "external_id": "1755123456789012345",
+    "external_url": "https://twitter.com/chimera_agent/status/1755123456789012345",
+}
+
+
+def make_store(kind, clock, **kwargs):
+    if kind == "memory":
+        return InMemoryIdempotencyStore(ttl=60, clock=clock, **kwargs)
+    if kind == "sqlite":
+        return SQLiteIdempotencyStore(ttl=60, clock=clock, **kwargs)
+    return RedisIdempotencyStore(
+        fakeredis.FakeAsyncRedis(), ttl=60, clock=clock, **kwargs
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, clock):
+    return make_store(request.param, clock)
+
+
+class TestIdempotencyStore:
+    """Test duplicate suppression per specs/technical.md §8.3.3"""
+
+    async def test_put_then_get_returns_outcome(self, store):
+        assert await store.get("k1") is None
+        assert await store.put("k1", OUTCOME) is True
+        record = await store.get("k1")
+        assert record.outcome == OUTCOME
+        assert record.expires_at - record.created_at == 60
+        assert store.stats.hits == 1
+        assert store.stats.misses == 1
+
+    async def test_first_writer_wins(self, store):
+        assert await store.put("k1", OUTCOME) is True
+        assert await store.put("k1", {"external_id": "other"}) is False
+        assert (await store.get("k1")).outcome == OUTCOME
+
+    @pytest.mark.parametrize("expires_at", ["tomorrow", 1])
+    async def test_outcome_fields_do_not_shadow_the_record(self, store, expires_at):
+        outcome = {"expires_at": expires_at, **OUTCOME}
+        assert await store.put("k1", outcome) is True
+        assert await store.put("k1", {"external_id": "other"}) is False
+        assert (await store.get("k1")).outcome == outcome
+
+    async def test_records_expire_after_ttl(self, store, clock):
+        await store.put("k1", OUTCOME)
+        clock.now += 61
+        assert await store.get("k1") is None
+        assert await store.put("k1", {"external_id": "second"}) is True
+        assert (await store.get("k1")).outcome == {"external_id": "second"}
+
+    async def test_delete_forgets_key(self, store):
+        await store.put("k1", OUTCOME)
+        assert await store.delete("k1") is True
+        assert await store.get("k1") is None
+        assert await store.delete("k1") is False
+
+    async def test_purge_removes_expired_records(self, store, clock):
+        await store.put("old", OUTCOME)
+        clock.now += 30
+        await store.put("new", OUTCOME)
+        clock.now += 40
+        purged = await store.purge_expired()
+        if isinstance(store, RedisIdempotencyStore):
+            assert purged == 0  # Redis expires keys itself
+        else:
+            assert purged == 1
+            assert await store.size() == 1
+        assert (await store.get("new")).outcome == OUTCOME
+
+
+class TestBloomFront:
+    """Test the Bloom filter negative cache in front of the store"""
+
+    @pytest.mark.parametrize("kind", ["memory", "sqlite", "redis"])
+    async def test_unseen_keys_skip_the_store(self, kind, clock):
+        store = make_store(kind, clock, bloom=BloomFilter(capacity=100))
+        await store.put("k1", OUTCOME)
+        for i in range(50):
+            assert await store.get(f"never-{i}") is None
+        assert store.stats.bloom_skips >= 48
+        assert (await store.get("k1")).outcome == OUTCOME
+
+    async def test_warm_loads_existing_keys(self, tmp_path, clock):
+        path = tmp_path / "idempotency.db"
+        first = SQLiteIdempotencyStore(path, ttl=60, clock=clock)
+        await first.put("k1", OUTCOME)
+        first.close()
+
+        store = SQLiteIdempotencyStore(
+            path, ttl=60, clock=clock, bloom=BloomFilter(capacity=100)
+        )
+        assert await store.warm() == 1
+        assert (await store.get("k1")).outcome == OUTCOME
+
+    async def test_saturated_filter_is_rebuilt_from_live_keys(self, clock):
+        store = InMemoryIdempotencyStore(
+            ttl=60, clock=clock, bloom=BloomFilter(capacity=8)
+        )
+        for i in range(7):
+            await store.put(f"old-{i}", OUTCOME)
+        clock.now += 61
+        await store.put("live", OUTCOME)
+        assert store.bloom.count == 1
+        assert "live" in store.bloom
+        assert await store.get("live") is not None
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(f"key-{i}" for i in range(1000))
+        assert all(f"key-{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+
+
+class TestBoundedMemory:
+    """Test the in-memory backend's entry bound"""
+
+    async def test_oldest_records_are_evicted(self, clock):
+        store = InMemoryIdempotencyStore(ttl=60, max_entries=3, clock=clock)
+        for i in range(5):
+            await store.put(f"k{i}", OUTCOME)
+        assert await store.size() == 3
+        assert store.stats.evicted == 2
+        assert await store.get("k0") is None
+        assert await store.get("k4") is not None
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(IdempotencyError):
+            InMemoryIdempotencyStore(ttl=0)
+        with pytest.raises(IdempotencyError):
+            SQLiteIdempotencyStore(synchronous="SOMETIMES")
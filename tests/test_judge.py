@@ -0,0 +1,294 @@
+"""
+Tests for the Judge engine per specs/technical.md §6.
+
+Reference: specs/technical.md §6.1–6.5, §3.13.2, §11.1
+"""
+
+import asyncio
+import random
+import re
+
+import pytest
+
+from chimera.audit import AuditEmitter, SegmentWriter, list_segments, read_segment
+from chimera.judge import (
+    APPROVE,
+    ESCALATE,
+    REJECT,
+    CampaignPolicy,
+    Judge,
+    JudgeError,
+    KeywordMatcher,
+    PersonaRules,
+    ReviewContext,
+)
+from chimera.state import GlobalState, campaign_key, result_key
+
+NO_FIRST_POSTS = CampaignPolicy("camp-1", first_posts_hitl_count=0)
+CONTEXT = ReviewContext("camp-1")
+
+
+def artifact(text="A calm note on open source tooling.", score=0.95, **extra):
+    return {
+        "result_id": extra.pop("result_id", "r1"),
+        "artifact_type": extra.pop("artifact_type", "content"),
+        "content": {"text": text, "media_urls": [], **extra.pop("content", {})},
+        "confidence_score": score,
+        "correlation_id": "corr-1",
+        **extra,
+    }
+
+
+@pytest.fixture
+def judge():
+    return Judge(policies=[NO_FIRST_POSTS])
+
+
+class TestKeywordMatcher:
+    """Test single-pass keyword detection per specs/technical.md §6.4"""
+
+    def test_overlapping_keywords_on_word_boundaries(self):
+        matcher = KeywordMatcher({"a": ["he", "she", "hers"], "b": ["vote now"]})
+        found = [(m.keyword, m.start) for m in matcher.find("She said: VOTE NOW, hers")]
+        assert found == [("she", 0), ("vote now", 10), ("hers", 20)]
+        assert matcher.categories("devoted ushers") == frozenset()
+
+    def test_agrees_with_regex_reference(self):
+        rng = random.Random(7)
+        words = ["ab", "abc", "bc", "c", "cab", "b a"]
+        matcher = KeywordMatcher({"x": words})
+        for _ in range(300):
+            text = " ".join(
+                rng.choice(["ab", "abc", "c", "b", "a", "cab", "x"])
+                for _ in range(rng.randint(1, 8))
+            )
+            expected = sorted(
+                (m.start(), word)
+                for word in words
+                for m in re.finditer(rf"(?<!\w)(?={re.escape(word)}(?!\w))", text)
+            )
+            assert sorted((m.start, m.keyword) for m in matcher.find(text)) == expected
+
+    def test_find_many_matches_find_per_text(self):
+        matcher = KeywordMatcher({"a": ["vote", "vote now", "cure"]})
+        texts = ["Vote", "", "now vote now", "cure\x00vote", "devoted", "VOTE NOW"]
+        assert matcher.find_many(texts) == [matcher.find(text) for text in texts]
+
+
+class TestConfidenceRouting:
+    """Test routing thresholds per specs/technical.md §6.3"""
+
+    @pytest.mark.parametrize(
+        ("score", "outcome", "reason"),
+        [
+            (0.95, APPROVE, None),
+            (0.90, APPROVE, None),
+            (0.80, ESCALATE, "low_confidence"),
+            (0.50, REJECT, "low_confidence"),
+        ],
+    )
+    def test_default_thresholds(self, judge, score, outcome, reason):
+        verdict = judge.review(artifact(score=score), CONTEXT)
+        assert (verdict.outcome, verdict.reason) == (outcome, reason)
+        assert verdict.reasoning_trace
+
+    def test_thresholds_are_configurable_per_campaign(self):
+        judge = Judge(
+            policies=[
+                CampaignPolicy(
+                    "strict", auto_approve_threshold=0.99, first_posts_hitl_count=0
+                )
+            ]
+        )
+        assert judge.review(artifact(score=0.95), ReviewContext("strict")).outcome == (
+            ESCALATE
+        )
+
+    def test_invalid_confidence_is_rejected(self, judge):
+        for score in (1.5, -0.1, None, True):
+            verdict = judge.review(artifact(score=score), CONTEXT)
+            assert (verdict.outcome, verdict.reason) == (REJECT, "invalid_artifact")
+
+    def test_rejects_inconsistent_thresholds(self):
+        with pytest.raises(JudgeError):
+            CampaignPolicy(auto_approve_threshold=0.6, review_threshold=0.7)
+
+
+class TestSensitiveTopicOverride:
+    """Test sensitive-topic escalation per specs/technical.md §6.4"""
+
+    @pytest.mark.parametrize(
+        ("text", "topic"),
+        [
+            ("Remember to vote on Tuesday", "political"),
+            ("This supplement is a cure for stress", "health"),
+            ("Guaranteed returns on this token sale", "financial"),
+            ("We will sue anyone who copies this", "legal"),
+            ("Fun ideas for kids this summer", "minors"),
+            ("Stay safe during the hurricane", "crisis"),
+        ],
+    )
+    def test_escalates_regardless_of_confidence(self, judge, text, topic):
+        for score in (0.99, 0.1):
+            verdict = judge.review(artifact(text, score=score), CONTEXT)
+            assert (verdict.outcome, verdict.reason) == (ESCALATE, "sensitive_topic")
+            assert topic in verdict.sensitive_topics
+
+    def test_campaign_keywords_extend_defaults(self):
+        policy = CampaignPolicy(
+            "camp-2",
+            sensitive_keywords={"financial": ("airdrop",)},
+            first_posts_hitl_count=0,
+        )
+        judge = Judge(policies=[policy])
+        verdict = judge.review(artifact("Claim the airdrop"), ReviewContext("camp-2"))
+        assert verdict.sensitive_topics == ("financial",)
+
+
+class TestValidationFailures:
+    """Test rejection on validation failure per specs/technical.md §6.1, §6.8"""
+
+    def test_blocked_keyword_is_a_safety_violation(self):
+        policy = CampaignPolicy("camp-1", blocked_keywords=("slur",))
+        verdict = Judge(policies=[policy]).review(artifact("a slur here"), CONTEXT)
+        assert (verdict.outcome, verdict.reason) == (REJECT, "safety_violation")
+
+    def test_persona_directives(self, judge):
+        persona = PersonaRules(
+            "p1",
+            forbidden_patterns=(r"\bto the moon\b", r"!!+"),
+            required_patterns=(r"#\w+",),
+        )
+        context = ReviewContext("camp-1", persona)
+        verdict = judge.review(artifact("Going to the moon!!"), context)
+        assert (verdict.outcome, verdict.reason) == (REJECT, "persona_violation")
+        assert len(verdict.violations) == 3
+        assert judge.review(artifact("Steady gains #oss"), context).outcome == APPROVE
+
+    def test_invalid_persona_pattern_raises(self, judge):
+        with pytest.raises(JudgeError):
+            judge.register_persona(PersonaRules("p1", forbidden_patterns=("(",)))
+
+    def test_acceptance_criteria(self, judge):
+        context = ReviewContext(
+            "camp-1",
+            acceptance_criteria=(
+                "max_length:20",
+                "must_include:#oss",
+                "media_required",
+                "Tone should be upbeat",  # free text: left to HITL
+            ),
+        )
+        verdict = judge.review(artifact("A long post without the tag"), context)
+        assert (verdict.outcome, verdict.reason) == (REJECT, "criteria_violation")
+        assert len(verdict.violations) == 3
+        ok = artifact("Ship it #oss", content={"media_urls": ["https://x/1.png"]})
+        assert judge.review(ok, context).outcome == APPROVE
+
+
+class TestMandatoryHITL:
+    """Test mandatory HITL scenarios per specs/technical.md §6.5"""
+
+    def test_first_posts_of_campaign(self):
+        judge = Judge(policies=[CampaignPolicy("camp-1", first_posts_hitl_count=2)])
+        outcomes = [judge.review(artifact(), CONTEXT) for _ in range(3)]
+        assert [v.outcome for v in outcomes] == [ESCALATE, ESCALATE, APPROVE]
+        assert outcomes[0].reason == "mandatory_hitl"
+
+    def test_transactions_above_limit(self, judge):
+        def transaction(amount):
+            return artifact(
+                "",
+                artifact_type="transaction",
+                content={"transaction_details": {"amount_usd": amount}},
+            )
+
+        assert judge.review(transaction(25.0), CONTEXT).reason == "mandatory_hitl"
+        assert judge.review(transaction(5.0), CONTEXT).outcome == APPROVE
+
+    @pytest.mark.parametrize("amount", ["lots", None, float("nan"), "inf"])
+    def test_unparseable_amount_escalates(self, judge, amount):
+        verdict = judge.review(
+            artifact(
+                "",
+                artifact_type="transaction",
+                content={"transaction_details": {"amount_usd": amount}},
+            ),
+            CONTEXT,
+        )
+        assert (verdict.outcome, verdict.reason) == (ESCALATE, "mandatory_hitl")
+
+
+class TestMicroBatching:
+    """Test batched submission from concurrent Workers"""
+
+    async def test_concurrent_submissions_share_batches(self):
+        async with Judge(policies=[NO_FIRST_POSTS], batch_size=32) as judge:
+            verdicts = await asyncio.gather(
+                *(
+                    judge.submit(artifact(result_id=f"r{i}", score=i / 100), CONTEXT)
+                    for i in range(100)
+                )
+            )
+        assert [v.result_id for v in verdicts] == [f"r{i}" for i in range(100)]
+        assert judge.stats.batches == 4
+        assert judge.stats.approved == 10  # scores 0.90–0.99
+        assert judge.stats.escalated == 20
+        assert judge.stats.rejected == 70
+
+    def test_batch_verdicts_match_single_reviews(self):
+        policies = [
+            CampaignPolicy("camp-1", first_posts_hitl_count=1),
+            CampaignPolicy("camp-2", first_posts_hitl_count=0),
+        ]
+        items = [
+            (artifact(text, result_id=f"r{i}"), ReviewContext(campaign))
+            for i, (text, campaign) in enumerate(
+                [
+                    ("A calm note.", "camp-1"),
+                    ("Vote now!", "camp-2"),
+                    ("A calm note.", "camp-1"),
+                    ("A miracle cure", "camp-1"),
+                    ("Nothing to see", "camp-2"),
+                ]
+            )
+        ]
+        single = Judge(policies=policies)
+        expected = [single.review(a, c) for a, c in items]
+        assert Judge(policies=policies).review_batch(items) == expected
+
+    async def test_verdicts_are_audited(self, tmp_path):
+        async with AuditEmitter(SegmentWriter(tmp_path)) as audit:
+            async with Judge(policies=[NO_FIRST_POSTS], audit=audit) as judge:
+                await judge.submit(artifact(), CONTEXT)
+                await judge.submit(artifact("vote!", result_id="r2"), CONTEXT)
+        events = [e for _, p in list_segments(tmp_path) for _, e in read_segment(p)]
+        assert [e["event_type"] for e in events] == [
+            "result.approved",
+            "result.escalated",
+        ]
+        assert events[1]["payload"]["sensitive_topics"] == ["political"]
+        assert {e["correlation_id"] for e in events} == {"corr-1"}
+
+
+class TestStateCommits:
+    """Test Judge-only OCC commits per specs/technical.md §6.6, §6.7"""
+
+    def test_approved_results_are_committed(self):
+        state = GlobalState({campaign_key("camp-1"): {"status": "active"}})
+        judge = Judge(policies=[NO_FIRST_POSTS], state=state)
+        seen = state.versions([campaign_key("camp-1")])
+        judge.review(artifact(state_version=seen), CONTEXT)
+        judge.review(artifact("vote!", result_id="r2", state_version=seen), CONTEXT)
+        assert result_key("r1") in state
+        assert result_key("r2") not in state  # escalated, not committed
+        assert state.read(result_key("r1")).committed_by == "judge"
+
+    def test_stale_state_version_is_rejected(self):
+        state = GlobalState({campaign_key("camp-1"): {"status": "active"}})
+        judge = Judge(policies=[NO_FIRST_POSTS], state=state)
+        stale = {campaign_key("camp-1"): 0}
+        verdict = judge.review(artifact(state_version=stale), CONTEXT)
+        assert (verdict.outcome, verdict.reason) == (REJECT, "state_conflict")
+        assert judge.stats.rejected == 1
+        assert result_key("r1") not in state
@@ -0,0 +1,278 @@
+"""
+Tests for the pooled MCP client per specs/technical.md §2.2 and §8.
+
+Sessions are in-process fakes, so these tests cover pooling, routing and
+recovery rather than any particular transport.
+
+Reference: specs/technical.md §2.2, §8
+"""
+
+import asyncio
+import contextlib
+import json
+
+import pytest
+
+from chimera.mcp import (
+    ClientPool,
+    MCPConnectionError,
+    MCPPoolTimeout,
+    MCPRoutingError,
+    MCPToolError,
+    SdkSession,
+    ServerConfig,
+)
+
+
+class FakeSession:
+    def __init__(self, server):
+        self.server = server
+        self.in_flight = 0
+        self.peak = 0
+        self.closed = False
+        self.fail_ping = False
+        self.ping_delay = 0.0
+        self.fail_calls = False
+
+    async def call_tool(self, name, arguments):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(arguments.get("delay", 0.01))
+            if self.fail_calls:
+                raise MCPConnectionError("transport closed")
+            if name == "boom":
+                raise ValueError("tool error")
+            return {"server": self.server.name, "tool": name, "args": arguments}
+        finally:
+            self.in_flight -= 1
+
+    async def read_resource(self, uri):
+        await asyncio.sleep(0.01)
+        if uri.endswith("/missing"):
+            raise LookupError(uri)
+        return {"server": self.server.name, "uri": uri}
+
+    async def ping(self):
+        await asyncio.sleep(self.ping_delay)
+        if self.fail_ping:
+            raise MCPConnectionError("no pong")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeServer:
+    """Counts handshakes; each handshake yields a new :class:`FakeSession`."""
+
+    def __init__(self, name):
+        self.name = name
+        self.handshakes = 0
+        self.sessions = []
+
+    async def __call__(self):
+        self.handshakes += 1
+        await asyncio.sleep(0.005)
+        session = FakeSession(self)
+        self.sessions.append(session)
+        return session
+
+
+def config(server, **overrides):
+    return ServerConfig(name=server.name, factory=server, **overrides)
+
+
+class TestSessionReuse:
+    """Test session pooling per specs/technical.md §2.2"""
+
+    async def test_many_calls_share_few_sessions(self):
+        news = FakeServer("news")
+        async with ClientPool([config(news, max_in_flight_per_session=50)]) as mcp:
+            results = await mcp.gather_tools(
+                ("search", {"q": str(i)}) for i in range(100)
+            )
+        assert [r["args"]["q"] for r in results] == [str(i) for i in range(100)]
+        assert news.handshakes == 2
+        assert all(s.peak <= 50 for s in news.sessions)
+        assert all(s.closed for s in news.sessions)
+
+    async def test_sessions_capped_at_max(self):
+        news = FakeServer("news")
+        cfg = config(news, max_sessions=2, max_in_flight_per_session=3)
+        async with ClientPool([cfg]) as mcp:
+            await mcp.gather_tools(("search", {"delay": 0.02}) for _ in range(20))
+            assert mcp.sessions("news") == 2
+        assert news.handshakes == 2
+        assert max(s.peak for s in news.sessions) == 3
+
+    async def test_acquire_timeout_when_saturated(self):
+        news = FakeServer("news")
+        cfg = config(
+            news, max_sessions=1, max_in_flight_per_session=1, acquire_timeout=0.02
+        )
+        async with ClientPool([cfg]) as mcp:
+            slow = asyncio.create_task(mcp.call_tool("search", {"delay": 0.2}))
+            await asyncio.sleep(0.01)
+            with pytest.raises(MCPPoolTimeout) as excinfo:
+                await mcp.call_tool("search", {})
+            assert excinfo.value.retryable
+            await slow
+
+
+class TestRouting:
+    """Test tool and resource routing per specs/technical.md §8"""
+
+    async def test_routes_by_tool_and_scheme(self):
+        news, twitter = FakeServer("news"), FakeServer("twitter")
+        servers = [
+            config(news, tools=frozenset({"search"}), resource_schemes={"news"}),
+            config(twitter, tools=frozenset({"post"}), resource_schemes={"twitter"}),
+        ]
+        async with ClientPool(servers) as mcp:
+            assert (await mcp.call_tool("post", {}))["server"] == "twitter"
+            results = await mcp.gather_resources(
+                ["news://ai/latest", "twitter://trends/ai", "news://ai/missing"]
+            )
+            with pytest.raises(MCPRoutingError):
+                await mcp.call_tool("unknown_tool", {})
+        assert [r["server"] for r in results[:2]] == ["news", "twitter"]
+        assert isinstance(results[2], LookupError)
+
+    async def test_single_server_is_default_route(self):
+        news = FakeServer("news")
+        async with ClientPool([config(news)]) as mcp:
+            result = await mcp.call_tool("anything", {})
+        assert result["server"] == "news"
+
+
+class TestRecovery:
+    """Test broken-session replacement and health checks"""
+
+    async def test_broken_session_is_replaced(self):
+        news = FakeServer("news")
+        async with ClientPool([config(news)]) as mcp:
+            news.sessions[0].fail_calls = True
+            with pytest.raises(MCPConnectionError):
+                await mcp.call_tool("search", {})
+            assert mcp.sessions("news") == 0
+            await mcp.call_tool("search", {})
+            assert mcp.stats()["news"].failures == 1
+        assert news.handshakes == 2
+        assert news.sessions[0].closed
+
+    async def test_tool_error_keeps_session(self):
+        news = FakeServer("news")
+        async with ClientPool([config(news)]) as mcp:
+            with pytest.raises(ValueError):
+                await mcp.call_tool("boom", {})
+            assert mcp.sessions("news") == 1
+        assert news.handshakes == 1
+
+    async def test_health_check_retires_dead_session(self):
+        news = FakeServer("news")
+        cfg = config(news, min_sessions=1)
+        async with ClientPool([cfg], health_check_interval=0.02) as mcp:
+            news.sessions[0].fail_ping = True
+            await asyncio.sleep(0.1)
+            assert mcp.stats()["news"].health_check_failures == 1
+            assert mcp.sessions("news") == 1
+        assert news.handshakes == 2
+        assert news.sessions[0].closed
+
+    async def test_session_handed_out_during_failed_ping_is_kept(self):
+        news = FakeServer("news")
+        cfg = config(news, min_sessions=1)
+        async with ClientPool([cfg], health_check_interval=0.05) as mcp:
+            news.sessions[0].fail_ping = True
+            news.sessions[0].ping_delay = 0.1
+            await asyncio.sleep(0.08)  # the ping is in progress
+            result = await mcp.call_tool("search", {"delay": 0.15})
+            assert result["tool"] == "search"
+            assert mcp.stats()["news"].health_check_failures == 1
+            assert news.handshakes == 1 and not news.sessions[0].closed
+
+    async def test_call_failing_after_close_does_not_crash_the_pool(self):
+        news = FakeServer("news")
+        mcp = ClientPool([config(news)])
+        await mcp.start()
+        call = asyncio.create_task(mcp.call_tool("search", {"delay": 0.05}))
+        await asyncio.sleep(0.01)
+        news.sessions[0].fail_calls = True
+        await mcp.close()
+        with pytest.raises(MCPConnectionError):
+            await call
+        assert mcp.stats()["news"].sessions_closed == 1
+
+
+class FakeClientSession:
+    """``mcp.ClientSession`` stand-in returning real SDK result types."""
+
+    def __init__(self, read, write):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def initialize(self):
+        pass
+
+    async def call_tool(self, name, arguments):
+        from mcp.types import CallToolResult, TextContent
+
+        if name == "publish":
+            return CallToolResult(
+                content=[TextContent(type="text", text="ok")],
+                structuredContent={"status": "success", "external_id": "x1"},
+            )
+        if name == "embed_texts":
+            body = json.dumps({"embeddings": [[0.1, 0.2]]})
+            return CallToolResult(content=[TextContent(type="text", text=body)])
+        return CallToolResult(
+            content=[TextContent(type="text", text="platform rejected post")],
+            isError=True,
+        )
+
+    async def read_resource(self, uri):
+        from mcp.types import ReadResourceResult, TextResourceContents
+
+        return ReadResourceResult(
+            contents=[
+                TextResourceContents(
+                    uri=uri,
+                    mimeType="application/json",
+                    text=json.dumps({"memories": [{"memory_id": "m1"}]}),
+                )
+            ]
+        )
+
+
+class TestSdkSession:
+    """Test that SDK results are unwrapped to domain dicts per specs/technical.md §8"""
+
+    @pytest.fixture
+    async def session(self, monkeypatch):
+        mcp = pytest.importorskip("mcp")
+        monkeypatch.setattr(mcp, "ClientSession", FakeClientSession)
+
+        @contextlib.asynccontextmanager
+        async def transport():
+            yield None, None
+
+        session = await SdkSession.open(transport)
+        yield session
+        await session.close()
+
+    async def test_structured_and_json_text_content(self, session):
+        published = await session.call_tool("publish", {"text_content": "hi"})
+        assert published == {"status": "success", "external_id": "x1"}
+        embedded = await session.call_tool("embed_texts", {"texts": ["a"]})
+        assert embedded == {"embeddings": [[0.1, 0.2]]}
+        found = await session.read_resource("memory://search?q=ai")
+        assert found == {"memories": [{"memory_id": "m1"}]}
+
+    async def test_tool_error_raises(self, session):
+        with pytest.raises(MCPToolError, match="platform rejected post"):
+            await session.call_tool("reject", {})
@@ -0,0 +1,246 @@
+"""
+Tests for tiered agent memory per specs/technical.md §3.9.
+
+Reference: specs/technical.md §3.9, §4.6, §8.2.5
+"""
+
+import json
+import urllib.parse
+
+import numpy as np
+import pytest
+
+from chimera.mcp import MCPConnectionError
+from chimera.memory import (
+    AgentMemoryError,
+    IVFIndex,
+    LongTermMemory,
+    MemoryIsolationError,
+    TieredMemory,
+    normalise,
+)
+from tests.conftest import FakeClock
+
+DIM = 16
+
+
+def clustered(count, dim=DIM, clusters=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    points = centres[rng.integers(clusters, size=count)] + rng.normal(
+        scale=0.3, size=(count, dim)
+    )
+    return points.astype(np.float32)
+
+
+class FakeMemoryServer:
+    """Vector store behind ``memory://search``: exact search per agent."""
+
+    def __init__(self, memories=()):
+        self.memories = list(memories)
+        self.reads = []
+        self.writes = []
+        self.fail = False
+        self.leak = None
+        self.envelope = False  # answer as a ReadResourceResult dump
+
+    def embed(self, text):
+        return np.asarray([float(x) for x in text.split(",")], dtype=np.float32)
+
+    async def read_resource(self, resource_uri):
+        if self.fail:
+            raise MCPConnectionError("vector store down")
+        query = dict(urllib.parse.parse_qsl(resource_uri.split("?", 1)[1]))
+        self.reads.append(query)
+        own = [m for m in self.memories if m.agent_id == query["agent_id"]]
+        vector = normalise(self.embed(query["q"]))
+        own.sort(key=lambda m: -float(m.embedding @ vector))
+        found = own[: int(query["k"])] + ([self.leak] if self.leak else [])
+        payload = {"memories": [m.to_dict() for m in found]}
+        if self.envelope:
+            return {"contents": [{"uri": resource_uri, "text": json.dumps(payload)}]}
+        return payload
+
+    async def call_tool(self, tool_name, params):
+        self.writes.append((tool_name, params))
+        return {"memory_id": params["memory_id"]}
+
+
+def memory(agent_id, vector, importance=0.5, memory_id=None):
+    kwargs = {"memory_id": memory_id} if memory_id else {}
+    return LongTermMemory(
+        agent_id, f"note {memory_id}", vector, importance_score=importance, **kwargs
+    )
+
+
+def as_query(vector):
+    return ",".join(str(float(x)) for x in vector)
+
+
+class TestIVFIndex:
+    """Test the in-process ANN index"""
+
+    def test_exact_below_train_threshold(self):
+        points = clustered(500)
+        index = IVFIndex(DIM)
+        for n, point in enumerate(points):
+            index.add(f"m{n}", point)
+        assert not index.trained
+        unit = points / np.linalg.norm(points, axis=1, keepdims=True)
+        expected = np.argsort(-(unit @ normalise(points[7])))[:5]
+        assert [key for key, _ in index.search(points[7], 5)] == [
+            f"m{n}" for n in expected
+        ]
+
+    def test_trained_recall(self):
+        points = clustered(6_000, clusters=64)
+        index = IVFIndex(DIM, train_threshold=2_048, nprobe=8)
+        for n, point in enumerate(points):
+            index.add(f"m{n}", point)
+        assert index.trained and index.nlist >= 45
+        unit = points / np.linalg.norm(points, axis=1, keepdims=True)
+        recalls = []
+        for q in range(0, 6_000, 60):
+            truth = {f"m{n}" for n in np.argsort(-(unit @ unit[q]))[:10]}
+            found = {key for key, _ in index.search(points[q], 10)}
+            recalls.append(len(truth & found) / 10)
+        assert np.mean(recalls) >= 0.9
+
+    def test_remove_replace_and_slot_reuse(self):
+        points = clustered(3_000)
+        index = IVFIndex(DIM, train_threshold=1_000)
+        for n, point in enumerate(points):
+            index.add(f"m{n}", point)
+        assert index.remove("m5") and not index.remove("m5")
+        assert "m5" not in {key for key, _ in index.search(points[5], 50)}
+        index.add("m6", points[9])  # replace in place
+        index.add("new", points[5])
+        assert len(index) == 3_000
+        assert index.search(points[5], 1)[0][0] == "new"
+        np.testing.assert_allclose(index.vector("m6"), normalise(points[9]))
+
+
+class TestTieredRetrieval:
+    """Test the semantic hot tier in front of memory://search"""
+
+    async def test_similar_queries_skip_the_round_trip(self):
+        points = clustered(200)
+        server = FakeMemoryServer(
+            memory("a1", p, memory_id=f"m{n}") for n, p in enumerate(points)
+        )
+        tiers = TieredMemory(server, dim=DIM)
+        first = await tiers.retrieve("a1", as_query(points[0]), points[0], k=4)
+        nearby = points[0] + 0.01
+        second = await tiers.retrieve("a1", as_query(nearby), nearby, k=4)
+        assert len(server.reads) == 1
+        assert (first.from_cache, second.from_cache) == (False, True)
+        assert [s.memory.memory_id for s in second.semantic] == [
+            s.memory.memory_id for s in first.semantic
+        ]
+        far = -points[0]
+        await tiers.retrieve("a1", as_query(far), far, k=4)
+        await tiers.retrieve("a1", as_query(points[0]), points[0], k=8)  # larger k
+        assert len(server.reads) == 3
+        assert tiers.stats.hit_rate == pytest.approx(0.25)
+
+    async def test_agents_are_isolated(self):
+        point = clustered(1)[0]
+        server = FakeMemoryServer([memory("a1", point, memory_id="secret")])
+        tiers = TieredMemory(server, dim=DIM)
+        await tiers.retrieve("a1", as_query(point), point)
+        context = await tiers.retrieve("a2", as_query(point), point)
+        assert context.semantic == ()
+        server.leak = memory("a1", point, memory_id="leaked")
+        with pytest.raises(MemoryIsolationError):
+            await tiers.retrieve("a2", as_query(-point), -point)
+        assert tiers.cached("a2") == 0
+
+    async def test_importance_weighted_eviction(self):
+        clock = FakeClock()
+        points = clustered(40, seed=3)
+        tiers = TieredMemory(
+            FakeMemoryServer(), dim=DIM, semantic_capacity=20, clock=clock
+        )
+        for n, point in enumerate(points[:20]):
+            await tiers.remember(memory("a1", point, 0.9 if n < 10 else 0.1, f"m{n}"))
+        clock.now += 60
+        for n, point in enumerate(points[20:], start=20):
+            await tiers.remember(memory("a1", point, 0.1, f"m{n}"))
+        cache = tiers._agents["a1"]
+        assert {f"m{n}" for n in range(10)} <= set(cache.items)
+        assert len(cache.items) <= 20
+        assert tiers.stats.evicted >= 20
+
+    async def test_store_failure_degrades_to_cache(self):
+        point = clustered(1)[0]
+        server = FakeMemoryServer()
+        tiers = TieredMemory(server, dim=DIM)
+        await tiers.remember(memory("a1", point, memory_id="m1"))
+        server.fail = True
+        context = await tiers.retrieve("a1", as_query(point), point)
+        assert context.degraded
+        assert context.memory_refs == ["m1"]
+
+    async def test_resource_contents_are_unwrapped(self):
+        point = clustered(1)[0]
+        server = FakeMemoryServer([memory("a1", point, memory_id="m1")])
+        server.envelope = True
+        context = await TieredMemory(server, dim=DIM).retrieve(
+            "a1", as_query(point), point
+        )
+        assert not context.degraded and context.memory_refs == ["m1"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{"contents": [{"text": "not json"}]}, {"memories": [{"agent_id": "a1"}]}],
+    )
+    async def test_malformed_response_degrades_to_cache(self, payload):
+        point = clustered(1)[0]
+        server = FakeMemoryServer()
+        tiers = TieredMemory(server, dim=DIM)
+        await tiers.remember(memory("a1", point, memory_id="m1"))
+
+        async def malformed(resource_uri):
+            return payload
+
+        server.read_resource = malformed
+        context = await tiers.retrieve("a1", as_query(-point), -point)
+        assert context.degraded and tiers.stats.degraded == 1
+
+    async def test_remember_writes_through(self):
+        point = clustered(1)[0]
+        server = FakeMemoryServer()
+        tiers = TieredMemory(server, dim=DIM)
+        await tiers.remember(memory("a1", point, memory_id="m1"))
+        [(tool, params)] = server.writes
+        assert (tool, params["agent_id"], len(params["embedding"])) == (
+            "memory_write",
+            "a1",
+            DIM,
+        )
+        with pytest.raises(AgentMemoryError):
+            await tiers.remember(memory("a1", np.ones(DIM + 1)))
+
+
+class TestShortTermMemory:
+    """Test episodic TTL per specs/technical.md §3.9 invariants"""
+
+    async def test_expires_after_ttl(self):
+        clock = FakeClock()
+        tiers = TieredMemory(FakeMemoryServer(), dim=DIM, clock=clock)
+        tiers.record("a1", "hello", ttl_seconds=3_600)
+        clock.now += 1_800
+        tiers.record("a1", "again", ttl_seconds=3_600)
+        assert [m.content for m in tiers.recent("a1")] == ["again", "hello"]
+        clock.now += 1_800
+        assert [m.content for m in tiers.recent("a1")] == ["again"]
+        point = clustered(1)[0]
+        context = await tiers.retrieve("a1", as_query(point), point)
+        assert [m.content for m in context.episodic] == ["again"]
+
+    def test_ttl_must_be_within_bounds(self):
+        tiers = TieredMemory(FakeMemoryServer(), dim=DIM)
+        for ttl in (60, 25 * 3_600):
+            with pytest.raises(AgentMemoryError):
+                tiers.record("a1", "x", ttl_seconds=ttl)
+        assert tiers.recent("b") == []
@@ -0,0 +1,376 @@
+"""
+Tests for OpenClaw status beacons: contract, signing, scheduling, backoff.
+
+Reference: specs/openclaw_integration.md §5, §6, §7.5, §8
+"""
+
+import pickle
+from collections import Counter
+
+import pytest
+
+from chimera.openclaw import (
+    AgentStatus,
+    BatchSigner,
+    BeaconScheduler,
+    Capability,
+    EndpointHealth,
+    OpenClawError,
+    RateLimited,
+    Secp256k1Signer,
+    TimingWheel,
+    backoff_delay,
+    build_beacon,
+    signing_payload,
+    verify_signature,
+)
+from tests.conftest import FakeClock
+
+ENDPOINT = "https://registry.example/agents/status"
+
+
+class Recorder:
+    """Stand-in endpoint: records batches, fails while ``failing`` is set."""
+
+    def __init__(self):
+        self.batches = []
+        self.failing = None
+
+    async def __call__(self, endpoint, beacons):
+        if self.failing is not None:
+            raise self.failing
+        self.batches.append((endpoint, beacons))
+
+    @property
+    def beacons(self):
+        return [b for _, batch in self.batches for b in batch]
+
+
+class AuditRecorder:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event_type, **kwargs):
+        self.events.append((event_type, kwargs))
+
+    def types(self):
+        return Counter(event_type for event_type, _ in self.events)
+
+
+def fake_sign(agent_id, payload):
+    return f"sig:{agent_id}:{len(payload)}"
+
+
+def status(n, **kwargs):
+    return AgentStatus(f"agent-{n}", f"Agent {n}", **kwargs)
+
+
+def make_scheduler(clock, publish=None, **kwargs):
+    return BeaconScheduler(
+        publish or Recorder(),
+        BatchSigner(fake_sign, chunk_size=64),
+        endpoints=[ENDPOINT],
+        clock=clock,
+        **kwargs,
+    )
+
+
+class TestBeaconContract:
+    """Test the Agent Status Beacon per specs/openclaw_integration.md §5"""
+
+    def test_beacon_has_exactly_the_schema_fields(self):
+        agent = status(
+            1,
+            capabilities=(Capability("generate_text", "content", "Posts"),),
+            wallet_address="0xabc",
+            last_activity=0.0,
+        )
+        beacon = build_beacon(agent, now=60.0)
+        assert set(beacon) == {
+            "beacon_id",
+            "agent_id",
+            "agent_name",
+            "protocol_version",
+            "timestamp",
+            "availability",
+            "capabilities",
+            "presence",
+            "contact",
+            "metadata",
+            "signature",
+        }
+        assert beacon["timestamp"] == "1970-01-01T00:01:00Z"
+        assert beacon["presence"] == {
+            "heartbeat_interval_seconds": 300,
+            "last_activity": "1970-01-01T00:00:00Z",
+        }
+        assert beacon["metadata"]["platform"] == "chimera"
+        assert build_beacon(agent, now=60.0)["beacon_id"] != beacon["beacon_id"]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"availability": "sleeping"}, "availability"),
+            ({"heartbeat_interval": 30}, "heartbeat_interval"),
+            ({"heartbeat_interval": 7200}, "heartbeat_interval"),
+        ],
+    )
+    def test_invalid_status_is_rejected(self, kwargs, error):
+        with pytest.raises(OpenClawError, match=error):
+            status(1, **kwargs)
+        with pytest.raises(OpenClawError, match="category"):
+            Capability("x", "trading")
+
+    def test_only_availability_and_capabilities_are_changes(self):
+        base = status(1)
+        assert not base.changed(status(1, last_activity=1.0))
+        assert base.changed(status(1, availability="busy"))
+        assert base.changed(
+            status(1, capabilities=(Capability("reply", "engagement"),))
+        )
+
+
+class TestSigning:
+    """Test beacon signatures per specs/openclaw_integration.md §7.5"""
+
+    def test_signature_verifies_and_covers_the_fields(self):
+        signer = Secp256k1Signer({"agent-1": bytes(range(1, 33))})
+        agent = status(1)
+        payload = signing_payload(agent, "2026-01-01T00:00:00Z")
+        signature = signer("agent-1", payload)
+        public = signer.public_key("agent-1")
+        assert len(public) == 33
+        assert verify_signature(public, payload, signature)
+        busy = signing_payload(status(1, availability="busy"), "2026-01-01T00:00:00Z")
+        assert not verify_signature(public, busy, signature)
+        assert not verify_signature(public, payload, "00")
+
+    def test_signer_pickles(self):
+        signer = Secp256k1Signer({"agent-1": bytes(range(1, 33))})
+        public = signer.public_key("agent-1")
+        clone = pickle.loads(pickle.dumps(signer))
+        assert clone.public_key("agent-1") == public
+        with pytest.raises(OpenClawError, match="No signing key"):
+            clone("agent-2", b"x")
+
+    async def test_batch_signer_keeps_order_across_chunks(self):
+        signer = BatchSigner(fake_sign, chunk_size=3)
+        items = [(f"agent-{n}", b"x" * n) for n in range(10)]
+        assert await signer.sign_many(items) == [fake_sign(*item) for item in items]
+        assert (signer.stats.signatures, signer.stats.chunks) == (10, 4)
+
+
+class TestTimingWheel:
+    """Test heartbeat timers per specs/openclaw_integration.md §6.2"""
+
+    def test_keys_fire_once_when_due(self):
+        wheel = TimingWheel(tick=1.0, slots=8, now=0.0)
+        wheel.schedule("a", 2.5)
+        wheel.schedule("b", 1.2)
+        wheel.schedule("c", 30.0)  # several revolutions away
+        assert wheel.advance(1.0) == []
+        assert wheel.advance(2.2) == ["b"]
+        assert wheel.advance(2.4) == []
+        assert wheel.advance(2.5) == ["a"]
+        assert wheel.advance(29.9) == [] and "c" in wheel
+        assert wheel.advance(100.0) == ["c"] and len(wheel) == 0
+
+    def test_reschedule_cancel_and_past_deadlines(self):
+        wheel = TimingWheel(tick=1.0, slots=8, now=0.0)
+        wheel.schedule("a", 5.0)
+        wheel.schedule("a", 3.0)
+        assert wheel.deadline("a") == 3.0 and len(wheel) == 1
+        assert wheel.cancel("a") and not wheel.cancel("a")
+        wheel.advance(10.0)
+        wheel.schedule("late", 4.0)  # already elapsed: fires on the next advance
+        assert wheel.advance(10.5) == ["late"]
+
+
+class TestEndpointBackoff:
+    """Test shared backoff per specs/openclaw_integration.md §6.4, §8.1"""
+
+    def test_backoff_table(self):
+        assert [backoff_delay(n) for n in range(7)] == [0, 30, 60, 120, 300, 600, 600]
+        assert backoff_delay(5, maximum=120) == 120
+
+    def test_pause_after_max_failures_and_resume(self):
+        health = EndpointHealth(ENDPOINT)
+        for _ in range(10):
+            health.record_failure(OSError(), 1, 0.0)
+        assert health.paused and not health.ready(10_000.0)
+        health.resume()
+        assert health.ready(0.0) and health.failures == 0
+        with pytest.raises(OpenClawError, match="not paused"):
+            health.resume()
+
+    def test_rate_limit_retry_after_is_honoured(self):
+        health = EndpointHealth(ENDPOINT)
+        health.record_failure(RateLimited("429", retry_after=90.0), 1, 0.0)
+        assert health.retry_at == 90.0
+
+
+class TestBeaconScheduler:
+    """Test fleet publishing per specs/openclaw_integration.md §6, §8.2"""
+
+    async def test_startup_beacons_are_signed_in_batches(self):
+        clock = FakeClock()
+        publish = Recorder()
+        scheduler = make_scheduler(clock, publish, batch_size=100)
+        for n in range(250):
+            scheduler.register(status(n))
+        assert await scheduler.run_once() == 250
+        assert [len(batch) for _, batch in publish.batches] == [100, 100, 50]
+        beacons = publish.beacons
+        assert len({b["beacon_id"] for b in beacons}) == 250
+        assert all(b["signature"].startswith("sig:") for b in beacons)
+        assert scheduler.signer.stats.chunks == 5  # 64 + 36, 64 + 36, 50
+
+    async def test_heartbeats_are_spread_over_the_interval(self):
+        clock = FakeClock()
+        publish = Recorder()
+        scheduler = make_scheduler(clock, publish)
+        for n in range(1_500):
+            scheduler.register(status(n))
+        await scheduler.run_once()
+        publish.batches.clear()
+        per_second = []
+        for _ in range(300):
+            clock.now += 1
+            per_second.append(await scheduler.run_once())
+        # 1,500 agents over 300 s: about 5 per second, never a herd.
+        assert max(per_second) <= 20
+        agents = {b["agent_id"] for b in publish.beacons}
+        assert len(agents) == 1_500
+
+    async def test_next_heartbeat_is_jittered_within_bounds(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, jitter=0.1)
+        scheduler.register(status(1))
+        first = scheduler.next_heartbeat("agent-1")
+        clock.now = first
+        await scheduler.run_once()
+        assert 270 <= scheduler.next_heartbeat("agent-1") - first <= 330
+
+    async def test_status_changes_publish_immediately(self):
+        clock = FakeClock()
+        publish = Recorder()
+        scheduler = make_scheduler(clock, publish)
+        scheduler.register(status(1))
+        await scheduler.run_once()
+        assert not scheduler.update(status(1, last_activity=5.0))
+        assert await scheduler.run_once() == 0
+        assert scheduler.update(status(1, availability="busy"))
+        assert await scheduler.run_once() == 1
+        assert publish.beacons[-1]["availability"] == "busy"
+
+    async def test_outage_backs_off_per_endpoint_not_per_agent(self):
+        clock = FakeClock()
+        publish = Recorder()
+        audit = AuditRecorder()
+        scheduler = make_scheduler(clock, publish, batch_size=50, audit=audit)
+        for n in range(200):
+            scheduler.register(status(n))
+        publish.failing = OSError("connection refused")
+        assert await scheduler.run_once() == 0
+        health = scheduler.health[ENDPOINT]
+        assert (health.failures, health.retry_at) == (1, clock.now + 30)
+        assert scheduler.pending(ENDPOINT) == 200
+        attempts = []
+        for _ in range(3):
+            retry_at = health.retry_at
+            clock.now = retry_at - 1
+            await scheduler.run_once()
+            attempts.append(health.failures)
+            clock.now = retry_at
+            await scheduler.run_once()
+            attempts.append(health.failures)
+        # One probe batch per backoff delay, not one retry per agent.
+        assert attempts == [1, 2, 2, 3, 3, 4]
+        assert scheduler.stats.failed == 4 * 50
+        assert audit.types()["openclaw.endpoint.unhealthy"] == 1
+        publish.failing = None
+        clock.now = health.retry_at
+        assert await scheduler.run_once() == 200
+        assert health.failures == 0 and scheduler.pending(ENDPOINT) == 0
+        assert audit.types()["openclaw.endpoint.recovered"] == 1
+        assert audit.types()["openclaw.beacon.published"] == 200
+
+    async def test_signing_failure_keeps_beacons_queued(self):
+        clock = FakeClock()
+        publish = Recorder()
+        broken = True
+
+        def sign(agent_id, payload):
+            if broken:
+                raise RuntimeError("key store unavailable")
+            return fake_sign(agent_id, payload)
+
+        scheduler = BeaconScheduler(
+            publish, BatchSigner(sign), endpoints=[ENDPOINT, "https://b"], clock=clock
+        )
+        for n in range(3):
+            scheduler.register(status(n))
+        assert await scheduler.run_once() == 0
+        assert scheduler.pending(ENDPOINT) == scheduler.pending("https://b") == 3
+        assert scheduler.stats.failed == 6
+        broken = False
+        clock.now = scheduler.health[ENDPOINT].retry_at
+        assert await scheduler.run_once() == 6
+        assert len(publish.beacons) == 6
+
+    async def test_publishing_pauses_after_ten_failures(self):
+        clock = FakeClock()
+        publish = Recorder()
+        audit = AuditRecorder()
+        scheduler = make_scheduler(clock, publish, audit=audit)
+        scheduler.register(status(1))
+        publish.failing = OSError()
+        for _ in range(12):
+            await scheduler.run_once()
+            clock.now = max(clock.now, scheduler.health[ENDPOINT].retry_at)
+        health = scheduler.health[ENDPOINT]
+        assert health.paused and health.failures == 10
+        assert any(kwargs.get("severity") == "critical" for _, kwargs in audit.events)
+        publish.failing = None
+        scheduler.resume(ENDPOINT)
+        assert await scheduler.run_once() == 1
+
+    async def test_close_publishes_offline_beacons(self):
+        clock = FakeClock()
+        publish = Recorder()
+        async with make_scheduler(clock, publish) as scheduler:
+            scheduler.register(status(1))
+            scheduler.register(status(2))
+        assert [b["availability"] for b in publish.beacons[-2:]] == [
+            "offline",
+            "offline",
+        ]
+        assert len(scheduler) == 0
+
+    async def test_registration_errors(self):
+        scheduler = BeaconScheduler(Recorder(), BatchSigner(fake_sign))
+        with pytest.raises(OpenClawError, match="no OpenClaw endpoint"):
+            scheduler.register(status(1))
+        scheduler.register(status(1), endpoints=[ENDPOINT])
+        with pytest.raises(OpenClawError, match="already registered"):
+            scheduler.register(status(1), endpoints=[ENDPOINT])
+        with pytest.raises(OpenClawError, match="not registered"):
+            scheduler.update(status(2))
+
+    async def test_real_signatures_verify(self):
+        keys = {f"agent-{n}": bytes([n + 1]) * 32 for n in range(3)}
+        signer = Secp256k1Signer(keys)
+        publish = Recorder()
+        scheduler = BeaconScheduler(
+            publish, BatchSigner(signer), endpoints=[ENDPOINT], clock=FakeClock()
+        )
+        for n in range(3):
+            scheduler.register(status(n))
+        await scheduler.run_once()
+        for beacon in publish.beacons:
+            payload = signing_payload(status(0), beacon["timestamp"]).replace(
+                b"agent-0", beacon["agent_id"].encode()
+            )
+            assert verify_signature(
+                signer.public_key(beacon["agent_id"]), payload, beacon["signature"]
+            )
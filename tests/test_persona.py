@@ -0,0 +1,241 @@
+"""
+Tests for SOUL.md compilation and the persona registry.
+
+Reference: specs/technical.md §3.1, §3.2
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from chimera.completions import CompletionCache, CompletionKey
+from chimera.persona import (
+    PersonaError,
+    PersonaRegistry,
+    compile_soul,
+    parse_soul,
+    render_soul,
+)
+from tests.conftest import FakeClock
+
+SOUL = """\
+---
+id: tech-analyst
+name: Tech Analyst
+---
+
+## Backstory
+A data-driven technology analyst
+focused on AI/ML trends.
+
+## Voice Traits
+- analytical
+- concise
+
+## Directives
+- cite sources when making claims
+- never promise financial returns,
+  even implicitly
+
+## Forbidden Patterns
+- `\\bguaranteed returns?\\b`
+
+## Required Patterns
+- `https?://`
+"""
+
+
+def write(root, ref, text):
+    path = root / ref.lstrip("/")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stat = path.stat() if path.exists() else None
+    path.write_text(text)
+    if stat is not None:
+        # Filesystems with coarse mtimes: make the edit visible to stat.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    return path
+
+
+class TestSoulCompilation:
+    """Test parsing and validation per specs/technical.md §3.2"""
+
+    def test_fields_are_parsed(self):
+        fields = parse_soul(SOUL)
+        assert fields["backstory"] == (
+            "A data-driven technology analyst focused on AI/ML trends."
+        )
+        assert fields["directives"][1] == (
+            "never promise financial returns, even implicitly"
+        )
+        assert fields["forbidden_patterns"] == [r"\bguaranteed returns?\b"]
+
+    def test_render_round_trips(self, mock_persona):
+        persona = compile_soul(render_soul(mock_persona).encode())
+        assert persona.as_constraints("/personas/p.md") == {
+            "persona_ref": "/personas/p.md",
+            "persona_id": mock_persona["id"],
+            "version": persona.version,
+            "name": mock_persona["name"],
+            "voice_traits": mock_persona["voice_traits"],
+            "directives": mock_persona["directives"],
+            "core_beliefs": mock_persona["core_beliefs"],
+        }
+
+    def test_directive_patterns_are_precompiled(self):
+        persona = compile_soul(SOUL.encode())
+        assert persona.rules.persona_id == "tech-analyst"
+        assert persona.violations("Sources: https://example.com") == []
+        assert persona.violations("Guaranteed return, trust me") == [
+            "persona tech-analyst: forbidden pattern '\\\\bguaranteed returns?\\\\b'",
+            "persona tech-analyst: missing required pattern 'https?://'",
+        ]
+
+    def test_version_is_the_content_hash(self):
+        first = compile_soul(SOUL.encode())
+        assert compile_soul(SOUL.encode()).version == first.version
+        assert compile_soul((SOUL + "- terse\n").encode()).version != first.version
+
+    def test_trait_embedding_is_unit_and_read_only(self):
+        embedding = compile_soul(SOUL.encode()).trait_embedding
+        assert embedding.dtype == np.float32
+        assert np.linalg.norm(embedding) == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            embedding[0] = 1.0
+
+    @pytest.mark.parametrize(
+        ("text", "error"),
+        [
+            (
+                SOUL.replace("id: tech-analyst\n", ""),
+                r"missing required fields \['id'\]",
+            ),
+            (SOUL.replace("## Directives", "## Notes"), "'directives'"),
+            (SOUL.replace("- analytical", "analytical"), "must be a list"),
+            (SOUL.replace("https?://", "(unclosed"), "invalid directive pattern"),
+            ("---\nid: x\n", "unterminated front matter"),
+        ],
+    )
+    def test_invalid_files_are_rejected(self, text, error):
+        with pytest.raises(PersonaError, match=error):
+            compile_soul(text.encode())
+
+
+class TestPersonaRegistry:
+    """Test caching, invalidation and preload per specs/technical.md §3.1"""
+
+    async def test_each_file_is_compiled_once(self, tmp_path):
+        write(tmp_path, "/personas/a.md", SOUL)
+        registry = PersonaRegistry(root=tmp_path)
+        personas = await asyncio.gather(
+            *(registry.get("/personas/a.md") for _ in range(20))
+        )
+        assert all(p is personas[0] for p in personas)
+        assert registry.stats.compiles == 1 and registry.stats.checks == 1
+        assert await registry.get("personas/a.md") is personas[0]
+        assert registry.stats.hits == 1
+
+    async def test_identical_content_is_shared(self, tmp_path):
+        write(tmp_path, "/a.md", SOUL)
+        write(tmp_path, "/b.md", SOUL)
+        registry = PersonaRegistry(root=tmp_path)
+        assert await registry.get("/a.md") is await registry.get("/b.md")
+        assert (registry.stats.compiles, registry.stats.shared, len(registry)) == (
+            1,
+            1,
+            1,
+        )
+
+    async def test_edit_is_picked_up_after_check_interval(self, tmp_path):
+        clock = FakeClock()
+        changes = []
+        registry = PersonaRegistry(
+            root=tmp_path,
+            check_interval=5,
+            clock=clock,
+            on_change=lambda old, new: changes.append((old, new)),
+        )
+        write(tmp_path, "/a.md", SOUL)
+        old = await registry.get("/a.md")
+        write(tmp_path, "/a.md", SOUL.replace("concise", "terse"))
+        assert await registry.get("/a.md") is old  # within the interval
+        clock.now += 5
+        new = await registry.get("/a.md")
+        assert new.voice_traits == ("analytical", "terse")
+        assert changes == [(old, new)] and registry.stats.reloads == 1
+        assert len(registry) == 1
+
+    async def test_unchanged_file_is_not_reread(self, tmp_path):
+        clock = FakeClock()
+        registry = PersonaRegistry(root=tmp_path, check_interval=5, clock=clock)
+        write(tmp_path, "/a.md", SOUL)
+        persona = await registry.get("/a.md")
+        clock.now += 5
+        assert await registry.get("/a.md") is persona
+        assert (registry.stats.checks, registry.stats.compiles) == (2, 1)
+
+    async def test_change_invalidates_cached_completions(self, tmp_path):
+        cache = CompletionCache()
+        registry = PersonaRegistry(
+            root=tmp_path, on_change=lambda old, new: cache.invalidate(persona=old.key)
+        )
+        write(tmp_path, "/a.md", SOUL)
+        persona = await registry.get("/a.md")
+        key = CompletionKey.build(
+            persona_id=persona.id,
+            persona_version=persona.version,
+            template="post/1",
+            inputs={"content_prompt": "EU AI Act"},
+        )
+        cache.put(key, {"text": "cached"})
+        write(tmp_path, "/a.md", SOUL.replace("concise", "terse"))
+        assert [p.voice_traits for p in await registry.refresh()] == [
+            ("analytical", "terse")
+        ]
+        assert key not in cache
+
+    async def test_background_polling(self, tmp_path):
+        write(tmp_path, "/a.md", SOUL)
+        changed = asyncio.Event()
+        async with PersonaRegistry(
+            root=tmp_path, check_interval=0.01, on_change=lambda *_: changed.set()
+        ) as registry:
+            await registry.get("/a.md")
+            write(tmp_path, "/a.md", SOUL.replace("concise", "terse"))
+            async with asyncio.timeout(1):
+                await changed.wait()
+
+    async def test_preload_reports_every_invalid_file(self, tmp_path):
+        write(tmp_path, "/personas/a.md", SOUL)
+        write(tmp_path, "/personas/b.md", SOUL.replace("tech-analyst", "b"))
+        registry = PersonaRegistry(root=tmp_path)
+        assert sorted(p.id for p in await registry.preload()) == ["b", "tech-analyst"]
+        write(tmp_path, "/personas/c.md", "no front matter")
+        write(tmp_path, "/personas/d.md", "---\n")
+        with pytest.raises(PersonaError, match="2 invalid persona file"):
+            await registry.preload()
+
+    async def test_trait_embedding_from_embedder(self, tmp_path):
+        texts = []
+
+        async def embed(text):
+            texts.append(text)
+            return [3.0, 4.0]
+
+        write(tmp_path, "/a.md", SOUL)
+        registry = PersonaRegistry(root=tmp_path, embed=embed)
+        persona = await registry.get("/a.md")
+        assert texts == ["analytical concise"]
+        np.testing.assert_allclose(persona.trait_embedding, [0.6, 0.8])
+
+    async def test_refs_outside_root_and_deleted_files(self, tmp_path):
+        registry = PersonaRegistry(root=tmp_path / "souls", check_interval=0)
+        with pytest.raises(PersonaError, match="outside"):
+            await registry.get("../secrets.md")
+        path = write(tmp_path / "souls", "/a.md", SOUL)
+        await registry.get("/a.md")
+        path.unlink()
+        with pytest.raises(PersonaError, match="Cannot read"):
+            await registry.get("/a.md")
+        assert len(registry) == 0
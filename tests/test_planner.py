@@ -0,0 +1,293 @@
+"""
+Tests for the Planner task DAG and incremental re-planning.
+
+Reference: specs/technical.md §3.3, §4.3–4.5
+"""
+
+import uuid
+
+import pytest
+
+from chimera.audit import AuditEmitter, SegmentWriter, list_segments, read_segment
+from chimera.budget import BudgetLedger, BudgetPolicy, campaign_scope, scopes_for
+from chimera.contracts import Campaign
+from chimera.planner import PlannedTask, Planner, PlannerError
+from chimera.queue import InMemoryTaskQueue
+
+
+class RecordingQueue(InMemoryTaskQueue):
+    """In-memory queue that records each batch call the Planner makes."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def enqueue_many(self, tasks):
+        tasks = list(tasks)
+        self.calls.append(("enqueue", sorted(t.task_id for t in tasks)))
+        return await super().enqueue_many(tasks)
+
+    async def remove_many(self, task_ids):
+        task_ids = list(task_ids)
+        self.calls.append(("remove", sorted(task_ids)))
+        return await super().remove_many(task_ids)
+
+
+def campaign(status="active") -> Campaign:
+    return Campaign(
+        campaign_id=str(uuid.uuid4()),
+        goal_description="Explain new AI regulations",
+        agent_ids=(str(uuid.uuid4()),),
+        status=status,
+        created_by="operator",
+    )
+
+
+async def pending(queue) -> dict:
+    leases = await queue.claim_batch("probe", 10_000)
+    for lease in leases:
+        await queue.release(lease)
+    return {lease.task_id: lease.task for lease in leases}
+
+
+@pytest.fixture
+def queue():
+    return RecordingQueue()
+
+
+@pytest.fixture
+def planner(queue):
+    return Planner(queue)
+
+
+def chain(campaign_id, n, **kwargs) -> list[PlannedTask]:
+    tasks = []
+    for _ in range(n):
+        depends = (tasks[-1].task_id,) if tasks else ()
+        tasks.append(
+            PlannedTask(campaign_id, "generate_content", depends_on=depends, **kwargs)
+        )
+    return tasks
+
+
+class TestTaskGraph:
+    """Test the Planner's task DAG per specs/technical.md §4.4"""
+
+    async def test_only_ready_tasks_are_queued(self, planner, queue):
+        c = campaign()
+        planner.add_campaign(c)
+        first, second, third = chain(c.campaign_id, 3)
+        delta = await planner.plan(c.campaign_id, [third, second, first])
+        assert delta.enqueued == (first.task_id,)
+        assert set(delta.held) == {second.task_id, third.task_id}
+        assert planner.hold_reasons(second.task_id) == ("dependencies",)
+
+        lease = await queue.claim("w")
+        await queue.ack(lease)
+        delta = await planner.complete(first.task_id)
+        assert delta.enqueued == (second.task_id,)
+        assert list(await pending(queue)) == [second.task_id]
+
+    async def test_dependents_may_follow_finished_tasks(self, planner):
+        c = campaign()
+        planner.add_campaign(c)
+        (first,) = chain(c.campaign_id, 1)
+        await planner.plan(c.campaign_id, [first])
+        await planner.complete(first.task_id)
+        later = PlannedTask(c.campaign_id, "reply_comment", depends_on=(first.task_id,))
+        assert (await planner.plan(c.campaign_id, [later])).enqueued == (later.task_id,)
+
+    async def test_invalid_plans_are_rejected_whole(self, planner, queue):
+        c, other = campaign(), campaign()
+        planner.add_campaign(c)
+        planner.add_campaign(other)
+        a = PlannedTask(c.campaign_id, "t", task_id="a", depends_on=("b",))
+        b = PlannedTask(c.campaign_id, "t", task_id="b", depends_on=("a",))
+        with pytest.raises(PlannerError, match="cycle"):
+            await planner.plan(c.campaign_id, [a, b])
+        with pytest.raises(PlannerError, match="unknown task"):
+            await planner.plan(c.campaign_id, [a])
+        (foreign,) = chain(other.campaign_id, 1)
+        await planner.plan(other.campaign_id, [foreign])
+        crossing = PlannedTask(c.campaign_id, "t", depends_on=(foreign.task_id,))
+        with pytest.raises(PlannerError, match="another campaign"):
+            await planner.plan(c.campaign_id, [crossing])
+        assert len(planner.graph) == 1
+        assert await queue.depth() == 1
+
+
+class TestCampaignTriggers:
+    """Test campaign pause/cancel re-planning per specs/technical.md §3.3, §4.4"""
+
+    async def test_pause_resume_and_cancel_touch_one_campaign(self, planner, queue):
+        campaigns = [campaign() for _ in range(10)]
+        for c in campaigns:
+            planner.add_campaign(c)
+            await planner.plan(
+                c.campaign_id, [PlannedTask(c.campaign_id, "t") for _ in range(100)]
+            )
+        target = campaigns[3]
+        owned = sorted(planner.graph.by_campaign(target.campaign_id))
+        queue.calls.clear()
+
+        delta = await planner.set_campaign_status(target.campaign_id, "paused")
+        assert sorted(delta.removed) == owned
+        assert queue.calls == [("remove", owned)]
+        assert await queue.depth() == 900
+        assert planner.hold_reasons(owned[0]) == ("campaign",)
+        with pytest.raises(PlannerError, match="paused"):
+            await planner.plan(
+                target.campaign_id, [PlannedTask(target.campaign_id, "t")]
+            )
+
+        queue.calls.clear()
+        delta = await planner.set_campaign_status(target.campaign_id, "active")
+        assert queue.calls == [("enqueue", owned)]
+        assert await queue.depth() == 1000
+
+        await planner.set_campaign_status(target.campaign_id, "cancelled")
+        assert await queue.depth() == 900
+        assert planner.graph.by_campaign(target.campaign_id) == frozenset()
+        assert planner.stats.cancelled == 100
+
+
+class TestPlatformTriggers:
+    """Test routing around a failing platform per specs/technical.md §4.4"""
+
+    async def test_reroute_then_hold_then_restore(self, planner, queue):
+        c = campaign()
+        planner.add_campaign(c)
+        both = PlannedTask(c.campaign_id, "t", platforms=("twitter", "linkedin"))
+        only = PlannedTask(c.campaign_id, "t", platforms=("twitter",))
+        other = PlannedTask(c.campaign_id, "t", platforms=("linkedin",))
+        await planner.plan(c.campaign_id, [both, only, other])
+
+        queue.calls.clear()
+        delta = await planner.platform_down("twitter")
+        assert sorted(delta.removed) == sorted([both.task_id, only.task_id])
+        assert delta.enqueued == (both.task_id,)
+        queued = await pending(queue)
+        assert queued[both.task_id].payload["platform"] == "linkedin"
+        assert only.task_id not in queued
+        assert planner.hold_reasons(only.task_id) == ("platform",)
+        assert [op for op, _ in queue.calls] == ["remove", "enqueue"]
+
+        await planner.platform_up("twitter")
+        queued = await pending(queue)
+        assert queued[both.task_id].payload["platform"] == "twitter"
+        assert queued[only.task_id].payload["platform"] == "twitter"
+
+
+class TestBudgetTriggers:
+    """Test budget-aware planning per specs/technical.md §4.3–4.5"""
+
+    async def test_exhausted_scope_holds_only_its_cost_incurring_tasks(
+        self, queue, tmp_path
+    ):
+        emitter = AuditEmitter(SegmentWriter(tmp_path))
+        planner = Planner(queue, audit=emitter)
+        c, other = campaign(), campaign()
+        for x in (c, other):
+            planner.add_campaign(x)
+        paid = PlannedTask(c.campaign_id, "t", estimated_cost_usd=0.5)
+        free = PlannedTask(c.campaign_id, "t")
+        elsewhere = PlannedTask(other.campaign_id, "t", estimated_cost_usd=0.5)
+        await planner.plan(c.campaign_id, [paid, free])
+        await planner.plan(other.campaign_id, [elsewhere])
+
+        delta = await planner.budget_exhausted(campaign_scope(c.campaign_id))
+        assert delta.removed == (paid.task_id,)
+        assert planner.hold_reasons(paid.task_id) == ("budget",)
+        assert set(await pending(queue)) == {free.task_id, elsewhere.task_id}
+
+        await planner.budget_restored(campaign_scope(c.campaign_id))
+        assert paid.task_id in await pending(queue)
+
+        await emitter.close()
+        events = [
+            event
+            for _, path in list_segments(tmp_path)
+            for _, event in read_segment(path)
+        ]
+        types = [event["event_type"] for event in events]
+        assert types.count("task.created") == 3
+        (notice,) = [e for e in events if e["event_type"] == "budget.threshold_reached"]
+        assert notice["severity"] == "warning"
+        assert notice["payload"]["held_tasks"] == [paid.task_id]
+
+    async def test_ledger_is_checked_before_queueing(self, queue):
+        ledger = BudgetLedger([BudgetPolicy(daily_limit_usd=3.0)])
+        planner = Planner(queue, budget=ledger, low_budget_usd=2.0)
+        c = campaign()
+        planner.add_campaign(c)
+        cheap = PlannedTask(c.campaign_id, "t", estimated_cost_usd=1.0)
+        dear = PlannedTask(c.campaign_id, "t", estimated_cost_usd=5.0)
+        delta = await planner.plan(c.campaign_id, [cheap, dear])
+        assert delta.enqueued == (cheap.task_id,)
+        assert planner.hold_reasons(dear.task_id) == ("budget",)
+        assert not (await pending(queue))[cheap.task_id].budget_constrained
+
+        ledger.reserve(scopes_for(), 1.5).commit()
+        await planner.budget_restored("global")
+        # Re-evaluated: 1.5 left covers the cheap task but is below the
+        # low-budget mark, so it is deprioritized (§4.3).
+        assert (await pending(queue))[cheap.task_id].budget_constrained
+
+
+class TestFailureTriggers:
+    """Test worker-failure and context-drift re-planning per specs/technical.md §4.4"""
+
+    async def test_retry_then_cancel_dependents(self, planner, queue):
+        c = campaign()
+        planner.add_campaign(c)
+        first, second, third = chain(c.campaign_id, 3, max_retries=1)
+        await planner.plan(c.campaign_id, [first, second, third])
+
+        lease = await queue.claim("w")
+        await queue.ack(lease)
+        delta = await planner.fail(first.task_id)
+        assert delta.enqueued == (first.task_id,)
+        assert (await pending(queue))[first.task_id].payload["attempt"] == 1
+
+        lease = await queue.claim("w")
+        await queue.ack(lease)
+        await planner.fail(first.task_id)
+        assert len(planner.graph) == 0
+        assert planner.stats.cancelled == 3
+        assert await queue.depth() == 0
+        # A late report for a cancelled task is ignored.
+        assert (await planner.complete(third.task_id)).enqueued == ()
+
+    async def test_prune_and_replace_in_one_batch(self, planner, queue):
+        c = campaign()
+        planner.add_campaign(c)
+        first, second = chain(c.campaign_id, 2)
+        keep = PlannedTask(c.campaign_id, "t")
+        await planner.plan(c.campaign_id, [first, second, keep])
+        replacement = PlannedTask(c.campaign_id, "t")
+        queue.calls.clear()
+
+        delta = await planner.prune([first.task_id], replacements=[replacement])
+        assert delta.removed == (first.task_id,)
+        assert delta.enqueued == (replacement.task_id,)
+        assert queue.calls == [
+            ("remove", [first.task_id]),
+            ("enqueue", [replacement.task_id]),
+        ]
+        assert set(await pending(queue)) == {keep.task_id, replacement.task_id}
+
+    async def test_batch_defers_flush(self, planner, queue):
+        c = campaign()
+        planner.add_campaign(c)
+        tasks = [
+            PlannedTask(c.campaign_id, "t", platforms=(p,)) for p in ("x", "y", "z")
+        ]
+        await planner.plan(c.campaign_id, tasks)
+        queue.calls.clear()
+        async with planner.batch():
+            await planner.platform_down("x")
+            await planner.platform_down("y")
+            assert queue.calls == []
+        assert queue.calls == [
+            ("remove", sorted(t.task_id for t in tasks[:2])),
+        ]
@@ -0,0 +1,192 @@
+"""
+Tests for the Worker autoscaler, its controller and the trace simulator.
+
+Reference: specs/functional.md §5.3–5.4
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.queue import Backlog, InMemoryTaskQueue, QueuedTask
+from chimera.scaling import (
+    Autoscaler,
+    LoadSample,
+    ScalingController,
+    ScalingError,
+    ScalingPolicy,
+    TraceEvent,
+    read_trace,
+    simulate,
+    write_trace,
+)
+from chimera.worker import WorkerPool
+
+
+def sample(at=0.0, *, in_flight=None, latency=None, **backlog) -> LoadSample:
+    return LoadSample(
+        at=at,
+        backlog={p: Backlog(*value) for p, value in backlog.items()},
+        in_flight=in_flight or {},
+        latency=latency or {},
+    )
+
+
+POLICY = ScalingPolicy(min_concurrency=4, max_concurrency=64, reserved=1, headroom=0)
+
+
+class TestAutoscaler:
+    """Test sizing and hysteresis per specs/functional.md §5.3–5.4"""
+
+    def test_sizes_for_in_flight_plus_backlog_drain(self):
+        scaler = Autoscaler(POLICY)
+        # 20 busy + 600 pending tasks of 10 s that must start within 300 s.
+        decision = scaler.decide(
+            sample(in_flight={"medium": 20}, latency={"medium": 10.0}, medium=(600, 0))
+        )
+        assert decision.action == "up"
+        assert decision.concurrency == 1 + 20 + 20
+        assert decision.demand == 40
+
+    def test_scale_down_waits_for_window_and_steps(self):
+        scaler = Autoscaler(POLICY, concurrency=40)
+        for at in range(0, 300, 5):
+            decision = scaler.decide(sample(at))
+            assert decision.action == "hold"
+            assert decision.reason == "hysteresis"
+        decision = scaler.decide(sample(300))
+        assert (decision.action, decision.concurrency) == ("down", 30)
+        # The next step waits for a full window again.
+        assert scaler.decide(sample(305)).action == "hold"
+        assert scaler.decide(sample(600)).concurrency == 22
+
+    def test_window_remembers_recent_peaks(self):
+        scaler = Autoscaler(POLICY, concurrency=40)
+        scaler.decide(sample(0, in_flight={"medium": 36}))
+        for at in range(5, 300, 5):
+            scaler.decide(sample(at))
+        # The 36-slot peak is still inside the window at 300 s.
+        assert scaler.decide(sample(300)).action == "hold"
+        assert scaler.decide(sample(305)).concurrency == 30
+
+    def test_small_increase_within_band_is_ignored(self):
+        scaler = Autoscaler(POLICY, concurrency=20)
+        assert scaler.decide(sample(in_flight={"medium": 20})).action == "hold"
+        assert scaler.decide(sample(in_flight={"medium": 25})).action == "up"
+
+    def test_slo_breach_forces_step_up(self):
+        scaler = Autoscaler(POLICY, concurrency=10)
+        decision = scaler.decide(sample(high=(1, 6.0)))
+        assert decision.action == "up"
+        assert decision.reason == "slo_breach:high"
+        assert decision.concurrency == 15
+
+    def test_growing_backlog_beyond_trigger_is_pressure(self):
+        scaler = Autoscaler(POLICY, concurrency=10)
+        # 150 pending analytics jobs barely register as demand...
+        assert scaler.decide(sample(0, low=(150, 0))).action == "hold"
+        # ...but a queue past the trigger that keeps growing does.
+        decision = scaler.decide(sample(5, low=(160, 0)))
+        assert (decision.action, decision.reason) == ("up", "backlog_growth")
+
+    def test_realtime_reserve_follows_realtime_demand(self):
+        scaler = Autoscaler(POLICY)
+        decision = scaler.decide(
+            sample(in_flight={"high": 6, "medium": 10}, latency={"high": 1.0})
+        )
+        assert decision.reserved == 6
+        assert decision.concurrency == 16
+        assert Autoscaler(POLICY).decide(sample()).reserved == 1
+
+    def test_replicas_for_external_orchestrators(self):
+        policy = ScalingPolicy(
+            min_concurrency=4, max_concurrency=16, max_replicas=4, headroom=0
+        )
+        decision = Autoscaler(policy).decide(sample(in_flight={"medium": 40}))
+        assert decision.concurrency == 16
+        assert decision.replicas == 3
+        capped = Autoscaler(policy).decide(sample(in_flight={"medium": 500}))
+        assert capped.replicas == 4
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"reserved": 4},
+            {"min_concurrency": 300},
+            {"slo": {"high": 5.0}},
+            {"step_up": 1.0},
+            {"max_replicas": 0},
+        ],
+    )
+    def test_policy_rejects(self, overrides):
+        with pytest.raises(ScalingError):
+            ScalingPolicy(**overrides)
+
+
+class TestScalingController:
+    """Test live resizing and recommendations per specs/functional.md §5.4"""
+
+    async def test_step_resizes_pool_and_publishes(self):
+        queue = InMemoryTaskQueue()
+        await queue.enqueue_many(
+            QueuedTask(task_id=f"t{i}", task_type="generate_content")
+            for i in range(3000)
+        )
+        pool = WorkerPool(queue, {}, review_queue=asyncio.Queue(), max_in_flight=4)
+        published = []
+
+        async def publish(decision):
+            published.append(decision)
+
+        async def broken(decision):
+            raise ConnectionError("orchestrator down")
+
+        controller = ScalingController(
+            queue, pool, policy=POLICY, recommend=[broken, publish]
+        )
+        decision = await controller.step()
+        assert decision.action == "up"
+        # 3000 tasks of ~1 s drain in 300 s on 10 slots, plus the reserve.
+        assert pool.max_in_flight == decision.concurrency == 11
+        assert pool.reserved == 1
+        assert published == [decision] and controller.last == decision
+
+
+class TestSimulation:
+    """Test offline trace replay per specs/functional.md §5.3"""
+
+    def trace(self) -> list[TraceEvent]:
+        # A wave of slow content generation, then a stream of DM replies.
+        events = [TraceEvent(0.0, "medium", 120.0) for _ in range(40)]
+        events += [
+            TraceEvent(1.0 + i, "high", 0.5, "reply_dm") for i in range(0, 60, 2)
+        ]
+        return events
+
+    def test_reserved_slots_keep_realtime_tier_responsive(self):
+        policy = ScalingPolicy(min_concurrency=8, max_concurrency=8, reserved=2)
+        report = simulate(self.trace(), policy, concurrency=8, autoscale=False)
+        assert report.slo_misses("high") == 0
+        assert report.percentile("high", 100) == 0.0
+        starved = ScalingPolicy(min_concurrency=8, max_concurrency=8, reserved=0)
+        report = simulate(self.trace(), starved, concurrency=8, autoscale=False)
+        assert report.slo_misses("high") == 30
+
+    def test_autoscaling_beats_static_small_pool(self):
+        policy = ScalingPolicy(min_concurrency=4, max_concurrency=64)
+        events = [TraceEvent(i * 0.5, "medium", 30.0) for i in range(2400)]
+        static = simulate(events, policy, concurrency=4, autoscale=False)
+        scaled = simulate(events, policy)
+        assert static.slo_misses("medium") > 0
+        assert scaled.slo_misses("medium") == 0
+        assert 4 < scaled.peak_concurrency <= 64
+        assert scaled.changes == sum(d.action != "hold" for d in scaled.decisions)
+
+    def test_trace_round_trip(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        events = self.trace()
+        assert write_trace(path, events) == len(events)
+        assert read_trace(path) == sorted(events, key=lambda event: event.at)
+        path.write_text('{"at": 1, "priority": "urgent", "service": 1}\n')
+        with pytest.raises(ScalingError, match="trace.jsonl:1"):
+            read_trace(path)
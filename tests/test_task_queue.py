@@ -0,0 +1,223 @@
+"""
+Tests for the Task Queue per specs/technical.md §4.3 and functional.md §5.4.
+
+Every test runs against both the in-memory heap backend and the Redis
+sorted-set backend (against an in-process fake Redis server).
+
+Reference: specs/technical.md §2.1, §4.3
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from chimera.queue import (
+    InMemoryTaskQueue,
+    QueuedTask,
+    QueueError,
+    RedisTaskQueue,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def queue(request, clock):
+    if request.param == "memory":
+        return InMemoryTaskQueue(visibility_timeout=30, clock=clock)
+    return RedisTaskQueue(
+        fakeredis.FakeAsyncRedis(), visibility_timeout=30, clock=clock
+    )
+
+
+def make_task(task_id: str, **kwargs) -> QueuedTask:
+    return QueuedTask(task_id=task_id, task_type="generate_content", **kwargs)
+
+
+class TestPrioritization:
+    """Test four-level ordering per specs/technical.md §4.3"""
+
+    async def test_explicit_priority_orders_first(self, queue):
+        await queue.enqueue_many(
+            [
+                make_task("low", priority="low"),
+                make_task("high", priority="high"),
+                make_task("medium", priority="medium"),
+            ]
+        )
+        leases = await queue.claim_batch("w1", 3)
+        assert [lease.task_id for lease in leases] == ["high", "medium", "low"]
+
+    async def test_closer_deadline_ranks_higher(self, queue):
+        await queue.enqueue_many(
+            [
+                make_task("none"),
+                make_task("later", deadline=2_000.0),
+                make_task("sooner", deadline=1_000.0),
+            ]
+        )
+        leases = await queue.claim_batch("w1", 3)
+        assert [lease.task_id for lease in leases] == ["sooner", "later", "none"]
+
+    async def test_launch_phase_before_maintenance(self, queue):
+        await queue.enqueue_many(
+            [
+                make_task("maint", campaign_phase="maintenance"),
+                make_task("launch", campaign_phase="launch"),
+            ]
+        )
+        lease = await queue.claim("w1")
+        assert lease.task_id == "launch"
+
+    async def test_budget_constrained_tasks_deprioritized(self, queue):
+        await queue.enqueue_many(
+            [make_task("costly", budget_constrained=True), make_task("free")]
+        )
+        lease = await queue.claim("w1")
+        assert lease.task_id == "free"
+
+    async def test_equal_rank_is_fifo(self, queue):
+        await queue.enqueue_many([make_task(f"t{i}") for i in range(5)])
+        leases = await queue.claim_batch("w1", 5)
+        assert [lease.task_id for lease in leases] == [f"t{i}" for i in range(5)]
+
+    @pytest.mark.parametrize("task_id", ["", "a|b"])
+    def test_rejects_unusable_task_id(self, task_id):
+        with pytest.raises(QueueError):
+            make_task(task_id)
+
+    def test_rejects_unknown_priority(self):
+        with pytest.raises(QueueError):
+            make_task("bad", priority="urgent")
+
+
+class TestClaimSemantics:
+    """Test atomic claim and lease handling per specs/functional.md §5.4"""
+
+    async def test_duplicate_task_id_not_enqueued_twice(self, queue):
+        assert await queue.enqueue(make_task("t1"))
+        assert not await queue.enqueue(make_task("t1"))
+        assert await queue.depth() == 1
+
+    async def test_concurrent_workers_never_share_a_task(self, queue):
+        await queue.enqueue_many([make_task(f"t{i}") for i in range(100)])
+        batches = await asyncio.gather(
+            *(queue.claim_batch(f"w{i}", 7) for i in range(20))
+        )
+        claimed = [lease.task_id for batch in batches for lease in batch]
+        assert len(claimed) == len(set(claimed)) == 100
+
+    async def test_ack_removes_task(self, queue):
+        await queue.enqueue(make_task("t1"))
+        lease = await queue.claim("w1")
+        assert await queue.ack(lease)
+        assert await queue.depth() == 0
+        assert await queue.in_flight() == 0
+        assert await queue.claim("w1") is None
+
+    async def test_release_returns_task_to_pending(self, queue):
+        await queue.enqueue(make_task("t1"))
+        lease = await queue.claim("w1")
+        assert await queue.release(lease)
+        again = await queue.claim("w2")
+        assert again.task_id == "t1"
+
+    async def test_expired_lease_is_reclaimable(self, queue, clock):
+        await queue.enqueue(make_task("t1"))
+        stale = await queue.claim("w1")
+        clock.now += 31
+        fresh = await queue.claim("w2")
+        assert fresh.task_id == "t1"
+        assert not await queue.ack(stale), "Stale lease holder must not ack"
+        assert await queue.ack(fresh)
+
+    async def test_extend_keeps_lease_alive(self, queue, clock):
+        await queue.enqueue(make_task("t1"))
+        lease = await queue.claim("w1")
+        clock.now += 20
+        lease = await queue.extend(lease, 30)
+        clock.now += 20
+        assert await queue.claim("w2") is None
+        assert await queue.ack(lease)
+
+    async def test_requeue_expired_preserves_rank(self, queue, clock):
+        await queue.enqueue_many(
+            [make_task("high", priority="high"), make_task("low", priority="low")]
+        )
+        await queue.claim("w1")
+        clock.now += 31
+        assert await queue.requeue_expired() == 1
+        lease = await queue.claim("w2")
+        assert lease.task_id == "high"
+
+    async def test_payload_round_trips(self, queue):
+        task = make_task("t1", campaign_id="c1", payload={"context": {"goal": "x"}})
+        await queue.enqueue(task)
+        lease = await queue.claim("w1")
+        assert lease.task == task
+
+    async def test_excluded_task_types_stay_pending(self, queue):
+        await queue.enqueue_many(
+            [
+                make_task("s1"),
+                QueuedTask(task_id="f1", task_type="reply_dm"),
+                make_task("s2"),
+                QueuedTask(task_id="f2", task_type="reply_dm", priority="high"),
+            ]
+        )
+        leases = await queue.claim_batch("w1", 5, exclude_types={"generate_content"})
+        assert [lease.task_id for lease in leases] == ["f2", "f1"]
+        lease = await queue.claim("w1", max_priority="high", exclude_types={"reply_dm"})
+        assert lease is None
+        leases = await queue.claim_batch("w1", 5)
+        assert [lease.task_id for lease in leases] == ["s1", "s2"]
+
+    async def test_remove_many_drops_pending_only(self, queue):
+        await queue.enqueue_many([make_task("a"), make_task("b"), make_task("c")])
+        leased = await queue.claim("w1")
+        assert await queue.remove_many(["a", "b", "c"]) == 2
+        assert await queue.depth() == 0
+        assert await queue.ack(leased)
+
+
+class TestBacklog:
+    """Test per-priority load signals for autoscaling per specs/functional.md §5.3–5.4"""
+
+    async def test_depth_and_oldest_pending_age_per_priority(self, queue, clock):
+        await queue.enqueue_many(
+            [make_task("h1", priority="high"), make_task("m1"), make_task("m2")]
+        )
+        clock.now += 10
+        await queue.enqueue_many([make_task("h2", priority="high")])
+        clock.now += 5
+        backlog = await queue.backlog()
+        assert backlog["high"].depth == 2 and backlog["high"].oldest_age == 15
+        assert backlog["medium"].depth == 2 and backlog["medium"].oldest_age == 15
+        assert backlog["low"].depth == 0 and backlog["low"].oldest_age == 0
+
+        # Leased tasks are not pending; the next oldest one counts.
+        lease = await queue.claim("w1")
+        assert lease.task_id == "h1"
+        assert (await queue.backlog())["high"].oldest_age == 5
+        # A released task keeps its original age.
+        await queue.release(lease)
+        assert (await queue.backlog())["high"].oldest_age == 15
+        await queue.ack(await queue.claim("w1"))
+        await queue.remove_many(["m1"])
+        backlog = await queue.backlog()
+        assert backlog["high"].depth == 1 and backlog["high"].oldest_age == 5
+        assert backlog["medium"].depth == 1
+
+    async def test_max_priority_leaves_lower_priorities_pending(self, queue):
+        await queue.enqueue_many(
+            [
+                make_task("m", priority="medium"),
+                make_task("h1", priority="high"),
+                make_task("h2", priority="high"),
+            ]
+        )
+        leases = await queue.claim_batch("w1", 5, max_priority="high")
+        assert [lease.task_id for lease in leases] == ["h1", "h2"]
+        assert await queue.claim("w1", max_priority="high") is None
+        assert (await queue.claim("w1", max_priority="medium")).task_id == "m"
+        with pytest.raises(QueueError):
+            await queue.claim("w1", max_priority="urgent")
@@ -0,0 +1,335 @@
+"""
+Tests for the Worker Pool runtime per specs/technical.md §5.
+
+Reference: specs/technical.md §5.1, §5.4–5.6
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from chimera.queue import InMemoryTaskQueue, QueuedTask
+from chimera.worker import TaskFailure, TaskTypePolicy, WorkerPool
+
+
+def make_task(task_id: str, task_type: str = "generate_content") -> QueuedTask:
+    return QueuedTask(
+        task_id=task_id,
+        task_type=task_type,
+        payload={"correlation_id": f"corr-{task_id}"},
+    )
+
+
+async def collect(queue: asyncio.Queue, count: int, timeout: float = 2.0) -> list:
+    async def take():
+        return [await queue.get() for _ in range(count)]
+
+    return await asyncio.wait_for(take(), timeout)
+
+
+@pytest.fixture
+def task_queue():
+    return InMemoryTaskQueue()
+
+
+class TestResultArtifacts:
+    """Test Result Artifact requirements per specs/technical.md §5.4"""
+
+    async def test_result_includes_measured_duration(self, task_queue):
+        async def handler(task):
+            await asyncio.sleep(0.02)
+            return {"content": {"text": "hi"}, "confidence_score": 0.9}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue(make_task("t1"))
+        async with WorkerPool(
+            task_queue, {"generate_content": handler}, review_queue=review
+        ):
+            [result] = await collect(review, 1)
+        assert result["task_id"] == "t1"
+        assert result["execution_duration_ms"] >= 20
+        assert result["correlation_id"] == "corr-t1"
+        assert result["content"] == {"text": "hi"}
+        assert await task_queue.in_flight() == 0
+
+    async def test_many_tasks_in_flight_on_one_loop(self, task_queue):
+        peak = 0
+        active = 0
+
+        async def handler(task):
+            nonlocal peak, active
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return {}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue_many(make_task(f"t{i}") for i in range(300))
+        async with WorkerPool(
+            task_queue,
+            {"generate_content": handler},
+            review_queue=review,
+            max_in_flight=300,
+            claim_batch=300,
+            default_policy=TaskTypePolicy(concurrency=300),
+        ):
+            await collect(review, 300)
+        assert peak >= 200
+
+
+class TestConcurrencyAndTimeouts:
+    """Test per-task-type limits per specs/technical.md §5.5"""
+
+    async def test_per_task_type_concurrency_bound(self, task_queue):
+        active = {"slow": 0}
+        peak = {"slow": 0}
+
+        async def handler(task):
+            active["slow"] += 1
+            peak["slow"] = max(peak["slow"], active["slow"])
+            await asyncio.sleep(0.01)
+            active["slow"] -= 1
+            return {}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue_many(make_task(f"t{i}", "slow") for i in range(20))
+        async with WorkerPool(
+            task_queue,
+            {"slow": handler},
+            review_queue=review,
+            policies={"slow": TaskTypePolicy(concurrency=3)},
+        ):
+            await collect(review, 20)
+        assert peak["slow"] == 3
+
+    async def test_saturated_task_type_neither_reruns_nor_blocks(self, clock):
+        task_queue = InMemoryTaskQueue(clock=clock)
+        runs = Counter()
+        slow_runs_seen = []
+
+        async def slow(task):
+            runs[task.task_id] += 1
+            clock.advance(3.0)  # past the lease of any task left waiting
+            await asyncio.sleep(0.002)
+            return {}
+
+        async def fast(task):
+            runs[task.task_id] += 1
+            slow_runs_seen.append(sum(runs[f"s{i}"] for i in range(40)))
+            return {}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue_many(make_task(f"s{i}", "slow") for i in range(40))
+        await task_queue.enqueue_many(make_task(f"f{i}", "fast") for i in range(10))
+        async with WorkerPool(
+            task_queue,
+            {"slow": slow, "fast": fast},
+            review_queue=review,
+            default_policy=TaskTypePolicy(timeout=1.0),
+            policies={"slow": TaskTypePolicy(timeout=1.0, concurrency=1)},
+            max_in_flight=4,
+            poll_interval=0.001,
+        ) as pool:
+            await collect(review, 50)
+        assert set(runs.values()) == {1}
+        assert pool.stats.lost_leases == 0
+        assert pool.stats.completed == 50
+        # Fast tasks ran while most of the slow backlog was still queued.
+        assert max(slow_runs_seen) < 10
+
+    async def test_timeout_cancels_and_reports_failure(self, task_queue):
+        cancelled = asyncio.Event()
+
+        async def handler(task):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        review, failures = asyncio.Queue(), asyncio.Queue()
+        await task_queue.enqueue(make_task("t1", "hang"))
+        async with WorkerPool(
+            task_queue,
+            {"hang": handler},
+            review_queue=review,
+            failure_queue=failures,
+            policies={"hang": TaskTypePolicy(timeout=0.05)},
+        ) as pool:
+            [failure] = await collect(failures, 1)
+        assert cancelled.is_set()
+        assert failure["failure_type"] == "timeout"
+        assert pool.stats.timed_out == 1
+        assert review.empty()
+
+    async def test_typed_handler_failure_is_reported(self, task_queue):
+        async def handler(task):
+            raise TaskFailure(
+                "transient_external",
+                "MCP tool unavailable",
+                tool_failures=["text_completion"],
+            )
+
+        failures = asyncio.Queue()
+        await task_queue.enqueue(make_task("t1"))
+        async with WorkerPool(
+            task_queue,
+            {"generate_content": handler},
+            review_queue=asyncio.Queue(),
+            failure_queue=failures,
+        ):
+            [failure] = await collect(failures, 1)
+        assert failure["tool_failures"] == ["text_completion"]
+        assert failure["failure_reason"] == "MCP tool unavailable"
+
+
+class TestReservedCapacity:
+    """Test real-time reservation and runtime resizing per specs/functional.md §5.3"""
+
+    async def test_batch_backlog_cannot_take_reserved_slots(self, task_queue):
+        release = asyncio.Event()
+
+        async def slow(task):
+            await release.wait()
+            return {}
+
+        async def reply(task):
+            return {}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue_many(make_task(f"b{i}") for i in range(10))
+        pool = WorkerPool(
+            task_queue,
+            {"generate_content": slow, "reply_dm": reply},
+            review_queue=review,
+            max_in_flight=4,
+            reserved=1,
+            poll_interval=0.005,
+        )
+        pool.start()
+        await asyncio.sleep(0.05)
+        assert pool.in_flight_by_priority["medium"] == 3
+        await task_queue.enqueue(
+            QueuedTask(task_id="dm", task_type="reply_dm", priority="high")
+        )
+        [result] = await collect(review, 1)
+        assert result["task_id"] == "dm"
+        assert "high" in pool.latency
+
+        pool.resize(6, reserved=0)
+        await asyncio.sleep(0.05)
+        assert pool.in_flight == 6
+        with pytest.raises(ValueError):
+            pool.resize(2, reserved=2)
+        with pytest.raises(ValueError):
+            WorkerPool(task_queue, {}, review_queue=review, max_in_flight=2, reserved=2)
+        release.set()
+        await pool.stop()
+
+
+class TestBackpressureAndShutdown:
+    """Test bounded review queue and graceful drain"""
+
+    async def test_full_review_queue_stops_claiming(self, task_queue):
+        async def handler(task):
+            return {}
+
+        review = asyncio.Queue(maxsize=2)
+        await task_queue.enqueue_many(make_task(f"t{i}") for i in range(50))
+        pool = WorkerPool(
+            task_queue,
+            {"generate_content": handler},
+            review_queue=review,
+            max_in_flight=4,
+            claim_batch=4,
+        )
+        pool.start()
+        await asyncio.sleep(0.1)
+        assert review.full()
+        assert await task_queue.depth() == 50 - 6
+        await collect(review, 10)
+        await pool.stop(drain=False)
+        assert await task_queue.in_flight() == 0
+
+    async def test_lease_outlives_a_full_review_queue(self, task_queue):
+        runs = Counter()
+
+        async def handler(task):
+            runs[task.task_id] += 1
+            return {}
+
+        review = asyncio.Queue(maxsize=1)
+        review.put_nowait({"task_id": "earlier"})
+        await task_queue.enqueue(make_task("t1"))
+        pool = WorkerPool(
+            task_queue,
+            {"generate_content": handler},
+            review_queue=review,
+            poll_interval=0.01,
+        )
+        pool._visibility_timeout = 0.15  # the Judge stalls for several leases
+        async with pool:
+            await asyncio.sleep(0.6)
+            results = await collect(review, 2)
+            await asyncio.sleep(0.05)
+        assert [r["task_id"] for r in results] == ["earlier", "t1"]
+        assert runs == {"t1": 1} and review.empty()
+        assert pool.stats.lost_leases == 0
+        assert await task_queue.in_flight() == await task_queue.depth() == 0
+
+    async def test_stop_drains_in_flight_tasks(self, task_queue):
+        async def handler(task):
+            await asyncio.sleep(0.05)
+            return {}
+
+        review = asyncio.Queue()
+        await task_queue.enqueue_many(make_task(f"t{i}") for i in range(5))
+        pool = WorkerPool(
+            task_queue, {"generate_content": handler}, review_queue=review
+        )
+        pool.start()
+        await asyncio.sleep(0.01)
+        await pool.stop(drain=True)
+        assert review.qsize() == 5
+        assert await task_queue.in_flight() == 0
+
+    async def test_stop_without_drain_releases_leases(self, task_queue):
+        async def handler(task):
+            await asyncio.sleep(10)
+            return {}
+
+        await task_queue.enqueue_many(make_task(f"t{i}") for i in range(3))
+        pool = WorkerPool(
+            task_queue, {"generate_content": handler}, review_queue=asyncio.Queue()
+        )
+        pool.start()
+        await asyncio.sleep(0.01)
+        await pool.stop(drain=False)
+        assert await task_queue.depth() == 3
+        assert pool.stats.released == 3
+
+    async def test_stop_releases_tasks_that_never_started(self, task_queue):
+        started = []
+
+        async def handler(task):
+            started.append(task.task_id)
+            return {}
+
+        await task_queue.enqueue_many(make_task(f"t{i}") for i in range(3))
+        pool = WorkerPool(
+            task_queue,
+            {"generate_content": handler},
+            review_queue=asyncio.Queue(),
+            max_in_flight=3,
+        )
+        pool.start()
+        while pool.in_flight < 3:
+            await asyncio.sleep(0)
+        await pool.stop(drain=False)
+        assert started == []
+        assert await task_queue.depth() == 3
+        assert await task_queue.in_flight() == 0
+        assert pool.stats.released == 3